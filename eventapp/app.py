@@ -15,28 +15,54 @@ Designed for deployment on PythonAnywhere with minimal external dependencies.
 """
 
 import base64
+import csv
+import hashlib
+import hmac
 import io
+import mimetypes
 import os
 import uuid
+import zlib
 import shutil
+import tempfile
 import json
-from datetime import datetime, timedelta
-from werkzeug.utils import secure_filename
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote as url_quote
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from werkzeug.utils import safe_join
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import smtplib
 import re
+from contextlib import contextmanager
+from functools import lru_cache, partial, wraps
 
-from flask import (Flask, flash, redirect, render_template, request, session,
-                   url_for, jsonify, send_from_directory)
+from flask import (Flask, Response, abort, flash, g, has_app_context, has_request_context, redirect,
+                   render_template, request, session, stream_with_context, url_for, jsonify,
+                   send_from_directory)
 from flask_login import (LoginManager, UserMixin, current_user, login_required,
                          login_user, logout_user)
 from flask_sqlalchemy import SQLAlchemy
+from markupsafe import Markup
+from flask_sqlalchemy.session import Session as FlaskSQLAlchemySession
+from sqlalchemy.exc import IntegrityError
 from werkzeug.security import check_password_hash, generate_password_hash
 from dotenv import load_dotenv
 
 import qrcode
 
+from assets import DIST_DIR, content_hash, load_manifest
+from i18n import DEFAULT_LOCALE, LocalizedEnvironment, TranslationExtension, compile_catalogs
+from forms_import import RATING_FIELDS as FEEDBACK_RATING_FIELDS, parse_response, read_export, resolve_columns
+from images import (HEADER_READ_LIMIT, UPLOAD_CONTENT_TYPES, UPLOAD_FORMATS, make_renditions,
+                    read_image_header)
+from singleflight import SingleFlight
+from storage import storage_from_config
+from badges import (BADGES_PER_PAGE, badge_filename, chunked, find_badge_font, render_badge_page,
+                    render_badge_png, render_in_pool, stream_badge_pdf, stream_badge_zip)
+from db_compat import (enable_sqlite_wal, engine_options_for, normalize_database_url,
+                       read_only_url, reporting_bind_options, snapshot_connection)
+
 # Stripe import removed - only credit payments are supported
 STRIPE_AVAILABLE = False
 
@@ -48,9 +74,24 @@ except:
 
 
 app = Flask(__name__)
+# Templates are compiled once per locale, with constant translation keys inlined
+app.jinja_environment = LocalizedEnvironment
+app.jinja_options = {**app.jinja_options, 'extensions': [TranslationExtension]}
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'replace-with-a-secure-random-secret-key')
-app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///eventapp.db')
+app.config['SQLALCHEMY_DATABASE_URI'] = normalize_database_url(os.getenv('DATABASE_URL', 'sqlite:///eventapp.db'))
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options_for(app.config['SQLALCHEMY_DATABASE_URI'])
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Read-only bind for analytics and exports. Defaults to a read-only connection
+# to the main database; set REPORTING_DATABASE_URL to use a replica or a
+# snapshot refreshed by refresh_reporting_snapshot.py.
+app.config['REPORTING_DATABASE_URL'] = normalize_database_url(
+    os.getenv('REPORTING_DATABASE_URL') or read_only_url(app.config['SQLALCHEMY_DATABASE_URI'])
+)
+app.config['SQLALCHEMY_BINDS'] = {
+    'reporting': reporting_bind_options(app.config['REPORTING_DATABASE_URL'])
+}
+# Opt-in: WAL needs shared memory, which network filesystems (e.g. PythonAnywhere) can't provide safely
+app.config['SQLITE_WAL'] = os.getenv('SQLITE_WAL', 'False').lower() == 'true'
 
 # Email configuration
 app.config['MAIL_SERVER'] = os.getenv('MAIL_SERVER', 'smtp.gmail.com')
@@ -68,7 +109,43 @@ app.config['PREFERRED_URL_SCHEME'] = os.getenv('PREFERRED_URL_SCHEME', 'http')
 # File upload configuration
 app.config['UPLOAD_FOLDER'] = 'static/uploads/events'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
+UPLOAD_URL_PREFIX = '/static/uploads/'
+# Uploads are stored once per distinct content, named by their SHA-256
+CONTENT_URL_PREFIX = '/static/uploads/content'
+RENDITION_URL_PREFIX = '/static/uploads/renditions'
+UPLOAD_CHUNK_SIZE = 64 * 1024
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # Per image; MAX_CONTENT_LENGTH caps the whole request
+# Unreferenced uploads younger than this are left alone by collect_uploads.py,
+# so files whose upload request has not committed yet are never removed
+UPLOAD_GRACE_PERIOD = timedelta(hours=24)
+
+# Where uploads are kept: 'local' (static/uploads) or 's3', an S3-compatible
+# bucket browsers upload to and download from directly (see storage.py)
+app.config['UPLOAD_STORAGE'] = os.getenv('UPLOAD_STORAGE', 'local')
+app.config['S3_BUCKET'] = os.getenv('S3_BUCKET')
+app.config['S3_REGION'] = os.getenv('S3_REGION', 'us-east-1')
+app.config['S3_ENDPOINT_URL'] = os.getenv('S3_ENDPOINT_URL')  # MinIO, R2, ...; unset for AWS
+app.config['S3_ACCESS_KEY_ID'] = os.getenv('S3_ACCESS_KEY_ID')
+app.config['S3_SECRET_ACCESS_KEY'] = os.getenv('S3_SECRET_ACCESS_KEY')
+app.config['S3_PUBLIC_URL'] = os.getenv('S3_PUBLIC_URL')  # Public bucket or CDN URL; presigned URLs otherwise
+UPLOAD_STORAGE = storage_from_config(app.config, os.path.join(app.static_folder, 'uploads'))
+
+# Static HTML copies of the public pages, for the front-end server to serve
+# without the app (see write_snapshots.py); changes are only queued when enabled
+app.config['STATIC_SNAPSHOTS'] = os.getenv('STATIC_SNAPSHOTS', 'False').lower() == 'true'
+app.config['SNAPSHOT_FOLDER'] = os.getenv('SNAPSHOT_FOLDER', os.path.join(app.static_folder, 'snapshots'))
+
+# Rendered check-in QR codes, kept outside static/ so they are only served to their owner
+app.config['QR_CACHE_FOLDER'] = os.getenv('QR_CACHE_FOLDER', os.path.join(app.instance_path, 'qr_codes'))
+# Key for signing check-in QR tokens; changing it invalidates every issued code
+app.config['QR_SIGNING_KEY'] = os.getenv('QR_SIGNING_KEY') or app.config['SECRET_KEY']
+# Badge sheets: a font with CJK coverage (auto-detected when unset) and the
+# number of rendering processes. The default, 1, renders inside the web worker;
+# a pool is started per request, so only raise it on hosts with spare cores
+app.config['BADGE_FONT_PATH'] = os.getenv('BADGE_FONT_PATH')
+app.config['BADGE_WORKERS'] = int(os.getenv('BADGE_WORKERS', '1'))
+# Lock and result files that let worker processes share one computation of an expensive result
+app.config['SINGLE_FLIGHT_LOCK_DIR'] = os.getenv('SINGLE_FLIGHT_LOCK_DIR', os.path.join(app.instance_path, 'locks'))
 
 # Stripe configuration
 app.config['STRIPE_PUBLISHABLE_KEY'] = os.getenv('STRIPE_PUBLISHABLE_KEY')
@@ -82,7 +159,26 @@ app.config['DEFAULT_COUNTRY'] = 'Singapore'
 # Superuser Configuration
 app.config['SUPERUSER_PASSWORD'] = os.getenv('SUPERUSER_PASSWORD', 'TXGF#813193')
 
-db = SQLAlchemy(app)
+# Concurrent cache misses for the same result wait for one computation (see singleflight.py)
+SINGLE_FLIGHT = SingleFlight(app.config['SINGLE_FLIGHT_LOCK_DIR'])
+
+class RoutingSession(FlaskSQLAlchemySession):
+    """Session that sends reads to the reporting bind inside reporting views.
+
+    Flushes and DML statements always go to the primary database, so a view
+    that accidentally writes fails loudly on the read-only bind instead of
+    silently writing to a replica.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (bind is None and not self._flushing
+                and not getattr(clause, 'is_dml', False)
+                and has_app_context() and g.get('use_reporting_db')):
+            return self._db.engines['reporting']
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+db = SQLAlchemy(app, session_options={'class_': RoutingSession})
 
 login_manager = LoginManager(app)
 login_manager.login_view = 'login'
@@ -98,17 +194,105 @@ SUPPORTED_LANGUAGES = {
 # Import translations from separate file
 from translations import TRANSLATIONS
 
+# One frozen lookup table per locale, English filling any gaps
+TRANSLATION_CATALOGS, TRANSLATION_GAPS = compile_catalogs(TRANSLATIONS, DEFAULT_LOCALE)
+
 def get_current_language():
-    """Get current language from session or user preference."""
-    if current_user.is_authenticated and current_user.locale:
-        return current_user.locale
-    return session.get('language', 'en')
+    """Get current language from user preference or session, resolved once per request."""
+    if not has_request_context():
+        return DEFAULT_LOCALE
+    if 'language' not in g:
+        if current_user.is_authenticated and current_user.locale:
+            language = current_user.locale
+        else:
+            language = session.get('language', DEFAULT_LOCALE)
+        g.language = language if language in TRANSLATION_CATALOGS else DEFAULT_LOCALE
+    return g.language
 
 def get_translation(key, language=None):
     """Get translation for a key in the specified language."""
-    if language is None:
-        language = get_current_language()
-    return TRANSLATIONS.get(language, TRANSLATIONS['en']).get(key, key)
+    catalog = TRANSLATION_CATALOGS.get(language or get_current_language(),
+                                       TRANSLATION_CATALOGS[DEFAULT_LOCALE])
+    return catalog.get(key, key)
+
+app.jinja_env.translation_catalogs = TRANSLATION_CATALOGS
+app.jinja_env.locale_selector = get_current_language
+
+# Fingerprinted static assets, built by build_assets.py
+ASSET_MANIFEST = load_manifest(app.static_folder)
+ASSET_MAX_AGE = 31536000
+ASSET_ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+# Upload keys whose content never changes under the same name
+IMMUTABLE_UPLOAD_PREFIXES = tuple(prefix[len(UPLOAD_URL_PREFIX):] + '/' for prefix in (CONTENT_URL_PREFIX, RENDITION_URL_PREFIX))
+REMOTE_UPLOAD_REDIRECT_MAX_AGE = 3600
+
+
+def static_url(filename, **values):
+    """Like ``url_for('static', filename=...)``, but fingerprinted for long-term caching.
+
+    Bundles built from assets/ map to their content-hashed file in
+    static/dist, and other files in the manifest get their hash as ``v``.
+    Anything else gets the plain static URL.
+    """
+    hashed = ASSET_MANIFEST['bundles'].get(filename)
+    if hashed:
+        return url_for('dist_asset', filename=hashed, **values)
+    version = ASSET_MANIFEST['files'].get(filename)
+    if version:
+        values['v'] = version
+    return url_for('static', filename=filename, **values)
+
+
+def _cache_forever(response):
+    response.cache_control.no_cache = None
+    response.cache_control.public = True
+    response.cache_control.max_age = ASSET_MAX_AGE
+    response.cache_control.immutable = True
+    return response
+
+
+@app.route('/static/dist/<path:filename>')
+def dist_asset(filename):
+    """Serve a built asset, precompressed when the client accepts it."""
+    folder = os.path.join(app.static_folder, DIST_DIR)
+    mimetype = mimetypes.guess_type(filename)[0]
+    for encoding, suffix in ASSET_ENCODINGS:
+        path = safe_join(folder, filename + suffix)
+        if request.accept_encodings[encoding] and path and os.path.isfile(path):
+            response = send_from_directory(folder, filename + suffix, mimetype=mimetype)
+            response.content_encoding = encoding
+            break
+    else:
+        response = send_from_directory(folder, filename, mimetype=mimetype)
+    response.vary.add('Accept-Encoding')
+    return _cache_forever(response)
+
+
+@app.route('/static/uploads/<path:key>')
+def uploaded_file(key):
+    """Serve an upload from local storage, or send the browser to remote storage for it.
+
+    Uploads stored under their hash, and the renditions made from those,
+    never change, so browsers may keep them.
+    """
+    if not UPLOAD_STORAGE.is_local:
+        response = redirect(UPLOAD_STORAGE.download_url(key))
+        response.cache_control.max_age = REMOTE_UPLOAD_REDIRECT_MAX_AGE
+        return response
+    response = send_from_directory(UPLOAD_STORAGE.root, key)
+    if key.startswith(IMMUTABLE_UPLOAD_PREFIXES):
+        _cache_forever(response)
+    return response
+
+
+@app.after_request
+def cache_fingerprinted_static(response):
+    """Let browsers keep static files requested with their current content hash."""
+    if (request.endpoint == 'static' and response.status_code in (200, 304)
+            and request.args.get('v') is not None
+            and request.args['v'] == ASSET_MANIFEST['files'].get(request.view_args['filename'])):
+        _cache_forever(response)
+    return response
 
 # Make helper functions and config available to templates
 @app.context_processor
@@ -121,6 +305,10 @@ def inject_helpers():
         'default_country': app.config.get('DEFAULT_COUNTRY', 'Singapore'),
         'get_current_language': get_current_language,
         'get_translation': get_translation,
+        'static_url': static_url,
+        'responsive_image': responsive_image,
+        'upload_url': upload_url,
+        'direct_uploads': not UPLOAD_STORAGE.is_local,
         'supported_languages': SUPPORTED_LANGUAGES
     }
 
@@ -164,6 +352,16 @@ MEMBERSHIP_GRADES = {
     }
 }
 
+# Engagement score points, and the lowest score suggested for each grade
+ENGAGEMENT_POINTS = {'attended': 10, 'no_show': -5, 'per_10_credits': 1}
+GRADE_SUGGESTION_SCORES = [
+    ('Diamond', 300),
+    ('Platinum', 150),
+    ('Gold', 60),
+    ('Silver', 20),
+    ('Classic', 0),
+]
+
 # Membership type configuration (for user registration)
 MEMBERSHIP_TYPES = {
     'NA': {
@@ -224,7 +422,10 @@ class User(UserMixin, db.Model):
         privacy_show_full_name (bool): Whether to show full name in public profile.
         account_status (str): Account status (active/suspended).
         email_verified (bool): Whether email is verified.
+        credit_balance (int): cached credit balance in minor units (cents),
+            kept in step with the CreditTransaction ledger.
         created_at (datetime): Account creation timestamp.
+        updated_at (datetime): last update timestamp.
     """
 
     id = db.Column(db.Integer, primary_key=True)
@@ -255,9 +456,10 @@ class User(UserMixin, db.Model):
     password_reset_sent_at = db.Column(db.DateTime, nullable=True)
     membership_type = db.Column(db.String(20), default='NA')  # NA, 会员, 家族, 星光, 嫡传
     membership_grade = db.Column(db.String(20), default='Pending Review')  # Classic, Silver, Gold, Platinum, Diamond
-    credit_point = db.Column(db.Float, default=0.0)  # Credit points for event payments
+    credit_balance = db.Column(db.Integer, nullable=False, default=0)  # Minor units; change only via the credit ledger
     has_default_password = db.Column(db.Boolean, default=False)  # Track if user has default password
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     events = db.relationship('Event', backref='creator', lazy=True)
     rsvps = db.relationship('RSVP', backref='attendee', lazy=True)
@@ -330,6 +532,11 @@ class User(UserMixin, db.Model):
             return f"{self.first_name} {self.last_name}"
         return self.username
 
+    @property
+    def credit_point(self) -> float:
+        """Return the credit balance in whole credits for display."""
+        return from_minor_units(self.credit_balance or 0)
+
     @property
     def display_name(self) -> str:
         """Return display name based on privacy settings."""
@@ -445,7 +652,7 @@ class Event(db.Model):
     meal_option_price = db.Column(db.Float, default=0.0)  # Additional cost for meal option
     pay_at_venue_enabled = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     rsvps = db.relationship('RSVP', backref='event', lazy=True)
     invitations = db.relationship('Invitation', backref='event', lazy=True)
@@ -499,6 +706,8 @@ class Event(db.Model):
         """Backward compatibility property."""
         return self.start_date
 
+    is_archived = False
+
 
 class CarouselImage(db.Model):
     """Represents a carousel image for the welcome section.
@@ -526,6 +735,52 @@ class CarouselImage(db.Model):
         return f'<CarouselImage {self.id}: {self.title or "Untitled"}>'
 
 
+class UploadedImage(db.Model):
+    """A stored upload (event cover or carousel image) and its responsive renditions.
+
+    Uploads are stored once per distinct content under CONTENT_URL_PREFIX,
+    so a row stands for one file however many events and carousel slides use
+    it; ``ref_count`` tracks how many do. Rows are added as pending;
+    process_images.py renders them outside the request (see images.py).
+    Pages show the original until the renditions are ready.
+
+    Attributes:
+        id (int): primary key.
+        url (str): URL of the original, as stored on the event or carousel image.
+        sha256 (str): content hash (empty for uploads from before content addressing).
+        size_bytes (int): size of the original.
+        ref_count (int): number of events, archived events and carousel images using it.
+        status (str): 'pending', 'processing', 'ready' or 'failed'.
+        width (int): width of the original after applying its orientation.
+        height (int): height of the original after applying its orientation.
+        placeholder (str): data URI of a tiny blurred preview.
+        renditions (str): JSON map of rendition name to [width, height].
+        error (str): why processing failed.
+        created_at (datetime): when the file was uploaded.
+        processed_at (datetime): when the renditions were written.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    url = db.Column(db.String(500), nullable=False, unique=True)
+    sha256 = db.Column(db.String(64), nullable=True, unique=True, index=True)
+    size_bytes = db.Column(db.Integer, nullable=True)
+    ref_count = db.Column(db.Integer, nullable=False, default=0)
+    status = db.Column(db.String(20), nullable=False, default='pending', index=True)
+    width = db.Column(db.Integer, nullable=True)
+    height = db.Column(db.Integer, nullable=True)
+    placeholder = db.Column(db.Text, nullable=True)
+    renditions = db.Column(db.Text, nullable=True)
+    error = db.Column(db.String(500), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    processed_at = db.Column(db.DateTime, nullable=True)
+
+    @property
+    def rendition_sizes(self) -> dict:
+        return json.loads(self.renditions) if self.renditions else {}
+
+    def rendition_url(self, name, extension) -> str:
+        return f'{RENDITION_URL_PREFIX}/{self.id}/{name}.{extension}'
+
+
 class RSVP(db.Model):
     """Represents an RSVP response from a user for an event.
 
@@ -539,10 +794,14 @@ class RSVP(db.Model):
         qr_code (str): unique code string for admission.
         checked_in (bool): whether user has been checked in.
         checked_in_at (datetime): when user was checked in.
+        cancelled_at (datetime): when an accepted RSVP was withdrawn; cleared on re-accepting.
         created_at (datetime): timestamp when RSVP was created.
         updated_at (datetime): timestamp when RSVP was last updated.
     """
 
+    # Serves the per-event status counts polled by the arrival dashboard
+    __table_args__ = (db.Index('ix_rsvp_event_status', 'event_id', 'status'),)
+
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(db.Integer, db.ForeignKey('event.id'), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -559,8 +818,151 @@ class RSVP(db.Model):
     receipt_url = db.Column(db.String(500), nullable=True)  # URL to receipt
     # New RSVP preference
     meal_opt_in = db.Column(db.Boolean, default=False)
+    cancelled_at = db.Column(db.DateTime, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+
+class StaleSnapshot(db.Model):
+    """A static page snapshot waiting to be re-rendered by write_snapshots.py.
+
+    Rows are added in the same transaction as the change that made the page
+    stale, and removed once the page has been written.
+
+    Attributes:
+        id (int): primary key.
+        event_id (int): event whose summary page changed; null for the home page.
+        queued_at (datetime): when the row was added.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.Integer, nullable=True)
+    queued_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+class CheckInBucket(db.Model):
+    """Check-in counts for one minute of an event.
+
+    Kept up to date by :func:`record_arrival` as attendees check in, and by
+    :func:`apply_arrival` when a checked-in RSVP is changed or declined, so
+    the arrival dashboard reads a handful of rows instead of every RSVP.
+
+    Attributes:
+        id (int): primary key.
+        event_id (int): associated event.
+        minute (datetime): start of the minute (UTC).
+        arrivals (int): RSVPs checked in during the minute.
+        guests (int): guests arriving with those RSVPs.
+        meal_arrivals (int): arrivals who opted in to the meal.
+    """
+
+    __table_args__ = (db.UniqueConstraint('event_id', 'minute', name='uq_check_in_bucket_event_minute'),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.Integer, db.ForeignKey('event.id'), nullable=False, index=True)
+    minute = db.Column(db.DateTime, nullable=False)
+    arrivals = db.Column(db.Integer, nullable=False, default=0)
+    guests = db.Column(db.Integer, nullable=False, default=0)
+    meal_arrivals = db.Column(db.Integer, nullable=False, default=0)
+
+
+class EventDailyStat(db.Model):
+    """One day of RSVP activity for an event, for one metric.
+
+    Kept up to date by :func:`apply_rsvp_rollup` as RSVPs change and rebuilt
+    from the RSVPs by :func:`rebuild_event_rollups`. ``creator_id`` is copied
+    from the event so organiser totals are a sum over these rows. Rows stay
+    when their event is archived, so ``event_id`` has no foreign key.
+
+    Metrics, with what ``key`` holds:
+        rsvp (status): RSVPs first made that day, by their current status.
+        meal: accepted RSVPs first made that day that opted in to the meal.
+        revenue (payment method): paid RSVPs first made that day.
+        cancellation: accepted RSVPs withdrawn that day.
+        check_in: accepted RSVPs checked in that day.
+
+    Attributes:
+        id (int): primary key.
+        event_id (int): associated event.
+        creator_id (int): organiser of the event.
+        day (date): UTC day.
+        metric (str): one of the metrics above.
+        key (str): status or payment method, '' when the metric has none.
+        count (int): number of RSVPs.
+        guests (int): guests on those RSVPs.
+        amount (int): amount paid in minor units (revenue only).
+    """
+
+    __table_args__ = (
+        db.UniqueConstraint('event_id', 'day', 'metric', 'key', name='uq_event_daily_stat'),
+        db.Index('ix_event_daily_stat_creator_day', 'creator_id', 'day'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.Integer, nullable=False, index=True)
+    creator_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    day = db.Column(db.Date, nullable=False)
+    metric = db.Column(db.String(20), nullable=False)
+    key = db.Column(db.String(20), nullable=False, default='')
+    count = db.Column(db.Integer, nullable=False, default=0)
+    guests = db.Column(db.Integer, nullable=False, default=0)
+    amount = db.Column(db.Integer, nullable=False, default=0)
+
+
+class MemberEngagement(db.Model):
+    """Running engagement totals for one member.
+
+    Kept up to date by :func:`apply_member_engagement` as RSVPs change and
+    members check in. No-shows are added when :func:`settle_engagement`
+    closes events that have ended, and :func:`rebuild_member_engagement`
+    recomputes everything from the RSVPs, archived ones included.
+
+    Attributes:
+        user_id (int): the member (primary key).
+        accepted (int): RSVPs accepted.
+        attended (int): RSVPs checked in.
+        no_shows (int): accepted RSVPs to settled events that were never checked in.
+        credits_spent (int): credits paid for RSVPs, in minor units.
+        last_activity_at (datetime): latest RSVP change or check-in.
+    """
+
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True, autoincrement=False)
+    accepted = db.Column(db.Integer, nullable=False, default=0)
+    attended = db.Column(db.Integer, nullable=False, default=0)
+    no_shows = db.Column(db.Integer, nullable=False, default=0)
+    credits_spent = db.Column(db.Integer, nullable=False, default=0)
+    last_activity_at = db.Column(db.DateTime, nullable=True)
+
+    user = db.relationship('User', backref=db.backref('engagement', uselist=False, lazy=True))
+
+    @property
+    def check_in_rate(self):
+        """Share of settled accepted RSVPs that checked in, or None before any."""
+        settled = self.attended + self.no_shows
+        return self.attended / settled if settled else None
+
+    @property
+    def score(self) -> int:
+        return (self.attended * ENGAGEMENT_POINTS['attended']
+                + self.no_shows * ENGAGEMENT_POINTS['no_show']
+                + self.credits_spent // 1000 * ENGAGEMENT_POINTS['per_10_credits'])
+
+    @property
+    def suggested_grade(self) -> str:
+        for grade, minimum in GRADE_SUGGESTION_SCORES:
+            if self.score >= minimum:
+                return grade
+        return GRADE_SUGGESTION_SCORES[-1][0]
+
+    @property
+    def suggested_change(self):
+        """The suggested grade when it differs from the member's current one.
+
+        Admins and members still pending review get no suggestions.
+        """
+        user = self.user
+        if user.is_admin or user.membership_grade in ('Pending Review', self.suggested_grade):
+            return None
+        return self.suggested_grade
 
 
 class Invitation(db.Model):
@@ -595,22 +997,26 @@ class Notification(db.Model):
     Attributes:
         id (int): primary key.
         user_id (int): recipient user.
+        event_id (int): related event, if any (used for archival).
         type (str): notification type (invite/rsvp/event_update/etc).
         title (str): notification title.
         message (str): notification message.
         payload (str): JSON payload with additional data.
         read_at (datetime): when notification was read.
         created_at (datetime): when notification was created.
+        updated_at (datetime): last update timestamp.
     """
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    event_id = db.Column(db.Integer, db.ForeignKey('event.id'), nullable=True, index=True)
     type = db.Column(db.String(50), nullable=False)
     title = db.Column(db.String(200), nullable=False)
     message = db.Column(db.Text, nullable=False)
     payload = db.Column(db.Text, nullable=True)  # JSON data
     read_at = db.Column(db.DateTime, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
 
 class Feedback(db.Model):
@@ -627,12 +1033,20 @@ class Feedback(db.Model):
         value_for_money (int): value for money rating (1-5 scale).
         likelihood_to_recommend (int): likelihood to recommend (1-5 scale).
         additional_comments (str): optional text feedback.
+        feedback_form_id (int): MS Forms form the response was imported from.
+        ms_response_id (str): the response's ID in the MS Forms export.
         created_at (datetime): when feedback was submitted.
+        updated_at (datetime): last update timestamp.
     """
     
+    # Re-importing an export updates responses instead of duplicating them
+    __table_args__ = (db.Index('uq_feedback_form_response', 'feedback_form_id', 'ms_response_id', unique=True),)
+    
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(db.Integer, db.ForeignKey('event.id'), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    feedback_form_id = db.Column(db.Integer, db.ForeignKey('event_feedback_form.id'), nullable=True)
+    ms_response_id = db.Column(db.String(50), nullable=True)
     
     # Rating questions (1-5 scale)
     overall_rating = db.Column(db.Integer, nullable=False)
@@ -646,6 +1060,7 @@ class Feedback(db.Model):
     additional_comments = db.Column(db.Text, nullable=True)
     
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # Relationships
     event = db.relationship('Event', backref='feedbacks', lazy=True)
@@ -662,6 +1077,8 @@ class EventFeedbackForm(db.Model):
         ms_form_id (str): Microsoft Forms form ID.
         ms_form_url (str): Microsoft Forms embed URL.
         is_active (bool): whether this form is currently active.
+        response_mapping (str): JSON map of feedback fields to export column headers,
+            for questions the response import can't match by keyword.
         created_by (int): user who created this form.
         created_at (datetime): when form was created.
     """
@@ -672,6 +1089,7 @@ class EventFeedbackForm(db.Model):
     ms_form_id = db.Column(db.String(100), nullable=False)  # MS Forms form ID
     ms_form_url = db.Column(db.Text, nullable=False)  # MS Forms embed URL
     is_active = db.Column(db.Boolean, default=True)
+    response_mapping = db.Column(db.Text, nullable=True)
     created_by = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
@@ -680,36 +1098,557 @@ class EventFeedbackForm(db.Model):
     creator = db.relationship('User', backref='created_feedback_forms', lazy=True)
 
 
+class CreditTransaction(db.Model):
+    """One entry in a member's append-only credit ledger.
+
+    Rows are never updated or deleted; corrections are new entries. Summing
+    ``amount`` per user replays to ``User.credit_balance``.
+
+    Attributes:
+        id (int): primary key.
+        user_id (int): member whose balance changed.
+        amount (int): signed change in minor units (positive credits the member).
+        kind (str): topup/debit/refund/adjustment/opening.
+        balance_after (int): member balance after this entry, in minor units.
+        rsvp_id (int): RSVP paid or refunded by this entry (optional).
+        batch_id (str): shared id of a bulk top-up (optional).
+        note (str): free-text reason.
+        created_by_id (int): admin who recorded the entry (optional).
+        created_at (datetime): when the entry was recorded.
+    """
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
+    amount = db.Column(db.Integer, nullable=False)
+    kind = db.Column(db.String(20), nullable=False)
+    balance_after = db.Column(db.Integer, nullable=False)
+    rsvp_id = db.Column(db.Integer, nullable=True, index=True)
+    batch_id = db.Column(db.String(36), nullable=True, index=True)
+    note = db.Column(db.String(200), nullable=True)
+    created_by_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    user = db.relationship('User', foreign_keys=[user_id],
+                           backref=db.backref('credit_transactions', lazy='dynamic'))
+
+
+def _archive_table(model):
+    """Build the archive table for a hot model.
+
+    Columns mirror the hot table (same names, types and primary keys, so rows
+    can move back unchanged) without foreign keys or unique constraints, plus
+    an ``archived_at`` timestamp.
+    """
+    columns = [
+        db.Column(col.name, col.type, primary_key=col.primary_key, autoincrement=False,
+                  nullable=col.nullable, index=col.name in ('event_id', 'user_id'))
+        for col in model.__table__.columns
+    ]
+    return db.Table(f'archived_{model.__tablename__}', *columns,
+                    db.Column('archived_at', db.DateTime, nullable=False, default=datetime.utcnow))
+
+
+class ArchivedEvent(db.Model):
+    """An event moved out of the hot ``event`` table by the archival job.
+
+    Read-only mirror of :class:`Event`; see :func:`archive_completed_events`.
+    """
+    __table__ = _archive_table(Event)
+
+    creator = db.relationship('User', primaryjoin='foreign(ArchivedEvent.creator_id) == User.id',
+                              viewonly=True, lazy=True)
+    rsvps = db.relationship('ArchivedRSVP', primaryjoin='ArchivedEvent.id == foreign(ArchivedRSVP.event_id)',
+                            viewonly=True, lazy=True)
+
+    accepted_count = Event.accepted_count
+    maybe_count = Event.maybe_count
+    declined_count = Event.declined_count
+    waitlist_count = Event.waitlist_count
+    available_spots = Event.available_spots
+    is_full = Event.is_full
+    is_past = Event.is_past
+    is_upcoming = Event.is_upcoming
+    date = Event.date
+    is_archived = True
+
+
+class ArchivedRSVP(db.Model):
+    """An RSVP archived together with its event."""
+    __table__ = _archive_table(RSVP)
+
+    attendee = db.relationship('User', primaryjoin='foreign(ArchivedRSVP.user_id) == User.id',
+                               viewonly=True, lazy=True)
+    event = db.relationship('ArchivedEvent', primaryjoin='foreign(ArchivedRSVP.event_id) == ArchivedEvent.id',
+                            viewonly=True, lazy=True)
+
+
+class ArchivedNotification(db.Model):
+    """A notification archived with its event, or read and past the cutoff."""
+    __table__ = _archive_table(Notification)
+
+
+class ArchivedFeedback(db.Model):
+    """Feedback archived together with its event."""
+    __table__ = _archive_table(Feedback)
+
+
+class ArchivedInvitation(db.Model):
+    """An invitation archived together with its event."""
+    __table__ = _archive_table(Invitation)
+
+
+class ArchivedEventFeedbackForm(db.Model):
+    """A feedback form configuration archived together with its event."""
+    __table__ = _archive_table(EventFeedbackForm)
+
+
+# Hot model -> archive model, children before parents so deletes respect foreign keys
+EVENT_ARCHIVE_CHILDREN = [
+    (RSVP, ArchivedRSVP),
+    (Notification, ArchivedNotification),
+    (Feedback, ArchivedFeedback),
+    (Invitation, ArchivedInvitation),
+    (EventFeedbackForm, ArchivedEventFeedbackForm),
+]
+
+# Columns holding upload URLs; archived events keep their covers for unarchiving
+UPLOAD_REFERENCE_COLUMNS = (Event.cover_image_url, ArchivedEvent.cover_image_url, CarouselImage.image_url)
+
+
 @login_manager.user_loader
 def load_user(user_id):
     return User.query.get(int(user_id))
 
 
-def allowed_file(filename):
-    """Check if file extension is allowed."""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+def content_url(sha256, extension):
+    """URL an upload with this content hash is stored under."""
+    return f'{CONTENT_URL_PREFIX}/{sha256[:2]}/{sha256}{extension.lower()}'
+
+
+def upload_key(url):
+    """Storage key of an upload URL (see storage.py), or None for other URLs."""
+    if not url or not url.startswith(UPLOAD_URL_PREFIX):
+        return None
+    return url[len(UPLOAD_URL_PREFIX):]
+
+
+def upload_url(url):
+    """Where browsers should load an upload from: the storage itself when it is remote."""
+    key = upload_key(url)
+    if key is None or UPLOAD_STORAGE.is_local:
+        return url
+    return UPLOAD_STORAGE.download_url(key)
+
+
+def _staging_dir():
+    """Directory for files on their way into storage; None for the system temp directory."""
+    if UPLOAD_STORAGE.staging_dir:
+        os.makedirs(UPLOAD_STORAGE.staging_dir, exist_ok=True)
+    return UPLOAD_STORAGE.staging_dir
+
+
+def _upload_size(stream):
+    """Size of an uploaded file's stream without reading it, or None if it can't seek."""
+    try:
+        size = stream.seek(0, os.SEEK_END)
+        stream.seek(0)
+        return size
+    except (AttributeError, OSError):
+        return None
+
+
+def _reject_oversized_upload(size):
+    if size > MAX_UPLOAD_BYTES:
+        raise ValueError(f'The image is too large; please upload one under {MAX_UPLOAD_BYTES // (1024 * 1024)} MB.')
+
+
+def _record_upload(url, sha256, size):
+    """Add the UploadedImage for newly stored content, count the caller's reference and return its URL."""
+    if not UploadedImage.query.filter_by(sha256=sha256).first():
+        try:
+            with db.session.begin_nested():
+                db.session.add(UploadedImage(url=url, sha256=sha256, size_bytes=size))
+        except IntegrityError:
+            pass  # The same file was stored by a concurrent upload
+    url = UploadedImage.query.filter_by(sha256=sha256).one().url
+    retain_upload(url)
+    return url
 
 
 def save_uploaded_file(file):
-    """Save uploaded file and return the filename."""
-    if file and allowed_file(file.filename):
-        # Create upload directory if it doesn't exist
-        os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-        
-        # Generate unique filename
-        filename = secure_filename(file.filename)
-        name, ext = os.path.splitext(filename)
-        unique_filename = f"{uuid.uuid4()}{ext}"
-        
-        # Save file
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-        file.save(file_path)
-        
-        return f"/static/uploads/events/{unique_filename}"
+    """Check an uploaded image, store it by its content hash and return its URL.
+
+    Werkzeug has already spooled the upload to a temporary file. The file's
+    size, real format and dimensions are checked from its first bytes (see
+    images.read_image_header) before the rest is read. It is then copied in
+    chunks, hashed as it goes, to a ``.part`` file that is moved into
+    storage. The uploaded name is ignored: a JPEG saved as ``.jfif`` or
+    with no extension is accepted, and the stored extension follows the
+    detected format.
+
+    A file whose content is already stored is not written again; the
+    existing URL is returned. The new reference is counted in the caller's
+    transaction (see retain_upload). If the caller never commits, the file is
+    left unreferenced for collect_uploads.py.
+
+    Raises:
+        ValueError: with a message for the user, if the file is not an
+            acceptable image.
+    """
+    if not file:
+        raise ValueError('Invalid file type. Please upload PNG, JPG, JPEG, GIF, or WebP images.')
+    declared_size = _upload_size(file.stream)
+    if declared_size is not None:
+        _reject_oversized_upload(declared_size)
+    head, pil_format, _ = read_image_header(file.stream, UPLOAD_CHUNK_SIZE)
+
+    digest = hashlib.sha256(head)
+    size = len(head)
+    with tempfile.NamedTemporaryFile(dir=_staging_dir(), suffix='.part', delete=False) as tmp:
+        try:
+            tmp.write(head)
+            for chunk in iter(lambda: file.stream.read(UPLOAD_CHUNK_SIZE), b''):
+                size += len(chunk)
+                _reject_oversized_upload(size)
+                digest.update(chunk)
+                tmp.write(chunk)
+        except BaseException:
+            tmp.close()
+            os.remove(tmp.name)
+            raise
+    sha256 = digest.hexdigest()
+
+    image = UploadedImage.query.filter_by(sha256=sha256).first()
+    url = image.url if image else content_url(sha256, UPLOAD_FORMATS[pil_format])
+    key = upload_key(url)
+    try:
+        if image and UPLOAD_STORAGE.exists(key):
+            UPLOAD_STORAGE.touch(key)  # Restarts the collector's grace period for the reused file
+        else:
+            UPLOAD_STORAGE.save(key, tmp.name, content_type=UPLOAD_CONTENT_TYPES[pil_format])
+    finally:
+        if os.path.exists(tmp.name):
+            os.remove(tmp.name)
+    return _record_upload(url, sha256, size)
+
+
+def presign_direct_upload(sha256, size, content_type):
+    """Where a browser can upload an image straight into remote storage.
+
+    The browser hashes the file first; the upload is stored under that
+    hash, and the storage refuses content that doesn't match it.
+
+    Returns:
+        None when storage is local (files are posted to the app instead).
+        Otherwise a dict with the ``key`` to post back with the form, plus
+        the ``url`` and ``headers`` to PUT the file with, unless the same
+        content is already stored.
+
+    Raises:
+        ValueError: if the described file can't be accepted.
+    """
+    if UPLOAD_STORAGE.is_local:
+        return None
+    extensions = {content_type: UPLOAD_FORMATS[pil_format] for pil_format, content_type in UPLOAD_CONTENT_TYPES.items()}
+    if content_type not in extensions:
+        raise ValueError('Invalid file type. Please upload PNG, JPG, JPEG, GIF, or WebP images.')
+    if not re.fullmatch(r'[0-9a-f]{64}', sha256 or ''):
+        raise ValueError('Invalid file checksum.')
+    _reject_oversized_upload(size)
+
+    image = UploadedImage.query.filter_by(sha256=sha256).first()
+    if image and UPLOAD_STORAGE.exists(upload_key(image.url)):
+        return {'key': upload_key(image.url)}
+    key = upload_key(content_url(sha256, extensions[content_type]))
+    return {'key': key, **UPLOAD_STORAGE.presigned_upload(key, content_type, sha256, size)}
+
+
+def register_direct_upload(key):
+    """Record an image a browser uploaded straight into storage and return its URL.
+
+    The object is checked as uploads through the app are (size from
+    storage, format and dimensions from its first bytes) and deleted if it
+    fails.
+
+    Raises:
+        ValueError: with a message for the user, if the key or file is not acceptable.
+    """
+    match = re.fullmatch(r'content/([0-9a-f]{2})/(\1[0-9a-f]{62})(\.[a-z]+)', key or '')
+    if not match or match.group(3) not in UPLOAD_FORMATS.values():
+        raise ValueError('Invalid upload; please choose the image again.')
+    sha256, size = match.group(2), None
+    if not UploadedImage.query.filter_by(sha256=sha256).first():
+        try:
+            size = UPLOAD_STORAGE.size(key)
+        except FileNotFoundError:
+            raise ValueError('The upload did not finish; please try again.') from None
+        try:
+            _reject_oversized_upload(size)
+            _, pil_format, _ = read_image_header(io.BytesIO(UPLOAD_STORAGE.read_head(key, HEADER_READ_LIMIT)))
+            if UPLOAD_FORMATS[pil_format] != match.group(3):
+                raise ValueError('Invalid file type. Please upload PNG, JPG, JPEG, GIF, or WebP images.')
+        except ValueError:
+            UPLOAD_STORAGE.delete(key)
+            raise
+    return _record_upload(UPLOAD_URL_PREFIX + key, sha256, size)
+
+
+def save_upload_from_request(field):
+    """Store the image posted as ``field`` and return its URL, or None if there is none.
+
+    With remote storage, browsers upload the file themselves and post its
+    storage key as ``<field>_key`` instead (see presign_upload).
+
+    Raises:
+        ValueError: with a message for the user, if the image is not acceptable.
+    """
+    key = request.form.get(f'{field}_key')
+    if key:
+        return register_direct_upload(key)
+    file = request.files.get(field)
+    if file and file.filename:
+        return save_uploaded_file(file)
     return None
 
 
+def _adjust_upload_refs(url, delta):
+    if url:
+        UploadedImage.query.filter_by(url=url).update(
+            {'ref_count': UploadedImage.ref_count + delta}, synchronize_session=False
+        )
+
+
+def retain_upload(url):
+    """Count a new reference to an upload (an event cover or carousel image)."""
+    _adjust_upload_refs(url, 1)
+
+
+def release_upload(url):
+    """Count a dropped reference; unreferenced files are removed by collect_uploads.py."""
+    _adjust_upload_refs(url, -1)
+
+
+def rebuild_upload_references() -> int:
+    """Recount every upload's references from the tables that use them.
+
+    Returns:
+        Number of uploads still referenced.
+    """
+    counts = {}
+    for column in UPLOAD_REFERENCE_COLUMNS:
+        rows = db.session.execute(
+            db.select(column, db.func.count()).where(column.isnot(None)).group_by(column)
+        ).all()
+        for url, count in rows:
+            counts[url] = counts.get(url, 0) + count
+    UploadedImage.query.update({'ref_count': 0}, synchronize_session=False)
+    for image in UploadedImage.query.filter(UploadedImage.url.in_(counts)):
+        image.ref_count = counts[image.url]
+    db.session.flush()
+    return len(counts)
+
+
+def static_file_path(url):
+    """Filesystem path for a /static/ URL, or None for any other URL."""
+    if not url or not url.startswith('/static/'):
+        return None
+    return safe_join(app.static_folder, url[len('/static/'):])
+
+
+def _rendition_key(image_id):
+    return f'{upload_key(RENDITION_URL_PREFIX)}/{image_id}'
+
+
+def process_uploaded_image(image):
+    """Write one image's renditions and mark it ready, or failed with the reason."""
+    try:
+        key = upload_key(image.url)
+        if key is None:
+            raise FileNotFoundError('original file is missing')
+        with UPLOAD_STORAGE.local_copy(key) as path, \
+                tempfile.TemporaryDirectory(dir=_staging_dir()) as output:
+            result = make_renditions(path, output)
+            for filename in sorted(os.listdir(output)):
+                UPLOAD_STORAGE.save(f'{_rendition_key(image.id)}/{filename}', os.path.join(output, filename),
+                                    content_type=mimetypes.guess_type(filename)[0])
+    except Exception as e:  # An unreadable upload fails on its own without stopping the batch
+        image.status = 'failed'
+        image.error = str(e)[:500]
+    else:
+        image.status = 'ready'
+        image.error = None
+        image.width, image.height = result['width'], result['height']
+        image.placeholder = result['placeholder']
+        image.renditions = json.dumps(result['renditions'])
+    image.processed_at = datetime.utcnow()
+    db.session.commit()
+
+
+def process_pending_images(limit=None) -> dict:
+    """Render pending uploads one at a time.
+
+    Each image is claimed with a conditional UPDATE first, so several
+    workers can run at once without rendering the same image twice.
+
+    Returns:
+        Dict with the number of images now ``ready`` and ``failed``.
+    """
+    query = db.select(UploadedImage.id).where(UploadedImage.status == 'pending').order_by(UploadedImage.id)
+    if limit:
+        query = query.limit(limit)
+    stats = {'ready': 0, 'failed': 0}
+    for image_id in db.session.execute(query).scalars().all():
+        claimed = UploadedImage.query.filter_by(id=image_id, status='pending').update({'status': 'processing'})
+        db.session.commit()
+        if not claimed:
+            continue
+        image = db.session.get(UploadedImage, image_id)
+        process_uploaded_image(image)
+        stats[image.status] += 1
+    return stats
+
+
+def backfill_uploaded_images() -> int:
+    """Queue renditions for existing covers and carousel images; returns how many were added."""
+    urls = set()
+    for column in UPLOAD_REFERENCE_COLUMNS:
+        urls.update(db.session.execute(
+            db.select(column).where(column.like(UPLOAD_URL_PREFIX + '%')).distinct()
+        ).scalars())
+    known = set(db.session.execute(db.select(UploadedImage.url)).scalars())
+    new = sorted(urls - known)
+    db.session.add_all(UploadedImage(url=url) for url in new)
+    rebuild_upload_references()
+    db.session.commit()
+    return len(new)
+
+
+def delete_uploaded_image(url):
+    """Remove an upload's renditions and record; the caller removes the original."""
+    image = UploadedImage.query.filter_by(url=url).first()
+    if image:
+        UPLOAD_STORAGE.delete_prefix(_rendition_key(image.id))
+        db.session.delete(image)
+
+
+def referenced_upload_urls() -> set:
+    """URLs of every upload an event, archived event or carousel image uses, in one query."""
+    query = db.union(*(
+        db.select(column.label('url')).where(column.like(UPLOAD_URL_PREFIX + '%'))
+        for column in UPLOAD_REFERENCE_COLUMNS
+    ))
+    return set(db.session.execute(query).scalars())
+
+
+def collect_unused_uploads(grace_period=UPLOAD_GRACE_PERIOD, dry_run=False, quarantine_dir=None,
+                           storage=None) -> dict:
+    """Remove uploaded files and records nothing refers to any more.
+
+    References are read from the database once and compared against every
+    file in ``storage`` (the upload storage by default): originals,
+    renditions and ``.part`` files left by interrupted uploads. Anything
+    modified or recorded within ``grace_period`` is kept. Renditions are
+    deleted; originals are moved into ``quarantine_dir`` instead when given.
+
+    Returns:
+        Dict with the number of ``files`` (and their ``bytes``) removed, the
+        UploadedImage ``records`` deleted, unused files kept as ``recent``,
+        and the removed ``paths`` (storage keys). With ``dry_run`` nothing is
+        changed and the counts are what would be.
+    """
+    storage = storage or UPLOAD_STORAGE
+    cutoff = datetime.utcnow() - grace_period
+    referenced = referenced_upload_urls()
+
+    unused = db.and_(UploadedImage.url.notin_(referenced), UploadedImage.ref_count <= 0,
+                     UploadedImage.created_at < cutoff)
+    if dry_run:
+        records = UploadedImage.query.filter(unused).count()
+    else:
+        # One conditional DELETE, so an upload reused since the query above keeps its record
+        records = UploadedImage.query.filter(unused).delete(synchronize_session=False)
+        db.session.commit()
+    kept = db.session.execute(db.select(UploadedImage.id, UploadedImage.url).where(db.not_(unused))).all()
+    live_urls = referenced | {url for _, url in kept}
+    rendition_prefix = RENDITION_URL_PREFIX + '/'
+    live_renditions = {f'{rendition_prefix}{image_id}/' for image_id, _ in kept}
+
+    report = {'files': 0, 'bytes': 0, 'records': records, 'recent': 0, 'paths': []}
+    cutoff_timestamp = cutoff.replace(tzinfo=timezone.utc).timestamp()
+    for key, size, modified in list(storage.list_files()):
+        url = UPLOAD_URL_PREFIX + key
+        if url.startswith(rendition_prefix):
+            if url[:url.find('/', len(rendition_prefix)) + 1] in live_renditions:
+                continue
+        elif url in live_urls:
+            continue
+        if modified > cutoff_timestamp:
+            report['recent'] += 1
+            continue
+        report['files'] += 1
+        report['bytes'] += size
+        report['paths'].append(key)
+        if dry_run:
+            continue
+        if quarantine_dir and not url.startswith(rendition_prefix):
+            target = os.path.join(quarantine_dir, *key.split('/'))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with storage.local_copy(key) as path:
+                shutil.copyfile(path, target)
+        storage.delete(key)
+    return report
+
+
+def load_ready_images(urls) -> dict:
+    """Look up the ready uploads among ``urls`` in one query, for responsive_image.
+
+    Views call this with the images a page is about to show. Results are
+    kept for the request: original URL -> UploadedImage, or None if it has
+    no renditions yet.
+    """
+    images = g.setdefault('ready_images', {})
+    wanted = {url for url in urls if url and url not in images}
+    if wanted:
+        images.update(dict.fromkeys(wanted))
+        images.update((image.url, image) for image in
+                      UploadedImage.query.filter(UploadedImage.url.in_(wanted), UploadedImage.status == 'ready'))
+    return images
+
+
+def responsive_image(url, alt, sizes, css_class='', eager=False):
+    """Markup for an uploaded image, using its renditions once they are ready.
+
+    Emits a <picture> with WebP and JPEG ``srcset``s for ``sizes``, the
+    intrinsic size and a blurred placeholder background; until then, a
+    plain <img> of the original. Images load lazily unless ``eager``.
+    """
+    loading = Markup('') if eager else Markup(' loading="lazy"')
+    # Views preload their images; anything else costs a query of its own
+    image = load_ready_images([url]).get(url)
+    if image is None:
+        return Markup('<img src="{}" alt="{}" class="{}"{} decoding="async">').format(
+            upload_url(url), alt, css_class, loading)
+
+    renditions = image.rendition_sizes
+    fallback = 'card' if 'card' in renditions else list(renditions)[-1]
+    width, height = renditions[fallback]
+
+    def srcset(extension):
+        return ', '.join(f'{upload_url(image.rendition_url(name, extension))} {size[0]}w'
+                         for name, size in renditions.items())
+
+    return Markup(
+        '<picture class="responsive-picture">'
+        '<source type="image/webp" srcset="{webp}" sizes="{sizes}">'
+        '<img src="{src}" srcset="{jpg}" sizes="{sizes}" width="{width}" height="{height}" alt="{alt}" '
+        'class="{css_class}"{loading} decoding="async" '
+        'style="background: url({placeholder}) center / cover no-repeat">'
+        '</picture>'
+    ).format(webp=srcset('webp'), jpg=srcset('jpg'), sizes=sizes, src=upload_url(image.rendition_url(fallback, 'jpg')),
+             width=width, height=height, alt=alt, css_class=css_class, loading=loading,
+             placeholder=image.placeholder)
+
+
 def send_email(to_email, subject, body, html_body=None):
     """Send email notification."""
     # Check if email is configured
@@ -916,14 +1855,170 @@ def validate_superuser_password(password):
 # Stripe payment functions removed - only credit payments are supported
 
 
-def create_notification(user_id, notification_type, title, message, payload=None):
-    """Create an in-app notification."""
+CREDIT_MINOR_UNITS = 100
+
+
+def to_minor_units(value) -> int:
+    """Convert a credit amount such as ``12.5`` or ``"12.50"`` to integer cents.
+
+    Raises:
+        ValueError: if ``value`` is not a finite number.
+    """
+    try:
+        amount = Decimal(str(value).strip())
+    except (InvalidOperation, AttributeError):
+        raise ValueError(f"Invalid credit amount: {value!r}")
+    if not amount.is_finite():
+        raise ValueError(f"Invalid credit amount: {value!r}")
+    return int((amount * CREDIT_MINOR_UNITS).quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+
+
+def from_minor_units(amount: int) -> float:
+    """Convert integer cents back to whole credits for display."""
+    return amount / CREDIT_MINOR_UNITS
+
+
+def _apply_credit_change(user_id, amount, expected_balance=None):
+    """Atomically add ``amount`` to a member's cached balance.
+
+    The guard is part of the UPDATE itself, so two concurrent debits can never
+    both pass a balance check made on a stale read.
+
+    Returns:
+        The new balance, or None if the guard rejected the change.
+    """
+    users = User.__table__
+    stmt = users.update().where(users.c.id == user_id)
+    if expected_balance is not None:
+        stmt = stmt.where(users.c.credit_balance == expected_balance)
+    if amount < 0:
+        stmt = stmt.where(users.c.credit_balance >= -amount)
+    stmt = stmt.values(credit_balance=users.c.credit_balance + amount)
+
+    bind = db.session.get_bind(mapper=User, clause=stmt)
+    if bind.dialect.update_returning:
+        new_balance = db.session.execute(stmt.returning(users.c.credit_balance)).scalar()
+    elif db.session.execute(stmt).rowcount == 1:
+        # The updated row stays locked until commit, so this read is consistent
+        new_balance = db.session.execute(
+            db.select(users.c.credit_balance).where(users.c.id == user_id)
+        ).scalar()
+    else:
+        new_balance = None
+
+    user = db.session.identity_map.get(db.inspect(User).identity_key_from_primary_key((user_id,)))
+    if user is not None:
+        db.session.expire(user, ['credit_balance'])
+    return new_balance
+
+
+def record_credit_transaction(user_id, amount, kind, note=None, rsvp_id=None,
+                              created_by_id=None, expected_balance=None):
+    """Apply a credit change and append it to the ledger.
+
+    Runs inside the caller's transaction; commit to make it permanent.
+
+    Args:
+        amount: signed change in minor units.
+        kind: topup/debit/refund/adjustment/opening.
+        expected_balance: only apply if the balance still equals this value.
+
+    Returns:
+        The CreditTransaction, or None if a debit would overdraw the balance
+        or ``expected_balance`` no longer matched.
+    """
+    new_balance = _apply_credit_change(user_id, amount, expected_balance)
+    if new_balance is None:
+        return None
+    entry = CreditTransaction(user_id=user_id, amount=amount, kind=kind, balance_after=new_balance,
+                              note=note, rsvp_id=rsvp_id, created_by_id=created_by_id)
+    db.session.add(entry)
+    return entry
+
+
+def set_credit_balance(user, new_balance, shown_balance, note=None, created_by_id=None):
+    """Record an admin adjustment that brings ``user`` to ``new_balance`` minor units.
+
+    ``shown_balance`` is the balance the admin's form was loaded with. The
+    adjustment only applies if the balance still equals it, so debits and
+    top-ups made while the form was open are never undone. Returns the
+    ledger entry, None when the admin left the balance as shown, or False
+    if the balance moved in the meantime.
+    """
+    new_balance = max(new_balance, 0)
+    if new_balance == shown_balance:
+        return None
+    entry = record_credit_transaction(user.id, new_balance - shown_balance, 'adjustment', note=note,
+                                      created_by_id=created_by_id, expected_balance=shown_balance)
+    return entry if entry is not None else False
+
+
+def bulk_top_up_credits(user_ids, amount, note=None, created_by_id=None):
+    """Credit ``amount`` minor units to many members in one transaction.
+
+    One UPDATE moves every balance and one multi-row INSERT writes the ledger,
+    all tagged with a shared ``batch_id``.
+
+    Returns:
+        The batch id, or None if no members matched.
+    """
+    if amount <= 0:
+        raise ValueError("Top-up amount must be positive")
+    user_ids = sorted(set(user_ids))
+    if not user_ids:
+        return None
+
+    users = User.__table__
+    db.session.execute(
+        users.update().where(users.c.id.in_(user_ids))
+        .values(credit_balance=users.c.credit_balance + amount)
+    )
+    balances = db.session.execute(
+        db.select(users.c.id, users.c.credit_balance).where(users.c.id.in_(user_ids))
+    ).all()
+    if not balances:
+        return None
+
+    batch_id = str(uuid.uuid4())
+    now = datetime.utcnow()
+    db.session.execute(CreditTransaction.__table__.insert(), [
+        {'user_id': user_id, 'amount': amount, 'kind': 'topup', 'balance_after': balance,
+         'batch_id': batch_id, 'note': note, 'created_by_id': created_by_id, 'created_at': now}
+        for user_id, balance in balances
+    ])
+    db.session.expire_all()
+    return batch_id
+
+
+def verify_credit_ledger():
+    """Replay the ledger and compare it with the cached balances.
+
+    Returns:
+        List of ``(user_id, cached_balance, ledger_balance)`` for every
+        member whose cached balance disagrees with the sum of their entries.
+    """
+    ledger = db.select(
+        CreditTransaction.user_id.label('user_id'),
+        db.func.sum(CreditTransaction.amount).label('total')
+    ).group_by(CreditTransaction.user_id).subquery()
+    ledger_total = db.func.coalesce(ledger.c.total, 0)
+    rows = db.session.execute(
+        db.select(User.id, User.credit_balance, ledger_total)
+        .outerjoin(ledger, ledger.c.user_id == User.id)
+        .where(User.credit_balance != ledger_total)
+    ).all()
+    return [tuple(row) for row in rows]
+
+
+def create_notification(user_id, notification_type, title, message, payload=None, event_id=None):
+    """Create an in-app notification, linked to ``event_id`` so it is archived with the event."""
     notification = Notification(
         user_id=user_id,
         type=notification_type,
         title=title,
         message=message,
-        payload=payload
+        payload=payload,
+        event_id=event_id
     )
     db.session.add(notification)
     db.session.commit()
@@ -950,7 +2045,8 @@ def create_feedback_notifications_for_event(event):
                 notification_type='feedback_request',
                 title='Event Feedback Request',
                 message=f'How was "{event.name}"? Please share your feedback to help us improve future events.',
-                payload=json.dumps(payload)
+                payload=json.dumps(payload),
+                event_id=event.id
             )
 
 
@@ -1061,18 +2157,439 @@ EventApp Team"""
             attendee.id,
             notification_type,
             subject,
-            body.split('\n\n')[1] if '\n\n' in body else body
+            body.split('\n\n')[1] if '\n\n' in body else body,
+            event_id=event.id
         )
 
 
-def generate_qr_image(code: str) -> str:
-    """Generate a QR code image as a base64 string for embedding in HTML.
+QR_TOKEN_PREFIX = 'EA1'
+
+
+def _qr_signature(event_id: int, rsvp_id: int) -> str:
+    """Return the truncated (128-bit) HMAC-SHA256 signature of a QR token."""
+    message = f"{QR_TOKEN_PREFIX}.{event_id}.{rsvp_id}".encode('utf-8')
+    digest = hmac.new(app.config['QR_SIGNING_KEY'].encode('utf-8'), message, hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest[:16]).decode('ascii').rstrip('=')
+
+
+def make_qr_token(event_id: int, rsvp_id: int) -> str:
+    """Build the signed check-in code for an RSVP.
+
+    The code carries the event and RSVP ids, so it is unique by construction
+    and a scanner can validate it without a database lookup.
+    """
+    return f"{QR_TOKEN_PREFIX}.{event_id}.{rsvp_id}.{_qr_signature(event_id, rsvp_id)}"
+
+
+def is_qr_token(code: str) -> bool:
+    """Check whether ``code`` uses the signed format (as opposed to a legacy UUID)."""
+    return code.startswith(f"{QR_TOKEN_PREFIX}.")
+
+
+def parse_qr_token(code: str):
+    """Validate a signed check-in code.
+
+    Returns:
+        ``(event_id, rsvp_id)`` if the signature matches, otherwise None.
+    """
+    parts = code.split('.')
+    if len(parts) != 4 or parts[0] != QR_TOKEN_PREFIX:
+        return None
+    try:
+        event_id, rsvp_id = int(parts[1]), int(parts[2])
+    except ValueError:
+        return None
+    if not hmac.compare_digest(parts[3], _qr_signature(event_id, rsvp_id)):
+        return None
+    return event_id, rsvp_id
+
+
+def _arrival_minute(at: datetime) -> datetime:
+    return at.replace(second=0, microsecond=0)
+
+
+def _increment_row(table, keys: dict, deltas: dict):
+    """Add ``deltas`` to the counter row matching ``keys``, creating it if needed.
+
+    A row is only created for increments; decrementing a missing row is a
+    no-op. Runs inside the caller's transaction; the caller commits.
+    """
+    where = [table.c[name] == value for name, value in keys.items()]
+    increment = table.update().where(*where).values(
+        {name: table.c[name] + delta for name, delta in deltas.items()}
+    )
+    if db.session.execute(increment).rowcount or min(deltas.values()) < 0:
+        return
+    try:
+        with db.session.begin_nested():
+            db.session.execute(table.insert().values(**keys, **deltas))
+    except IntegrityError:
+        # A concurrent writer created the row first
+        db.session.execute(increment)
+
+
+def _shift_arrival_bucket(event_id: int, checked_in_at: datetime, guests, meal, sign: int):
+    guests = guests or 0
+    _increment_row(
+        CheckInBucket.__table__,
+        {'event_id': event_id, 'minute': _arrival_minute(checked_in_at)},
+        {'arrivals': sign, 'guests': sign * guests, 'meal_arrivals': sign if meal else 0},
+    )
+
+
+def record_arrival(event_id: int, checked_in_at: datetime, guests: int = 0,
+                   meal: bool = False, sign: int = 1):
+    """Add one arrival to its minute bucket, or remove it with ``sign=-1``.
+
+    The event's daily check-in rollup moves with it. Runs inside the
+    caller's transaction; the caller commits.
+    """
+    _shift_arrival_bucket(event_id, checked_in_at, guests, meal, sign)
+    fact = [_check_in_fact(checked_in_at, guests)]
+    apply_rsvp_rollup(event_id, before=fact if sign < 0 else (), after=fact if sign > 0 else ())
+
+
+def rsvp_arrival(rsvp):
+    """Return what one RSVP adds to its arrival bucket, or None.
+
+    ``(checked_in_at, guests, meal_opt_in)`` for an accepted, checked-in
+    RSVP. ``rsvp`` is an RSVP or any row with the same column names.
+    """
+    if rsvp.status != 'Accepted' or not rsvp.checked_in or rsvp.checked_in_at is None:
+        return None
+    return rsvp.checked_in_at, rsvp.guests or 0, bool(rsvp.meal_opt_in)
+
+
+def apply_arrival(event_id: int, before, after):
+    """Replace an RSVP's arrival ``before`` with ``after`` in the minute buckets.
+
+    Both come from :func:`rsvp_arrival`. The daily check-in rollup is left
+    to :func:`apply_rsvp_rollup`. Runs inside the caller's transaction; the
+    caller commits.
+    """
+    if before == after:
+        return
+    if before is not None:
+        _shift_arrival_bucket(event_id, *before, sign=-1)
+    if after is not None:
+        _shift_arrival_bucket(event_id, *after, sign=1)
+
+
+def rebuild_arrival_buckets(event_id: int) -> int:
+    """Recompute an event's arrival buckets from its RSVPs.
+
+    Returns:
+        Number of buckets written. The caller commits.
+    """
+    rsvps = RSVP.__table__
+    rows = db.session.execute(
+        db.select(rsvps.c.status, rsvps.c.checked_in, rsvps.c.checked_in_at, rsvps.c.guests, rsvps.c.meal_opt_in)
+        .where(rsvps.c.event_id == event_id, rsvps.c.checked_in.is_(True), rsvps.c.checked_in_at.isnot(None))
+    ).all()
+    totals = {}
+    for arrival in filter(None, map(rsvp_arrival, rows)):
+        checked_in_at, guests, meal = arrival
+        bucket = totals.setdefault(_arrival_minute(checked_in_at), [0, 0, 0])
+        bucket[0] += 1
+        bucket[1] += guests
+        bucket[2] += 1 if meal else 0
+
+    CheckInBucket.query.filter_by(event_id=event_id).delete()
+    if totals:
+        db.session.execute(CheckInBucket.__table__.insert(), [
+            {'event_id': event_id, 'minute': minute, 'arrivals': arrivals,
+             'guests': guests, 'meal_arrivals': meals}
+            for minute, (arrivals, guests, meals) in sorted(totals.items())
+        ])
+    return len(totals)
+
+
+def _check_in_fact(checked_in_at: datetime, guests) -> tuple:
+    return (checked_in_at.date(), 'check_in', '', 1, guests or 0, 0)
+
+
+def rsvp_rollup_facts(rsvp) -> list:
+    """Return what one RSVP contributes to its event's daily rollups.
+
+    ``rsvp`` is an RSVP or any row with the same column names. Each fact is
+    ``(day, metric, key, count, guests, amount)``; see :class:`EventDailyStat`.
+    """
+    facts = []
+    guests = rsvp.guests or 0
+    if rsvp.created_at is not None:
+        day = rsvp.created_at.date()
+        facts.append((day, 'rsvp', rsvp.status or '', 1, guests, 0))
+        if rsvp.status == 'Accepted' and rsvp.meal_opt_in:
+            facts.append((day, 'meal', '', 1, 0, 0))
+        if rsvp.payment_status == 'paid':
+            facts.append((day, 'revenue', rsvp.payment_method or '', 1, 0,
+                          to_minor_units(rsvp.payment_amount or 0)))
+    if rsvp.cancelled_at is not None:
+        facts.append((rsvp.cancelled_at.date(), 'cancellation', '', 1, guests, 0))
+    if rsvp_arrival(rsvp) is not None:
+        facts.append(_check_in_fact(rsvp.checked_in_at, guests))
+    return facts
+
+
+def _sum_facts(signed_facts) -> dict:
+    totals = {}
+    for sign, facts in signed_facts:
+        for day, metric, key, count, guests, amount in facts:
+            total = totals.setdefault((day, metric, key), [0, 0, 0])
+            total[0] += sign * count
+            total[1] += sign * guests
+            total[2] += sign * amount
+    return totals
+
+
+def apply_rsvp_rollup(event_id: int, before=(), after=()):
+    """Replace an RSVP's rollup contribution ``before`` with ``after``.
+
+    Both are lists from :func:`rsvp_rollup_facts`; pass an empty ``before``
+    for a new RSVP. Runs inside the caller's transaction; the caller commits.
+    """
+    changes = {k: v for k, v in _sum_facts([(-1, before), (1, after)]).items() if any(v)}
+    if not changes:
+        return
+    creator_id = db.session.execute(db.select(Event.creator_id).where(Event.id == event_id)).scalar()
+    for (day, metric, key), (count, guests, amount) in changes.items():
+        _increment_row(
+            EventDailyStat.__table__,
+            {'event_id': event_id, 'creator_id': creator_id, 'day': day, 'metric': metric, 'key': key},
+            {'count': count, 'guests': guests, 'amount': amount},
+        )
+
+
+def rebuild_event_rollups(event_id: int) -> int:
+    """Recompute an event's daily rollups from its RSVPs.
+
+    An archived event is recomputed from its archived RSVPs, since its
+    rollups still count towards the organiser's totals.
+
+    Returns:
+        Number of rollup rows written. The caller commits.
+    """
+    event_model, rsvps = Event, RSVP.__table__
+    if db.session.execute(db.select(Event.id).where(Event.id == event_id)).scalar() is None:
+        event_model, rsvps = ArchivedEvent, ArchivedRSVP.__table__
+    rows = db.session.execute(db.select(rsvps).where(rsvps.c.event_id == event_id)).all()
+    totals = _sum_facts((1, rsvp_rollup_facts(row)) for row in rows)
+
+    EventDailyStat.query.filter_by(event_id=event_id).delete()
+    if totals:
+        creator_id = db.session.execute(
+            db.select(event_model.creator_id).where(event_model.id == event_id)
+        ).scalar()
+        db.session.execute(EventDailyStat.__table__.insert(), [
+            {'event_id': event_id, 'creator_id': creator_id, 'day': day, 'metric': metric, 'key': key,
+             'count': count, 'guests': guests, 'amount': amount}
+            for (day, metric, key), (count, guests, amount) in sorted(totals.items())
+        ])
+    return len(totals)
+
+
+ENGAGEMENT_SETTING = 'engagement_settled_until'
+# Events count towards no-shows this long after they end, so late kiosk syncs land first
+ENGAGEMENT_SETTLE_AFTER = timedelta(hours=12)
+ENGAGEMENT_FIELDS = ('accepted', 'attended', 'no_shows', 'credits_spent')
+
+
+def engagement_settled_until():
+    """Return the end time up to which events have been settled, or None."""
+    value = AppSettings.get_setting(ENGAGEMENT_SETTING)
+    return datetime.fromisoformat(value) if value else None
+
+
+def _is_settled(finished_at, until) -> bool:
+    return until is not None and finished_at is not None and finished_at <= until
+
+
+def _event_settled(event_id: int) -> bool:
+    finished_at = db.session.execute(
+        db.select(db.func.coalesce(Event.end_date, Event.start_date)).where(Event.id == event_id)
+    ).scalar()
+    return _is_settled(finished_at, engagement_settled_until())
+
+
+def member_engagement_facts(rsvp, settled: bool, checked_in=None) -> tuple:
+    """Return what one RSVP adds to its member's totals, in ``ENGAGEMENT_FIELDS`` order.
+
+    ``rsvp`` is an RSVP or any row with the same column names; ``checked_in``
+    overrides its check-in state, to describe the RSVP just before a check-in.
+    """
+    accepted = rsvp.status == 'Accepted'
+    attended = bool(rsvp.checked_in if checked_in is None else checked_in)
+    credits = 0
+    if rsvp.payment_method == 'credit' and rsvp.payment_status == 'paid':
+        credits = to_minor_units(rsvp.payment_amount or 0)
+    return (int(accepted), int(attended), int(settled and accepted and not attended), credits)
+
+
+def apply_member_engagement(user_id: int, before, after, at=None):
+    """Replace an RSVP's contribution ``before`` with ``after`` in a member's totals.
+
+    Both come from :func:`member_engagement_facts`; pass None as ``before``
+    for a new RSVP. Runs inside the caller's transaction; the caller commits.
+    """
+    before = before or (0,) * len(ENGAGEMENT_FIELDS)
+    _increment_row(MemberEngagement.__table__, {'user_id': user_id},
+                   {name: new - old for name, old, new in zip(ENGAGEMENT_FIELDS, before, after)})
+    at = at or datetime.utcnow()
+    engagement = MemberEngagement.__table__
+    db.session.execute(
+        engagement.update()
+        .where(engagement.c.user_id == user_id,
+               db.or_(engagement.c.last_activity_at.is_(None), engagement.c.last_activity_at < at))
+        .values(last_activity_at=at)
+    )
+
+
+def record_member_check_in(rsvp_id: int, checked_in_at: datetime):
+    """Count an RSVP's first check-in towards its member's engagement.
+
+    Runs inside the caller's transaction, after the check-in was written.
+    """
+    rsvps = RSVP.__table__
+    row = db.session.execute(db.select(rsvps).where(rsvps.c.id == rsvp_id)).one()
+    settled = _event_settled(row.event_id)
+    apply_member_engagement(row.user_id, member_engagement_facts(row, settled, checked_in=False),
+                            member_engagement_facts(row, settled), at=checked_in_at)
+
+
+def settle_engagement(now=None) -> int:
+    """Add no-shows for events that ended since the previous settlement.
+
+    Only the RSVPs of the newly finished events are read. Commits.
+
+    Returns:
+        Number of no-shows added.
+    """
+    now = now or datetime.utcnow()
+    until = now - ENGAGEMENT_SETTLE_AFTER
+    since = engagement_settled_until()
+    if since is not None and since >= until:
+        return 0
+
+    rsvps = RSVP.__table__
+    finished = db.func.coalesce(Event.end_date, Event.start_date)
+    conditions = [finished <= until, rsvps.c.status == 'Accepted', rsvps.c.checked_in.isnot(True)]
+    if since is not None:
+        conditions.append(finished > since)
+    rows = db.session.execute(
+        db.select(rsvps.c.user_id, db.func.count())
+        .join(Event, Event.id == rsvps.c.event_id)
+        .where(*conditions)
+        .group_by(rsvps.c.user_id)
+    ).all()
+    for user_id, count in rows:
+        _increment_row(MemberEngagement.__table__, {'user_id': user_id}, {'no_shows': count})
+    # Commits the no-shows together with the new watermark
+    AppSettings.set_setting(ENGAGEMENT_SETTING, until.isoformat(),
+                            'Events that ended before this time count towards member no-shows')
+    return sum(count for _, count in rows)
+
+
+def rebuild_member_engagement(user_id=None) -> int:
+    """Recompute engagement totals from the RSVPs, archived ones included.
+
+    Rebuilds every member, or just ``user_id``.
+
+    Returns:
+        Number of members written. The caller commits.
+    """
+    until = engagement_settled_until()
+    totals = {}
+    for rsvp_model, event_model in ((RSVP, Event), (ArchivedRSVP, ArchivedEvent)):
+        rsvps, events = rsvp_model.__table__, event_model.__table__
+        query = (
+            db.select(rsvps.c.user_id, rsvps.c.status, rsvps.c.checked_in, rsvps.c.checked_in_at,
+                      rsvps.c.payment_method, rsvps.c.payment_status, rsvps.c.payment_amount,
+                      rsvps.c.updated_at,
+                      db.func.coalesce(events.c.end_date, events.c.start_date).label('finished_at'))
+            .join(events, events.c.id == rsvps.c.event_id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        if user_id is not None:
+            query = query.where(rsvps.c.user_id == user_id)
+        for row in db.session.execute(query):
+            total = totals.setdefault(row.user_id, [0] * len(ENGAGEMENT_FIELDS) + [None])
+            facts = member_engagement_facts(row, _is_settled(row.finished_at, until))
+            for i, value in enumerate(facts):
+                total[i] += value
+            last = max(filter(None, (row.updated_at, row.checked_in_at)), default=None)
+            if last is not None and (total[-1] is None or last > total[-1]):
+                total[-1] = last
+
+    engagement = MemberEngagement.__table__
+    delete = engagement.delete()
+    if user_id is not None:
+        delete = delete.where(engagement.c.user_id == user_id)
+    db.session.execute(delete)
+    if totals:
+        db.session.execute(engagement.insert(), [
+            dict(zip(ENGAGEMENT_FIELDS, total), user_id=member_id, last_activity_at=total[-1])
+            for member_id, total in sorted(totals.items())
+        ])
+    return len(totals)
+
+
+def grade_suggestions() -> list:
+    """Return ``(member, suggested grade)`` for every suggested grade change.
+
+    Reads the stored engagement totals only, never the RSVPs.
+    """
+    engagements = MemberEngagement.query.options(db.joinedload(MemberEngagement.user)) \
+        .order_by(MemberEngagement.user_id).all()
+    return [(e.user, e.suggested_change) for e in engagements if e.suggested_change]
+
+
+def check_in_rsvp(rsvp_id: int, code: str):
+    """Record a check-in with a single conditional UPDATE.
+
+    The update only matches while the RSVP still holds ``code`` (declining
+    clears it) and is not yet checked in, so repeated scans are harmless.
+
+    Returns:
+        ``(rsvp, checked_in_now)``; ``rsvp`` is None if the code was revoked.
+    """
+    rsvps = RSVP.__table__
+    now = datetime.utcnow()
+    result = db.session.execute(
+        rsvps.update()
+        .where(rsvps.c.id == rsvp_id, rsvps.c.qr_code == code, rsvps.c.checked_in.isnot(True))
+        .values(checked_in=True, checked_in_at=now)
+    )
+    if result.rowcount == 1:
+        row = db.session.execute(
+            db.select(rsvps.c.event_id, rsvps.c.guests, rsvps.c.meal_opt_in).where(rsvps.c.id == rsvp_id)
+        ).one()
+        record_arrival(row.event_id, now, row.guests, row.meal_opt_in)
+        record_member_check_in(rsvp_id, now)
+    db.session.commit()
+    rsvp = db.session.get(RSVP, rsvp_id)
+    if rsvp is None or rsvp.qr_code != code:
+        return None, False
+    return rsvp, result.rowcount == 1
+
+
+# Bump when the QR rendering settings change so cached images and ETags are replaced
+QR_RENDER_VERSION = 1
+QR_MEMORY_CACHE_SIZE = 512
+
+
+def qr_etag(code: str) -> str:
+    """Return the strong ETag (and cache file stem) for a QR code image."""
+    return hashlib.sha256(f"{QR_RENDER_VERSION}:{code}".encode('utf-8')).hexdigest()[:32]
+
+
+def render_qr_png(code: str) -> bytes:
+    """Render a QR code as PNG bytes.
 
     Args:
         code: Unique code to encode in the QR image.
 
     Returns:
-        Base64 encoded PNG image string.
+        PNG image bytes.
     """
     qr = qrcode.QRCode(version=1, box_size=10, border=4)
     qr.add_data(code)
@@ -1080,8 +2597,124 @@ def generate_qr_image(code: str) -> str:
     img = qr.make_image(fill_color='black', back_color='white')
     buffer = io.BytesIO()
     img.save(buffer, format='PNG')
-    img_b64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-    return img_b64
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=QR_MEMORY_CACHE_SIZE)
+def get_qr_png(code: str) -> bytes:
+    """Return the PNG for ``code`` from memory, then disk, rendering it only once.
+
+    Rendered images are written to ``QR_CACHE_FOLDER`` atomically so every
+    worker process shares them.
+    """
+    path = os.path.join(app.config['QR_CACHE_FOLDER'], f"{qr_etag(code)}.png")
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+
+    png = render_qr_png(code)
+    try:
+        os.makedirs(app.config['QR_CACHE_FOLDER'], exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(png)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️  Could not cache QR image: {e}")
+    return png
+
+
+def _move_rows(source_model, target_model, condition, archived_at=None):
+    """Copy rows matching ``condition`` from one table to another, then delete them.
+
+    Uses INSERT ... SELECT and DELETE so rows never pass through Python.
+    Runs inside the caller's transaction.
+
+    Returns:
+        Number of rows moved.
+    """
+    source = source_model.__table__
+    target = target_model.__table__
+    names = [col.name for col in source.columns if col.name in target.c]
+    columns = [source.c[name] for name in names]
+    if archived_at is not None:
+        names.append('archived_at')
+        columns.append(db.literal(archived_at, db.DateTime))
+    db.session.execute(target.insert().from_select(names, db.select(*columns).where(condition)))
+    return db.session.execute(source.delete().where(condition)).rowcount
+
+
+def archive_completed_events(months=12, batch_size=100, now=None):
+    """Move events that finished more than ``months`` ago out of the hot tables.
+
+    Each batch of events moves together with its RSVPs, notifications,
+    feedback, invitations and feedback forms in one transaction. Daily
+    rollups are kept, so organiser analytics still count archived events.
+    Read notifications older than the cutoff are archived as well.
+
+    Returns:
+        Dict of moved row counts keyed by hot table name.
+    """
+    now = now or datetime.utcnow()
+    cutoff = now - timedelta(days=30 * months)
+    moved = {'event': 0, 'notification': 0}
+
+    finished = db.func.coalesce(Event.end_date, Event.start_date) < cutoff
+    while True:
+        event_ids = db.session.execute(
+            db.select(Event.id).where(finished).order_by(Event.id).limit(batch_size)
+        ).scalars().all()
+        if not event_ids:
+            break
+        for hot, archive in EVENT_ARCHIVE_CHILDREN:
+            count = _move_rows(hot, archive, hot.__table__.c.event_id.in_(event_ids), now)
+            moved[hot.__tablename__] = moved.get(hot.__tablename__, 0) + count
+        # Arrival buckets are derived data; unarchive_event rebuilds them
+        CheckInBucket.query.filter(CheckInBucket.event_id.in_(event_ids)).delete(synchronize_session=False)
+        moved['event'] += _move_rows(Event, ArchivedEvent, Event.__table__.c.id.in_(event_ids), now)
+        bump_home_page_generation()
+        queue_snapshots(event_ids)
+        db.session.commit()
+
+    notifications = Notification.__table__
+    moved['notification'] += _move_rows(
+        Notification, ArchivedNotification,
+        db.and_(notifications.c.read_at.isnot(None), notifications.c.created_at < cutoff),
+        now
+    )
+    db.session.commit()
+    return moved
+
+
+def unarchive_event(event_id):
+    """Move an archived event and its related rows back into the hot tables.
+
+    Returns:
+        True if the event was found in the archive and restored.
+    """
+    if db.session.get(ArchivedEvent, event_id) is None:
+        return False
+    _move_rows(ArchivedEvent, Event, ArchivedEvent.__table__.c.id == event_id)
+    for hot, archive in reversed(EVENT_ARCHIVE_CHILDREN):
+        _move_rows(archive, hot, archive.__table__.c.event_id == event_id)
+    rebuild_arrival_buckets(event_id)
+    rebuild_event_rollups(event_id)
+    bump_home_page_generation()
+    queue_snapshots([event_id])
+    db.session.commit()
+    return True
+
+
+def get_event_or_archived_or_404(event_id):
+    """Return the event from the hot table, falling back to the archive."""
+    event = db.session.get(Event, event_id)
+    if event is None:
+        event = db.session.get(ArchivedEvent, event_id)
+    if event is None:
+        abort(404)
+    return event
 
 
 def create_tables():
@@ -1101,9 +2734,147 @@ def create_tables():
 
 # Create tables when app starts
 with app.app_context():
+    if app.config['SQLITE_WAL']:
+        enable_sqlite_wal(db.engine)
     create_tables()
 
 
+@contextmanager
+def reporting_reads():
+    """Route ORM reads in this block to the read-only reporting database."""
+    previous = g.get('use_reporting_db', False)
+    g.use_reporting_db = True
+    try:
+        yield
+    finally:
+        g.use_reporting_db = previous
+
+
+def reporting_view(view):
+    """Decorator for heavy read-only views and exports.
+
+    Their scans run on the reporting bind so they never hold locks on the
+    database that RSVP and check-in writes use.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        with reporting_reads():
+            return view(*args, **kwargs)
+    return wrapper
+
+
+# Rows fetched per round trip by exports, and written per response chunk
+EXPORT_BATCH_SIZE = 500
+
+
+def attachment_disposition(filename: str) -> str:
+    """Content-Disposition for a download, with an RFC 5987 UTF-8 filename."""
+    ascii_fallback = re.sub(r'[^A-Za-z0-9._-]+', '_', filename)
+    return f"attachment; filename=\"{ascii_fallback}\"; filename*=UTF-8''{url_quote(filename)}"
+
+
+class _EchoWriter:
+    """File-like object for csv.writer that hands each formatted line back."""
+
+    def write(self, value):
+        return value
+
+
+def csv_response(filename: str, header, rows):
+    """Stream a CSV download (UTF-8 with BOM, for Excel).
+
+    ``rows`` should be lazy, such as a generator over a ``yield_per`` query:
+    it is only consumed while the response is sent, so memory stays flat
+    and the header goes out before the first row is fetched. Reads keep the
+    reporting bind when called from a :func:`reporting_view`.
+    """
+    use_reporting_db = g.get('use_reporting_db', False)
+
+    def generate():
+        writer = csv.writer(_EchoWriter())
+        yield ('\ufeff' + writer.writerow(header)).encode('utf-8')
+        g.use_reporting_db = use_reporting_db
+        lines = []
+        for row in rows:
+            lines.append(writer.writerow(row))
+            if len(lines) >= EXPORT_BATCH_SIZE:
+                yield ''.join(lines).encode('utf-8')
+                lines = []
+        if lines:
+            yield ''.join(lines).encode('utf-8')
+
+    return Response(stream_with_context(generate()), mimetype='text/csv; charset=utf-8',
+                    headers={'Content-Disposition': attachment_disposition(filename)})
+
+
+# Tables in the analytics dump, with the columns left out of it
+ANALYTICS_EXPORT_TABLES = {
+    'user': ('password_hash', 'email_verification_token', 'password_reset_token'),
+    'event': (),
+    'rsvp': (),
+    'feedback': (),
+    'notification': (),
+}
+# Incremental dumps reach back this far before the previous watermark, so
+# rows whose transaction committed while that dump ran are not missed.
+# Consumers upsert rows by (table, id).
+ANALYTICS_WATERMARK_OVERLAP = timedelta(minutes=5)
+
+
+def _dump_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat() + 'Z'
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Cannot serialise {type(value).__name__}")
+
+
+def iter_analytics_dump(since=None, tables=None):
+    """Yield an NDJSON dump of the analytics tables, one line at a time.
+
+    All tables are read from the reporting bind in a single snapshot, so the
+    dump is consistent across tables. With ``since`` only rows whose
+    ``updated_at`` is at or after it (less ``ANALYTICS_WATERMARK_OVERLAP``)
+    are included.
+
+    Lines are ``{"type": "header", ...}``, then one ``{"type": "row",
+    "table": ..., "data": {...}}`` per row, then ``{"type": "footer",
+    "counts": {...}, "watermark": ...}``. Pass the footer's watermark as
+    ``since`` next time; a dump without a footer did not finish. Deleted
+    and archived rows only disappear from full dumps.
+
+    Raises:
+        ValueError: if ``tables`` names a table that is not exported.
+    """
+    tables = list(tables or ANALYTICS_EXPORT_TABLES)
+    unknown = sorted(set(tables) - set(ANALYTICS_EXPORT_TABLES))
+    if unknown:
+        raise ValueError(f"Unknown tables: {', '.join(unknown)}")
+
+    def line(record):
+        return json.dumps(record, default=_dump_value, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+    yield line({'type': 'header', 'version': 1, 'tables': tables, 'since': since,
+                'generated_at': datetime.utcnow()})
+    counts = {}
+    watermark = since
+    with snapshot_connection(db.engines['reporting']) as conn:
+        for name in tables:
+            table = db.metadata.tables[name]
+            columns = [col for col in table.columns if col.name not in ANALYTICS_EXPORT_TABLES[name]]
+            query = db.select(*columns).order_by(table.c.id)
+            if since is not None:
+                query = query.where(table.c.updated_at >= since - ANALYTICS_WATERMARK_OVERLAP)
+            counts[name] = 0
+            for row in conn.execution_options(yield_per=EXPORT_BATCH_SIZE).execute(query):
+                data = row._mapping
+                if data['updated_at'] is not None and (watermark is None or data['updated_at'] > watermark):
+                    watermark = data['updated_at']
+                counts[name] += 1
+                yield line({'type': 'row', 'table': name, 'data': dict(data)})
+    yield line({'type': 'footer', 'counts': counts, 'watermark': watermark})
+
+
 @app.before_request
 def check_email_verification():
     """Check if logged-in user has verified their email."""
@@ -1137,19 +2908,314 @@ def check_email_verification():
         return redirect(url_for('change_password'))
 
 
+HOME_PAGE_GENERATION_KEY = 'home_page_generation'
+# What the public pages show: model -> columns whose changes alter them (None for any).
+# Users and uploads only appear through an event, so adding one doesn't change a page.
+HOME_PAGE_SOURCES = {
+    Event: None,
+    CarouselImage: None,
+    RSVP: ('event_id', 'status', 'guests'),
+    User: ('username', 'first_name', 'last_name', 'privacy_show_full_name'),
+    UploadedImage: ('url', 'status', 'width', 'height', 'placeholder', 'renditions'),
+}
+HOME_PAGE_INSERTS = (Event, CarouselImage, RSVP)
+
+# Locale -> rendered anonymous home page, valid while its generation is current
+_home_page_cache = {}
+
+
+def _pages_showing(connection, obj) -> set:
+    """Public pages that show an object: event ids for event summaries, None for the home page."""
+    if isinstance(obj, Event):
+        return {None, obj.id}
+    if isinstance(obj, RSVP):
+        return {None, obj.event_id}
+    if isinstance(obj, User):
+        column, value = Event.creator_id, obj.id
+    elif isinstance(obj, UploadedImage):
+        column, value = Event.cover_image_url, obj.url
+    else:
+        return {None}
+    return {None, *connection.execute(db.select(Event.id).where(column == value)).scalars()}
+
+
+def _changed_pages(session) -> set:
+    """Public pages changed by the objects a session is flushing (see _pages_showing)."""
+    changed = [obj for obj in session.new if isinstance(obj, HOME_PAGE_INSERTS)]
+    changed += [obj for obj in session.deleted if type(obj) in HOME_PAGE_SOURCES]
+    for obj in session.dirty:
+        if type(obj) not in HOME_PAGE_SOURCES:
+            continue
+        columns = HOME_PAGE_SOURCES[type(obj)]
+        if columns is None:
+            if session.is_modified(obj, include_collections=False):
+                changed.append(obj)
+        else:
+            state = db.inspect(obj)
+            if any(state.attrs[name].history.has_changes() for name in columns):
+                changed.append(obj)
+    if not changed:
+        return set()
+    connection = session.connection()
+    return set().union(*(_pages_showing(connection, obj) for obj in changed))
+
+
+def bump_home_page_generation(connection=None):
+    """Invalidate the cached home page in every worker.
+
+    The generation lives in AppSettings and is bumped inside the writer's
+    transaction, so it rolls back with the write. ORM changes bump it
+    automatically on flush; call this after bulk statements that bypass the
+    ORM. Runs inside the caller's transaction.
+    """
+    connection = connection or db.session
+    settings = AppSettings.__table__
+    now = datetime.utcnow()
+    bumped = connection.execute(
+        settings.update().where(settings.c.key == HOME_PAGE_GENERATION_KEY)
+        .values(value=db.cast(db.cast(settings.c.value, db.Integer) + 1, db.String), updated_at=now)
+    ).rowcount
+    if not bumped:
+        connection.execute(settings.insert().values(
+            key=HOME_PAGE_GENERATION_KEY, value='1', updated_at=now,
+            description='Bumped whenever the public home page changes'))
+
+
+def queue_snapshots(event_ids=(), home=True, connection=None):
+    """Mark static snapshots for re-rendering by write_snapshots.py.
+
+    Does nothing unless ``STATIC_SNAPSHOTS`` is enabled. Call this after bulk
+    statements that bypass the ORM. Runs inside the caller's transaction.
+    """
+    if not app.config['STATIC_SNAPSHOTS']:
+        return
+    rows = [{'event_id': event_id} for event_id in sorted(set(event_ids))]
+    if home:
+        rows.append({'event_id': None})
+    if rows:
+        (connection or db.session).execute(StaleSnapshot.__table__.insert(), rows)
+
+
+@db.event.listens_for(RoutingSession, 'after_flush')
+def _public_pages_changed(session, flush_context):
+    # History is still available here; it is reset once the flush completes
+    pages = _changed_pages(session)
+    if pages:
+        connection = session.connection()
+        bump_home_page_generation(connection)
+        queue_snapshots(pages - {None}, home=None in pages, connection=connection)
+
+
+def home_page_generation() -> tuple:
+    """The current (generation, time it was last bumped)."""
+    settings = AppSettings.__table__
+    row = db.session.execute(
+        db.select(settings.c.value, settings.c.updated_at).where(settings.c.key == HOME_PAGE_GENERATION_KEY)
+    ).first()
+    return (row.value, row.updated_at) if row else ('0', None)
+
+
+def _render_home_page(generation, changed_at, now) -> dict:
+    """Render the anonymous home page and note how long it stays correct."""
+    events = Event.query.filter(Event.status != 'cancelled').order_by(Event.start_date.desc()).all()
+    load_ready_images(event.cover_image_url for event in events)
+    # Anonymous visitors see no carousel
+    body = render_template('index.html', events=events, carousel_images=[], current_time=now).encode('utf-8')
+
+    # Events flip from upcoming to past on their own, without a write
+    started = [event.start_date for event in events if event.start_date <= now]
+    upcoming = [event.start_date for event in events if event.start_date > now]
+    changed = [moment for moment in [changed_at, max(started, default=None)] if moment]
+    expires = min(upcoming, default=None)
+    if not UPLOAD_STORAGE.is_local:
+        # Presigned upload URLs are re-signed at the start of each UTC day
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        changed.append(midnight)
+        expires = min(filter(None, [expires, midnight + timedelta(days=1)]))
+    return {
+        'generation': generation,
+        'expires': expires,
+        'body': body,
+        'etag': hashlib.sha256(body).hexdigest()[:32],
+        'last_modified': max(changed, default=None),
+    }
+
+
+def cached_home_page():
+    """The home page for anonymous visitors, from the cache when it is current.
+
+    Answers conditional requests with 304 from the ETag or Last-Modified.
+    """
+    locale = get_current_language()
+    now = datetime.utcnow()
+    generation, changed_at = home_page_generation()
+    entry = _home_page_cache.get(locale)
+    if entry is None or entry['generation'] != generation or (entry['expires'] and entry['expires'] <= now):
+        # A burst of visitors right after a change renders the page once
+        entry = SINGLE_FLIGHT.do(('home_page', locale, generation),
+                                 lambda: _render_home_page(generation, changed_at, now))
+        _home_page_cache[locale] = entry
+
+    response = app.response_class(entry['body'], mimetype='text/html')
+    response.set_etag(entry['etag'])
+    if entry['last_modified']:
+        response.last_modified = entry['last_modified']
+    # Browsers may keep the page but must check it is still current
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
 @app.route('/')
 def index():
     """Home page showing events sorted by latest first."""
-    from datetime import datetime
+    # Flashed messages are rendered into the page, so those visits are never cached
+    if not current_user.is_authenticated and '_flashes' not in session:
+        return cached_home_page()
     events = Event.query.filter(Event.status != 'cancelled').order_by(Event.start_date.desc()).all()
     carousel_images = CarouselImage.query.filter(CarouselImage.is_active == True).order_by(CarouselImage.order.asc()).all()
+    load_ready_images([event.cover_image_url for event in events] + [image.image_url for image in carousel_images])
     return render_template('index.html', events=events, carousel_images=carousel_images, current_time=datetime.utcnow())
 
+
+def is_public_event(event) -> bool:
+    """Whether an event has a public summary page (and snapshot)."""
+    return event is not None and event.status != 'cancelled' and (event.visibility or 'public') == 'public'
+
+
+@app.route('/events/<int:event_id>.html')
+def event_summary(event_id):
+    """Shareable summary of a public event; RSVPs still go through event_detail."""
+    event = db.session.get(Event, event_id)
+    if not is_public_event(event):
+        abort(404)
+    load_ready_images([event.cover_image_url])
+    return render_template('event_summary.html', event=event)
+
+
+SNAPSHOTS_RENDERED_KEY = 'snapshots_rendered_at'
+SNAPSHOTS_ASSETS_KEY = 'snapshots_asset_manifest'
+
+
+def snapshot_path(locale, event_id=None) -> str:
+    """File the snapshot of the home page, or of an event's summary, is written to."""
+    if event_id is None:
+        return os.path.join(app.config['SNAPSHOT_FOLDER'], locale, 'index.html')
+    return os.path.join(app.config['SNAPSHOT_FOLDER'], locale, 'events', f'{event_id}.html')
+
+
+def _write_atomically(path, data):
+    """Write through a temporary file and a rename, so readers never see half a page."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _render_snapshot(locale, event_id=None):
+    """Render a public page as a signed-out visitor would see it; None if the event isn't public."""
+    path = '/' if event_id is None else f'/events/{event_id}.html'
+    # A fresh app context keeps the language and login state out of the caller's g
+    with app.app_context(), app.test_request_context(path):
+        g.language = locale
+        if event_id is None:
+            generation, changed_at = home_page_generation()
+            return _render_home_page(generation, changed_at, datetime.utcnow())['body']
+        event = db.session.get(Event, event_id)
+        if not is_public_event(event):
+            return None
+        load_ready_images([event.cover_image_url])
+        return render_template('event_summary.html', event=event).encode('utf-8')
+
+
+def write_snapshot(event_id=None) -> bool:
+    """Write one public page in every language, or remove it if the event is no longer public.
+
+    Returns:
+        True if the page was written, False if it was removed.
+    """
+    for locale in SUPPORTED_LANGUAGES:
+        body = _render_snapshot(locale, event_id)
+        path = snapshot_path(locale, event_id)
+        if body is not None:
+            _write_atomically(path, body)
+        elif os.path.exists(path):
+            os.remove(path)
+    return body is not None
+
+
+def _snapshot_event_ids() -> set:
+    """Ids of the events that currently have a snapshot file."""
+    event_ids = set()
+    for locale in SUPPORTED_LANGUAGES:
+        directory = os.path.dirname(snapshot_path(locale, 0))
+        if os.path.isdir(directory):
+            event_ids.update(int(name[:-5]) for name in os.listdir(directory)
+                             if name.endswith('.html') and name[:-5].isdigit())
+    return event_ids
+
+
+def write_snapshots(rebuild=False, now=None) -> dict:
+    """Bring the static snapshots up to date.
+
+    Only the pages queued by changes since the last run are rendered, plus
+    those of events that have started since (they now show as past). The
+    first run, ``rebuild``, the first run after build_assets.py changed the
+    bundles (pages link to their hashed names, and old bundles are deleted)
+    and, with presigned upload URLs, the first run of each UTC day render
+    every page and drop snapshots of events that are no longer public.
+
+    Returns:
+        Dict with the number of pages ``written`` and ``removed``.
+    """
+    now = now or datetime.utcnow()
+    queued = db.session.execute(db.select(StaleSnapshot.id, StaleSnapshot.event_id)).all()
+    last_run = AppSettings.get_setting(SNAPSHOTS_RENDERED_KEY)
+    last_run = datetime.fromisoformat(last_run) if last_run else None
+    if last_run is None or (not UPLOAD_STORAGE.is_local and last_run.date() != now.date()):
+        rebuild = True
+    manifest = load_manifest(app.static_folder)
+    if manifest != ASSET_MANIFEST:
+        # Assets were rebuilt since this process started (e.g. a --watch loop)
+        ASSET_MANIFEST.clear()
+        ASSET_MANIFEST.update(manifest)
+    assets_version = content_hash(json.dumps(manifest, sort_keys=True).encode('utf-8'))
+    if AppSettings.get_setting(SNAPSHOTS_ASSETS_KEY) != assets_version:
+        rebuild = True
+
+    if rebuild:
+        public = db.session.execute(
+            db.select(Event.id).where(Event.status != 'cancelled',
+                                      db.func.coalesce(Event.visibility, 'public') == 'public')
+        ).scalars()
+        pages = {None, *public, *_snapshot_event_ids()}
+    else:
+        pages = {event_id for _, event_id in queued}
+        started = db.session.execute(
+            db.select(Event.id).where(Event.start_date > last_run, Event.start_date <= now)
+        ).scalars().all()
+        if started:
+            pages.update({None, *started})
+
+    stats = {'written': 0, 'removed': 0}
+    for event_id in sorted(pages, key=lambda page: -1 if page is None else page):
+        stats['written' if write_snapshot(event_id) else 'removed'] += 1
+    if queued:
+        db.session.execute(StaleSnapshot.__table__.delete().where(
+            StaleSnapshot.id <= max(row.id for row in queued)))
+    AppSettings.set_setting(SNAPSHOTS_ASSETS_KEY, assets_version,
+                            'Fingerprint of the asset manifest the static pages link to')
+    AppSettings.set_setting(SNAPSHOTS_RENDERED_KEY, now.isoformat(),
+                            'When write_snapshots.py last brought the static pages up to date')
+    return stats
+
+
 @app.route('/set_language/<language>')
 def set_language(language):
     """Set the language preference."""
     if language in SUPPORTED_LANGUAGES:
         session['language'] = language
+        g.pop('language', None)
         # Update user's locale preference if logged in
         if current_user.is_authenticated:
             current_user.locale = language
@@ -1489,14 +3555,11 @@ def create_event():
         rsvp_deadline_str = request.form.get('rsvp_deadline')  # optional
         
         # Handle image upload
-        cover_image_url = None
-        if 'cover_image' in request.files:
-            file = request.files['cover_image']
-            if file.filename:  # If file is selected
-                cover_image_url = save_uploaded_file(file)
-                if not cover_image_url:
-                    flash('Invalid file type. Please upload PNG, JPG, JPEG, GIF, or WebP images.', 'danger')
-                    return redirect(url_for('create_event'))
+        try:
+            cover_image_url = save_upload_from_request('cover_image')
+        except ValueError as e:
+            flash(str(e), 'danger')
+            return redirect(url_for('create_event'))
         
         try:
             event_datetime = datetime.strptime(f"{date_str} {time_str}", '%Y-%m-%d %H:%M')
@@ -1564,13 +3627,21 @@ def create_event():
 @login_required
 def event_detail(event_id):
     """View event details and handle RSVP responses."""
-    event = Event.query.get_or_404(event_id)
+    event = get_event_or_archived_or_404(event_id)
     
     # Check if event is cancelled
     if event.status == 'cancelled':
         flash('This event has been cancelled and is no longer available.', 'warning')
         return redirect(url_for('index'))
     
+    # Archived events are read-only
+    if event.is_archived:
+        if request.method == 'POST':
+            flash('This event has been archived and no longer accepts RSVPs.', 'warning')
+            return redirect(url_for('event_detail', event_id=event.id))
+        rsvp = ArchivedRSVP.query.filter_by(event_id=event.id, user_id=current_user.id).first()
+        return render_template('event_detail.html', event=event, rsvp=rsvp)
+    
     rsvp = RSVP.query.filter_by(event_id=event.id, user_id=current_user.id).first()
     if request.method == 'POST':
         # Handle RSVP submission with integrated payment
@@ -1593,15 +3664,30 @@ def event_detail(event_id):
             flash('Event capacity reached. You can no longer accept.', 'danger')
             return redirect(url_for('event_detail', event_id=event.id))
         
+        settled = _is_settled(event.end_date or event.start_date, engagement_settled_until())
         if rsvp is None:
             rsvp = RSVP(event_id=event.id, user_id=current_user.id)
             db.session.add(rsvp)
+        rollup_before = rsvp_rollup_facts(rsvp)
+        arrival_before = rsvp_arrival(rsvp)
+        engagement_before = member_engagement_facts(rsvp, settled)
+        was_accepted = rsvp.status == 'Accepted'
+        
+        # Credits already paid for this RSVP (minor units), refunded or topped up below
+        credit_paid = 0
+        if rsvp.payment_method == 'credit' and rsvp.payment_status == 'paid':
+            credit_paid = to_minor_units(rsvp.payment_amount or 0)
         
         # Update RSVP details
         rsvp.status = status
         rsvp.guests = guests_int
+        if status == 'Accepted':
+            rsvp.cancelled_at = None
+        elif was_accepted:
+            rsvp.cancelled_at = datetime.utcnow()
         # Meal opt-in
         rsvp.meal_opt_in = request.form.get('meal_opt_in') == 'on'
+        db.session.flush()
         
         # Handle payment for accepted RSVPs
         if status == 'Accepted':
@@ -1616,53 +3702,92 @@ def event_detail(event_id):
                     return redirect(url_for('event_detail', event_id=event.id))
                 
                 if payment_method == 'credit':
-                    # Check if user has sufficient credits
-                    if (current_user.credit_point or 0) < total_cost:
-                        flash('Insufficient credits. You need {:.2f} more credits.'.format(total_cost - (current_user.credit_point or 0)), 'danger')
-                        return redirect(url_for('event_detail', event_id=event.id))
+                    # Debit only the difference from what this RSVP already paid;
+                    # the debit fails atomically if the balance is too low
+                    due = to_minor_units(total_cost) - credit_paid
+                    if due > 0:
+                        if not record_credit_transaction(current_user.id, -due, 'debit',
+                                                         note=f'RSVP: {event.name}', rsvp_id=rsvp.id):
+                            db.session.rollback()
+                            shortfall = from_minor_units(due - (current_user.credit_balance or 0))
+                            flash('Insufficient credits. You need {:.2f} more credits.'.format(shortfall), 'danger')
+                            return redirect(url_for('event_detail', event_id=event.id))
+                    elif due < 0:
+                        record_credit_transaction(current_user.id, -due, 'refund',
+                                                  note=f'RSVP change: {event.name}', rsvp_id=rsvp.id)
                     
-                    # Deduct credits and mark as paid
-                    current_user.credit_point = (current_user.credit_point or 0) - total_cost
+                    # Mark as paid
                     rsvp.payment_status = 'paid'
                     rsvp.payment_amount = total_cost
                     rsvp.payment_method = 'credit'
                     flash('Payment successful! Credits deducted from your account.', 'success')
                 elif payment_method == 'pay_at_venue' and event.pay_at_venue_enabled:
+                    if credit_paid:
+                        record_credit_transaction(current_user.id, credit_paid, 'refund',
+                                                  note=f'Switched to pay at venue: {event.name}', rsvp_id=rsvp.id)
                     # Mark as pending payment to be collected at venue
                     rsvp.payment_status = 'pending'
                     rsvp.payment_amount = total_cost
                     rsvp.payment_method = 'pay_at_venue'
                     flash('You selected Pay at Venue. Please prepare payment on arrival.', 'info')
             else:
+                if credit_paid:
+                    record_credit_transaction(current_user.id, credit_paid, 'refund',
+                                              note=f'RSVP change: {event.name}', rsvp_id=rsvp.id)
                 # Free event
                 rsvp.payment_status = 'paid'
                 rsvp.payment_amount = 0.0
                 rsvp.payment_method = 'free'
             
-            # Generate unique QR code if accepted
+            # Issue a signed QR code if accepted (unique by construction)
             if not rsvp.qr_code:
-                code = str(uuid.uuid4())
-                # Ensure uniqueness across RSVPs
-                while RSVP.query.filter_by(qr_code=code).first():
-                    code = str(uuid.uuid4())
-                rsvp.qr_code = code
+                rsvp.qr_code = make_qr_token(event.id, rsvp.id)
+                # Render now so the attendee's first page view is served from cache
+                get_qr_png(rsvp.qr_code)
             
             # Send confirmation email
             send_event_notification(event, 'rsvp_confirmation', current_user)
         else:
-            # Clear payment and QR code if not attending
+            # Refund credits and clear payment and QR code if not attending
+            if credit_paid:
+                record_credit_transaction(current_user.id, credit_paid, 'refund',
+                                          note=f'RSVP declined: {event.name}', rsvp_id=rsvp.id)
             rsvp.qr_code = None
             rsvp.payment_status = 'pending'
             rsvp.payment_amount = 0.0
             rsvp.payment_method = None
         
+        apply_rsvp_rollup(event.id, rollup_before, rsvp_rollup_facts(rsvp))
+        apply_arrival(event.id, arrival_before, rsvp_arrival(rsvp))
+        apply_member_engagement(current_user.id, engagement_before, member_engagement_facts(rsvp, settled))
         db.session.commit()
         flash('Your RSVP has been updated.', 'success')
         return redirect(url_for('event_detail', event_id=event.id))
-    qr_image = None
-    if rsvp and rsvp.qr_code:
-        qr_image = generate_qr_image(rsvp.qr_code)
-    return render_template('event_detail.html', event=event, rsvp=rsvp, qr_image=qr_image)
+    return render_template('event_detail.html', event=event, rsvp=rsvp)
+
+
+@app.route('/qr/<code>.png')
+@login_required
+def rsvp_qr_image(code):
+    """Serve the check-in QR image for an RSVP.
+
+    The image for a code never changes (a new RSVP gets a new code), so it is
+    sent with a strong ETag and a one-year private cache lifetime. Conditional
+    requests are answered before touching the database.
+    """
+    etag = qr_etag(code)
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+    else:
+        rsvp = RSVP.query.filter_by(qr_code=code).first_or_404()
+        if rsvp.user_id != current_user.id and not current_user.is_admin:
+            abort(404)
+        response = app.response_class(get_qr_png(code), mimetype='image/png')
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.max_age = 31536000
+    response.cache_control.immutable = True
+    return response
 
 
 @app.route('/verify', methods=['GET', 'POST'])
@@ -1673,22 +3798,294 @@ def verify_qr():
         flash('Only organisers can verify attendees.', 'danger')
         return redirect(url_for('index'))
     attendee = None
+    # Optional: only accept codes for the event being checked in
+    event_id = request.values.get('event_id', type=int)
     if request.method == 'POST':
-        code = request.form.get('code')
-        rsvp = RSVP.query.filter_by(qr_code=code).first()
-        if not rsvp:
-            flash('QR code not found.', 'danger')
+        code = (request.form.get('code') or '').strip()
+        rsvp_id = None
+        if is_qr_token(code):
+            # Signed codes are rejected without touching the database
+            claims = parse_qr_token(code)
+            if claims is None:
+                flash('Invalid QR code.', 'danger')
+            elif event_id and claims[0] != event_id:
+                flash('This QR code is for a different event.', 'danger')
+            else:
+                rsvp_id = claims[1]
         else:
-            if rsvp.checked_in:
-                flash('Attendee already checked in.', 'warning')
-                attendee = rsvp
+            # Legacy UUID codes issued before signed tokens
+            rsvp = RSVP.query.filter_by(qr_code=code).first()
+            if not rsvp:
+                flash('QR code not found.', 'danger')
+            elif event_id and rsvp.event_id != event_id:
+                flash('This QR code is for a different event.', 'danger')
             else:
-                rsvp.checked_in = True
-                rsvp.checked_in_at = datetime.utcnow()  # Record check-in timestamp
-                db.session.commit()
+                rsvp_id = rsvp.id
+        
+        if rsvp_id is not None:
+            attendee, checked_in_now = check_in_rsvp(rsvp_id, code)
+            if attendee is None:
+                flash('QR code not found.', 'danger')
+            elif checked_in_now:
                 flash('Check‑in successful.', 'success')
-                attendee = rsvp
-    return render_template('verify.html', attendee=attendee)
+            else:
+                flash('Attendee already checked in.', 'warning')
+    
+    events = Event.query.filter(
+        Event.status != 'cancelled',
+        Event.start_date >= datetime.utcnow() - timedelta(days=1)
+    ).order_by(Event.start_date.asc()).limit(50).all()
+    return render_template('verify.html', attendee=attendee, events=events, selected_event_id=event_id)
+
+
+# Check-in kiosk: devices keep the roster locally, validate scans offline and
+# sync check-ins in batches.
+KIOSK_MAX_BATCH = 500
+# Roster deltas overlap the previous sync by this much so rows whose
+# transaction committed late are never skipped
+KIOSK_DELTA_OVERLAP = timedelta(minutes=2)
+
+
+def roster_hash(code: str) -> str:
+    """Return the short hash kiosks use to look up a scanned code."""
+    return hashlib.sha256(code.encode('utf-8')).hexdigest()[:16]
+
+
+def kiosk_roster_entry(rsvp) -> dict:
+    """Summarise an RSVP for the kiosk roster."""
+    if rsvp.status != 'Accepted' or not rsvp.qr_code:
+        return {'id': rsvp.id, 'removed': True}
+    return {
+        'id': rsvp.id,
+        'h': roster_hash(rsvp.qr_code),
+        'name': rsvp.attendee.display_name,
+        'grade': rsvp.attendee.membership_grade,
+        'guests': rsvp.guests or 0,
+        'meal': bool(rsvp.meal_opt_in),
+        'checked_in': bool(rsvp.checked_in),
+        'checked_in_at': rsvp.checked_in_at.isoformat() + 'Z' if rsvp.checked_in_at else None,
+    }
+
+
+def _parse_scan_time(value, now):
+    """Parse a kiosk scan timestamp (ISO 8601), never later than ``now``."""
+    try:
+        scanned_at = datetime.fromisoformat(str(value))
+    except (TypeError, ValueError):
+        return now
+    if scanned_at.tzinfo is not None:
+        scanned_at = scanned_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return min(scanned_at, now)
+
+
+def kiosk_check_in(event_id: int, code: str, scanned_at: datetime) -> dict:
+    """Apply one kiosk scan and describe the outcome.
+
+    When several devices scan the same code, the earliest scan time wins;
+    later scans are reported as duplicates.
+    """
+    result = {'status': 'invalid'}
+    if is_qr_token(code):
+        claims = parse_qr_token(code)
+        if claims is None:
+            return result
+        if claims[0] != event_id:
+            return {'status': 'wrong_event'}
+        rsvp_id = claims[1]
+    else:
+        rsvp = RSVP.query.filter_by(qr_code=code).first() if code else None
+        if rsvp is None:
+            return result
+        if rsvp.event_id != event_id:
+            return {'status': 'wrong_event'}
+        rsvp_id = rsvp.id
+
+    rsvps = RSVP.__table__
+    row = db.session.execute(
+        db.select(rsvps.c.qr_code, rsvps.c.checked_in, rsvps.c.checked_in_at,
+                  rsvps.c.guests, rsvps.c.meal_opt_in)
+        .where(rsvps.c.id == rsvp_id, rsvps.c.event_id == event_id)
+    ).first()
+    if row is None or row.qr_code != code:
+        return {'status': 'revoked', 'rsvp_id': rsvp_id}
+
+    # Compare-and-set on the check-in time we just read, so the arrival
+    # buckets can move this RSVP from its old minute to the earlier one.
+    previous = row.checked_in_at if row.checked_in else None
+    updated = 0
+    if previous is None or previous > scanned_at:
+        unchanged = (db.or_(rsvps.c.checked_in.isnot(True), rsvps.c.checked_in_at.is_(None))
+                     if previous is None else rsvps.c.checked_in_at == previous)
+        updated = db.session.execute(
+            rsvps.update()
+            .where(rsvps.c.id == rsvp_id, rsvps.c.qr_code == code, unchanged)
+            .values(checked_in=True, checked_in_at=scanned_at)
+        ).rowcount
+    if updated:
+        if previous is not None:
+            record_arrival(event_id, previous, row.guests, row.meal_opt_in, sign=-1)
+        else:
+            record_member_check_in(rsvp_id, scanned_at)
+        record_arrival(event_id, scanned_at, row.guests, row.meal_opt_in)
+        checked_in_at = scanned_at
+    else:
+        checked_in_at = db.session.execute(
+            db.select(rsvps.c.checked_in_at).where(rsvps.c.id == rsvp_id)
+        ).scalar()
+    return {
+        'status': 'checked_in' if updated else 'duplicate',
+        'rsvp_id': rsvp_id,
+        'checked_in_at': checked_in_at.isoformat() + 'Z' if checked_in_at else None,
+    }
+
+
+def _can_manage_event(event) -> bool:
+    return current_user.id == event.creator_id or current_user.is_admin
+
+
+@app.route('/event/<int:event_id>/kiosk')
+@login_required
+def checkin_kiosk(event_id):
+    """Offline-capable check-in kiosk for one event."""
+    event = Event.query.get_or_404(event_id)
+    if not _can_manage_event(event):
+        flash('Only organisers can check in attendees.', 'danger')
+        return redirect(url_for('event_detail', event_id=event.id))
+    return render_template('kiosk.html', event=event)
+
+
+@app.route('/api/event/<int:event_id>/kiosk/roster')
+@login_required
+def kiosk_roster(event_id):
+    """Roster for the kiosk, in full or as changes since ``?since=<version>``."""
+    event = Event.query.get_or_404(event_id)
+    if not _can_manage_event(event):
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    since = request.args.get('since')
+    query = RSVP.query.options(db.joinedload(RSVP.attendee)).filter(RSVP.event_id == event.id)
+    full = True
+    if since:
+        try:
+            query = query.filter(RSVP.updated_at >= datetime.fromisoformat(since) - KIOSK_DELTA_OVERLAP)
+            full = False
+        except ValueError:
+            pass
+    if full:
+        query = query.filter(RSVP.status == 'Accepted', RSVP.qr_code.isnot(None))
+
+    # Read the version first so nothing changed after it is missed next time
+    version = db.session.execute(
+        db.select(db.func.max(RSVP.updated_at)).where(RSVP.event_id == event.id)
+    ).scalar()
+    entries = [kiosk_roster_entry(rsvp) for rsvp in query.all()]
+    return jsonify({
+        'event_id': event.id,
+        'version': version.isoformat() if version else None,
+        'full': full,
+        'accepted': event.accepted_count,
+        'entries': entries,
+    })
+
+
+@app.route('/api/event/<int:event_id>/kiosk/check-ins', methods=['POST'])
+@login_required
+def kiosk_bulk_check_in(event_id):
+    """Record a batch of kiosk scans.
+
+    Expects ``{"check_ins": [{"ref": ..., "code": ..., "scanned_at": ...}]}``
+    and answers with one result per scan, matched by ``ref``.
+    """
+    event = Event.query.get_or_404(event_id)
+    if not _can_manage_event(event):
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    payload = request.get_json(silent=True) or {}
+    check_ins = payload.get('check_ins')
+    if not isinstance(check_ins, list) or len(check_ins) > KIOSK_MAX_BATCH:
+        return jsonify({'error': f'check_ins must be a list of at most {KIOSK_MAX_BATCH} scans'}), 400
+
+    now = datetime.utcnow()
+    results = []
+    for item in check_ins:
+        if not isinstance(item, dict):
+            item = {}
+        code = str(item.get('code') or '').strip()
+        outcome = kiosk_check_in(event.id, code, _parse_scan_time(item.get('scanned_at'), now))
+        outcome['ref'] = item.get('ref')
+        results.append(outcome)
+    db.session.commit()
+    return jsonify({'results': results})
+
+
+def arrival_summary(event, now=None) -> dict:
+    """Summarise check-in arrivals for the live arrival dashboard.
+
+    Reads the event's minute buckets (a few hundred rows at most) plus one
+    indexed count of accepted RSVPs. Every bucket is returned each time
+    because offline kiosks can sync scans into minutes already shown.
+    """
+    now = now or datetime.utcnow()
+    rsvps = RSVP.__table__
+    accepted = db.session.execute(
+        db.select(db.func.count(),
+                  db.func.coalesce(db.func.sum(rsvps.c.guests), 0),
+                  db.func.count(db.case((rsvps.c.meal_opt_in.is_(True), 1))))
+        .where(rsvps.c.event_id == event.id, rsvps.c.status == 'Accepted')
+    ).one()
+    accepted_rsvps, accepted_guests, accepted_meals = accepted
+
+    arrived = arrived_guests = arrived_meals = 0
+    buckets = []
+    for bucket in CheckInBucket.query.filter_by(event_id=event.id).order_by(CheckInBucket.minute):
+        if not bucket.arrivals:
+            continue  # emptied when a kiosk synced an earlier scan of the same code
+        arrived += bucket.arrivals
+        arrived_guests += bucket.guests
+        arrived_meals += bucket.meal_arrivals
+        buckets.append({
+            'minute': bucket.minute.isoformat() + 'Z',
+            'arrivals': bucket.arrivals,
+            'guests': bucket.guests,
+            'meal_arrivals': bucket.meal_arrivals,
+            'cumulative': arrived + arrived_guests,
+        })
+
+    accepted_headcount = accepted_rsvps + accepted_guests
+    started = event.start_date is not None and now >= event.start_date
+    return {
+        'event_id': event.id,
+        'generated_at': now.isoformat() + 'Z',
+        'accepted': {'rsvps': accepted_rsvps, 'headcount': accepted_headcount, 'meals': accepted_meals},
+        'arrived': {'rsvps': arrived, 'headcount': arrived + arrived_guests, 'meals': arrived_meals},
+        'turnout_rate': round((arrived + arrived_guests) / accepted_headcount, 4) if accepted_headcount else None,
+        # Only meaningful once doors have opened
+        'no_show_rate': (round(max(accepted_rsvps - arrived, 0) / accepted_rsvps, 4)
+                         if started and accepted_rsvps else None),
+        'meals_remaining': max(accepted_meals - arrived_meals, 0),
+        'buckets': buckets,
+    }
+
+
+@app.route('/event/<int:event_id>/arrivals')
+@login_required
+def event_arrivals(event_id):
+    """Live arrival dashboard for organisers."""
+    event = Event.query.get_or_404(event_id)
+    if not _can_manage_event(event):
+        flash('Only organisers can view arrivals.', 'danger')
+        return redirect(url_for('event_detail', event_id=event.id))
+    return render_template('event_arrivals.html', event=event)
+
+
+@app.route('/api/event/<int:event_id>/arrivals')
+@login_required
+def event_arrivals_data(event_id):
+    """Arrival analytics as JSON, polled by the arrival dashboard."""
+    event = Event.query.get_or_404(event_id)
+    if not _can_manage_event(event):
+        return jsonify({'error': 'Unauthorized'}), 403
+    return jsonify(arrival_summary(event))
 
 
 @app.route('/dashboard')
@@ -1747,14 +4144,14 @@ def update_event(event_id):
         feedback_enabled = request.form.get('feedback_enabled') == 'on'  # Checkbox value
         
         # Handle image upload
-        if 'cover_image' in request.files:
-            file = request.files['cover_image']
-            if file.filename:  # If file is selected
-                cover_image_url = save_uploaded_file(file)
-                if not cover_image_url:
-                    flash('Invalid file type. Please upload PNG, JPG, JPEG, GIF, or WebP images.', 'danger')
-                    return redirect(url_for('update_event', event_id=event.id))
-                event.cover_image_url = cover_image_url
+        try:
+            cover_image_url = save_upload_from_request('cover_image')
+        except ValueError as e:
+            flash(str(e), 'danger')
+            return redirect(url_for('update_event', event_id=event.id))
+        if cover_image_url:
+            release_upload(event.cover_image_url)
+            event.cover_image_url = cover_image_url
         
         try:
             event_datetime = datetime.strptime(f"{date_str} {time_str}", '%Y-%m-%d %H:%M')
@@ -1894,30 +4291,109 @@ def profile():
     return render_template('profile.html')
 
 
+# Days shown on the analytics "RSVPs over time" chart
+ANALYTICS_CHART_DAYS = 90
+
+
+def organiser_analytics(creator_id: int, days: int = ANALYTICS_CHART_DAYS, today=None) -> dict:
+    """Summarise an organiser's RSVP activity from the daily rollups.
+
+    One grouped query over :class:`EventDailyStat`; days before the chart
+    window are folded into a single group per event, so the rows read grow
+    with the organiser's events rather than their RSVP history.
+
+    Returns:
+        Dict with ``totals`` and ``events`` (per event id), both mapping
+        ``(metric, key)`` to ``{'count', 'guests', 'amount'}``, and ``days``,
+        one entry per day of the chart window.
+    """
+    today = today or datetime.utcnow().date()
+    start = today - timedelta(days=days - 1)
+    stats = EventDailyStat.__table__
+    in_window = db.case((stats.c.day >= start, stats.c.day), else_=None).label('window_day')
+    rows = db.session.execute(
+        db.select(stats.c.event_id, stats.c.metric, stats.c.key, in_window,
+                  db.func.sum(stats.c.count), db.func.sum(stats.c.guests), db.func.sum(stats.c.amount))
+        .where(stats.c.creator_id == creator_id)
+        .group_by(stats.c.event_id, stats.c.metric, stats.c.key, in_window)
+    ).all()
+
+    totals, events = {}, {}
+    series = {start + timedelta(days=i): {'day': start + timedelta(days=i), 'rsvps': {}, 'new_rsvps': 0,
+                                          'check_ins': 0, 'cancellations': 0}
+              for i in range(days)}
+    for event_id, metric, key, day, count, guests, amount in rows:
+        for target in (totals, events.setdefault(event_id, {})):
+            total = target.setdefault((metric, key), {'count': 0, 'guests': 0, 'amount': 0})
+            total['count'] += count
+            total['guests'] += guests
+            total['amount'] += amount
+        if day is None or day not in series:
+            continue
+        point = series[day]
+        if metric == 'rsvp':
+            point['rsvps'][key] = point['rsvps'].get(key, 0) + count
+            point['new_rsvps'] += count
+        elif metric == 'check_in':
+            point['check_ins'] += count
+        elif metric == 'cancellation':
+            point['cancellations'] += count
+    return {'totals': totals, 'events': events, 'days': [series[day] for day in sorted(series)]}
+
+
 @app.route('/analytics')
 @login_required
+@reporting_view
 def analytics():
-    """Event analytics for organizers."""
+    """Event analytics for organizers, read from the daily RSVP rollups."""
     if not current_user.is_admin:
         flash('Only organizers can view analytics.', 'danger')
         return redirect(url_for('index'))
     
+    user_id, today = current_user.id, datetime.utcnow().date()
+    summary = SINGLE_FLIGHT.do(('organiser_analytics', user_id, today),
+                               lambda: organiser_analytics(user_id, today=today))
+    totals = summary['totals']
+
+    def total(metric, key='', field='count', source=totals):
+        return source.get((metric, key), {}).get(field, 0)
+
     # Get statistics
-    total_events = Event.query.filter_by(creator_id=current_user.id).count()
-    total_rsvps = db.session.query(RSVP).join(Event).filter(Event.creator_id == current_user.id).count()
-    total_attendees = db.session.query(RSVP).join(Event).filter(
-        Event.creator_id == current_user.id,
-        RSVP.status == 'Accepted'
-    ).count()
+    # Archived events too, like the rollups the other totals come from
+    total_events = (Event.query.filter_by(creator_id=current_user.id).count()
+                    + ArchivedEvent.query.filter_by(creator_id=current_user.id).count())
+    total_rsvps = sum(value['count'] for (metric, _), value in totals.items() if metric == 'rsvp')
+    total_attendees = total('rsvp', 'Accepted')
+    revenue = sorted(
+        ((key or 'other', value['count'], from_minor_units(value['amount']))
+         for (metric, key), value in totals.items() if metric == 'revenue' and value['count']),
+        key=lambda item: -item[2]
+    )
     
     # Recent events with stats
     recent_events = Event.query.filter_by(creator_id=current_user.id).order_by(Event.start_date.desc()).limit(5).all()
+    event_stats = {}
+    for event in recent_events:
+        source = summary['events'].get(event.id, {})
+        event_stats[event.id] = {
+            'accepted': total('rsvp', 'Accepted', source=source) + total('rsvp', 'Accepted', 'guests', source),
+            'maybe': total('rsvp', 'Maybe', source=source),
+            'declined': total('rsvp', 'Declined', source=source),
+            'check_ins': total('check_in', source=source),
+        }
     
     return render_template('analytics.html', 
                          total_events=total_events,
                          total_rsvps=total_rsvps,
                          total_attendees=total_attendees,
-                         recent_events=recent_events)
+                         total_check_ins=total('check_in'),
+                         total_cancellations=total('cancellation'),
+                         total_meals=total('meal'),
+                         revenue=revenue,
+                         days=summary['days'],
+                         peak_day=max([1] + [day['new_rsvps'] for day in summary['days']]),
+                         recent_events=recent_events,
+                         event_stats=event_stats)
 
 
 @app.route('/admin/members')
@@ -1928,8 +4404,8 @@ def admin_members():
         flash('Access denied. Admin privileges required.', 'danger')
         return redirect(url_for('index'))
     
-    # Get all users with their details
-    members = User.query.all()
+    # Get all users with their details and engagement totals
+    members = User.query.options(db.joinedload(User.engagement)).all()
     
     # Get membership grade statistics
     grade_stats = {}
@@ -1942,6 +4418,7 @@ def admin_members():
     return render_template('admin_members.html', 
                          members=members, 
                          grade_stats=grade_stats, 
+                         ENGAGEMENT_POINTS=ENGAGEMENT_POINTS,
                          get_membership_type_info=get_membership_type_info, 
                          MEMBERSHIP_TYPES=MEMBERSHIP_TYPES,
                          email_verification_enabled=email_verification_enabled)
@@ -1978,24 +4455,13 @@ def update_email_verification_setting():
 
 @app.route('/admin/members/export')
 @login_required
+@reporting_view
 def export_members():
     """Export all member data to CSV (admin only)."""
     if not current_user.is_admin:
         flash('Access denied. Admin privileges required.', 'danger')
         return redirect(url_for('index'))
     
-    import csv
-    import io
-    from flask import make_response
-    
-    # Get all users
-    members = User.query.all()
-    
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Write header row
     headers = [
         'ID', 'Username', 'First Name', 'Last Name', 'Email', 'Phone', 
         'Country', 'City', 'Timezone', 'Locale', 'Membership Type', 'Membership Grade',
@@ -2004,45 +4470,81 @@ def export_members():
         'Time Format 24h', 'Privacy Show City', 'Privacy Show Full Name',
         'Has Default Password', 'Created At'
     ]
-    writer.writerow(headers)
-    
-    # Write member data
-    for member in members:
-        row = [
-            member.id,
-            member.username,
-            member.first_name or '',
-            member.last_name or '',
-            member.email,
-            member.phone or '',
-            member.country or '',
-            member.city or '',
-            member.timezone or '',
-            member.locale or '',
-            member.membership_type or '',
-            member.membership_grade or '',
-            member.credit_point or 0.0,
-            member.account_status or '',
-            'Yes' if member.email_verified else 'No',
-            'Yes' if member.is_admin else 'No',
-            'Yes' if member.email_notifications else 'No',
-            'Yes' if member.push_notifications else 'No',
-            'Yes' if member.sms_notifications else 'No',
-            'Yes' if member.time_format_24h else 'No',
-            'Yes' if member.privacy_show_city else 'No',
-            'Yes' if member.privacy_show_full_name else 'No',
-            'Yes' if member.has_default_password else 'No',
-            member.created_at.strftime('%Y-%m-%d %H:%M:%S') if member.created_at else ''
-        ]
-        writer.writerow(row)
-    
-    # Prepare response
-    output.seek(0)
-    response = make_response(output.getvalue())
-    response.headers['Content-Type'] = 'text/csv'
-    response.headers['Content-Disposition'] = f'attachment; filename=members_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-    
-    return response
+
+    def rows():
+        members = db.session.execute(
+            db.select(User).order_by(User.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        ).scalars()
+        for member in members:
+            yield [
+                member.id,
+                member.username,
+                member.first_name or '',
+                member.last_name or '',
+                member.email,
+                member.phone or '',
+                member.country or '',
+                member.city or '',
+                member.timezone or '',
+                member.locale or '',
+                member.membership_type or '',
+                member.membership_grade or '',
+                member.credit_point or 0.0,
+                member.account_status or '',
+                'Yes' if member.email_verified else 'No',
+                'Yes' if member.is_admin else 'No',
+                'Yes' if member.email_notifications else 'No',
+                'Yes' if member.push_notifications else 'No',
+                'Yes' if member.sms_notifications else 'No',
+                'Yes' if member.time_format_24h else 'No',
+                'Yes' if member.privacy_show_city else 'No',
+                'Yes' if member.privacy_show_full_name else 'No',
+                'Yes' if member.has_default_password else 'No',
+                member.created_at.strftime('%Y-%m-%d %H:%M:%S') if member.created_at else ''
+            ]
+
+    return csv_response(f'members_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv', headers, rows())
+
+
+@app.route('/admin/analytics-export')
+@login_required
+def analytics_export():
+    """Stream the NDJSON analytics dump (admin only).
+
+    Query parameters: ``since`` (ISO timestamp, the previous dump's
+    watermark), ``tables`` (comma separated) and ``gzip=1``.
+    """
+    if not current_user.is_admin:
+        flash('Access denied. Admin privileges required.', 'danger')
+        return redirect(url_for('index'))
+
+    since = None
+    if request.args.get('since'):
+        try:
+            since = datetime.fromisoformat(request.args['since'].rstrip('Z'))
+        except ValueError:
+            abort(400)
+    tables = [t for t in request.args.get('tables', '').split(',') if t] or None
+    if tables and not set(tables) <= set(ANALYTICS_EXPORT_TABLES):
+        abort(400)
+    compress = request.args.get('gzip') == '1'
+
+    def generate():
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+        lines = []
+        for record in iter_analytics_dump(since, tables):
+            lines.append(record)
+            if len(lines) >= EXPORT_BATCH_SIZE:
+                chunk = ''.join(lines).encode('utf-8')
+                lines = []
+                yield compressor.compress(chunk) if compressor else chunk
+        chunk = ''.join(lines).encode('utf-8')
+        yield compressor.compress(chunk) + compressor.flush() if compressor else chunk
+
+    filename = f"analytics_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.ndjson" + ('.gz' if compress else '')
+    return Response(stream_with_context(generate()),
+                    mimetype='application/gzip' if compress else 'application/x-ndjson',
+                    headers={'Content-Disposition': attachment_disposition(filename)})
 
 
 @app.route('/admin/members/<int:user_id>/update_grade', methods=['POST'])
@@ -2107,16 +4609,20 @@ def validate_superuser():
             user.is_admin = 'is_admin' in parsed_data
             user.email_verified = 'email_verified' in parsed_data
             
-            # Update credit points
+            # Update credit points through the ledger
             credit_point = parsed_data.get('credit_point', [None])[0]
-            if credit_point is not None:
+            credit_point_loaded = parsed_data.get('credit_point_loaded', [None])[0]
+            if credit_point is not None and credit_point_loaded is not None:
                 try:
-                    user.credit_point = float(credit_point)
-                    if user.credit_point < 0:
-                        user.credit_point = 0.0
-                except (ValueError, TypeError):
+                    adjusted = set_credit_balance(user, to_minor_units(credit_point),
+                                                  to_minor_units(credit_point_loaded),
+                                                  note='Admin edit', created_by_id=current_user.id)
+                except ValueError:
                     # Keep existing credit_point if invalid
-                    pass
+                    adjusted = None
+                if adjusted is False:
+                    db.session.rollback()
+                    return jsonify({'success': False, 'error': 'Credit balance changed meanwhile, please reload'})
             
             db.session.commit()
             
@@ -2129,6 +4635,43 @@ def validate_superuser():
     return jsonify({'success': True})
 
 
+@app.route('/admin/credits/top-up', methods=['POST'])
+@login_required
+def bulk_top_up():
+    """Top up credits for all active members, or one membership grade (admin only)."""
+    if not current_user.is_admin:
+        flash('Access denied. Admin privileges required.', 'danger')
+        return redirect(url_for('index'))
+    
+    if not validate_superuser_password(request.form.get('superuser_password')):
+        flash('Invalid superuser password.', 'danger')
+        return redirect(url_for('admin_members'))
+    
+    try:
+        amount = to_minor_units(request.form.get('amount', ''))
+    except ValueError:
+        amount = 0
+    if amount <= 0:
+        flash('Top-up amount must be greater than zero.', 'danger')
+        return redirect(url_for('admin_members'))
+    
+    query = db.select(User.id).where(db.func.lower(User.account_status) == 'active')
+    membership_grade = request.form.get('membership_grade')
+    if membership_grade:
+        query = query.where(User.membership_grade == membership_grade)
+    user_ids = db.session.execute(query).scalars().all()
+    
+    batch_id = bulk_top_up_credits(user_ids, amount, note=request.form.get('note') or 'Bulk top-up',
+                                   created_by_id=current_user.id)
+    db.session.commit()
+    
+    if batch_id:
+        flash(f'Added {from_minor_units(amount):.2f} credits to {len(user_ids)} members.', 'success')
+    else:
+        flash('No members matched the selection.', 'warning')
+    return redirect(url_for('admin_members'))
+
+
 @app.route('/admin/members/<int:user_id>/update', methods=['POST'])
 @login_required
 def update_member(user_id):
@@ -2158,16 +4701,21 @@ def update_member(user_id):
     user.is_admin = request.form.get('is_admin') == 'on'
     user.email_verified = request.form.get('email_verified') == 'on'
     
-    # Update credit points (only superuser can modify)
+    # Update credit points through the ledger (only superuser can modify)
+    # Compared with the balance the form was loaded with, not the current one
     credit_point = request.form.get('credit_point')
-    if credit_point is not None:
+    credit_point_loaded = request.form.get('credit_point_loaded')
+    if credit_point is not None and credit_point_loaded is not None:
         try:
-            user.credit_point = float(credit_point)
-            if user.credit_point < 0:
-                user.credit_point = 0.0
-        except (ValueError, TypeError):
+            adjusted = set_credit_balance(user, to_minor_units(credit_point), to_minor_units(credit_point_loaded),
+                                          note='Admin edit', created_by_id=current_user.id)
+        except ValueError:
             flash('Invalid credit point value.', 'warning')
-            user.credit_point = user.credit_point or 0.0
+            adjusted = None
+        if adjusted is False:
+            db.session.rollback()
+            flash('Credit balance changed while you were editing. Please try again.', 'warning')
+            return redirect(url_for('admin_members'))
     
     db.session.commit()
     
@@ -2204,8 +4752,14 @@ def delete_member(user_id):
     username = user.username
     
     # Delete all related data
-    # Delete RSVPs
+    # Delete RSVPs, then recount the daily rollups and arrivals of their events
+    rsvp_event_ids = db.session.execute(
+        db.select(RSVP.event_id).where(RSVP.user_id == user_id).distinct()
+    ).scalars().all()
     RSVP.query.filter_by(user_id=user_id).delete()
+    for event_id in rsvp_event_ids:
+        rebuild_event_rollups(event_id)
+        rebuild_arrival_buckets(event_id)
     
     # Delete notifications
     Notification.query.filter_by(user_id=user_id).delete()
@@ -2213,6 +4767,21 @@ def delete_member(user_id):
     # Delete feedback
     Feedback.query.filter_by(user_id=user_id).delete()
     
+    # Delete credit ledger
+    CreditTransaction.query.filter_by(user_id=user_id).delete()
+    CreditTransaction.query.filter_by(created_by_id=user_id).update({'created_by_id': None})
+    
+    # Delete archived copies, then recount the rollups of those archived events
+    archived_event_ids = db.session.execute(
+        db.select(ArchivedRSVP.event_id).where(ArchivedRSVP.user_id == user_id).distinct()
+    ).scalars().all()
+    for archive in (ArchivedRSVP, ArchivedNotification, ArchivedFeedback):
+        archive.query.filter_by(user_id=user_id).delete()
+    for event_id in archived_event_ids:
+        rebuild_event_rollups(event_id)
+    
+    MemberEngagement.query.filter_by(user_id=user_id).delete()
+    
     # Delete the user
     db.session.delete(user)
     db.session.commit()
@@ -2254,8 +4823,21 @@ def past_events():
         Event.status != 'cancelled'
     ).order_by(Event.start_date.desc()).all()
     
+    # Events moved out of the hot tables by archive_completed_events
+    archived_organized = ArchivedEvent.query.filter(
+        ArchivedEvent.creator_id == current_user.id,
+        ArchivedEvent.status != 'cancelled'
+    ).all()
+    
+    archived_attended = ArchivedEvent.query.join(
+        ArchivedRSVP, ArchivedRSVP.event_id == ArchivedEvent.id
+    ).filter(
+        ArchivedRSVP.user_id == current_user.id,
+        ArchivedEvent.status != 'cancelled'
+    ).all()
+    
     # Combine and deduplicate
-    all_past_events = list(set(organized_events + attended_events))
+    all_past_events = list(set(organized_events + attended_events + archived_organized + archived_attended))
     all_past_events.sort(key=lambda x: x.start_date, reverse=True)
     
     return render_template('past_events.html', events=all_past_events)
@@ -2350,6 +4932,21 @@ def event_feedback(event_id):
     return redirect(url_for('feedback_page', event_id=event_id))
 
 
+@app.route('/admin/event/<int:event_id>/unarchive', methods=['POST'])
+@login_required
+def unarchive_event_route(event_id):
+    """Move an archived event back into the live tables (admin only)."""
+    if not current_user.is_admin:
+        flash('Access denied. Admin privileges required.', 'danger')
+        return redirect(url_for('index'))
+    
+    if unarchive_event(event_id):
+        flash('Event restored from the archive.', 'success')
+    else:
+        flash('Event is not archived.', 'warning')
+    return redirect(url_for('event_detail', event_id=event_id))
+
+
 @app.route('/admin/event/<int:event_id>/send-feedback-notifications', methods=['POST'])
 @login_required
 def send_feedback_notifications(event_id):
@@ -2366,10 +4963,157 @@ def send_feedback_notifications(event_id):
     flash(f'Feedback notifications sent to all attendees of "{event.name}".', 'success')
     return redirect(url_for('event_detail', event_id=event_id))
 
+
+FEEDBACK_SCALE = range(1, 6)
+
+# (version, summaries) for every event, valid while the feedback table's version is unchanged
+_feedback_summary_cache = {}
+
+
+def _feedback_version() -> tuple:
+    """Cheap fingerprint of the feedback table: row count, newest id and newest update."""
+    feedback = Feedback.__table__
+    return tuple(db.session.execute(
+        db.select(db.func.count(), db.func.max(feedback.c.id), db.func.max(feedback.c.updated_at))
+    ).one())
+
+
+def _compute_feedback_summaries() -> dict:
+    feedback = Feedback.__table__
+    # One pass over the table: a count per event, question and score
+    columns = [db.func.sum(db.case((feedback.c[field] == score, 1), else_=0))
+               for field in FEEDBACK_RATING_FIELDS for score in FEEDBACK_SCALE]
+    rows = db.session.execute(
+        db.select(feedback.c.event_id, db.func.count(), *columns).group_by(feedback.c.event_id)
+    ).all()
+
+    summaries = {}
+    for event_id, responses, *counts in rows:
+        ratings = {}
+        for i, field in enumerate(FEEDBACK_RATING_FIELDS):
+            distribution = dict(zip(FEEDBACK_SCALE, counts[i * len(FEEDBACK_SCALE):(i + 1) * len(FEEDBACK_SCALE)]))
+            answered = sum(distribution.values())
+            ratings[field] = {
+                'mean': round(sum(score * n for score, n in distribution.items()) / answered, 2) if answered else None,
+                'distribution': distribution,
+            }
+        # Recommendation is asked on a 1-5 scale: 5 promotes, 1-3 detract
+        recommend = ratings['likelihood_to_recommend']['distribution']
+        answered = sum(recommend.values())
+        nps = None
+        if answered:
+            nps = round((recommend[5] - recommend[1] - recommend[2] - recommend[3]) / answered * 100)
+        summaries[event_id] = {'responses': responses, 'ratings': ratings, 'nps': nps}
+    return summaries
+
+
+def feedback_summaries() -> dict:
+    """Per-event rating summaries keyed by event id.
+
+    Means, score distributions and a net promoter score come from one
+    GROUP BY query, cached until feedback is added, changed or removed.
+    """
+    # Read the version first: feedback arriving mid-computation only causes an extra recompute
+    version = _feedback_version()
+    cached = _feedback_summary_cache.get('entry')
+    if cached is None or cached[0] != version:
+        # Shared between workers too: one GROUP BY per version, whichever process runs it
+        cached = (version, SINGLE_FLIGHT.do('feedback_summaries', _compute_feedback_summaries, version=version))
+        _feedback_summary_cache['entry'] = cached
+    return cached[1]
+
+
+# Export rows parsed, matched and written per transaction by the response import
+FEEDBACK_IMPORT_BATCH_SIZE = 500
+
+
+def _import_feedback_batch(form, batch, stats):
+    """Upsert one batch of parsed responses with one user lookup and one existing-row lookup."""
+    emails = {values['email'] for values in batch}
+    user_ids = dict(db.session.execute(
+        db.select(db.func.lower(User.email), User.id).where(db.func.lower(User.email).in_(emails))
+    ).all())
+    feedback = Feedback.__table__
+    existing = dict(db.session.execute(
+        db.select(feedback.c.ms_response_id, feedback.c.id)
+        .where(feedback.c.feedback_form_id == form.id,
+               feedback.c.ms_response_id.in_({values['response_id'] for values in batch}))
+    ).all())
+
+    now = datetime.utcnow()
+    inserts, updates = {}, {}
+    for values in batch:
+        user_id = user_ids.get(values['email'])
+        if user_id is None:
+            stats['unmatched'] += 1
+            continue
+        row = {field: values[field] for field in FEEDBACK_RATING_FIELDS}
+        row.update(user_id=user_id, additional_comments=values['additional_comments'], updated_at=now)
+        response_id = values['response_id']
+        if response_id in existing:
+            updates[response_id] = dict(row, row_id=existing[response_id])
+        else:
+            # A later row with the same response id (a re-exported edit) wins
+            inserts[response_id] = dict(row, event_id=form.event_id, feedback_form_id=form.id,
+                                        ms_response_id=response_id,
+                                        created_at=values['completed_at'] or now)
+    if inserts:
+        db.session.execute(feedback.insert(), list(inserts.values()))
+    if updates:
+        db.session.execute(
+            feedback.update().where(feedback.c.id == db.bindparam('row_id')), list(updates.values())
+        )
+    db.session.commit()
+    stats['inserted'] += len(inserts)
+    stats['updated'] += len(updates)
+
+
+def import_feedback_responses(form, path, mapping=None, batch_size=FEEDBACK_IMPORT_BATCH_SIZE) -> dict:
+    """Import an MS Forms response export (CSV or XLSX) as feedback for ``form``'s event.
+
+    The file is streamed row by row. Each batch matches respondents to
+    members by email in one query and upserts on (form, response id), so
+    re-importing a newer export updates earlier answers. Responses from
+    unknown emails are skipped, since feedback belongs to a member.
+    ``mapping`` defaults to the form's saved ``response_mapping``.
+
+    Returns:
+        Dict of counts: ``rows``, ``inserted``, ``updated``, ``unmatched``
+        and ``invalid``, plus ``errors`` (the first few invalid rows).
+
+    Raises:
+        ValueError: if the file can't be read or its columns can't be matched.
+    """
+    if mapping is None and form.response_mapping:
+        mapping = json.loads(form.response_mapping)
+    stats = {'rows': 0, 'inserted': 0, 'updated': 0, 'unmatched': 0, 'invalid': 0, 'errors': []}
+    with read_export(path) as (headers, rows):
+        columns = resolve_columns(headers, mapping)
+        batch = []
+        for line, row in enumerate(rows, start=2):
+            if not any(cell not in (None, '') for cell in row):
+                continue
+            stats['rows'] += 1
+            try:
+                batch.append(parse_response(row, columns))
+            except ValueError as e:
+                stats['invalid'] += 1
+                if len(stats['errors']) < 20:
+                    stats['errors'].append(f'Row {line}: {e}')
+                continue
+            if len(batch) >= batch_size:
+                _import_feedback_batch(form, batch, stats)
+                batch = []
+        if batch:
+            _import_feedback_batch(form, batch, stats)
+    return stats
+
+
 @app.route('/admin/feedback-analytics')
 @login_required
+@reporting_view
 def feedback_analytics():
-    """Admin feedback analytics page with Microsoft Forms."""
+    """Admin feedback analytics page with Microsoft Forms and rating summaries."""
     if not current_user.is_admin:
         flash('Only administrators can view feedback analytics.', 'danger')
         return redirect(url_for('index'))
@@ -2377,16 +5121,22 @@ def feedback_analytics():
     # Get all events with their feedback forms
     events = Event.query.filter(Event.status != 'cancelled').order_by(Event.start_date.desc()).all()
     
-    # Get feedback forms for each event
-    event_forms = []
-    for event in events:
-        feedback_forms = EventFeedbackForm.query.filter_by(event_id=event.id, is_active=True).all()
-        event_forms.append({
-            'event': event,
-            'feedback_forms': feedback_forms
-        })
+    # Active feedback forms for every event in one query
+    forms_by_event = {}
+    forms = (EventFeedbackForm.query.options(db.joinedload(EventFeedbackForm.creator))
+             .filter_by(is_active=True).order_by(EventFeedbackForm.id))
+    for form in forms:
+        forms_by_event.setdefault(form.event_id, []).append(form)
+    
+    summaries = feedback_summaries()
+    event_forms = [{
+        'event': event,
+        'feedback_forms': forms_by_event.get(event.id, []),
+        'summary': summaries.get(event.id),
+    } for event in events]
     
-    return render_template('feedback_analytics.html', event_forms=event_forms)
+    return render_template('feedback_analytics.html', event_forms=event_forms,
+                           rating_fields=FEEDBACK_RATING_FIELDS)
 
 
 @app.route('/admin/feedback-forms/add', methods=['GET', 'POST'])
@@ -2408,8 +5158,12 @@ def add_feedback_form():
             flash('All fields are required.', 'danger')
             return redirect(url_for('add_feedback_form'))
         
-        # Validate event exists
-        event = Event.query.get(event_id)
+        # Validate event exists (server databases won't coerce the form string)
+        try:
+            event_id = int(event_id)
+        except ValueError:
+            event_id = None
+        event = Event.query.get(event_id) if event_id else None
         if not event:
             flash('Event not found.', 'danger')
             return redirect(url_for('add_feedback_form'))
@@ -2525,6 +5279,7 @@ def duplicate_event(event_id):
     )
     
     db.session.add(new_event)
+    retain_upload(new_event.cover_image_url)
     db.session.commit()
     
     flash('Event duplicated successfully.', 'success')
@@ -2535,50 +5290,91 @@ def duplicate_event(event_id):
 @login_required
 def event_attendees(event_id):
     """View and manage event attendees."""
-    event = Event.query.get_or_404(event_id)
+    event = get_event_or_archived_or_404(event_id)
     if current_user.id != event.creator_id and not current_user.is_admin:
         flash('You do not have permission to view attendees.', 'danger')
         return redirect(url_for('event_detail', event_id=event.id))
     
-    attendees = RSVP.query.filter_by(event_id=event.id).order_by(RSVP.created_at.asc()).all()
+    rsvp_model = ArchivedRSVP if event.is_archived else RSVP
+    attendees = rsvp_model.query.filter_by(event_id=event.id).order_by(rsvp_model.created_at.asc()).all()
     
     return render_template('event_attendees.html', event=event, attendees=attendees)
 
 
 @app.route('/event/<int:event_id>/export')
 @login_required
+@reporting_view
 def export_attendees(event_id):
     """Export attendee list to CSV."""
-    event = Event.query.get_or_404(event_id)
+    event = get_event_or_archived_or_404(event_id)
     if current_user.id != event.creator_id and not current_user.is_admin:
         flash('You do not have permission to export attendees.', 'danger')
         return redirect(url_for('event_detail', event_id=event.id))
     
-    attendees = RSVP.query.filter_by(event_id=event.id).all()
-    
-    # Create CSV content
-    csv_content = "Name,Email,Status,Guests,Note,Checked In,RSVP Date\n"
-    for rsvp in attendees:
-        csv_content += f'"{rsvp.attendee.display_name}","{rsvp.attendee.email}","{rsvp.status}",{rsvp.guests},"{rsvp.note or ""}","{"Yes" if rsvp.checked_in else "No"}","{rsvp.created_at.strftime("%Y-%m-%d %H:%M")}"\n'
+    rsvp_model = ArchivedRSVP if event.is_archived else RSVP
+
+    def rows():
+        attendees = db.session.execute(
+            db.select(rsvp_model, User)
+            .join(User, User.id == rsvp_model.user_id)
+            .where(rsvp_model.event_id == event.id)
+            .order_by(rsvp_model.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        for rsvp, attendee in attendees:
+            yield [attendee.display_name, attendee.email, rsvp.status, rsvp.guests, rsvp.note or '',
+                   'Yes' if rsvp.checked_in else 'No', rsvp.created_at.strftime('%Y-%m-%d %H:%M')]
 
-    # Ensure UTF-8 bytes (with BOM for Excel compatibility) and RFC 5987 filename
-    from flask import Response
-    from urllib.parse import quote as url_quote
-    import re
+    return csv_response(f"{event.name}_attendees.csv",
+                        ['Name', 'Email', 'Status', 'Guests', 'Note', 'Checked In', 'RSVP Date'], rows())
 
-    filename_base = f"{event.name}_attendees.csv"
-    ascii_fallback = re.sub(r'[^A-Za-z0-9._-]+', '_', filename_base)
-    content_disposition = (
-        f"attachment; filename=\"{ascii_fallback}\"; "
-        f"filename*=UTF-8''{url_quote(filename_base)}"
-    )
 
-    data = csv_content.encode('utf-8-sig')
-    return Response(
-        data,
-        mimetype='text/csv; charset=utf-8',
-        headers={'Content-Disposition': content_disposition}
-    )
+@app.route('/event/<int:event_id>/badges')
+@login_required
+def event_badges(event_id):
+    """Download printable badges for accepted attendees.
+
+    ``?format=pdf`` (default) gives A4 sheets of badges; ``?format=zip``
+    gives one PNG per attendee. Badges are rendered in a process pool and
+    streamed out in order as they finish.
+    """
+    event = Event.query.get_or_404(event_id)
+    if not _can_manage_event(event):
+        flash('You do not have permission to print badges.', 'danger')
+        return redirect(url_for('event_detail', event_id=event.id))
+    output = request.args.get('format', 'pdf')
+    if output not in ('pdf', 'zip'):
+        abort(400)
+
+    rsvps = (RSVP.query.options(db.joinedload(RSVP.attendee))
+             .filter(RSVP.event_id == event.id, RSVP.status == 'Accepted', RSVP.qr_code.isnot(None))
+             .order_by(RSVP.created_at.asc())
+             .all())
+    if not rsvps:
+        flash('There are no accepted attendees to print badges for.', 'info')
+        return redirect(url_for('event_attendees', event_id=event.id))
+
+    badges = [{
+        'name': rsvp.attendee.display_name,
+        'grade': rsvp.attendee.membership_grade or '',
+        'meal': bool(rsvp.meal_opt_in),
+        'code': rsvp.qr_code,
+        'event': event.name,
+    } for rsvp in rsvps]
+    font_path = find_badge_font(app.config['BADGE_FONT_PATH'])
+    workers = app.config['BADGE_WORKERS']
+
+    if output == 'pdf':
+        pages = render_in_pool(partial(render_badge_page, font_path=font_path),
+                               chunked(badges, BADGES_PER_PAGE), workers)
+        body, mimetype = stream_badge_pdf(pages), 'application/pdf'
+    else:
+        pngs = render_in_pool(partial(render_badge_png, font_path=font_path), badges, workers)
+        files = ((badge_filename(index, badge), png) for index, (badge, png) in enumerate(zip(badges, pngs), 1))
+        body, mimetype = stream_badge_zip(files), 'application/zip'
+
+    return Response(body, mimetype=mimetype,
+                    headers={'Content-Disposition': attachment_disposition(f"{event.name}_badges.{output}")})
 
 
 @app.route('/api/event/<int:event_id>/stats')
@@ -2589,7 +5385,8 @@ def event_stats(event_id):
     if current_user.id != event.creator_id and not current_user.is_admin:
         return jsonify({'error': 'Unauthorized'}), 403
     
-    stats = {
+    # Dashboards polling a popular event share one pass over its RSVPs
+    return jsonify(SINGLE_FLIGHT.do(('event_stats', event.id), lambda: {
         'accepted': event.accepted_count,
         'maybe': event.maybe_count,
         'declined': event.declined_count,
@@ -2597,8 +5394,7 @@ def event_stats(event_id):
         'capacity': event.capacity,
         'available_spots': event.available_spots,
         'checked_in': sum(1 for rsvp in event.rsvps if rsvp.checked_in)
-    }
-    return jsonify(stats)
+    }))
 
 
 # Stripe payment routes removed - only credit payments are supported
@@ -2623,6 +5419,25 @@ def admin_carousel():
     return render_template('admin_carousel.html', carousel_images=carousel_images)
 
 
+@app.route('/uploads/presign', methods=['POST'])
+@login_required
+def presign_upload():
+    """Let the browser upload an image straight into remote storage.
+
+    Takes JSON with the file's ``sha256``, ``size`` and ``content_type``
+    and returns what presign_direct_upload does; 404 when storage is local.
+    """
+    data = request.get_json(silent=True) or {}
+    try:
+        upload = presign_direct_upload(str(data.get('sha256', '')).lower(), int(data.get('size') or 0),
+                                       data.get('content_type'))
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    if upload is None:
+        abort(404)
+    return jsonify(upload)
+
+
 @app.route('/admin/carousel/add', methods=['POST'])
 @login_required
 def add_carousel_image():
@@ -2631,62 +5446,35 @@ def add_carousel_image():
         flash('Access denied. Admin privileges required.', 'danger')
         return redirect(url_for('index'))
     
-    # Check if file was uploaded
-    if 'image_file' not in request.files:
-        flash('No image file selected.', 'danger')
+    try:
+        image_url = save_upload_from_request('image_file')
+    except ValueError as e:
+        flash(str(e), 'danger')
         return redirect(url_for('admin_carousel'))
-    
-    file = request.files['image_file']
-    if file.filename == '':
+    if not image_url:
         flash('No image file selected.', 'danger')
         return redirect(url_for('admin_carousel'))
+
+    title = request.form.get('title', '').strip()
+    description = request.form.get('description', '').strip()
     
-    if file and allowed_file(file.filename):
-        # Generate unique filename
-        filename = secure_filename(file.filename)
-        unique_filename = f"{uuid.uuid4()}_{filename}"
-        
-        # Create carousel directory if it doesn't exist
-        carousel_dir = os.path.join(app.static_folder, 'uploads', 'carousel')
-        os.makedirs(carousel_dir, exist_ok=True)
-        
-        # Save file
-        file_path = os.path.join(carousel_dir, unique_filename)
-        file.save(file_path)
-        
-        # Create URL for the saved file
-        image_url = f"/static/uploads/carousel/{unique_filename}"
-        
-        title = request.form.get('title', '').strip()
-        description = request.form.get('description', '').strip()
-        
-        # Get the next order number
-        max_order = db.session.query(db.func.max(CarouselImage.order)).scalar() or 0
-        
-        carousel_image = CarouselImage(
-            image_url=image_url,
-            title=title or None,
-            description=description or None,
-            order=max_order + 1
-        )
-        
-        db.session.add(carousel_image)
-        db.session.commit()
-        
-        flash('Carousel image added successfully.', 'success')
-    else:
-        flash('Invalid file type. Please upload a valid image file.', 'danger')
+    # Get the next order number
+    max_order = db.session.query(db.func.max(CarouselImage.order)).scalar() or 0
     
+    carousel_image = CarouselImage(
+        image_url=image_url,
+        title=title or None,
+        description=description or None,
+        order=max_order + 1
+    )
+    
+    db.session.add(carousel_image)
+    db.session.commit()
+    
+    flash('Carousel image added successfully.', 'success')
     return redirect(url_for('admin_carousel'))
 
 
-def allowed_file(filename):
-    """Check if file extension is allowed."""
-    ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
-
-
 @app.route('/admin/carousel/<int:image_id>/delete', methods=['POST'])
 @login_required
 def delete_carousel_image(image_id):
@@ -2697,15 +5485,8 @@ def delete_carousel_image(image_id):
     
     carousel_image = CarouselImage.query.get_or_404(image_id)
     
-    # Delete the actual file from filesystem
-    if carousel_image.image_url.startswith('/static/uploads/carousel/'):
-        file_path = os.path.join(app.static_folder, carousel_image.image_url.replace('/static/', ''))
-        if os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-            except OSError:
-                pass  # File might already be deleted
-    
+    # The file may be shared; collect_uploads.py removes it once nothing uses it
+    release_upload(carousel_image.image_url)
     db.session.delete(carousel_image)
     db.session.commit()
     
@@ -2743,7 +5524,7 @@ def reorder_carousel_images():
     for image_id, order in image_orders.items():
         carousel_image = CarouselImage.query.get(int(image_id))
         if carousel_image:
-            carousel_image.order = order
+            carousel_image.order = int(order)
     
     db.session.commit()
     return jsonify({'success': True})
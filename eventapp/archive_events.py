@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Move finished events out of the hot tables.
+
+Events that ended more than --months ago are moved, with their RSVPs,
+notifications, feedback, invitations and feedback forms, into the archived_*
+tables. Read notifications older than the cutoff are archived too. Archived
+events stay visible on the Past Events page and can be restored.
+
+Usage:
+    python archive_events.py                  # archive events older than 12 months
+    python archive_events.py --months 6 --dry-run
+    python archive_events.py --unarchive 42   # restore event 42
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, Event, archive_completed_events, unarchive_event
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Archive finished EventApp events.')
+    parser.add_argument('--months', type=int, default=12,
+                        help='Archive events that ended more than this many months ago (default 12)')
+    parser.add_argument('--batch-size', type=int, default=100,
+                        help='Events moved per transaction (default 100)')
+    parser.add_argument('--unarchive', type=int, metavar='EVENT_ID',
+                        help='Restore an archived event instead of archiving')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Only report how many events would be archived')
+    args = parser.parse_args()
+
+    with app.app_context():
+        if args.unarchive:
+            if unarchive_event(args.unarchive):
+                print(f"✅ Event {args.unarchive} restored from the archive")
+            else:
+                print(f"❌ Event {args.unarchive} is not archived")
+                sys.exit(1)
+            return
+
+        if args.dry_run:
+            cutoff = datetime.utcnow() - timedelta(days=30 * args.months)
+            count = Event.query.filter(
+                db.func.coalesce(Event.end_date, Event.start_date) < cutoff
+            ).count()
+            print(f"ℹ️  {count} events finished before {cutoff:%Y-%m-%d} would be archived")
+            return
+
+        print(f"📦 Archiving events finished more than {args.months} months ago...")
+        moved = archive_completed_events(months=args.months, batch_size=args.batch_size)
+        for table, count in moved.items():
+            print(f"✅ {table}: {count} rows archived")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+Build fingerprinted static assets.
+
+Plain file handling with no Flask. :func:`build_assets` minifies and bundles
+the stylesheets and scripts in ``assets/`` into ``static/dist/`` under
+content-hashed names, next to precompressed ``.gz`` (and, when the optional
+``brotli`` package is installed, ``.br``) copies, and writes a manifest. Static images that are shown much smaller
+than their originals (``RESIZED_IMAGES``) get a resized copy the same way.
+The manifest also records a content hash for each static image, so the app can
+add it to their URLs. Since a name changes whenever its content does,
+everything in the manifest can be cached by browsers indefinitely.
+
+Third-party libraries (Bootstrap, jQuery, DataTables, Font Awesome) are
+loaded from their pinned CDN URLs and are not bundled.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+
+from images import resize_to_width
+
+try:
+    import brotli
+except ImportError:  # Optional; only .gz copies are written without it
+    brotli = None
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+DIST_DIR = 'dist'
+MANIFEST_FILE = 'manifest.json'
+
+# Bundle name -> source files (relative to SOURCE_DIR), concatenated in order
+BUNDLES = {
+    'app.css': ['css/theme.css'],
+    'datatables-dark.css': ['css/datatables-dark.css'],
+    'app.js': ['js/file-inputs.js', 'js/carousel.js', 'js/direct-upload.js'],
+}
+# Smaller copies of static images: name -> (source under static/, width)
+RESIZED_IMAGES = {
+    'chinese-seal-96.png': ('images/logos/chinese-seal.png', 96),  # header logo, 48px at 2x
+}
+# Static directories whose files get a content hash in the manifest
+FINGERPRINTED_DIRS = ['images']
+
+_CSS_STRINGS = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')''')
+_CSS_COMMENTS = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|/\*.*?\*/''', re.S)
+_CSS_PUNCTUATION = re.compile(r'\s*([{};,])\s*')
+_JS_TOKENS = re.compile(r'''("(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`)|//[^\n]*|/\*.*?\*/''', re.S)
+
+
+def _minify_css_code(code):
+    code = _CSS_PUNCTUATION.sub(r'\1', re.sub(r'\s+', ' ', code))
+    return code.replace(';}', '}')
+
+
+def minify_css(text: str) -> str:
+    """Drop comments and collapse whitespace, leaving quoted strings alone."""
+    text = _CSS_COMMENTS.sub(lambda m: m.group(1) or ' ', text)
+    # split() with a capturing group alternates code and strings
+    pieces = _CSS_STRINGS.split(text)
+    return ''.join(piece if i % 2 else _minify_css_code(piece) for i, piece in enumerate(pieces)).strip()
+
+
+def minify_js(text: str) -> str:
+    """Drop comments, indentation and blank lines, leaving strings alone.
+
+    Line breaks are kept, so automatic semicolon insertion behaves as in the
+    source. Regular expression literals containing quotes or ``//`` are not
+    understood; write those with ``new RegExp()``.
+    """
+    text = _JS_TOKENS.sub(lambda m: m.group(1) or '', text)
+    return '\n'.join(line.strip() for line in text.splitlines() if line.strip())
+
+
+MINIFIERS = {'.css': minify_css, '.js': minify_js}
+
+
+def content_hash(data: bytes) -> str:
+    """Short, stable fingerprint of some content."""
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _publish(dist, name, data, compress=True):
+    """Write ``data`` under a content-hashed version of ``name``; return the filenames written."""
+    stem, extension = os.path.splitext(name)
+    hashed = f'{stem}.{content_hash(data)}{extension}'
+    _write(os.path.join(dist, hashed), data)
+    written = [hashed]
+    if compress:
+        # mtime=0 keeps the compressed copies identical between builds
+        _write(os.path.join(dist, hashed + '.gz'), gzip.compress(data, 9, mtime=0))
+        written.append(hashed + '.gz')
+        if brotli is not None:
+            _write(os.path.join(dist, hashed + '.br'), brotli.compress(data))
+            written.append(hashed + '.br')
+    return written
+
+
+def build_assets(static_dir, source_dir=SOURCE_DIR, bundles=BUNDLES, resized_images=RESIZED_IMAGES,
+                 fingerprinted_dirs=FINGERPRINTED_DIRS) -> dict:
+    """Write the bundles and manifest into ``static_dir``/dist and return the manifest.
+
+    Output from earlier builds that the new manifest doesn't name is removed.
+    """
+    dist = os.path.join(static_dir, DIST_DIR)
+    os.makedirs(dist, exist_ok=True)
+    manifest = {'bundles': {}, 'files': {}}
+    written = {MANIFEST_FILE}
+
+    for name, sources in bundles.items():
+        minify = MINIFIERS[os.path.splitext(name)[1]]
+        parts = []
+        for source in sources:
+            with open(os.path.join(source_dir, source), encoding='utf-8') as f:
+                parts.append(minify(f.read()))
+        files = _publish(dist, name, ('\n'.join(parts) + '\n').encode('utf-8'))
+        written.update(files)
+        manifest['bundles'][name] = files[0]
+
+    for name, (source, width) in resized_images.items():
+        # Images are already compressed; .gz copies would not be smaller
+        files = _publish(dist, name, resize_to_width(os.path.join(static_dir, source), width), compress=False)
+        written.update(files)
+        manifest['bundles'][name] = files[0]
+
+    for directory in fingerprinted_dirs:
+        for root, _, files in os.walk(os.path.join(static_dir, directory)):
+            for filename in sorted(files):
+                path = os.path.join(root, filename)
+                with open(path, 'rb') as f:
+                    relative = os.path.relpath(path, static_dir).replace(os.sep, '/')
+                    manifest['files'][relative] = content_hash(f.read())
+
+    for filename in os.listdir(dist):
+        if filename not in written:
+            os.remove(os.path.join(dist, filename))
+    with open(os.path.join(dist, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    return manifest
+
+
+def load_manifest(static_dir) -> dict:
+    """Read the manifest written by :func:`build_assets`; empty if assets haven't been built."""
+    try:
+        with open(os.path.join(static_dir, DIST_DIR, MANIFEST_FILE)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'bundles': {}, 'files': {}}
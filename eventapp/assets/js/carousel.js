@@ -0,0 +1,115 @@
+document.addEventListener('DOMContentLoaded', function() {
+  const carouselSlides = document.getElementById('carousel-slides');
+  const carouselIndicators = document.getElementById('carousel-indicators');
+  const prevBtn = document.getElementById('carousel-prev');
+  const nextBtn = document.getElementById('carousel-next');
+
+  if (!carouselSlides) return; // Exit if carousel doesn't exist
+
+  const slides = carouselSlides.querySelectorAll('.carousel-slide');
+  const indicators = carouselIndicators ? carouselIndicators.querySelectorAll('.carousel-indicator') : [];
+
+  let currentSlide = 0;
+  let autoSlideInterval;
+
+  function showSlide(index) {
+    // Remove active class from all slides and indicators
+    slides.forEach(slide => slide.classList.remove('active'));
+    indicators.forEach(indicator => indicator.classList.remove('active'));
+
+    // Add active class to current slide and indicator
+    if (slides[index]) {
+      slides[index].classList.add('active');
+    }
+    if (indicators[index]) {
+      indicators[index].classList.add('active');
+    }
+
+    currentSlide = index;
+  }
+
+  function nextSlide() {
+    const nextIndex = (currentSlide + 1) % slides.length;
+    showSlide(nextIndex);
+  }
+
+  function prevSlide() {
+    const prevIndex = (currentSlide - 1 + slides.length) % slides.length;
+    showSlide(prevIndex);
+  }
+
+  function startAutoSlide() {
+    autoSlideInterval = setInterval(nextSlide, 8000); // 8 seconds
+  }
+
+  function stopAutoSlide() {
+    if (autoSlideInterval) {
+      clearInterval(autoSlideInterval);
+    }
+  }
+
+  // Event listeners
+  if (nextBtn) {
+    nextBtn.addEventListener('click', () => {
+      nextSlide();
+      stopAutoSlide();
+      startAutoSlide();
+    });
+  }
+
+  if (prevBtn) {
+    prevBtn.addEventListener('click', () => {
+      prevSlide();
+      stopAutoSlide();
+      startAutoSlide();
+    });
+  }
+
+  // Indicator click events
+  indicators.forEach((indicator, index) => {
+    indicator.addEventListener('click', () => {
+      showSlide(index);
+      stopAutoSlide();
+      startAutoSlide();
+    });
+  });
+
+  // Touch/swipe support
+  let startX = 0;
+  let startY = 0;
+  let endX = 0;
+  let endY = 0;
+
+  carouselSlides.addEventListener('touchstart', (e) => {
+    startX = e.touches[0].clientX;
+    startY = e.touches[0].clientY;
+  });
+
+  carouselSlides.addEventListener('touchend', (e) => {
+    endX = e.changedTouches[0].clientX;
+    endY = e.changedTouches[0].clientY;
+
+    const deltaX = endX - startX;
+    const deltaY = endY - startY;
+
+    // Only trigger swipe if horizontal movement is greater than vertical
+    if (Math.abs(deltaX) > Math.abs(deltaY) && Math.abs(deltaX) > 50) {
+      if (deltaX > 0) {
+        prevSlide();
+      } else {
+        nextSlide();
+      }
+      stopAutoSlide();
+      startAutoSlide();
+    }
+  });
+
+  // Pause auto-slide on hover
+  carouselSlides.addEventListener('mouseenter', stopAutoSlide);
+  carouselSlides.addEventListener('mouseleave', startAutoSlide);
+
+  // Start auto-slide
+  if (slides.length > 1) {
+    startAutoSlide();
+  }
+});
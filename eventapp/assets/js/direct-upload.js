@@ -0,0 +1,61 @@
+// Upload chosen images straight to remote storage, then submit the form with
+// their storage keys instead of the files. Only file inputs marked with
+// data-direct-upload (the presign URL) take part; if anything goes wrong the
+// form is submitted with the file as usual.
+function directUpload(input, file) {
+  return file.arrayBuffer().then(function(buffer) {
+    return crypto.subtle.digest('SHA-256', buffer);
+  }).then(function(digest) {
+    const sha256 = Array.from(new Uint8Array(digest)).map(function(byte) {
+      return byte.toString(16).padStart(2, '0');
+    }).join('');
+    return fetch(input.dataset.directUpload, {
+      method: 'POST',
+      credentials: 'same-origin',
+      headers: {'Content-Type': 'application/json'},
+      body: JSON.stringify({sha256: sha256, size: file.size, content_type: file.type})
+    });
+  }).then(function(response) {
+    if (!response.ok) {
+      throw new Error('Upload not accepted');
+    }
+    return response.json();
+  }).then(function(upload) {
+    if (!upload.url) {
+      return upload.key;  // The same image is already stored
+    }
+    return fetch(upload.url, {method: 'PUT', headers: upload.headers, body: file}).then(function(response) {
+      if (!response.ok) {
+        throw new Error('Upload failed');
+      }
+      return upload.key;
+    });
+  });
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+  const inputs = document.querySelectorAll('input[type="file"][data-direct-upload]');
+
+  inputs.forEach(function(input) {
+    input.form.addEventListener('submit', function(event) {
+      const file = input.files[0];
+      if (!file || input.disabled || !(window.crypto && window.crypto.subtle)) {
+        return;
+      }
+      event.preventDefault();
+      const form = this;
+      directUpload(input, file).then(function(key) {
+        const field = document.createElement('input');
+        field.type = 'hidden';
+        field.name = input.name + '_key';
+        field.value = key;
+        form.appendChild(field);
+        input.disabled = true;  // Disabled inputs aren't submitted
+      }).catch(function() {
+        // Post the file through the app instead
+      }).then(function() {
+        form.submit();
+      });
+    });
+  });
+});
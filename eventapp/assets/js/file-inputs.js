@@ -0,0 +1,12 @@
+// Handle custom file input labels
+document.addEventListener('DOMContentLoaded', function() {
+  const fileInputs = document.querySelectorAll('.custom-file-input');
+
+  fileInputs.forEach(function(input) {
+    input.addEventListener('change', function() {
+      const fileName = this.files[0] ? this.files[0].name : 'Choose file';
+      const label = this.nextElementSibling;
+      label.textContent = fileName;
+    });
+  });
+});
@@ -0,0 +1,277 @@
+"""
+Printable name badges with check-in QR codes.
+
+Rendering is plain Pillow work with no Flask or database access, so badges
+can be drawn in worker processes: the view loads the attendee details,
+hands plain dicts to :func:`render_in_pool` and streams the results out as
+a multi-page PDF (:func:`stream_badge_pdf`) or a ZIP of PNGs
+(:func:`stream_badge_zip`) while later badges are still being drawn.
+
+Each badge dict carries ``name``, ``grade``, ``meal``, ``code`` and ``event``.
+"""
+
+import io
+import os
+import re
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+
+import qrcode
+from PIL import Image, ImageDraw, ImageFont
+
+BADGE_DPI = 300
+BADGE_SIZE_MM = (85, 55)
+PAGE_SIZE_MM = (210, 297)  # A4
+BADGE_COLUMNS = 2
+BADGE_ROWS = 5
+BADGES_PER_PAGE = BADGE_COLUMNS * BADGE_ROWS
+
+# Fonts with CJK coverage come first so Chinese, Japanese and Korean names
+# render; DejaVu only covers Latin, Greek and Cyrillic.
+BADGE_FONT_CANDIDATES = [
+    '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',
+    '/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc',
+    '/usr/share/fonts/google-noto-cjk/NotoSansCJK-Regular.ttc',
+    '/usr/share/fonts/truetype/wqy/wqy-microhei.ttc',
+    '/usr/share/fonts/truetype/wqy/wqy-zenhei.ttc',
+    '/System/Library/Fonts/PingFang.ttc',
+    '/System/Library/Fonts/Hiragino Sans GB.ttc',
+    'C:/Windows/Fonts/msyh.ttc',
+    'C:/Windows/Fonts/simsun.ttc',
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+]
+
+
+def find_badge_font(configured=None):
+    """Return the path of the font to draw badges with, or None for Pillow's default."""
+    for path in [configured] + BADGE_FONT_CANDIDATES:
+        if path and os.path.isfile(path):
+            return path
+    return None
+
+
+def _mm_to_px(mm):
+    return round(mm / 25.4 * BADGE_DPI)
+
+
+@lru_cache(maxsize=32)
+def _font(path, size):
+    if path:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            pass
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:  # Pillow < 10.1 only has the fixed-size bitmap font
+        return ImageFont.load_default()
+
+
+def _fit_text(draw, text, font_path, max_width, max_size, min_size):
+    """Return ``(text, font)`` shrunk (and if need be truncated) to fit ``max_width``."""
+    if not isinstance(_font(font_path, min_size), ImageFont.FreeTypeFont):
+        # Pillow's built-in bitmap font only covers Latin-1
+        text = text.encode('latin-1', 'replace').decode('latin-1')
+    size = max_size
+    while size > min_size:
+        font = _font(font_path, size)
+        if draw.textlength(text, font=font) <= max_width:
+            return text, font
+        size = int(size * 0.9)
+    font = _font(font_path, min_size)
+    ellipsis = '…' if isinstance(font, ImageFont.FreeTypeFont) else '...'
+    while text and draw.textlength(text + ellipsis, font=font) > max_width:
+        text = text[:-1]
+    return (text + ellipsis if text else ''), font
+
+
+def _qr_image(code, size):
+    # A fixed mask skips qrcode's scoring of all eight patterns, which is most
+    # of the rendering time; every mask is equally valid to scanners.
+    qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_M, border=2, mask_pattern=0)
+    qr.add_data(code)
+    qr.make(fit=True)
+    matrix = qr.get_matrix()
+    modules = Image.frombytes('L', (len(matrix), len(matrix)),
+                              bytes(0 if dark else 255 for row in matrix for dark in row))
+    return modules.resize((size, size), Image.NEAREST)
+
+
+def draw_badge(badge, font_path=None):
+    """Draw one badge as a greyscale image at ``BADGE_DPI``."""
+    width, height = _mm_to_px(BADGE_SIZE_MM[0]), _mm_to_px(BADGE_SIZE_MM[1])
+    img = Image.new('L', (width, height), 255)
+    draw = ImageDraw.Draw(img)
+    pad = _mm_to_px(4)
+
+    # Cutting guide
+    draw.rectangle([0, 0, width - 1, height - 1], outline=200, width=2)
+
+    full_width = width - 2 * pad
+    event, font = _fit_text(draw, badge.get('event') or '', font_path, full_width,
+                            _mm_to_px(3.5), _mm_to_px(2.5))
+    draw.text((pad, pad), event, font=font, fill=90)
+
+    name, font = _fit_text(draw, badge.get('name') or '', font_path, full_width,
+                           _mm_to_px(9), _mm_to_px(4))
+    draw.text((pad, pad + _mm_to_px(7)), name, font=font, fill=0)
+
+    # QR code in the bottom-right corner, grade and meal beside it
+    qr_size = _mm_to_px(28)
+    img.paste(_qr_image(badge['code'], qr_size), (width - pad - qr_size, height - pad - qr_size))
+    grade, font = _fit_text(draw, badge.get('grade') or '', font_path, full_width - qr_size - pad,
+                            _mm_to_px(5), _mm_to_px(3))
+    draw.text((pad, height - pad - qr_size), grade, font=font, fill=40)
+
+    if badge.get('meal'):
+        font = _font(font_path, _mm_to_px(4))
+        label_y = height - pad - _mm_to_px(7)
+        label_width = draw.textlength('MEAL', font=font) + _mm_to_px(4)
+        draw.rectangle([pad, label_y, pad + label_width, height - pad], fill=0)
+        draw.text((pad + _mm_to_px(2), label_y + _mm_to_px(1)), 'MEAL', font=font, fill=255)
+    return img
+
+
+def render_badge_png(badge, font_path=None):
+    """Render one badge as PNG bytes."""
+    buffer = io.BytesIO()
+    draw_badge(badge, font_path).save(buffer, format='PNG', optimize=False)
+    return buffer.getvalue()
+
+
+def render_badge_page(badges, font_path=None):
+    """Render up to ``BADGES_PER_PAGE`` badges onto an A4 sheet.
+
+    Returns:
+        ``(width, height, data)`` where ``data`` is the Flate-compressed
+        8-bit greyscale raster, ready to embed in a PDF.
+    """
+    page_width, page_height = _mm_to_px(PAGE_SIZE_MM[0]), _mm_to_px(PAGE_SIZE_MM[1])
+    badge_width, badge_height = _mm_to_px(BADGE_SIZE_MM[0]), _mm_to_px(BADGE_SIZE_MM[1])
+    left = (page_width - BADGE_COLUMNS * badge_width) // 2
+    top = (page_height - BADGE_ROWS * badge_height) // 2
+
+    page = Image.new('L', (page_width, page_height), 255)
+    for index, badge in enumerate(badges[:BADGES_PER_PAGE]):
+        row, column = divmod(index, BADGE_COLUMNS)
+        page.paste(draw_badge(badge, font_path), (left + column * badge_width, top + row * badge_height))
+    return page_width, page_height, zlib.compress(page.tobytes(), 1)
+
+
+def render_in_pool(func, items, workers):
+    """Yield ``func(item)`` for each item, in order, rendered by ``workers`` processes.
+
+    With ``workers`` of 1 or less everything is rendered in this process,
+    for hosts that do not allow child processes. Abandoning the generator
+    (e.g. the client disconnects mid-download) cancels the remaining work.
+    """
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    workers = min(workers, len(items))
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        chunksize = max(1, len(items) // (workers * 4))
+        yield from executor.map(func, items, chunksize=chunksize)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def chunked(items, size):
+    """Split ``items`` into lists of at most ``size``."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def stream_badge_pdf(pages):
+    """Stream a PDF built from ``(width, height, data)`` pages as they arrive.
+
+    Each page is one full-bleed greyscale image, so objects can be written
+    out immediately; the page tree and cross-reference table come last.
+    """
+    offsets = {}
+    position = 0
+    kids = []
+
+    def emit(number, body, stream=None):
+        nonlocal position
+        offsets[number] = position
+        chunk = f"{number} 0 obj\n".encode('ascii') + body
+        if stream is not None:
+            chunk += b"\nstream\n" + stream + b"\nendstream"
+        chunk += b"\nendobj\n"
+        position += len(chunk)
+        return chunk
+
+    header = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+    position = len(header)
+    yield header
+    yield emit(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+
+    points_width = PAGE_SIZE_MM[0] / 25.4 * 72
+    points_height = PAGE_SIZE_MM[1] / 25.4 * 72
+    next_number = 3
+    for width, height, data in pages:
+        image, content, page = next_number, next_number + 1, next_number + 2
+        next_number += 3
+        yield emit(image, (
+            f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height} "
+            f"/ColorSpace /DeviceGray /BitsPerComponent 8 /Filter /FlateDecode "
+            f"/Length {len(data)} >>"
+        ).encode('ascii'), data)
+        drawing = f"q {points_width:.2f} 0 0 {points_height:.2f} 0 0 cm /Im0 Do Q".encode('ascii')
+        yield emit(content, f"<< /Length {len(drawing)} >>".encode('ascii'), drawing)
+        yield emit(page, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {points_width:.2f} {points_height:.2f}] "
+            f"/Resources << /XObject << /Im0 {image} 0 R >> >> /Contents {content} 0 R >>"
+        ).encode('ascii'))
+        kids.append(f"{page} 0 R")
+
+    yield emit(2, f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode('ascii'))
+
+    xref = [f"xref\n0 {next_number}\n", "0000000000 65535 f \n"]
+    xref.extend(f"{offsets[number]:010d} 00000 n \n" for number in range(1, next_number))
+    xref.append(f"trailer\n<< /Size {next_number} /Root 1 0 R >>\nstartxref\n{position}\n%%EOF\n")
+    yield ''.join(xref).encode('ascii')
+
+
+class _ChunkBuffer:
+    """Write-only file object that hands back what was written since the last drain."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def badge_filename(index, badge):
+    """Archive member name for a badge, e.g. ``0001_Jane Tan.png``."""
+    name = re.sub(r'[\\/:*?"<>|\x00-\x1f]+', '_', badge.get('name') or 'badge').strip() or 'badge'
+    return f"{index:04d}_{name}.png"
+
+
+def stream_badge_zip(files):
+    """Stream a ZIP archive of ``(filename, data)`` pairs as they arrive."""
+    buffer = _ChunkBuffer()
+    timestamp = datetime.now().timetuple()[:6]
+    # An unseekable target makes zipfile write data descriptors instead of seeking back
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as archive:
+        for filename, data in files:
+            archive.writestr(zipfile.ZipInfo(filename, date_time=timestamp), data)
+            yield buffer.drain()
+    yield buffer.drain()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Build the fingerprinted CSS/JS bundles and resized images in static/dist.
+
+Run this after editing anything in assets/ (or adding images under
+static/images) and commit the result; the app reads static/dist/manifest.json
+at startup, so restart it after building. Static page snapshots link to
+the old bundles, which this deletes: with STATIC_SNAPSHOTS on, run
+write_snapshots.py next, which re-renders every page when the manifest
+changes. Install the optional brotli
+package to also write .br copies.
+
+Usage:
+    python build_assets.py
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from assets import DIST_DIR, brotli, build_assets
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+
+
+def main():
+    print("📦 Building static assets...")
+    manifest = build_assets(STATIC_DIR)
+    for name, hashed in manifest['bundles'].items():
+        path = os.path.join(STATIC_DIR, DIST_DIR, hashed)
+        size = f"{os.path.getsize(path):,} bytes"
+        if os.path.exists(path + '.gz'):
+            size += f", {os.path.getsize(path + '.gz'):,} gzipped"
+        print(f"✅ {name} -> {hashed} ({size})")
+    print(f"✅ Fingerprinted {len(manifest['files'])} static files")
+    if brotli is None:
+        print("ℹ️  brotli is not installed; only .gz copies were written")
+    print(f"🎉 Wrote {os.path.join('static', DIST_DIR, 'manifest.json')}")
+
+
+if __name__ == '__main__':
+    main()
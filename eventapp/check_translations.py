@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Check the translation catalogs and templates before deploying.
+
+Compiles every template for every supported language, as the app does on
+first render, and lists translation keys that are used in a template but
+missing from translations.py, and keys a language is missing compared
+with English. Exits with status 1 if anything is missing.
+
+Usage:
+    python check_translations.py
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, SUPPORTED_LANGUAGES, TRANSLATION_GAPS
+from i18n import compile_all_templates
+
+
+def main():
+    print("🌐 Compiling templates for " + ', '.join(SUPPORTED_LANGUAGES) + "...")
+    with app.app_context():
+        missing = compile_all_templates(app.jinja_env, SUPPORTED_LANGUAGES)
+
+    for name, line, key in missing:
+        print(f"❌ {name}:{line}: no translation for {key!r}")
+    gaps = {language: keys for language, keys in TRANSLATION_GAPS.items() if keys}
+    for language, keys in gaps.items():
+        print(f"⚠️  {SUPPORTED_LANGUAGES.get(language, language)} is missing {len(keys)} keys: {', '.join(keys)}")
+
+    if missing or gaps:
+        sys.exit(1)
+    print("✅ Every template key is translated")
+
+
+if __name__ == '__main__':
+    main()
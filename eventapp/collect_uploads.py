@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Remove uploaded images that nothing uses any more.
+
+Replaced event covers, deleted carousel slides and abandoned uploads leave
+files behind in static/uploads. This job reads every upload still in use
+from the database in one query, compares it with the files on disk, and
+removes the rest: originals, their renditions, and partial files from
+interrupted uploads. Files younger than the grace period are left alone, so
+uploads still in progress are never touched.
+
+Usage:
+    python collect_uploads.py --dry-run               # report what would be removed
+    python collect_uploads.py                         # remove it (e.g. as a daily scheduled task)
+    python collect_uploads.py --quarantine /tmp/old   # move originals there instead of deleting them
+    python collect_uploads.py --grace-hours 72        # only touch files older than three days
+"""
+
+import argparse
+import os
+import sys
+from datetime import timedelta
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, UPLOAD_GRACE_PERIOD, collect_unused_uploads
+
+
+def _format_bytes(size):
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1024
+    return f'{size:.1f} GB'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Remove uploaded images that nothing uses any more.')
+    parser.add_argument('--dry-run', action='store_true', help='Only report what would be removed')
+    parser.add_argument('--grace-hours', type=float, default=UPLOAD_GRACE_PERIOD.total_seconds() / 3600,
+                        help='Leave files younger than this alone (default: %(default)g)')
+    parser.add_argument('--quarantine', metavar='DIR',
+                        help='Move unused originals into DIR instead of deleting them')
+    parser.add_argument('-v', '--verbose', action='store_true', help='List every file removed')
+    args = parser.parse_args()
+
+    with app.app_context():
+        report = collect_unused_uploads(grace_period=timedelta(hours=args.grace_hours), dry_run=args.dry_run,
+                                        quarantine_dir=args.quarantine)
+
+    if args.verbose or args.dry_run:
+        for path in report['paths']:
+            print(f"  {path}")
+    verb = 'Would remove' if args.dry_run else 'Removed'
+    print(f"✅ {verb} {report['files']} files ({_format_bytes(report['bytes'])}) "
+          f"and {report['records']} upload records")
+    if report['recent']:
+        print(f"ℹ️  Kept {report['recent']} unused files younger than {args.grace_hours:g} hours")
+
+
+if __name__ == '__main__':
+    main()
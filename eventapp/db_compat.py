@@ -0,0 +1,192 @@
+"""
+Dialect-neutral database helpers.
+
+The app started on SQLite, but the hosting notes in the user stories call for
+MySQL (PythonAnywhere) or PostgreSQL once load grows. Everything in here goes
+through SQLAlchemy's inspector and dialect compiler instead of SQLite-only
+constructs such as ``pragma_table_info`` or an unquoted ``user`` table name
+(a reserved word on PostgreSQL), so migrations and maintenance scripts run
+unchanged on every supported engine.
+"""
+
+from contextlib import contextmanager
+
+from sqlalchemy import Column, event, inspect, literal
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
+
+
+def normalize_database_url(url: str) -> str:
+    """Return a SQLAlchemy-compatible database URL.
+
+    Hosting providers commonly hand out ``postgres://`` URLs, which
+    SQLAlchemy 1.4+ no longer accepts, and bare ``mysql://`` URLs, which
+    would pick the C MySQLdb driver that PythonAnywhere does not always ship.
+    """
+    if url.startswith('postgres://'):
+        return 'postgresql://' + url[len('postgres://'):]
+    if url.startswith('mysql://'):
+        return 'mysql+pymysql://' + url[len('mysql://'):]
+    return url
+
+
+def is_sqlite_url(url: str) -> bool:
+    """Check whether a database URL points at SQLite."""
+    return url.startswith('sqlite')
+
+
+def engine_options_for(url: str) -> dict:
+    """Return engine options suited to the database behind ``url``.
+
+    Server databases drop idle connections (PythonAnywhere MySQL after 300s),
+    so the pool pings before use and recycles connections early.
+    """
+    if is_sqlite_url(url):
+        return {}
+    return {
+        'pool_pre_ping': True,
+        'pool_recycle': 280,
+    }
+
+
+def read_only_url(url: str) -> str:
+    """Return a read-only variant of a SQLite URL.
+
+    SQLite opens the same file through a ``mode=ro`` URI, so reporting
+    connections can never take a write lock. Server database URLs are returned
+    unchanged; point ``REPORTING_DATABASE_URL`` at a replica for those.
+    """
+    if not is_sqlite_url(url):
+        return url
+    parsed = make_url(url)
+    if parsed.database in (None, '', ':memory:') or parsed.query.get('uri'):
+        return url
+    return f"{parsed.drivername}:///file:{parsed.database}?mode=ro&uri=true"
+
+
+def reporting_bind_options(url: str) -> dict:
+    """Return Flask-SQLAlchemy bind options for the reporting engine.
+
+    SQLite reporting connections are not pooled so a refreshed snapshot file
+    is picked up by the next request instead of a stale pooled handle.
+    """
+    options = {'url': url}
+    if is_sqlite_url(url):
+        options['poolclass'] = NullPool
+    return options
+
+
+def enable_sqlite_wal(engine) -> None:
+    """Switch a SQLite engine to write-ahead logging.
+
+    In WAL mode readers work from a snapshot and never block the writer, so a
+    long report running on the reporting connection can't stall check-ins.
+    Only enabled with ``SQLITE_WAL=true``: use it for databases on a local
+    disk, never on a network filesystem.
+    """
+    if engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def _set_journal_mode(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.close()
+
+
+@contextmanager
+def snapshot_connection(engine):
+    """Yield a connection whose reads all see one consistent snapshot.
+
+    PostgreSQL and MySQL get a REPEATABLE READ transaction. pysqlite only
+    opens a transaction before writes, so SQLite gets an explicit BEGIN; the
+    first read then pins the snapshot (in WAL mode without blocking writers).
+    """
+    with engine.connect() as conn:
+        if conn.dialect.name == 'sqlite':
+            conn.exec_driver_sql('BEGIN')
+        else:
+            conn.execution_options(isolation_level='REPEATABLE READ')
+        try:
+            yield conn
+        finally:
+            conn.rollback()
+
+
+def quote_table(conn, table: str) -> str:
+    """Quote a table name for the connection's dialect."""
+    return conn.dialect.identifier_preparer.quote(table)
+
+
+def table_exists(conn, table: str) -> bool:
+    """Check whether a table exists."""
+    return inspect(conn).has_table(table)
+
+
+def column_exists(conn, table: str, column: str) -> bool:
+    """Check whether a column exists on a table."""
+    if not table_exists(conn, table):
+        return False
+    return any(col['name'] == column for col in inspect(conn).get_columns(table))
+
+
+def column_type(conn, table: str, column: str):
+    """Return the reflected type of a column, or None if it is missing."""
+    if not table_exists(conn, table):
+        return None
+    for col in inspect(conn).get_columns(table):
+        if col['name'] == column:
+            return col['type']
+    return None
+
+
+def add_column(conn, table: str, column: Column) -> bool:
+    """Add ``column`` to ``table`` unless it already exists.
+
+    The column type and default are rendered by the connection's dialect, so
+    ``Boolean`` defaults come out as ``1``/``0`` on SQLite and MySQL and as
+    ``true``/``false`` on PostgreSQL.
+
+    Returns:
+        True if the column was added, False if it already existed.
+    """
+    if column_exists(conn, table, column.name):
+        return False
+
+    preparer = conn.dialect.identifier_preparer
+    ddl = (
+        f"ALTER TABLE {preparer.quote(table)} "
+        f"ADD COLUMN {preparer.quote(column.name)} "
+        f"{column.type.compile(dialect=conn.dialect)}"
+    )
+    if column.default is not None and column.default.is_scalar:
+        default_sql = literal(column.default.arg, type_=column.type).compile(
+            dialect=conn.dialect, compile_kwargs={'literal_binds': True}
+        )
+        ddl += f" DEFAULT {default_sql}"
+
+    conn.exec_driver_sql(ddl)
+    return True
+
+
+def drop_foreign_key(conn, table: str, column: str) -> bool:
+    """Drop the foreign key on ``table.column`` if it has one.
+
+    SQLite can't drop a constraint without rebuilding the table, and only
+    enforces foreign keys when ``PRAGMA foreign_keys`` is on (the app never
+    turns it on), so there the key is left in place.
+
+    Returns:
+        True if a foreign key was dropped.
+    """
+    if conn.dialect.name == 'sqlite' or not table_exists(conn, table):
+        return False
+    preparer = conn.dialect.identifier_preparer
+    dropped = False
+    for key in inspect(conn).get_foreign_keys(table):
+        if key['constrained_columns'] != [column] or not key.get('name'):
+            continue
+        drop = 'FOREIGN KEY' if conn.dialect.name == 'mysql' else 'CONSTRAINT'
+        conn.exec_driver_sql(f"ALTER TABLE {preparer.quote(table)} DROP {drop} {preparer.quote(key['name'])}")
+        dropped = True
+    return dropped
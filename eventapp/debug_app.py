@@ -127,7 +127,8 @@ def test_database():
         # Test database connection
         with app.app_context():
             db.create_all()
-            result = db.engine.execute("SELECT 1").fetchone()
+            with db.engine.connect() as conn:
+                result = conn.execute(db.text("SELECT 1")).fetchone()
         
         return '''
         <h1>✅ Database Test Passed</h1>
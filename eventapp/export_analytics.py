@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Dump users, events, RSVPs, feedback and notifications for offline analysis.
+
+Each run writes one gzip-compressed NDJSON file (see iter_analytics_dump in
+app.py for the line format) from a consistent snapshot of the reporting
+database. The watermark of the last complete dump is kept next to the
+output, so nightly runs only export rows changed since then.
+
+Usage:
+    python export_analytics.py --output exports/          # incremental after the first run
+    python export_analytics.py --output exports/ --full   # everything
+    python export_analytics.py --output exports/ --tables rsvp,event
+    python export_analytics.py --since 2026-01-01T00:00:00 --stdout > changes.ndjson
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+from datetime import datetime
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, iter_analytics_dump
+
+WATERMARK_FILE = 'analytics_watermark.json'
+
+
+def _read_watermark(output):
+    try:
+        with open(os.path.join(output, WATERMARK_FILE)) as f:
+            return datetime.fromisoformat(json.load(f)['watermark'].rstrip('Z'))
+    except (FileNotFoundError, KeyError, TypeError, ValueError):
+        return None
+
+
+def export_analytics(output, since=None, tables=None):
+    """Write a dump into ``output`` and advance its watermark.
+
+    Returns:
+        Tuple of (path written, footer dict).
+    """
+    os.makedirs(output, exist_ok=True)
+    name = f"analytics_{datetime.utcnow():%Y%m%d_%H%M%S}{'_incremental' if since else ''}.ndjson.gz"
+    path = os.path.join(output, name)
+    tmp_path = f"{path}.tmp"
+
+    footer = None
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        for line in iter_analytics_dump(since, tables):
+            f.write(line)
+            record = json.loads(line) if line.startswith('{"type":"footer"') else None
+            if record:
+                footer = record
+    os.replace(tmp_path, path)
+
+    # Only a complete dump moves the watermark forward
+    if footer and footer['watermark']:
+        with open(os.path.join(output, WATERMARK_FILE), 'w') as f:
+            json.dump({'watermark': footer['watermark'], 'file': name}, f)
+    return path, footer
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export EventApp tables as NDJSON for analytics.')
+    parser.add_argument('--output', default='analytics_exports',
+                        help='Directory for dumps and the watermark file (default analytics_exports)')
+    parser.add_argument('--full', action='store_true', help='Ignore the stored watermark')
+    parser.add_argument('--since', help='Only export rows updated at or after this ISO timestamp')
+    parser.add_argument('--tables', help='Comma-separated tables (default: all)')
+    parser.add_argument('--stdout', action='store_true',
+                        help='Write uncompressed NDJSON to stdout; the watermark file is not touched')
+    args = parser.parse_args()
+
+    tables = args.tables.split(',') if args.tables else None
+    if args.since:
+        since = datetime.fromisoformat(args.since.rstrip('Z'))
+    elif args.full or args.stdout:
+        since = None
+    else:
+        since = _read_watermark(args.output)
+
+    with app.app_context():
+        try:
+            if args.stdout:
+                for line in iter_analytics_dump(since, tables):
+                    sys.stdout.write(line)
+                return
+            label = f"rows changed since {since.isoformat()}" if since else "all rows"
+            print(f"📤 Exporting {label}...")
+            path, footer = export_analytics(args.output, since, tables)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+
+    for table, count in footer['counts'].items():
+        print(f"✅ {table}: {count} rows")
+    print(f"🎉 Wrote {path} (watermark {footer['watermark']})")
+
+
+if __name__ == '__main__':
+    main()
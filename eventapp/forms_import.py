@@ -0,0 +1,167 @@
+"""
+Read Microsoft Forms response exports.
+
+Plain file handling with no Flask or database access. :func:`read_export`
+yields rows one at a time from a ``.csv`` or ``.xlsx`` export, so files of
+any size are read in constant memory; :func:`resolve_columns` maps the
+export's headers onto feedback fields and :func:`parse_response` turns one
+row into a dict ready for the ``Feedback`` model.
+
+``.xlsx`` exports need openpyxl, which is optional; CSV needs nothing extra.
+"""
+
+import csv
+import os
+from contextlib import contextmanager
+from datetime import datetime
+
+RATING_FIELDS = ('overall_rating', 'content_quality', 'organization', 'venue_rating',
+                 'value_for_money', 'likelihood_to_recommend')
+FIELDS = ('response_id', 'email', 'completed_at') + RATING_FIELDS + ('additional_comments',)
+REQUIRED_FIELDS = ('response_id', 'email') + RATING_FIELDS
+
+# Fixed columns every MS Forms export has, matched exactly
+EXPORT_COLUMNS = {
+    'response_id': ('id',),
+    'email': ('email', 'email address'),
+    'completed_at': ('completion time',),
+}
+# Question columns are named after the question; matched by keyword unless mapped
+QUESTION_KEYWORDS = {
+    'overall_rating': ('overall',),
+    'content_quality': ('content',),
+    'organization': ('organis', 'organiz'),
+    'venue_rating': ('venue',),
+    'value_for_money': ('value',),
+    'likelihood_to_recommend': ('recommend',),
+    'additional_comments': ('comment', 'suggestion'),
+}
+EXPORT_TIME_FORMATS = ('%m/%d/%y %H:%M:%S', '%m/%d/%Y %H:%M:%S', '%Y-%m-%d %H:%M:%S')
+
+
+@contextmanager
+def read_export(path):
+    """Open an export and yield ``(headers, rows)``; ``rows`` is a lazy iterator of lists.
+
+    Raises:
+        ValueError: for unsupported file types or an empty file.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            reader = csv.reader(f)
+            headers = next(reader, None)
+            if headers is None:
+                raise ValueError(f'{path} is empty')
+            yield [h.strip() for h in headers], reader
+    elif extension == '.xlsx':
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ValueError('Reading .xlsx exports needs openpyxl (pip install openpyxl), '
+                             'or save the export as CSV') from None
+        # Read-only mode streams rows from the zip instead of building the sheet
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            headers = next(rows, None)
+            if headers is None:
+                raise ValueError(f'{path} is empty')
+            yield ['' if h is None else str(h).strip() for h in headers], rows
+        finally:
+            workbook.close()
+    else:
+        raise ValueError(f'Unsupported export type {extension or path!r}; use .csv or .xlsx')
+
+
+def resolve_columns(headers, mapping=None) -> dict:
+    """Return the column index of each feedback field.
+
+    ``mapping`` maps field names to exact header text and wins over the
+    defaults; unmapped fields fall back to the standard export columns and
+    question keywords.
+
+    Raises:
+        ValueError: if a mapped header is missing or a required field is unmatched.
+    """
+    mapping = mapping or {}
+    unknown = set(mapping) - set(FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown feedback fields in mapping: {', '.join(sorted(unknown))}")
+
+    lowered = [h.lower() for h in headers]
+    columns = {}
+    for field, header in mapping.items():
+        if header not in headers:
+            raise ValueError(f'Column {header!r} mapped to {field} is not in the export')
+        columns[field] = headers.index(header)
+
+    taken = set(columns.values())
+    for field in FIELDS:
+        if field in columns:
+            continue
+        for index, header in enumerate(lowered):
+            if index in taken:
+                continue
+            if header in EXPORT_COLUMNS.get(field, ()) or \
+                    any(keyword in header for keyword in QUESTION_KEYWORDS.get(field, ())):
+                columns[field] = index
+                taken.add(index)
+                break
+
+    missing = [field for field in REQUIRED_FIELDS if field not in columns]
+    if missing:
+        raise ValueError(f"No column found for {', '.join(missing)}; map them explicitly")
+    return columns
+
+
+def _cell(row, index):
+    value = row[index] if index < len(row) else None
+    return value.strip() if isinstance(value, str) else value
+
+
+def _rating(value) -> int:
+    try:
+        rating = int(float(value))
+    except (TypeError, ValueError):
+        raise ValueError(f'rating {value!r} is not a number') from None
+    if not 1 <= rating <= 5:
+        raise ValueError(f'rating {rating} is outside 1-5')
+    return rating
+
+
+def _completed_at(value):
+    if isinstance(value, datetime):
+        return value
+    if not isinstance(value, str):
+        return None
+    for fmt in EXPORT_TIME_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            pass
+    return None
+
+
+def parse_response(row, columns) -> dict:
+    """Turn one export row into feedback values.
+
+    Raises:
+        ValueError: if the response id or email is blank or a rating is invalid.
+    """
+    response_id = _cell(row, columns['response_id'])
+    email = _cell(row, columns['email'])
+    if response_id in (None, '') or not email:
+        raise ValueError('response id or email is missing')
+    if isinstance(response_id, float) and response_id.is_integer():
+        response_id = int(response_id)  # Excel stores the ID column as a number
+    values = {
+        'response_id': str(response_id),
+        'email': str(email).lower(),
+        'completed_at': _completed_at(_cell(row, columns['completed_at'])) if 'completed_at' in columns else None,
+    }
+    for field in RATING_FIELDS:
+        values[field] = _rating(_cell(row, columns[field]))
+    comments = _cell(row, columns['additional_comments']) if 'additional_comments' in columns else None
+    values['additional_comments'] = str(comments) if comments not in (None, '') else None
+    return values
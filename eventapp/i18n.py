@@ -0,0 +1,124 @@
+"""
+Compiled translation catalogs and the template machinery that uses them.
+
+:func:`compile_catalogs` turns ``TRANSLATIONS`` into one read-only lookup
+table per locale, with the default locale's text filled in for keys a
+locale lacks, so a lookup is a single dict access.
+
+:class:`TranslationExtension` replaces ``get_translation('key')`` calls that
+use a constant key with the translated text while a template compiles, and
+:class:`LocalizedEnvironment` keeps one compiled copy of each template per
+locale so that is possible. Constant keys missing from the catalogs are
+recorded as templates compile; :func:`compile_all_templates` compiles every
+template for every locale so they can be reported before deploying.
+"""
+
+import logging
+from types import MappingProxyType
+
+from flask.templating import Environment
+from jinja2.ext import Extension
+from jinja2.lexer import TOKEN_DOT, TOKEN_LPAREN, TOKEN_NAME, TOKEN_RPAREN, TOKEN_STRING, Token
+
+DEFAULT_LOCALE = 'en'
+
+logger = logging.getLogger(__name__)
+
+
+def compile_catalogs(translations, default=DEFAULT_LOCALE):
+    """Build a frozen lookup table per locale.
+
+    Returns:
+        Tuple of (read-only dict of locale -> catalog, dict of locale -> sorted
+        keys the locale is missing from the default locale).
+    """
+    base = translations[default]
+    catalogs, gaps = {}, {}
+    for locale, messages in translations.items():
+        catalogs[locale] = MappingProxyType({**base, **messages})
+        gaps[locale] = sorted(set(base) - set(messages))
+    return MappingProxyType(catalogs), gaps
+
+
+class TranslationExtension(Extension):
+    """Inline ``get_translation('constant')`` calls for the environment's locale.
+
+    Calls with a variable key or an explicit language are left alone and
+    run at render time as before.
+    """
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(translation_catalogs=None, translation_locale=DEFAULT_LOCALE,
+                           missing_translations=set())
+
+    def filter_stream(self, stream):
+        catalogs = self.environment.translation_catalogs
+        if catalogs is None:
+            return stream
+        catalog = catalogs[self.environment.translation_locale]
+        return self._inline(list(stream), catalog, stream.name)
+
+    def _inline(self, tokens, catalog, name):
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            call = tokens[i:i + 4]
+            if (token.type == TOKEN_NAME and token.value == 'get_translation'
+                    and [t.type for t in call[1:]] == [TOKEN_LPAREN, TOKEN_STRING, TOKEN_RPAREN]
+                    and (i == 0 or tokens[i - 1].type != TOKEN_DOT)):
+                key = call[2].value
+                if key not in catalog:
+                    self.environment.missing_translations.add((name, token.lineno, key))
+                    logger.warning('%s:%s: no translation for %r', name, token.lineno, key)
+                yield Token(token.lineno, TOKEN_STRING, catalog.get(key, key))
+                i += 4
+            else:
+                yield token
+                i += 1
+
+
+class LocalizedEnvironment(Environment):
+    """Flask's template environment, compiling and caching templates per locale.
+
+    Set ``locale_selector`` to a function returning the locale to render in;
+    templates are then loaded through a per-locale overlay with its own
+    template cache. Templates a template extends or includes come from the
+    same overlay.
+    """
+
+    locale_selector = None
+    is_locale_overlay = False
+
+    def __init__(self, app, **options):
+        super().__init__(app, **options)
+        self.locale_overlays = {}
+
+    def for_locale(self, locale):
+        """Return the environment that compiles templates for ``locale``."""
+        overlay = self.locale_overlays.get(locale)
+        if overlay is None:
+            overlay = self.overlay(cache_size=self.cache.capacity if self.cache is not None else 0)
+            overlay.is_locale_overlay = True
+            overlay.translation_locale = locale
+            overlay = self.locale_overlays.setdefault(locale, overlay)
+        return overlay
+
+    def _load_template(self, name, globals):
+        if self.locale_selector is None or self.is_locale_overlay:
+            return super()._load_template(name, globals)
+        return self.for_locale(self.locale_selector())._load_template(name, globals)
+
+
+def compile_all_templates(environment, locales):
+    """Compile every template for each locale and return the missing keys found.
+
+    Returns:
+        Sorted list of (template name, line, key) for constant keys that
+        aren't in the catalogs.
+    """
+    for locale in locales:
+        localized = environment.for_locale(locale)
+        for name in environment.list_templates(extensions=['html']):
+            localized.get_template(name)
+    return sorted(environment.missing_translations)
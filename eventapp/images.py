@@ -0,0 +1,178 @@
+"""
+Responsive renditions of uploaded images.
+
+Plain Pillow work with no Flask or database access. :func:`make_renditions`
+turns one uploaded original into a fixed set of sizes (see ``RENDITIONS``),
+each in WebP and JPEG, with EXIF and other metadata stripped and the camera
+orientation applied to the pixels. It also returns a tiny blurred
+placeholder as a data URI, which pages show until the real image loads.
+
+Animated GIFs are rendered from their first frame.
+
+:func:`read_image_header` checks an upload before it is stored: it reads
+only the first bytes of the stream to find the real format (from the file's
+signature, not its name) and the pixel dimensions.
+"""
+
+import base64
+import io
+import os
+import warnings
+
+from PIL import Image, ImageFilter, ImageOps, UnidentifiedImageError
+
+# Rendition name -> maximum width in pixels; originals are never upscaled
+RENDITIONS = {'thumb': 320, 'card': 800, 'hero': 1600}
+RENDITION_FORMATS = {'webp': 'WEBP', 'jpg': 'JPEG'}
+RENDITION_QUALITY = {'WEBP': 80, 'JPEG': 82}
+PLACEHOLDER_WIDTH = 16
+JPEG_BACKGROUND = (255, 255, 255)
+
+# Accepted upload formats: Pillow format -> extension the file is stored with
+UPLOAD_FORMATS = {'JPEG': '.jpg', 'PNG': '.png', 'GIF': '.gif', 'WEBP': '.webp'}
+UPLOAD_CONTENT_TYPES = {'JPEG': 'image/jpeg', 'PNG': 'image/png', 'GIF': 'image/gif', 'WEBP': 'image/webp'}
+MAX_UPLOAD_PIXELS = 40_000_000
+# How far into a file to look for its dimensions (JPEG EXIF blocks can be large)
+HEADER_READ_LIMIT = 1024 * 1024
+
+
+def image_format(head):
+    """The Pillow format named by a file's leading bytes, or None if it isn't one we accept."""
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'JPEG'
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'PNG'
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return 'GIF'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'WEBP'
+    return None
+
+
+def _header_size(head, pil_format):
+    """Image dimensions from a file's first bytes; None if they aren't in there yet."""
+    try:
+        with warnings.catch_warnings():
+            # Oversized images are rejected by the caller against MAX_UPLOAD_PIXELS
+            warnings.simplefilter('ignore', Image.DecompressionBombWarning)
+            with Image.open(io.BytesIO(head), formats=[pil_format]) as image:
+                return image.size
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError):
+        return None
+
+
+def read_image_header(stream, chunk_size=64 * 1024, limit=HEADER_READ_LIMIT, max_pixels=MAX_UPLOAD_PIXELS):
+    """Read the start of an uploaded image, just far enough to check it.
+
+    Usually the first chunk is enough. The pixels are never decoded.
+
+    Returns:
+        Tuple of (bytes read so far, Pillow format, (width, height)).
+
+    Raises:
+        ValueError: if the file is not a JPEG, PNG, GIF or WebP image, its
+            dimensions aren't within ``limit`` bytes, or it has more than
+            ``max_pixels`` pixels.
+    """
+    head = b''
+    while True:
+        chunk = stream.read(chunk_size)
+        head += chunk
+        pil_format = image_format(head)
+        if pil_format is None and (len(head) >= 12 or not chunk):
+            raise ValueError('Invalid file type. Please upload PNG, JPG, JPEG, GIF, or WebP images.')
+        size = _header_size(head, pil_format) if pil_format else None
+        if size:
+            break
+        if not chunk or len(head) >= limit:
+            raise ValueError('The file is not a readable image.')
+    if size[0] * size[1] > max_pixels:
+        raise ValueError(f'The image is too large ({size[0]}x{size[1]}); '
+                         f'please upload one under {max_pixels // 1_000_000} megapixels.')
+    return head, pil_format, size
+
+
+def _open_upright(path):
+    """Open an image, apply its EXIF orientation and drop everything but the pixels."""
+    with Image.open(path) as original:
+        original.seek(0)
+        image = ImageOps.exif_transpose(original)
+        image.load()
+    if image.mode not in ('RGB', 'RGBA'):
+        has_alpha = image.mode in ('LA', 'PA') or 'transparency' in image.info
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+    image.info = {}
+    return image
+
+
+def _flatten(image):
+    """JPEG has no alpha channel; composite transparent images onto white."""
+    if image.mode != 'RGBA':
+        return image
+    background = Image.new('RGB', image.size, JPEG_BACKGROUND)
+    background.paste(image, mask=image.getchannel('A'))
+    return background
+
+
+def _resized(image, width):
+    if image.width <= width:
+        return image
+    height = max(1, round(image.height * width / image.width))
+    return image.resize((width, height), Image.LANCZOS)
+
+
+def encode(image, pil_format) -> bytes:
+    """Encode an image for the web without metadata."""
+    buffer = io.BytesIO()
+    if pil_format == 'JPEG':
+        _flatten(image).save(buffer, 'JPEG', quality=RENDITION_QUALITY['JPEG'], optimize=True, progressive=True)
+    elif pil_format == 'WEBP':
+        image.save(buffer, 'WEBP', quality=RENDITION_QUALITY['WEBP'], method=6)
+    else:
+        image.save(buffer, pil_format, optimize=True)
+    return buffer.getvalue()
+
+
+def placeholder_data_uri(image) -> str:
+    """A ~16px wide blurred JPEG of the image, inline as a data URI."""
+    small = _flatten(_resized(image, PLACEHOLDER_WIDTH)).filter(ImageFilter.GaussianBlur(1))
+    buffer = io.BytesIO()
+    small.save(buffer, 'JPEG', quality=40, optimize=True)
+    return 'data:image/jpeg;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def make_renditions(source_path, output_dir) -> dict:
+    """Write every rendition of ``source_path`` into ``output_dir``.
+
+    Files are named ``<rendition>.<webp|jpg>``. Renditions that would be no
+    smaller than a smaller one (because the original is small) are skipped.
+
+    Returns:
+        Dict with the upright original's ``width`` and ``height``, the
+        ``placeholder`` data URI and ``renditions``: name -> [width, height].
+
+    Raises:
+        OSError: if the file is not an image Pillow can read.
+    """
+    image = _open_upright(source_path)
+    os.makedirs(output_dir, exist_ok=True)
+    renditions = {}
+    for name, width in sorted(RENDITIONS.items(), key=lambda item: item[1]):
+        resized = _resized(image, width)
+        if any(size[0] == resized.width for size in renditions.values()):
+            continue
+        for extension, pil_format in RENDITION_FORMATS.items():
+            with open(os.path.join(output_dir, f'{name}.{extension}'), 'wb') as f:
+                f.write(encode(resized, pil_format))
+        renditions[name] = [resized.width, resized.height]
+    return {
+        'width': image.width,
+        'height': image.height,
+        'placeholder': placeholder_data_uri(image),
+        'renditions': renditions,
+    }
+
+
+def resize_to_width(source_path, width, pil_format='PNG') -> bytes:
+    """One upright, metadata-free copy of an image no wider than ``width``."""
+    return encode(_resized(_open_upright(source_path), width), pil_format)
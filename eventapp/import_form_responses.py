@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Import Microsoft Forms responses as in-app feedback.
+
+Export the responses from MS Forms ("Open results in Excel"), then import
+the file against the feedback form it came from. The file is streamed, so
+large exports are fine, and re-importing a newer export updates the
+responses already imported instead of duplicating them. Respondents are
+matched to members by email; responses from other emails are skipped.
+
+Question columns are matched by keyword (overall, content, organisation,
+venue, value, recommend, comment). Map any that don't match with --map;
+mappings are saved on the form and reused by later imports.
+
+Usage:
+    python import_form_responses.py --form 3 responses.xlsx
+    python import_form_responses.py --form 3 responses.csv \\
+        --map "overall_rating=How was the course?" --map "likelihood_to_recommend=Would you tell a friend?"
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, EventFeedbackForm, FEEDBACK_IMPORT_BATCH_SIZE, import_feedback_responses
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import an MS Forms response export as feedback.')
+    parser.add_argument('path', help='Exported responses (.xlsx or .csv)')
+    parser.add_argument('--form', type=int, required=True, metavar='FORM_ID',
+                        help='Feedback form the responses belong to (see Feedback Analytics)')
+    parser.add_argument('--map', action='append', default=[], metavar='FIELD=HEADER',
+                        help='Map a feedback field to an export column header (may be repeated)')
+    parser.add_argument('--batch-size', type=int, default=FEEDBACK_IMPORT_BATCH_SIZE,
+                        help=f'Rows written per transaction (default {FEEDBACK_IMPORT_BATCH_SIZE})')
+    args = parser.parse_args()
+
+    with app.app_context():
+        form = db.session.get(EventFeedbackForm, args.form)
+        if form is None:
+            print(f"❌ Feedback form {args.form} not found")
+            sys.exit(1)
+
+        mapping = None
+        if args.map:
+            mapping = json.loads(form.response_mapping) if form.response_mapping else {}
+            for item in args.map:
+                field, sep, header = item.partition('=')
+                if not sep:
+                    print(f"❌ --map expects FIELD=HEADER, got {item!r}")
+                    sys.exit(1)
+                mapping[field.strip()] = header.strip()
+
+        print(f"📥 Importing {args.path} into \"{form.form_name}\" ({form.event.name})...")
+        try:
+            stats = import_feedback_responses(form, args.path, mapping, args.batch_size)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+
+        if args.map:
+            # Saved only once the mapping has worked
+            form.response_mapping = json.dumps(mapping)
+            db.session.commit()
+            print("✅ Column mapping saved for this form")
+
+    for error in stats['errors']:
+        print(f"⚠️  {error}")
+    print(f"✅ {stats['rows']} rows: {stats['inserted']} added, {stats['updated']} updated, "
+          f"{stats['unmatched']} from unknown emails, {stats['invalid']} invalid")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Settle member engagement and suggest membership grade changes.
+
+Engagement totals are kept up to date as members RSVP and check in. This job
+adds no-shows for events that have ended since its last run, then lists the
+members whose engagement score suggests a different grade. Only the stored
+totals are read, never the full RSVP history.
+
+Usage:
+    python member_engagement.py            # settle and list suggestions (e.g. nightly)
+    python member_engagement.py --apply    # also apply the suggested grades
+    python member_engagement.py --rebuild  # recount every member from the RSVPs first
+"""
+
+import argparse
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, grade_suggestions, rebuild_member_engagement, settle_engagement
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Settle member engagement and suggest grade changes.')
+    parser.add_argument('--apply', action='store_true', help='Apply the suggested grades')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Recompute every member from the RSVPs (including archived ones) first')
+    args = parser.parse_args()
+
+    with app.app_context():
+        no_shows = settle_engagement()
+        print(f"✅ Settled finished events: {no_shows} new no-shows")
+
+        if args.rebuild:
+            members = rebuild_member_engagement()
+            db.session.commit()
+            print(f"✅ Rebuilt engagement for {members} members")
+
+        suggestions = grade_suggestions()
+        if not suggestions:
+            print("ℹ️  No grade changes suggested")
+            return
+        for user, grade in suggestions:
+            e = user.engagement
+            print(f"  {user.username} ({user.email}): {user.membership_grade} -> {grade}"
+                  f"  [score {e.score}, attended {e.attended}, no-shows {e.no_shows}]")
+            if args.apply:
+                user.membership_grade = grade
+        if args.apply:
+            db.session.commit()
+            print(f"🎉 Applied {len(suggestions)} grade changes")
+        else:
+            print(f"ℹ️  {len(suggestions)} grade changes suggested; re-run with --apply to apply them")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,74 +6,66 @@ This script adds the new column and sets default values for existing users.
 
 import os
 import sys
-import sqlite3
+
+from sqlalchemy import Boolean, Column, func, inspect, select, update
+from sqlalchemy.exc import SQLAlchemyError
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from app import app, db, User
+from db_compat import add_column, column_exists, table_exists
+
 def migrate_add_default_password_field():
     """Add has_default_password field to User table."""
     print("🔄 Adding has_default_password field to User table...")
     print("=" * 60)
     
     try:
-        # Check if we're in the right directory
-        if not os.path.exists('instance/eventapp.db'):
-            print("❌ Database not found. Make sure you're in the eventapp directory.")
-            return False
-        
-        # Connect to database
-        conn = sqlite3.connect('instance/eventapp.db')
-        cursor = conn.cursor()
-        
-        # Check if column already exists
-        cursor.execute("PRAGMA table_info(user)")
-        columns = [column[1] for column in cursor.fetchall()]
-        
-        if 'has_default_password' in columns:
-            print("✅ has_default_password column already exists.")
-            conn.close()
-            return True
-        
-        print("📝 Adding has_default_password column...")
-        
-        # Add the new column
-        cursor.execute("ALTER TABLE user ADD COLUMN has_default_password BOOLEAN DEFAULT 0")
-        
-        # Update existing users to have has_default_password = False
-        cursor.execute("UPDATE user SET has_default_password = 0 WHERE has_default_password IS NULL")
-        
-        # Commit changes
-        conn.commit()
-        
-        # Verify the column was added
-        cursor.execute("PRAGMA table_info(user)")
-        columns = [column[1] for column in cursor.fetchall()]
-        
-        if 'has_default_password' in columns:
-            print("✅ has_default_password column added successfully!")
-            
-            # Show user count
-            cursor.execute("SELECT COUNT(*) FROM user")
-            user_count = cursor.fetchone()[0]
-            print(f"📊 Updated {user_count} existing users with has_default_password = False")
+        with app.app_context():
+            with db.engine.connect() as conn:
+                if not table_exists(conn, 'user'):
+                    print("❌ User table not found. Make sure the database has been created.")
+                    return False
+                
+                # Check if column already exists
+                if column_exists(conn, 'user', 'has_default_password'):
+                    print("✅ has_default_password column already exists.")
+                    return True
+                
+                print("📝 Adding has_default_password column...")
+                
+                # Add the new column
+                add_column(conn, 'user', Column('has_default_password', Boolean, default=False))
+                
+                # Update existing users to have has_default_password = False
+                user_table = User.__table__
+                conn.execute(
+                    update(user_table)
+                    .where(user_table.c.has_default_password.is_(None))
+                    .values(has_default_password=False)
+                )
+                
+                # Commit changes
+                conn.commit()
+                
+                # Verify the column was added
+                if column_exists(conn, 'user', 'has_default_password'):
+                    print("✅ has_default_password column added successfully!")
+                    
+                    # Show user count
+                    user_count = conn.execute(select(func.count()).select_from(user_table)).scalar()
+                    print(f"📊 Updated {user_count} existing users with has_default_password = False")
+                    return True
+                else:
+                    print("❌ Failed to add has_default_password column.")
+                    return False
             
-            conn.close()
-            return True
-        else:
-            print("❌ Failed to add has_default_password column.")
-            conn.close()
-            return False
-            
-    except sqlite3.Error as e:
+    except SQLAlchemyError as e:
         print(f"❌ Database error: {e}")
-        if 'conn' in locals():
-            conn.close()
         return False
     except Exception as e:
         print(f"❌ Error: {e}")
-        if 'conn' in locals():
-            conn.close()
         return False
 
 def test_migration():
@@ -81,42 +73,41 @@ def test_migration():
     print("\n🧪 Testing migration...")
     
     try:
-        conn = sqlite3.connect('instance/eventapp.db')
-        cursor = conn.cursor()
-        
-        # Check table structure
-        cursor.execute("PRAGMA table_info(user)")
-        columns = cursor.fetchall()
-        
-        print("📋 Current User table structure:")
-        for column in columns:
-            print(f"   - {column[1]} ({column[2]}) - Default: {column[4]}")
-        
-        # Check if has_default_password column exists
-        has_default_password_exists = any(col[1] == 'has_default_password' for col in columns)
-        
-        if has_default_password_exists:
-            print("✅ has_default_password column is present")
-            
-            # Check user data
-            cursor.execute("SELECT COUNT(*) FROM user WHERE has_default_password = 1")
-            default_password_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM user WHERE has_default_password = 0")
-            normal_password_count = cursor.fetchone()[0]
-            
-            print(f"📊 Users with default password: {default_password_count}")
-            print(f"📊 Users with normal password: {normal_password_count}")
-        else:
-            print("❌ has_default_password column is missing")
-        
-        conn.close()
-        return has_default_password_exists
+        with app.app_context():
+            with db.engine.connect() as conn:
+                # Check table structure
+                columns = inspect(conn).get_columns('user')
+                
+                print("📋 Current User table structure:")
+                for column in columns:
+                    print(f"   - {column['name']} ({column['type']}) - Default: {column.get('default')}")
+                
+                # Check if has_default_password column exists
+                has_default_password_exists = any(col['name'] == 'has_default_password' for col in columns)
+                
+                if has_default_password_exists:
+                    print("✅ has_default_password column is present")
+                    
+                    # Check user data
+                    user_table = User.__table__
+                    default_password_count = conn.execute(
+                        select(func.count()).select_from(user_table)
+                        .where(user_table.c.has_default_password.is_(True))
+                    ).scalar()
+                    normal_password_count = conn.execute(
+                        select(func.count()).select_from(user_table)
+                        .where(user_table.c.has_default_password.is_(False))
+                    ).scalar()
+                    
+                    print(f"📊 Users with default password: {default_password_count}")
+                    print(f"📊 Users with normal password: {normal_password_count}")
+                else:
+                    print("❌ has_default_password column is missing")
+                
+                return has_default_password_exists
         
     except Exception as e:
         print(f"❌ Test error: {e}")
-        if 'conn' in locals():
-            conn.close()
         return False
 
 def main():
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Database migration script for incremental analytics exports.
+
+This script:
+- Adds updated_at to the user, feedback and notification tables (and the
+  archived copies of feedback and notifications)
+- Backfills it from created_at (read_at for read notifications)
+- Adds the updated_at indexes used by incremental dumps
+
+Run this script after updating the models in app.py.
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import Column, DateTime
+
+from app import (app, db, ANALYTICS_EXPORT_TABLES, ArchivedFeedback, ArchivedNotification,
+                 Feedback, Notification, User)
+from db_compat import add_column
+
+
+def migrate_analytics_export():
+    """Add and backfill updated_at, then index it."""
+    print("Starting analytics export migration...")
+
+    with app.app_context():
+        try:
+            models = [User, Feedback, Notification, ArchivedFeedback, ArchivedNotification]
+            with db.engine.connect() as conn:
+                for model in models:
+                    table = model.__table__
+                    if add_column(conn, table.name, Column('updated_at', DateTime)):
+                        print(f"✅ Added updated_at to {table.name}.")
+                    else:
+                        print(f"✅ {table.name}.updated_at already exists.")
+                conn.commit()
+
+                for model in models:
+                    table = model.__table__
+                    backfill = db.func.coalesce(table.c.read_at, table.c.created_at) \
+                        if 'read_at' in table.c else table.c.created_at
+                    count = conn.execute(
+                        table.update().where(table.c.updated_at.is_(None)).values(updated_at=backfill)
+                    ).rowcount
+                    print(f"✅ Backfilled updated_at for {count} {table.name} rows.")
+                conn.commit()
+
+            for name in ANALYTICS_EXPORT_TABLES:
+                for index in db.metadata.tables[name].indexes:
+                    index.create(db.engine, checkfirst=True)
+            print("✅ updated_at indexes are in place.")
+
+            print("🎉 Analytics export migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            raise
+
+
+if __name__ == '__main__':
+    migrate_analytics_export()
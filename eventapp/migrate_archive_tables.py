@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Database migration script for event archival.
+
+This script:
+- Adds notification.event_id so notifications move with their event
+- Backfills event_id from the JSON payload of existing feedback requests
+- Creates the archived_* tables (also created automatically on app start)
+
+Run this script after updating the models in app.py.
+"""
+
+import json
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import Column, Integer
+
+from app import app, db, Notification
+from db_compat import add_column
+
+
+def migrate_archive_tables():
+    """Add notification.event_id and create the archive tables."""
+    print("Starting event archival migration...")
+
+    with app.app_context():
+        try:
+            with db.engine.connect() as conn:
+                if add_column(conn, 'notification', Column('event_id', Integer)):
+                    print("✅ Added event_id to Notification table.")
+                else:
+                    print("✅ notification.event_id already exists.")
+                conn.commit()
+
+            db.create_all()
+            print("✅ Archive tables are in place.")
+
+            # Only the columns this script needs, so columns added by later
+            # migrations don't have to exist yet
+            notifications = Notification.__table__
+            backfilled = 0
+            pending = db.session.execute(
+                db.select(notifications.c.id, notifications.c.payload).where(
+                    notifications.c.event_id.is_(None),
+                    notifications.c.payload.isnot(None)
+                )
+            ).all()
+            for notification_id, payload in pending:
+                try:
+                    event_id = json.loads(payload).get('event_id')
+                except (ValueError, AttributeError):
+                    continue
+                if event_id:
+                    # Plain SQL: a Core update would also set onupdate columns
+                    db.session.execute(db.text('UPDATE notification SET event_id = :event_id WHERE id = :id'),
+                                       {'event_id': event_id, 'id': notification_id})
+                    backfilled += 1
+            db.session.commit()
+            print(f"✅ Linked {backfilled} existing notifications to their events.")
+
+            print("🎉 Event archival migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            db.session.rollback()
+            raise
+
+
+if __name__ == '__main__':
+    migrate_archive_tables()
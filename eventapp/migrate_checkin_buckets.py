@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Database migration script for live arrival analytics.
+
+This script:
+- Creates the check_in_bucket table (also created automatically on app start)
+- Adds the rsvp (event_id, status) index used by the arrival dashboard
+- Backfills minute buckets from the checked_in_at of existing RSVPs
+
+It is safe to re-run; buckets are rebuilt from scratch for every event.
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, RSVP, rebuild_arrival_buckets
+
+
+def migrate_checkin_buckets():
+    """Create the arrival bucket table and backfill it."""
+    print("Starting arrival analytics migration...")
+
+    with app.app_context():
+        try:
+            db.create_all()
+            print("✅ check_in_bucket table is in place.")
+
+            for index in RSVP.__table__.indexes:
+                index.create(db.engine, checkfirst=True)
+            print("✅ RSVP indexes are in place.")
+
+            event_ids = db.session.execute(
+                db.select(RSVP.event_id).where(RSVP.checked_in.is_(True)).distinct()
+            ).scalars().all()
+            buckets = 0
+            for event_id in event_ids:
+                buckets += rebuild_arrival_buckets(event_id)
+            db.session.commit()
+            print(f"✅ Wrote {buckets} arrival buckets for {len(event_ids)} events.")
+
+            print("🎉 Arrival analytics migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            db.session.rollback()
+            raise
+
+
+if __name__ == '__main__':
+    migrate_checkin_buckets()
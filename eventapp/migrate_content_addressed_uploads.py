@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Database migration script for content-addressed uploads.
+
+This script:
+- Adds sha256, size_bytes and ref_count to the uploaded_image table, and
+  the unique index on sha256
+- Copies every existing upload into the content store under its hash,
+  pointing events, archived events and carousel images at the new URL
+  (uploads with identical content are merged into one)
+- Recounts every upload's references
+
+The old files are left in place; collect_uploads.py removes them once
+nothing refers to them. Run this script after updating the models in
+app.py. It is safe to re-run.
+"""
+
+import hashlib
+import os
+import shutil
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import Column, Integer, String
+
+from app import (app, db, UploadedImage, UPLOAD_CHUNK_SIZE, UPLOAD_REFERENCE_COLUMNS,
+                 backfill_uploaded_images, content_url, delete_uploaded_image,
+                 rebuild_upload_references, static_file_path)
+from db_compat import add_column
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(UPLOAD_CHUNK_SIZE), b''):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def _rewrite_references(old_url, new_url):
+    for column in UPLOAD_REFERENCE_COLUMNS:
+        db.session.execute(db.update(column.class_).where(column == old_url).values({column.key: new_url}))
+
+
+def _convert_legacy_upload(image):
+    """Move one legacy upload into the content store; returns False if its file is missing."""
+    path = static_file_path(image.url)
+    if path is None or not os.path.isfile(path):
+        return False
+    sha256, size = _hash_file(path)
+    existing = UploadedImage.query.filter_by(sha256=sha256).first()
+    if existing:
+        _rewrite_references(image.url, existing.url)
+        delete_uploaded_image(image.url)
+    else:
+        url = content_url(sha256, os.path.splitext(path)[1])
+        target = static_file_path(url)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if not os.path.exists(target):
+            shutil.copyfile(path, target + '.part')
+            os.replace(target + '.part', target)
+        _rewrite_references(image.url, url)
+        # Renditions are stored by id, so they stay valid
+        image.url, image.sha256, image.size_bytes = url, sha256, size
+    db.session.commit()
+    return True
+
+
+def migrate_content_addressed_uploads():
+    """Add the content hash columns and move existing uploads into the content store."""
+    print("Starting content-addressed upload migration...")
+
+    with app.app_context():
+        try:
+            table = UploadedImage.__table__.name
+            columns = [
+                Column('sha256', String(64)),
+                Column('size_bytes', Integer),
+                Column('ref_count', Integer, nullable=False, default=0),
+            ]
+            with db.engine.connect() as conn:
+                for column in columns:
+                    if add_column(conn, table, column):
+                        print(f"✅ Added {table}.{column.name}.")
+                    else:
+                        print(f"✅ {table}.{column.name} already exists.")
+                conn.commit()
+
+            for index in UploadedImage.__table__.indexes:
+                index.create(db.engine, checkfirst=True)
+            print("✅ Upload hash index is in place.")
+
+            queued = backfill_uploaded_images()
+            print(f"✅ Queued {queued} uploads that had no record yet.")
+
+            legacy = UploadedImage.query.filter(UploadedImage.sha256.is_(None)).order_by(UploadedImage.id).all()
+            missing = [image.url for image in legacy if not _convert_legacy_upload(image)]
+            print(f"✅ Moved {len(legacy) - len(missing)} uploads into the content store.")
+            for url in missing:
+                print(f"⚠️  File for {url} is missing; left as it is.")
+
+            referenced = rebuild_upload_references()
+            db.session.commit()
+            print(f"✅ Recounted references; {referenced} uploads are in use.")
+
+            print("🎉 Content-addressed upload migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            db.session.rollback()
+            raise
+
+
+if __name__ == '__main__':
+    migrate_content_addressed_uploads()
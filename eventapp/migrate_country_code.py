@@ -10,14 +10,13 @@ Run this script to fix the OperationalError: no such column: user.country_code
 
 import os
 import sys
-import sqlite3
-from sqlalchemy import create_engine, text
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import Column, String, update
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app import app, db
+from app import app, db, User
+from db_compat import add_column, column_exists, column_type, table_exists
 
 def migrate_country_code():
     """Add country_code column to User table."""
@@ -25,62 +24,42 @@ def migrate_country_code():
     
     try:
         with app.app_context():
-            # Get the database file path
-            db_path = app.config['SQLALCHEMY_DATABASE_URI'].replace('sqlite:///', '')
-            if not db_path.startswith('/') and not db_path.startswith('C:'):
-                # If it's a relative path, look in the instance directory
-                db_path = os.path.join('instance', db_path)
-            
-            if not os.path.exists(db_path):
-                print("❌ Database file not found. Creating new database...")
-                db.create_all()
-                print("✅ New database created with all tables and columns.")
-                return
-            
-            # Check if country_code column already exists
             with db.engine.connect() as conn:
-                result = conn.execute(text("""
-                    SELECT COUNT(*) as count 
-                    FROM pragma_table_info('user') 
-                    WHERE name = 'country_code'
-                """))
-                column_exists = result.fetchone()[0] > 0
+                if not table_exists(conn, 'user'):
+                    print("❌ User table not found. Creating new database...")
+                    db.create_all()
+                    print("✅ New database created with all tables and columns.")
+                    return
                 
-                if column_exists:
+                # Check if country_code column already exists
+                if column_exists(conn, 'user', 'country_code'):
                     print("✅ country_code column already exists. Migration not needed.")
                     return
                 
                 print("📝 Adding country_code column to User table...")
                 
                 # Add country_code column
-                conn.execute(text("""
-                    ALTER TABLE user 
-                    ADD COLUMN country_code VARCHAR(5)
-                """))
+                add_column(conn, 'user', Column('country_code', String(5)))
                 
                 conn.commit()
                 print("✅ Successfully added country_code column!")
                 
                 # Set default country code for existing users (Singapore +65)
                 print("🌏 Setting default country code for existing users...")
-                conn.execute(text("""
-                    UPDATE user 
-                    SET country_code = '+65' 
-                    WHERE country_code IS NULL
-                """))
+                user_table = User.__table__
+                conn.execute(
+                    update(user_table)
+                    .where(user_table.c.country_code.is_(None))
+                    .values(country_code='+65')
+                )
                 
                 conn.commit()
                 print("✅ Successfully set default country code for existing users!")
                 
                 # Verify the column was added
-                result = conn.execute(text("""
-                    SELECT name, type 
-                    FROM pragma_table_info('user') 
-                    WHERE name = 'country_code'
-                """))
-                column_info = result.fetchone()
-                if column_info:
-                    print(f"✅ Verified: country_code column added as {column_info[1]}")
+                added_type = column_type(conn, 'user', 'country_code')
+                if added_type is not None:
+                    print(f"✅ Verified: country_code column added as {added_type}")
                 else:
                     print("❌ Warning: Could not verify country_code column was added")
                 
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Database migration script for the credit ledger.
+
+This script:
+- Adds user.credit_balance (integer minor units, i.e. cents)
+- Creates the credit_transaction ledger table
+- Seeds one 'opening' ledger entry per member from the legacy float
+  user.credit_point column, so the ledger replays to the current balances
+
+The legacy credit_point column is left in place but is no longer used.
+Running the script again skips members who already have ledger entries.
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import Column, Integer, text
+
+from app import app, db, CreditTransaction, to_minor_units, verify_credit_ledger
+from db_compat import add_column, column_exists, quote_table
+
+
+def migrate_credit_ledger():
+    """Move credit balances from the float column into the ledger."""
+    print("Starting credit ledger migration...")
+
+    with app.app_context():
+        try:
+            with db.engine.connect() as conn:
+                if add_column(conn, 'user', Column('credit_balance', Integer, default=0)):
+                    print("✅ Added credit_balance to User table.")
+                else:
+                    print("✅ user.credit_balance already exists.")
+                conn.commit()
+
+            db.create_all()
+            print("✅ Credit ledger table is in place.")
+
+            with db.engine.begin() as conn:
+                if not column_exists(conn, 'user', 'credit_point'):
+                    print("ℹ️  No legacy credit_point column, nothing to seed.")
+                    return
+
+                seeded_users = set(conn.execute(
+                    db.select(CreditTransaction.user_id).distinct()
+                ).scalars())
+                rows = conn.execute(text(
+                    f"SELECT id, credit_point FROM {quote_table(conn, 'user')}"
+                )).all()
+
+                seeded = 0
+                for user_id, credit_point in rows:
+                    if user_id in seeded_users:
+                        continue
+                    balance = max(to_minor_units(credit_point or 0), 0)
+                    conn.execute(text(
+                        f"UPDATE {quote_table(conn, 'user')} SET credit_balance = :balance WHERE id = :id"
+                    ), {'balance': balance, 'id': user_id})
+                    if balance:
+                        conn.execute(CreditTransaction.__table__.insert().values(
+                            user_id=user_id, amount=balance, kind='opening', balance_after=balance,
+                            note='Opening balance migrated from credit_point'
+                        ))
+                        seeded += 1
+                print(f"✅ Seeded opening balances for {seeded} members.")
+
+            mismatches = verify_credit_ledger()
+            if mismatches:
+                print(f"⚠️  {len(mismatches)} balances do not match the ledger: {mismatches}")
+            else:
+                print("✅ Ledger replays to the cached balances.")
+
+            print("🎉 Credit ledger migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            db.session.rollback()
+            raise
+
+
+if __name__ == '__main__':
+    migrate_credit_ledger()
@@ -6,13 +6,14 @@ This script adds the credit_point column to the users table.
 
 import os
 import sys
-from sqlalchemy import create_engine, text
+from sqlalchemy import Column, Float, func, select, update
 from sqlalchemy.exc import SQLAlchemyError
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app import app, db
+from app import app, db, User
+from db_compat import add_column, column_exists
 
 def migrate_credit_system():
     """Add credit_point column to users table."""
@@ -22,46 +23,36 @@ def migrate_credit_system():
         with app.app_context():
             # Check if credit_point column already exists
             with db.engine.connect() as conn:
-                result = conn.execute(text("""
-                    SELECT COUNT(*) as count 
-                    FROM pragma_table_info('user') 
-                    WHERE name = 'credit_point'
-                """))
-                column_exists = result.fetchone()[0] > 0
-                
-                if column_exists:
+                if column_exists(conn, 'user', 'credit_point'):
                     print("✅ credit_point column already exists. Migration not needed.")
                     return
                 
                 print("📝 Adding credit_point column to users table...")
                 
                 # Add credit_point column
-                conn.execute(text("""
-                    ALTER TABLE user 
-                    ADD COLUMN credit_point REAL DEFAULT 0.0
-                """))
+                add_column(conn, 'user', Column('credit_point', Float, default=0.0))
                 
                 conn.commit()
                 print("✅ Successfully added credit_point column!")
                 
                 # Set default credit points for existing users
                 print("💰 Setting default credit points for existing users...")
-                conn.execute(text("""
-                    UPDATE user 
-                    SET credit_point = 0.0 
-                    WHERE credit_point IS NULL
-                """))
+                user_table = User.__table__
+                conn.execute(
+                    update(user_table)
+                    .where(user_table.c.credit_point.is_(None))
+                    .values(credit_point=0.0)
+                )
                 
                 conn.commit()
                 print("✅ Successfully set default credit points for existing users!")
                 
                 # Verify the migration
-                result = conn.execute(text("""
-                    SELECT COUNT(*) as count 
-                    FROM user 
-                    WHERE credit_point IS NOT NULL
-                """))
-                user_count = result.fetchone()[0]
+                user_count = conn.execute(
+                    select(func.count())
+                    .select_from(user_table)
+                    .where(user_table.c.credit_point.isnot(None))
+                ).scalar()
                 print(f"✅ Migration completed! {user_count} users now have credit_point field.")
                 
     except SQLAlchemyError as e:
@@ -81,22 +72,15 @@ def rollback_credit_system():
         with app.app_context():
             with db.engine.connect() as conn:
                 # Check if credit_point column exists
-                result = conn.execute(text("""
-                    SELECT COUNT(*) as count 
-                    FROM pragma_table_info('user') 
-                    WHERE name = 'credit_point'
-                """))
-                column_exists = result.fetchone()[0] > 0
-                
-                if not column_exists:
+                if not column_exists(conn, 'user', 'credit_point'):
                     print("ℹ️ credit_point column does not exist. Nothing to rollback.")
                     return
                 
                 print("📝 Removing credit_point column from users table...")
                 
-                # Note: SQLite doesn't support DROP COLUMN directly
-                # We need to recreate the table without the credit_point column
-                print("⚠️ SQLite doesn't support DROP COLUMN. Manual table recreation required.")
+                # Note: older SQLite versions don't support DROP COLUMN directly
+                # and would need the table recreated without the credit_point column
+                print("⚠️ DROP COLUMN is not portable across SQLite versions. Manual table recreation may be required.")
                 print("⚠️ This rollback is not implemented for safety reasons.")
                 print("⚠️ If you need to remove the column, please backup your data first.")
                 
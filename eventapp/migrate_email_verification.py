@@ -16,7 +16,10 @@ from datetime import datetime
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy import Column, DateTime, String
+
 from app import app, db, User
+from db_compat import add_column
 
 def migrate_email_verification():
     """Add email verification fields to existing User table."""
@@ -36,8 +39,8 @@ def migrate_email_verification():
             
             # Add the new columns
             with db.engine.connect() as conn:
-                conn.execute(db.text('ALTER TABLE user ADD COLUMN email_verification_token VARCHAR(100)'))
-                conn.execute(db.text('ALTER TABLE user ADD COLUMN email_verification_sent_at DATETIME'))
+                add_column(conn, 'user', Column('email_verification_token', String(100)))
+                add_column(conn, 'user', Column('email_verification_sent_at', DateTime))
                 conn.commit()
             
             print("✅ Successfully added email verification fields to User table.")
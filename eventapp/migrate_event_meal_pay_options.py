@@ -3,34 +3,25 @@
 Migration script to add meal/pay options to Event and RSVP tables.
 
 Adds to event table:
-  - meal_option_enabled BOOLEAN DEFAULT 0
+  - meal_option_enabled BOOLEAN DEFAULT false
   - meal_option_remarks TEXT NULL
-  - pay_at_venue_enabled BOOLEAN DEFAULT 0
+  - meal_option_price FLOAT DEFAULT 0.0
+  - pay_at_venue_enabled BOOLEAN DEFAULT false
 
 Adds to rsvp table:
-  - meal_opt_in BOOLEAN DEFAULT 0
+  - meal_opt_in BOOLEAN DEFAULT false
 """
 
 import os
 import sys
-from sqlalchemy import text
+from sqlalchemy import Boolean, Column, Float, Text
 from sqlalchemy.exc import SQLAlchemyError
 
 # Ensure we can import app
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app import app, db  # noqa: E402
-
-
-def column_exists(conn, table: str, column: str) -> bool:
-    result = conn.execute(text(
-        """
-        SELECT COUNT(*) as count
-        FROM pragma_table_info(:table)
-        WHERE name = :column
-        """
-    ), {"table": table, "column": column})
-    return result.fetchone()[0] > 0
+from db_compat import add_column, column_exists  # noqa: E402
 
 
 def migrate_event_meal_pay_options() -> bool:
@@ -41,35 +32,35 @@ def migrate_event_meal_pay_options() -> bool:
                 # EVENT: meal_option_enabled
                 if not column_exists(conn, 'event', 'meal_option_enabled'):
                     print("📝 Adding column event.meal_option_enabled ...")
-                    conn.execute(text("ALTER TABLE event ADD COLUMN meal_option_enabled BOOLEAN DEFAULT 0"))
+                    add_column(conn, 'event', Column('meal_option_enabled', Boolean, default=False))
                 else:
                     print("✅ event.meal_option_enabled already exists")
 
                 # EVENT: meal_option_remarks
                 if not column_exists(conn, 'event', 'meal_option_remarks'):
                     print("📝 Adding column event.meal_option_remarks ...")
-                    conn.execute(text("ALTER TABLE event ADD COLUMN meal_option_remarks TEXT"))
+                    add_column(conn, 'event', Column('meal_option_remarks', Text))
                 else:
                     print("✅ event.meal_option_remarks already exists")
 
                 # EVENT: meal_option_price
                 if not column_exists(conn, 'event', 'meal_option_price'):
                     print("📝 Adding column event.meal_option_price ...")
-                    conn.execute(text("ALTER TABLE event ADD COLUMN meal_option_price FLOAT DEFAULT 0.0"))
+                    add_column(conn, 'event', Column('meal_option_price', Float, default=0.0))
                 else:
                     print("✅ event.meal_option_price already exists")
 
                 # EVENT: pay_at_venue_enabled
                 if not column_exists(conn, 'event', 'pay_at_venue_enabled'):
                     print("📝 Adding column event.pay_at_venue_enabled ...")
-                    conn.execute(text("ALTER TABLE event ADD COLUMN pay_at_venue_enabled BOOLEAN DEFAULT 0"))
+                    add_column(conn, 'event', Column('pay_at_venue_enabled', Boolean, default=False))
                 else:
                     print("✅ event.pay_at_venue_enabled already exists")
 
                 # RSVP: meal_opt_in
                 if not column_exists(conn, 'rsvp', 'meal_opt_in'):
                     print("📝 Adding column rsvp.meal_opt_in ...")
-                    conn.execute(text("ALTER TABLE rsvp ADD COLUMN meal_opt_in BOOLEAN DEFAULT 0"))
+                    add_column(conn, 'rsvp', Column('meal_opt_in', Boolean, default=False))
                 else:
                     print("✅ rsvp.meal_opt_in already exists")
 
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Database migration script for importing MS Forms responses.
+
+This script:
+- Adds feedback_form_id and ms_response_id to the feedback and
+  archived_feedback tables
+- Adds response_mapping to the event_feedback_form and
+  archived_event_feedback_form tables
+- Adds the unique (feedback_form_id, ms_response_id) index imports upsert on
+
+Run this script after updating the models in app.py. It is safe to re-run.
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import Column, Integer, String, Text
+
+from app import app, db, ArchivedEventFeedbackForm, ArchivedFeedback, EventFeedbackForm, Feedback
+from db_compat import add_column
+
+
+def migrate_feedback_import():
+    """Add the response import columns and index."""
+    print("Starting feedback import migration...")
+
+    with app.app_context():
+        try:
+            columns = [
+                (Feedback, Column('feedback_form_id', Integer)),
+                (Feedback, Column('ms_response_id', String(50))),
+                (ArchivedFeedback, Column('feedback_form_id', Integer)),
+                (ArchivedFeedback, Column('ms_response_id', String(50))),
+                (EventFeedbackForm, Column('response_mapping', Text)),
+                (ArchivedEventFeedbackForm, Column('response_mapping', Text)),
+            ]
+            with db.engine.connect() as conn:
+                for model, column in columns:
+                    table = model.__table__.name
+                    if add_column(conn, table, column):
+                        print(f"✅ Added {table}.{column.name}.")
+                    else:
+                        print(f"✅ {table}.{column.name} already exists.")
+                conn.commit()
+
+            # Only this migration's index: others on feedback may need columns
+            # that later migrations add
+            index = next(i for i in Feedback.__table__.indexes if i.name == 'uq_feedback_form_response')
+            index.create(db.engine, checkfirst=True)
+            print("✅ Feedback response index is in place.")
+
+            print("🎉 Feedback import migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            raise
+
+
+if __name__ == '__main__':
+    migrate_feedback_import()
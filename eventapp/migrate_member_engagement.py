@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Database migration script for member engagement totals.
+
+This script:
+- Creates the member_engagement table (also created automatically on app start)
+- Settles every event that has already ended, so past no-shows count
+- Builds each member's totals from their RSVPs, archived ones included
+
+It is safe to re-run; totals are rebuilt from scratch.
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, rebuild_member_engagement, settle_engagement
+
+
+def migrate_member_engagement():
+    """Create the engagement table and backfill it."""
+    print("Starting member engagement migration...")
+
+    with app.app_context():
+        try:
+            db.create_all()
+            print("✅ member_engagement table is in place.")
+
+            # Moves the watermark; the rebuild below recounts the no-shows it adds
+            settle_engagement()
+            members = rebuild_member_engagement()
+            db.session.commit()
+            print(f"✅ Built engagement totals for {members} members.")
+
+            print("🎉 Member engagement migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            db.session.rollback()
+            raise
+
+
+if __name__ == '__main__':
+    migrate_member_engagement()
@@ -6,13 +6,14 @@ This script adds the payment_method column to the rsvp table.
 
 import os
 import sys
-from sqlalchemy import create_engine, text
+from sqlalchemy import Column, String, func, select, update
 from sqlalchemy.exc import SQLAlchemyError
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app import app, db
+from app import app, db, RSVP
+from db_compat import add_column, column_exists
 
 def migrate_rsvp_payment_method():
     """Add payment_method column to rsvp table."""
@@ -22,52 +23,45 @@ def migrate_rsvp_payment_method():
         with app.app_context():
             # Check if payment_method column already exists
             with db.engine.connect() as conn:
-                result = conn.execute(text("""
-                    SELECT COUNT(*) as count 
-                    FROM pragma_table_info('rsvp') 
-                    WHERE name = 'payment_method'
-                """))
-                column_exists = result.fetchone()[0] > 0
-                
-                if column_exists:
+                if column_exists(conn, 'rsvp', 'payment_method'):
                     print("✅ payment_method column already exists. Migration not needed.")
                     return
                 
                 print("📝 Adding payment_method column to rsvp table...")
                 
                 # Add payment_method column
-                conn.execute(text("""
-                    ALTER TABLE rsvp 
-                    ADD COLUMN payment_method VARCHAR(20)
-                """))
+                add_column(conn, 'rsvp', Column('payment_method', String(20)))
                 
                 conn.commit()
                 print("✅ Successfully added payment_method column!")
                 
                 # Set default payment_method for existing RSVPs based on payment_status
                 print("💰 Setting default payment methods for existing RSVPs...")
-                conn.execute(text("""
-                    UPDATE rsvp 
-                    SET payment_method = 'card' 
-                    WHERE payment_status = 'paid' AND payment_method IS NULL
-                """))
+                rsvp_table = RSVP.__table__
+                conn.execute(
+                    update(rsvp_table)
+                    .where(rsvp_table.c.payment_status == 'paid',
+                           rsvp_table.c.payment_amount == 0.0,
+                           rsvp_table.c.payment_method.is_(None))
+                    .values(payment_method='free')
+                )
                 
-                conn.execute(text("""
-                    UPDATE rsvp 
-                    SET payment_method = 'free' 
-                    WHERE payment_status = 'paid' AND payment_amount = 0.0 AND payment_method IS NULL
-                """))
+                conn.execute(
+                    update(rsvp_table)
+                    .where(rsvp_table.c.payment_status == 'paid',
+                           rsvp_table.c.payment_method.is_(None))
+                    .values(payment_method='card')
+                )
                 
                 conn.commit()
                 print("✅ Successfully set default payment methods for existing RSVPs!")
                 
                 # Verify the migration
-                result = conn.execute(text("""
-                    SELECT COUNT(*) as count 
-                    FROM rsvp 
-                    WHERE payment_method IS NOT NULL
-                """))
-                rsvp_count = result.fetchone()[0]
+                rsvp_count = conn.execute(
+                    select(func.count())
+                    .select_from(rsvp_table)
+                    .where(rsvp_table.c.payment_method.isnot(None))
+                ).scalar()
                 print(f"✅ Migration completed! {rsvp_count} RSVPs now have payment_method field.")
                 
     except SQLAlchemyError as e:
@@ -87,18 +81,11 @@ def rollback_rsvp_payment_method():
         with app.app_context():
             with db.engine.connect() as conn:
                 # Check if payment_method column exists
-                result = conn.execute(text("""
-                    SELECT COUNT(*) as count 
-                    FROM pragma_table_info('rsvp') 
-                    WHERE name = 'payment_method'
-                """))
-                column_exists = result.fetchone()[0] > 0
-                
-                if not column_exists:
+                if not column_exists(conn, 'rsvp', 'payment_method'):
                     print("ℹ️ payment_method column does not exist. Nothing to rollback.")
                     return
                 
-                print("⚠️ SQLite doesn't support DROP COLUMN. Manual table recreation required.")
+                print("⚠️ DROP COLUMN is not portable across SQLite versions. Manual table recreation may be required.")
                 print("⚠️ This rollback is not implemented for safety reasons.")
                 print("⚠️ If you need to remove the column, please backup your data first.")
                 
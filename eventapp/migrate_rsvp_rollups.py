@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Database migration script for the daily RSVP rollups behind /analytics.
+
+This script:
+- Adds cancelled_at to the rsvp and archived_rsvp tables
+- Creates the event_daily_stat table (also created automatically on app start)
+- Drops the foreign key from event_daily_stat.event_id, so rollups outlive
+  their event's move to the archive
+- Builds the rollups for every event from its RSVPs
+
+Cancellations made before this migration were never timestamped, so the
+rollups only count cancellations from now on. It is safe to re-run.
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import Column, DateTime
+
+from app import app, db, ArchivedRSVP, Event, RSVP, rebuild_event_rollups
+from db_compat import add_column, drop_foreign_key
+
+
+def migrate_rsvp_rollups():
+    """Add cancelled_at, create the rollup table and backfill it."""
+    print("Starting RSVP rollup migration...")
+
+    with app.app_context():
+        try:
+            with db.engine.connect() as conn:
+                for model in (RSVP, ArchivedRSVP):
+                    name = model.__table__.name
+                    if add_column(conn, name, Column('cancelled_at', DateTime)):
+                        print(f"✅ Added cancelled_at to {name}.")
+                    else:
+                        print(f"✅ {name}.cancelled_at already exists.")
+                conn.commit()
+
+            db.create_all()
+            print("✅ event_daily_stat table is in place.")
+            with db.engine.connect() as conn:
+                if drop_foreign_key(conn, 'event_daily_stat', 'event_id'):
+                    print("✅ Dropped the event_daily_stat.event_id foreign key.")
+                conn.commit()
+
+            event_ids = db.session.execute(db.select(Event.id).order_by(Event.id)).scalars().all()
+            rows = 0
+            for event_id in event_ids:
+                rows += rebuild_event_rollups(event_id)
+                db.session.commit()
+            print(f"✅ Wrote {rows} rollup rows for {len(event_ids)} events.")
+
+            print("🎉 RSVP rollup migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            db.session.rollback()
+            raise
+
+
+if __name__ == '__main__':
+    migrate_rsvp_rollups()
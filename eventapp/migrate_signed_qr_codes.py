@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Reissue legacy UUID check-in codes as signed QR tokens.
+
+Legacy codes keep working at check-in, so this can run any time before the
+event. Attendees see the new code the next time they open the event page;
+codes they saved or printed earlier stop working once reissued, so by
+default only RSVPs for events that have not started yet are touched.
+
+Usage:
+    python migrate_signed_qr_codes.py            # upcoming events only
+    python migrate_signed_qr_codes.py --all      # every accepted RSVP
+    python migrate_signed_qr_codes.py --dry-run
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, Event, RSVP, is_qr_token, make_qr_token
+
+
+def migrate_signed_qr_codes(include_past=False, dry_run=False, batch_size=500):
+    """Replace legacy codes with signed tokens.
+
+    Returns:
+        Number of RSVPs whose code was (or would be) reissued.
+    """
+    print("Starting signed QR code migration...")
+
+    with app.app_context():
+        query = RSVP.query.join(Event).filter(
+            RSVP.qr_code.isnot(None),
+            RSVP.checked_in.isnot(True)
+        )
+        if not include_past:
+            query = query.filter(Event.start_date >= datetime.utcnow())
+
+        reissued = 0
+        last_id = 0
+        while True:
+            batch = query.filter(RSVP.id > last_id).order_by(RSVP.id).limit(batch_size).all()
+            if not batch:
+                break
+            for rsvp in batch:
+                if not is_qr_token(rsvp.qr_code):
+                    rsvp.qr_code = make_qr_token(rsvp.event_id, rsvp.id)
+                    reissued += 1
+            last_id = batch[-1].id
+            if dry_run:
+                db.session.rollback()
+            else:
+                db.session.commit()
+
+        verb = "Would reissue" if dry_run else "Reissued"
+        print(f"✅ {verb} {reissued} check-in codes.")
+        print("🎉 Signed QR code migration completed successfully!")
+        return reissued
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Reissue legacy check-in codes as signed tokens.')
+    parser.add_argument('--all', action='store_true', help='Include events that already started')
+    parser.add_argument('--dry-run', action='store_true', help='Only report how many codes would change')
+    args = parser.parse_args()
+    migrate_signed_qr_codes(include_past=args.all, dry_run=args.dry_run)
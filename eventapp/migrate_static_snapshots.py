@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Database migration script for static page snapshots.
+
+This script:
+- Creates the stale_snapshot table (also created automatically on app start)
+
+Rendering pages needs every column the models map, so the snapshots are not
+written here: run write_snapshots.py once the other migrations are done. Its
+first run writes every page; later runs only re-render what changed. It is
+safe to re-run.
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db
+
+
+def migrate_static_snapshots():
+    """Create the snapshot queue table."""
+    print("Starting static snapshot migration...")
+
+    with app.app_context():
+        try:
+            db.create_all()
+            print("✅ stale_snapshot table is in place.")
+
+            print("ℹ️  Run python write_snapshots.py after the remaining migrations to write the pages.")
+
+            print("🎉 Static snapshot migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            db.session.rollback()
+            raise
+
+
+if __name__ == '__main__':
+    migrate_static_snapshots()
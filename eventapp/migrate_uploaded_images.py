@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Database migration script for responsive image renditions.
+
+This script:
+- Creates the uploaded_image table (also created automatically on app start)
+- Queues every existing event cover and carousel image for renditions
+
+Run process_images.py afterwards to render them. It is safe to re-run;
+images already queued are skipped.
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, backfill_uploaded_images
+
+
+def migrate_uploaded_images():
+    """Create the uploaded image table and queue existing uploads."""
+    print("Starting uploaded image migration...")
+
+    with app.app_context():
+        try:
+            db.create_all()
+            print("✅ uploaded_image table is in place.")
+
+            queued = backfill_uploaded_images()
+            print(f"✅ Queued {queued} existing uploads for renditions.")
+
+            print("🎉 Uploaded image migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            db.session.rollback()
+            raise
+
+
+if __name__ == '__main__':
+    migrate_uploaded_images()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Render responsive versions of uploaded images.
+
+Uploads are queued when they are saved; this job renders the queue outside
+the web workers, writing thumbnail, card and hero sizes in WebP and JPEG
+(see images.py) plus a blurred placeholder. Pages show the original image
+until its renditions are ready.
+
+Usage:
+    python process_images.py                  # render everything queued (e.g. every few minutes)
+    python process_images.py --watch 10       # keep running, checking the queue every 10 seconds
+    python process_images.py --backfill       # queue existing covers and carousel images first
+    python process_images.py --retry-failed   # re-queue images that failed or were interrupted
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, UploadedImage, backfill_uploaded_images, process_pending_images
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render responsive versions of uploaded images.')
+    parser.add_argument('--backfill', action='store_true', help='Queue existing uploads that have no renditions')
+    parser.add_argument('--retry-failed', action='store_true',
+                        help='Re-queue failed images and ones left mid-render by a stopped worker')
+    parser.add_argument('--watch', type=float, metavar='SECONDS',
+                        help='Keep running, checking the queue this often')
+    args = parser.parse_args()
+
+    with app.app_context():
+        if args.backfill:
+            print(f"✅ Queued {backfill_uploaded_images()} existing uploads")
+        if args.retry_failed:
+            count = (UploadedImage.query.filter(UploadedImage.status.in_(['failed', 'processing']))
+                     .update({'status': 'pending', 'error': None}, synchronize_session=False))
+            db.session.commit()
+            print(f"✅ Re-queued {count} images")
+
+        while True:
+            stats = process_pending_images()
+            if stats['ready'] or stats['failed'] or not args.watch:
+                print(f"✅ Rendered {stats['ready']} images, {stats['failed']} failed")
+            if not args.watch:
+                break
+            db.session.remove()
+            time.sleep(args.watch)
+
+        for image in UploadedImage.query.filter_by(status='failed').order_by(UploadedImage.id):
+            print(f"⚠️  {image.url}: {image.error}")
+
+
+if __name__ == '__main__':
+    main()
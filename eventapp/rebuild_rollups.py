@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Rebuild the daily RSVP rollups (and arrival buckets) from the RSVP table.
+
+The rollups are kept up to date as RSVPs change; run this after editing RSVPs
+directly in the database, or to check that the live counts have not drifted.
+
+Usage:
+    python rebuild_rollups.py              # every event
+    python rebuild_rollups.py --event 42   # one event
+"""
+
+import argparse
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, Event, rebuild_arrival_buckets, rebuild_event_rollups
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild EventApp analytics rollups.')
+    parser.add_argument('--event', type=int, action='append', metavar='EVENT_ID',
+                        help='Only rebuild this event (may be repeated)')
+    args = parser.parse_args()
+
+    with app.app_context():
+        event_ids = args.event or db.session.execute(db.select(Event.id).order_by(Event.id)).scalars().all()
+        rows = buckets = 0
+        for event_id in event_ids:
+            if db.session.get(Event, event_id) is None:
+                print(f"❌ Event {event_id} not found")
+                sys.exit(1)
+            # One event per transaction keeps write locks short
+            rows += rebuild_event_rollups(event_id)
+            buckets += rebuild_arrival_buckets(event_id)
+            db.session.commit()
+        print(f"✅ Rebuilt {rows} rollup rows and {buckets} arrival buckets for {len(event_ids)} events")
+
+
+if __name__ == '__main__':
+    main()
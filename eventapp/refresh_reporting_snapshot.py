@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Refresh the SQLite snapshot used by the read-only reporting bind.
+
+Schedule this as a PythonAnywhere task (e.g. every 15 minutes) and point the
+app at the snapshot so analytics and exports never touch the live database:
+
+    REPORTING_DATABASE_URL=sqlite:///file:eventapp_reporting.db?mode=ro&uri=true
+
+The snapshot is taken with SQLite's online backup API, which copies a
+consistent view while the app keeps writing, into a temporary file that is
+then renamed over the old snapshot so readers never see a half-written file.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db
+
+
+def refresh_reporting_snapshot(snapshot_path=None):
+    """Copy the live SQLite database to ``snapshot_path`` atomically.
+
+    Returns:
+        The path of the refreshed snapshot.
+    """
+    with app.app_context():
+        url = db.engine.url
+        if url.get_backend_name() != 'sqlite':
+            raise ValueError("Snapshots are only used with SQLite; point "
+                             "REPORTING_DATABASE_URL at a replica instead.")
+        source_path = url.database
+
+    if snapshot_path is None:
+        snapshot_path = os.path.join(app.instance_path, 'eventapp_reporting.db')
+
+    snapshot_dir = os.path.dirname(os.path.abspath(snapshot_path))
+    os.makedirs(snapshot_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix='.db', dir=snapshot_dir)
+    os.close(fd)
+
+    try:
+        source = sqlite3.connect(f"file:{source_path}?mode=ro", uri=True)
+        target = sqlite3.connect(tmp_path)
+        try:
+            source.backup(target)
+            # Readers open the snapshot read-only, so keep it in rollback-journal mode
+            target.execute('PRAGMA journal_mode=DELETE')
+        finally:
+            target.close()
+            source.close()
+        os.replace(tmp_path, snapshot_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return snapshot_path
+
+
+if __name__ == '__main__':
+    path = refresh_reporting_snapshot(sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"✅ Reporting snapshot refreshed: {path}")
@@ -10,7 +10,7 @@ from datetime import datetime
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app import app, db, User
+from app import app, db, User, record_credit_transaction, to_minor_units
 from werkzeug.security import generate_password_hash
 
 def reset_admin_simple():
@@ -53,7 +53,6 @@ def reset_admin_simple():
                 city='Singapore',
                 membership_type='嫡传',
                 membership_grade='Diamond',
-                credit_point=1000.0,
                 is_admin=True,
                 email_verified=True,
                 account_status='Active',
@@ -62,6 +61,10 @@ def reset_admin_simple():
             
             db.session.add(new_admin)
             db.session.commit()
+
+            # Give admin some credits
+            record_credit_transaction(new_admin.id, to_minor_units(1000), 'topup', note='Admin account setup')
+            db.session.commit()
             
             print("✅ New admin created:")
             print("   - Username: admin")
@@ -9,7 +9,7 @@ import sys
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app import app, db, User
+from app import app, db, User, from_minor_units, set_credit_balance, to_minor_units
 
 def set_test_credits():
     """Set test credit points for users."""
@@ -23,12 +23,10 @@ def set_test_credits():
             test_credits = [100.50, 250.00, 75.25, 500.00, 0.00]
             
             for i, user in enumerate(users):
-                if i < len(test_credits):
-                    user.credit_point = test_credits[i]
-                    print(f"✅ Set {user.username} credits to {test_credits[i]}")
-                else:
-                    user.credit_point = 0.0
-                    print(f"✅ Set {user.username} credits to 0.0")
+                credits = test_credits[i] if i < len(test_credits) else 0.0
+                # Balances only change through the ledger
+                set_credit_balance(user, to_minor_units(credits), user.credit_balance or 0, note='Test credits')
+                print(f"✅ Set {user.username} credits to {credits}")
             
             db.session.commit()
             print("\n🎉 Test credit points set successfully!")
@@ -37,7 +35,7 @@ def set_test_credits():
             print("\n📊 Updated Credit Points:")
             print("=" * 40)
             for user in users:
-                print(f"👤 {user.username:<15} | 💰 {user.credit_point:>8.2f}")
+                print(f"👤 {user.username:<15} | 💰 {from_minor_units(user.credit_balance or 0):>8.2f}")
             
     except Exception as e:
         print(f"❌ Error setting test credits: {e}")
@@ -0,0 +1,123 @@
+"""
+Coalesce concurrent requests for the same computation.
+
+Plain threading and file locks with no Flask. When many requests miss a
+cache at the same moment, :meth:`SingleFlight.do` lets the first caller for
+a key run the computation while the others wait for it and share its
+result (or its exception) instead of each running the same queries.
+
+Across processes (several web workers), results that come with a version
+are also shared through files in ``lock_dir``: the first process computes
+while holding the key's lock file and stores the result with its version,
+and processes that were waiting on the lock, or that arrive later, read it
+instead of computing again until the version changes. This needs
+``fcntl``; on platforms without it only callers in the same process are
+coalesced.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+import uuid
+
+try:
+    import fcntl
+except ImportError:  # Windows; cross-process coalescing is skipped
+    fcntl = None
+
+_MISSING = object()
+
+
+class _Call:
+    """One computation in progress and, once done, its outcome."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Run each keyed computation once for all callers that ask for it at the same time.
+
+    Results are handed to other threads as they are, so computations should
+    return plain data (no ORM objects bound to the computing thread's session).
+    Results shared across processes must also be picklable.
+    """
+
+    def __init__(self, lock_dir=None):
+        self.lock_dir = lock_dir
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, compute, version=None):
+        """Return ``compute()``, running it only if no other caller already is for ``key``.
+
+        Args:
+            key: hashable naming the computation and its inputs.
+            compute: function of no arguments.
+            version: fingerprint of the data the result depends on. When
+                given, the result is shared with other processes through
+                ``lock_dir`` for as long as the version stays the same.
+        """
+        flight = (key, version)
+        with self._lock:
+            call = self._calls.get(flight)
+            leader = call is None
+            if leader:
+                call = self._calls[flight] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            if version is None or fcntl is None or self.lock_dir is None:
+                call.result = compute()
+            else:
+                call.result = self._shared(key, version, compute)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[flight]
+            call.done.set()
+        return call.result
+
+    def path(self, key) -> str:
+        """Path, without extension, of the lock (``.lock``) and result (``.result``) files for ``key``."""
+        return os.path.join(self.lock_dir, hashlib.sha256(repr(key).encode('utf-8')).hexdigest()[:32])
+
+    def _stored(self, path, version):
+        """The result stored at ``path`` for ``version``, or _MISSING."""
+        try:
+            with open(path + '.result', 'rb') as f:
+                stored_version, result = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return _MISSING
+        return result if stored_version == version else _MISSING
+
+    def _shared(self, key, version, compute):
+        path = self.path(key)
+        result = self._stored(path, version)
+        if result is not _MISSING:
+            return result
+        os.makedirs(self.lock_dir, exist_ok=True)
+        with open(path + '.lock', 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                # Another process may have stored it while we waited for the lock
+                result = self._stored(path, version)
+                if result is not _MISSING:
+                    return result
+                result = compute()
+                tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump((version, result), f, pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path + '.result')
+                return result
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
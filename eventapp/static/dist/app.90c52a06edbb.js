@@ -0,0 +1,151 @@
+document.addEventListener('DOMContentLoaded', function() {
+const fileInputs = document.querySelectorAll('.custom-file-input');
+fileInputs.forEach(function(input) {
+input.addEventListener('change', function() {
+const fileName = this.files[0] ? this.files[0].name : 'Choose file';
+const label = this.nextElementSibling;
+label.textContent = fileName;
+});
+});
+});
+document.addEventListener('DOMContentLoaded', function() {
+const carouselSlides = document.getElementById('carousel-slides');
+const carouselIndicators = document.getElementById('carousel-indicators');
+const prevBtn = document.getElementById('carousel-prev');
+const nextBtn = document.getElementById('carousel-next');
+if (!carouselSlides) return;
+const slides = carouselSlides.querySelectorAll('.carousel-slide');
+const indicators = carouselIndicators ? carouselIndicators.querySelectorAll('.carousel-indicator') : [];
+let currentSlide = 0;
+let autoSlideInterval;
+function showSlide(index) {
+slides.forEach(slide => slide.classList.remove('active'));
+indicators.forEach(indicator => indicator.classList.remove('active'));
+if (slides[index]) {
+slides[index].classList.add('active');
+}
+if (indicators[index]) {
+indicators[index].classList.add('active');
+}
+currentSlide = index;
+}
+function nextSlide() {
+const nextIndex = (currentSlide + 1) % slides.length;
+showSlide(nextIndex);
+}
+function prevSlide() {
+const prevIndex = (currentSlide - 1 + slides.length) % slides.length;
+showSlide(prevIndex);
+}
+function startAutoSlide() {
+autoSlideInterval = setInterval(nextSlide, 8000);
+}
+function stopAutoSlide() {
+if (autoSlideInterval) {
+clearInterval(autoSlideInterval);
+}
+}
+if (nextBtn) {
+nextBtn.addEventListener('click', () => {
+nextSlide();
+stopAutoSlide();
+startAutoSlide();
+});
+}
+if (prevBtn) {
+prevBtn.addEventListener('click', () => {
+prevSlide();
+stopAutoSlide();
+startAutoSlide();
+});
+}
+indicators.forEach((indicator, index) => {
+indicator.addEventListener('click', () => {
+showSlide(index);
+stopAutoSlide();
+startAutoSlide();
+});
+});
+let startX = 0;
+let startY = 0;
+let endX = 0;
+let endY = 0;
+carouselSlides.addEventListener('touchstart', (e) => {
+startX = e.touches[0].clientX;
+startY = e.touches[0].clientY;
+});
+carouselSlides.addEventListener('touchend', (e) => {
+endX = e.changedTouches[0].clientX;
+endY = e.changedTouches[0].clientY;
+const deltaX = endX - startX;
+const deltaY = endY - startY;
+if (Math.abs(deltaX) > Math.abs(deltaY) && Math.abs(deltaX) > 50) {
+if (deltaX > 0) {
+prevSlide();
+} else {
+nextSlide();
+}
+stopAutoSlide();
+startAutoSlide();
+}
+});
+carouselSlides.addEventListener('mouseenter', stopAutoSlide);
+carouselSlides.addEventListener('mouseleave', startAutoSlide);
+if (slides.length > 1) {
+startAutoSlide();
+}
+});
+function directUpload(input, file) {
+return file.arrayBuffer().then(function(buffer) {
+return crypto.subtle.digest('SHA-256', buffer);
+}).then(function(digest) {
+const sha256 = Array.from(new Uint8Array(digest)).map(function(byte) {
+return byte.toString(16).padStart(2, '0');
+}).join('');
+return fetch(input.dataset.directUpload, {
+method: 'POST',
+credentials: 'same-origin',
+headers: {'Content-Type': 'application/json'},
+body: JSON.stringify({sha256: sha256, size: file.size, content_type: file.type})
+});
+}).then(function(response) {
+if (!response.ok) {
+throw new Error('Upload not accepted');
+}
+return response.json();
+}).then(function(upload) {
+if (!upload.url) {
+return upload.key;
+}
+return fetch(upload.url, {method: 'PUT', headers: upload.headers, body: file}).then(function(response) {
+if (!response.ok) {
+throw new Error('Upload failed');
+}
+return upload.key;
+});
+});
+}
+document.addEventListener('DOMContentLoaded', function() {
+const inputs = document.querySelectorAll('input[type="file"][data-direct-upload]');
+inputs.forEach(function(input) {
+input.form.addEventListener('submit', function(event) {
+const file = input.files[0];
+if (!file || input.disabled || !(window.crypto && window.crypto.subtle)) {
+return;
+}
+event.preventDefault();
+const form = this;
+directUpload(input, file).then(function(key) {
+const field = document.createElement('input');
+field.type = 'hidden';
+field.name = input.name + '_key';
+field.value = key;
+form.appendChild(field);
+input.disabled = true;
+}).catch(function() {
+}).then(function() {
+form.submit();
+});
+});
+});
+});
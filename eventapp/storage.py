@@ -0,0 +1,315 @@
+"""
+Where uploaded images are kept.
+
+Plain file and HTTP handling with no Flask or database access. Uploads are
+addressed by a key such as ``content/ab/<sha256>.jpg``; the app's URL for
+one is always ``/static/uploads/<key>``, whichever backend holds it.
+
+:class:`LocalStorage` keeps them under ``static/uploads`` for Flask's
+static route to serve. :class:`S3Storage` keeps them in an S3-compatible
+bucket (AWS S3, MinIO, Cloudflare R2, ...). Browsers upload to it and
+download from it directly through presigned URLs, so image bytes don't pass
+through the app. It signs requests itself (AWS Signature Version 4) with
+``urllib``, so it needs no extra packages.
+
+:func:`storage_from_config` picks the backend from the app config.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+import shutil
+import tempfile
+import urllib.error
+import urllib.request
+import xml.etree.ElementTree as ElementTree
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from urllib.parse import quote, urlsplit
+
+S3_NAMESPACE = '{http://s3.amazonaws.com/doc/2006-03-01/}'
+SIGNING_ALGORITHM = 'AWS4-HMAC-SHA256'
+MAX_PRESIGN_SECONDS = 7 * 24 * 3600  # SigV4 limit
+DOWNLOAD_URL_SECONDS = 2 * 24 * 3600
+UPLOAD_URL_SECONDS = 15 * 60
+
+
+class LocalStorage:
+    """Uploads kept in a directory on this server, served as static files."""
+
+    is_local = True
+
+    def __init__(self, root):
+        self.root = os.path.normpath(root)
+        # Files are staged next to where they end up, so moving them in is a rename
+        self.staging_dir = os.path.join(self.root, 'content')
+
+    def path(self, key):
+        """Filesystem path of a key; keys can't point outside the root."""
+        path = os.path.normpath(os.path.join(self.root, key))
+        if os.path.commonpath([self.root, path]) != self.root or path == self.root:
+            raise ValueError(f'Invalid storage key {key!r}')
+        return path
+
+    def save(self, key, source_path, content_type=None):
+        """Move a file (staged in ``staging_dir``) into place under ``key``."""
+        target = self.path(key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(source_path, target)
+
+    def exists(self, key):
+        return os.path.isfile(self.path(key))
+
+    def size(self, key):
+        """Size of a stored file in bytes; FileNotFoundError if it is missing."""
+        return os.path.getsize(self.path(key))
+
+    def read_head(self, key, length):
+        with open(self.path(key), 'rb') as f:
+            return f.read(length)
+
+    def touch(self, key):
+        """Mark a file as just used, restarting the collector's grace period."""
+        os.utime(self.path(key))
+
+    @contextmanager
+    def local_copy(self, key):
+        """Yield a filesystem path holding the file's content."""
+        path = self.path(key)
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f'{key} is missing')
+        yield path
+
+    def delete(self, key):
+        """Remove a file if it exists, and any directories that leaves empty.
+
+        Top-level folders (``content``, ``renditions``, ...) are kept.
+        """
+        path = self.path(key)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        directory = os.path.dirname(path)
+        while os.path.dirname(directory) != self.root and directory != self.root:
+            try:
+                os.rmdir(directory)
+            except OSError:
+                break  # Not empty
+            directory = os.path.dirname(directory)
+
+    def delete_prefix(self, prefix):
+        """Remove every file whose key starts with ``prefix/``."""
+        shutil.rmtree(self.path(prefix), ignore_errors=True)
+
+    def list_files(self, prefix=''):
+        """Yield ``(key, size, modified timestamp)`` for every stored file."""
+        top = self.path(prefix) if prefix else self.root
+        for root, _, files in os.walk(top):
+            for filename in sorted(files):
+                path = os.path.join(root, filename)
+                stat = os.stat(path)
+                yield os.path.relpath(path, self.root).replace(os.sep, '/'), stat.st_size, stat.st_mtime
+
+    def download_url(self, key):
+        """Served by the app's static route, so there is no separate download URL."""
+        return None
+
+    def presigned_upload(self, key, content_type, sha256, size):
+        """Browsers upload through the app when storage is local."""
+        return None
+
+
+def _hmac(key, message):
+    return hmac.new(key, message.encode('utf-8'), hashlib.sha256).digest()
+
+
+def _uri_encode(value, safe='-_.~'):
+    return quote(value, safe=safe)
+
+
+class S3Storage:
+    """Uploads kept in an S3-compatible bucket.
+
+    Without ``endpoint_url`` the bucket is addressed on AWS
+    (``https://<bucket>.s3.<region>.amazonaws.com``). With one (MinIO, R2,
+    a test server) it is addressed path-style: ``<endpoint_url>/<bucket>``.
+    ``public_url``, if the bucket or a CDN in front of it is readable
+    without signing, is used for downloads instead of presigned URLs.
+    """
+
+    is_local = False
+    staging_dir = None
+
+    def __init__(self, bucket, access_key, secret_key, region='us-east-1', endpoint_url=None,
+                 public_url=None, timeout=30):
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.public_url = public_url.rstrip('/') if public_url else None
+        self.timeout = timeout
+        if endpoint_url:
+            self.base_url = f"{endpoint_url.rstrip('/')}/{bucket}"
+        elif region == 'us-east-1':
+            self.base_url = f'https://{bucket}.s3.amazonaws.com'
+        else:
+            self.base_url = f'https://{bucket}.s3.{region}.amazonaws.com'
+
+    def _signing_key(self, datestamp):
+        key = _hmac(('AWS4' + self.secret_key).encode('utf-8'), datestamp)
+        for part in (self.region, 's3', 'aws4_request'):
+            key = _hmac(key, part)
+        return key
+
+    def presign(self, method, key='', expires=300, query=None, headers=None, now=None):
+        """A URL that performs one request without further credentials.
+
+        ``headers`` are signed, so the request must send them with exactly
+        these values. Signing the same request at the same ``now`` always
+        gives the same URL.
+        """
+        now = now or datetime.now(timezone.utc)
+        amz_date = now.strftime('%Y%m%dT%H%M%SZ')
+        datestamp = now.strftime('%Y%m%d')
+        scope = f'{datestamp}/{self.region}/s3/aws4_request'
+        url = urlsplit(f'{self.base_url}/{_uri_encode(key, safe="/-_.~")}' if key else self.base_url + '/')
+        signed = {'host': url.netloc}
+        signed.update({name.lower(): str(value).strip() for name, value in (headers or {}).items()})
+        signed_names = ';'.join(sorted(signed))
+
+        params = dict(query or {})
+        params.update({
+            'X-Amz-Algorithm': SIGNING_ALGORITHM,
+            'X-Amz-Credential': f'{self.access_key}/{scope}',
+            'X-Amz-Date': amz_date,
+            'X-Amz-Expires': str(min(expires, MAX_PRESIGN_SECONDS)),
+            'X-Amz-SignedHeaders': signed_names,
+        })
+        canonical_query = '&'.join(f'{_uri_encode(k)}={_uri_encode(str(v))}' for k, v in sorted(params.items()))
+        canonical_request = '\n'.join([
+            method,
+            url.path,
+            canonical_query,
+            ''.join(f'{name}:{signed[name]}\n' for name in sorted(signed)),
+            signed_names,
+            'UNSIGNED-PAYLOAD',
+        ])
+        string_to_sign = '\n'.join([
+            SIGNING_ALGORITHM, amz_date, scope, hashlib.sha256(canonical_request.encode('utf-8')).hexdigest(),
+        ])
+        signature = hmac.new(self._signing_key(datestamp), string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
+        return f'{url.scheme}://{url.netloc}{url.path}?{canonical_query}&X-Amz-Signature={signature}'
+
+    def _request(self, method, key='', query=None, signed_headers=None, headers=None, data=None):
+        url = self.presign(method, key, query=query, headers=signed_headers)
+        request = urllib.request.Request(url, data=data, method=method,
+                                         headers={**(signed_headers or {}), **(headers or {})})
+        try:
+            return urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                raise FileNotFoundError(f'{key} is missing') from None
+            raise OSError(f'{method} {key or self.bucket} failed: {e.code} {e.reason}') from None
+
+    def save(self, key, source_path, content_type=None):
+        """Upload a local file under ``key`` and remove the local copy."""
+        headers = {'Content-Length': str(os.path.getsize(source_path))}
+        with open(source_path, 'rb') as f:
+            self._request('PUT', key, signed_headers={'Content-Type': content_type} if content_type else None,
+                          headers=headers, data=f).close()
+        os.remove(source_path)
+
+    def exists(self, key):
+        try:
+            self.size(key)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def size(self, key):
+        with self._request('HEAD', key) as response:
+            return int(response.headers['Content-Length'])
+
+    def read_head(self, key, length):
+        with self._request('GET', key, headers={'Range': f'bytes=0-{length - 1}'}) as response:
+            return response.read(length)
+
+    def touch(self, key):
+        """Objects can't be touched in place; the collector's grace period counts from the upload."""
+
+    @contextmanager
+    def local_copy(self, key):
+        """Download an object to a temporary file for the duration of the block."""
+        with tempfile.NamedTemporaryFile(suffix=os.path.splitext(key)[1]) as tmp:
+            with self._request('GET', key) as response:
+                shutil.copyfileobj(response, tmp)
+            tmp.flush()
+            yield tmp.name
+
+    def delete(self, key):
+        self._request('DELETE', key).close()
+
+    def delete_prefix(self, prefix):
+        for key, _, _ in list(self.list_files(prefix + '/')):
+            self.delete(key)
+
+    def list_files(self, prefix=''):
+        """Yield ``(key, size, modified timestamp)`` for every object, a page at a time."""
+        token = None
+        while True:
+            query = {'list-type': '2', 'prefix': prefix}
+            if token:
+                query['continuation-token'] = token
+            with self._request('GET', query=query) as response:
+                listing = ElementTree.fromstring(response.read())
+            for item in listing.iter(S3_NAMESPACE + 'Contents'):
+                modified = datetime.strptime(item.findtext(S3_NAMESPACE + 'LastModified')[:19], '%Y-%m-%dT%H:%M:%S')
+                yield (item.findtext(S3_NAMESPACE + 'Key'), int(item.findtext(S3_NAMESPACE + 'Size')),
+                       modified.replace(tzinfo=timezone.utc).timestamp())
+            token = listing.findtext(S3_NAMESPACE + 'NextContinuationToken')
+            if listing.findtext(S3_NAMESPACE + 'IsTruncated') != 'true' or not token:
+                break
+
+    def download_url(self, key):
+        """Public or presigned URL for an object.
+
+        Presigned URLs are signed as of the start of the current UTC day, so
+        a page shows the same URL all day and browsers can cache the image.
+        """
+        if self.public_url:
+            return f'{self.public_url}/{_uri_encode(key, safe="/-_.~")}'
+        day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        return self.presign('GET', key, expires=DOWNLOAD_URL_SECONDS, now=day)
+
+    def presigned_upload(self, key, content_type, sha256, size):
+        """A URL and headers for a browser to PUT one file straight into the bucket.
+
+        The content type and SHA-256 checksum are signed, so the bucket
+        refuses any other content under this key.
+        """
+        headers = {
+            'Content-Type': content_type,
+            'x-amz-checksum-sha256': base64.b64encode(bytes.fromhex(sha256)).decode('ascii'),
+        }
+        return {'url': self.presign('PUT', key, expires=UPLOAD_URL_SECONDS, headers=headers), 'headers': headers}
+
+
+def storage_from_config(config, local_root):
+    """The storage backend named by ``UPLOAD_STORAGE`` (``local`` or ``s3``).
+
+    Raises:
+        ValueError: for an unknown backend or missing S3 settings.
+    """
+    backend = (config.get('UPLOAD_STORAGE') or 'local').lower()
+    if backend == 'local':
+        return LocalStorage(local_root)
+    if backend == 's3':
+        missing = [name for name in ('S3_BUCKET', 'S3_ACCESS_KEY_ID', 'S3_SECRET_ACCESS_KEY') if not config.get(name)]
+        if missing:
+            raise ValueError(f"UPLOAD_STORAGE=s3 needs {', '.join(missing)}")
+        return S3Storage(config['S3_BUCKET'], config['S3_ACCESS_KEY_ID'], config['S3_SECRET_ACCESS_KEY'],
+                         region=config.get('S3_REGION') or 'us-east-1', endpoint_url=config.get('S3_ENDPOINT_URL'),
+                         public_url=config.get('S3_PUBLIC_URL'))
+    raise ValueError(f'Unknown UPLOAD_STORAGE {backend!r}; use local or s3')
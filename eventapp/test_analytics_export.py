@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test script for the NDJSON analytics dump.
+"""
+
+import gzip
+import json
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, User, Event, RSVP, iter_analytics_dump
+from testutils import client_for, make_user
+from export_analytics import WATERMARK_FILE, export_analytics
+
+
+def _read(lines):
+    records = [json.loads(line) for line in lines]
+    assert records[0]['type'] == 'header'
+    assert records[-1]['type'] == 'footer'
+    rows = {}
+    for record in records[1:-1]:
+        rows.setdefault(record['table'], {})[record['data']['id']] = record['data']
+    return rows, records[-1]
+
+
+def _setup():
+    with app.app_context():
+        admin = make_user('dump-admin@example.com', is_admin=True)
+        member = make_user('dump-member@example.com')
+        event = Event(name='Dump Test Course', start_date=datetime.utcnow() + timedelta(days=2),
+                      location='Singapore', capacity=10, creator_id=admin.id)
+        old_event = Event(name='Dump Old Course', start_date=datetime(2001, 1, 1),
+                          location='Singapore', capacity=10, creator_id=admin.id)
+        db.session.add_all([event, old_event])
+        db.session.commit()
+        rsvp = RSVP(event_id=event.id, user_id=member.id, status='Maybe')
+        db.session.add(rsvp)
+        db.session.commit()
+        # An event nobody has touched in years
+        db.session.execute(Event.__table__.update().where(Event.__table__.c.id == old_event.id)
+                           .values(updated_at=datetime(2001, 1, 1)))
+        db.session.commit()
+        return admin.id, member.id, event.id, old_event.id, rsvp.id
+
+
+def _cleanup(event_ids):
+    with app.app_context():
+        RSVP.query.filter(RSVP.event_id.in_(event_ids)).delete()
+        Event.query.filter(Event.id.in_(event_ids)).delete()
+        db.session.commit()
+
+
+def test_full_and_incremental_dump():
+    """A full dump has every table minus secrets; the next one only changed rows."""
+    print("🧪 Testing analytics dump...")
+    admin_id, member_id, event_id, old_event_id, rsvp_id = _setup()
+    try:
+        with app.app_context():
+            rows, footer = _read(iter_analytics_dump())
+            assert set(rows) <= {'user', 'event', 'rsvp', 'feedback', 'notification'}
+            assert footer['counts']['user'] == User.query.count()
+            member = rows['user'][member_id]
+            assert member['email'] == 'dump-member@example.com'
+            assert 'password_hash' not in member and 'password_reset_token' not in member
+            assert rows['rsvp'][rsvp_id]['status'] == 'Maybe'
+            assert old_event_id in rows['event']
+
+            RSVP.query.filter_by(id=rsvp_id).update({'status': 'Accepted'})
+            db.session.commit()
+
+            since = datetime.fromisoformat(footer['watermark'].rstrip('Z'))
+            rows, next_footer = _read(iter_analytics_dump(since=since, tables=['event', 'rsvp']))
+            assert rows['rsvp'][rsvp_id]['status'] == 'Accepted'
+            assert old_event_id not in rows.get('event', {})
+            assert set(next_footer['counts']) == {'event', 'rsvp'}
+            assert next_footer['watermark'] > footer['watermark']
+
+            # Rows committed while a dump is running are left for the next one,
+            # even in tables the dump has not reached yet
+            dump = iter_analytics_dump(tables=['event', 'rsvp'])
+            lines = [next(dump), next(dump)]
+            late = RSVP(event_id=event_id, user_id=admin_id, status='Accepted')
+            db.session.add(late)
+            db.session.commit()
+            rows, _ = _read(lines + list(dump))
+            assert rsvp_id in rows['rsvp'] and late.id not in rows['rsvp']
+
+            try:
+                list(iter_analytics_dump(tables=['credit_transaction']))
+                raise AssertionError("unknown table should be rejected")
+            except ValueError:
+                pass
+    finally:
+        _cleanup([event_id, old_event_id])
+    print("✅ Full and incremental dumps")
+
+
+def test_endpoint_and_command():
+    """Admins can stream the dump; the command keeps a watermark between runs."""
+    print("🧪 Testing analytics export endpoint and command...")
+    admin_id, member_id, event_id, old_event_id, rsvp_id = _setup()
+    output = tempfile.mkdtemp()
+    try:
+        response = client_for(admin_id).get('/admin/analytics-export?gzip=1&tables=rsvp')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/gzip'
+        rows, footer = _read(gzip.decompress(response.data).decode('utf-8').splitlines())
+        assert rsvp_id in rows['rsvp']
+        assert client_for(admin_id).get('/admin/analytics-export?tables=secrets').status_code == 400
+        assert client_for(member_id).get('/admin/analytics-export').status_code == 302
+
+        with app.app_context():
+            path, footer = export_analytics(output)
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                rows, _ = _read(f)
+            assert rsvp_id in rows['rsvp']
+            with open(os.path.join(output, WATERMARK_FILE)) as f:
+                assert json.load(f)['watermark'] == footer['watermark']
+            assert set(os.listdir(output)) == {os.path.basename(path), WATERMARK_FILE}
+    finally:
+        shutil.rmtree(output, ignore_errors=True)
+        _cleanup([event_id, old_event_id])
+    print("✅ Endpoint and command export")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧾 Analytics Export Test Suite")
+    print("=" * 60)
+    test_full_and_incremental_dump()
+    test_endpoint_and_command()
+    print("\n🎉 All analytics export tests passed!")
+    print("=" * 60)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test script for live check-in arrival analytics.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import (app, db, Event, RSVP, CheckInBucket, EventDailyStat, make_qr_token,
+                 rebuild_arrival_buckets)
+from testutils import client_for, make_user
+
+
+def _buckets(event_id):
+    return [(b.minute, b.arrivals, b.guests, b.meal_arrivals)
+            for b in CheckInBucket.query.filter_by(event_id=event_id)
+            .filter(CheckInBucket.arrivals > 0).order_by(CheckInBucket.minute)]
+
+
+def test_arrival_buckets():
+    """Check-ins update minute buckets that match a full rebuild."""
+    print("🧪 Testing arrival analytics...")
+    with app.app_context():
+        organiser = make_user('arrivals-organiser@example.com')
+        outsider = make_user('arrivals-outsider@example.com')
+        event = Event(name='Arrivals Test Course', start_date=datetime.utcnow() - timedelta(minutes=30),
+                      location='Singapore', capacity=50, creator_id=organiser.id)
+        db.session.add(event)
+        db.session.commit()
+
+        codes, attendee_ids = [], []
+        for i, (status, guests, meal) in enumerate([('Accepted', 0, True), ('Accepted', 2, False),
+                                                    ('Accepted', 0, True), ('Declined', 0, False)]):
+            attendee = make_user(f'arrivals-attendee{i}@example.com')
+            rsvp = RSVP(event_id=event.id, user_id=attendee.id, status=status, guests=guests, meal_opt_in=meal)
+            db.session.add(rsvp)
+            db.session.flush()
+            rsvp.qr_code = make_qr_token(event.id, rsvp.id) if status == 'Accepted' else None
+            codes.append(rsvp.qr_code)
+            attendee_ids.append(attendee.id)
+        db.session.commit()
+        organiser_id, outsider_id, event_id = organiser.id, outsider.id, event.id
+
+    try:
+        client = client_for(organiser_id)
+        client.post('/verify', data={'code': codes[0], 'event_id': event_id})
+
+        # An offline kiosk syncs a later scan, then another device an earlier one
+        later = (datetime.utcnow() - timedelta(minutes=5)).replace(microsecond=0)
+        earlier = later - timedelta(minutes=10)
+        url = f'/api/event/{event_id}/kiosk/check-ins'
+        client.post(url, json={'check_ins': [{'ref': 'a', 'code': codes[1], 'scanned_at': later.isoformat()}]})
+        client.post(url, json={'check_ins': [{'ref': 'b', 'code': codes[1], 'scanned_at': earlier.isoformat()},
+                                             {'ref': 'c', 'code': codes[0], 'scanned_at': later.isoformat()}]})
+
+        data = client.get(f'/api/event/{event_id}/arrivals').get_json()
+        assert data['accepted'] == {'rsvps': 3, 'headcount': 5, 'meals': 2}
+        assert data['arrived'] == {'rsvps': 2, 'headcount': 4, 'meals': 1}
+        assert data['turnout_rate'] == 0.8
+        assert data['no_show_rate'] == round(1 / 3, 4)
+        assert data['meals_remaining'] == 1
+        assert [b['minute'] for b in data['buckets']][0] == earlier.replace(second=0).isoformat() + 'Z'
+        assert data['buckets'][-1]['cumulative'] == 4
+
+        with app.app_context():
+            incremental = _buckets(event_id)
+            rebuild_arrival_buckets(event_id)
+            db.session.commit()
+            assert _buckets(event_id) == incremental
+
+        # Changing or declining a checked-in RSVP moves its arrival too
+        client_for(attendee_ids[0]).post(f'/event/{event_id}',
+                                          data={'status': 'Accepted', 'guests': '1', 'meal_opt_in': 'on'})
+        client_for(attendee_ids[1]).post(f'/event/{event_id}', data={'status': 'Declined'})
+        data = client.get(f'/api/event/{event_id}/arrivals').get_json()
+        assert data['arrived'] == {'rsvps': 1, 'headcount': 2, 'meals': 1}
+        assert data['buckets'][-1]['cumulative'] == 2
+        with app.app_context():
+            incremental = _buckets(event_id)
+            rebuild_arrival_buckets(event_id)
+            db.session.commit()
+            assert _buckets(event_id) == incremental
+
+        assert client.get(f'/event/{event_id}/arrivals').status_code == 200
+        assert client_for(outsider_id).get(f'/api/event/{event_id}/arrivals').status_code == 403
+    finally:
+        with app.app_context():
+            CheckInBucket.query.filter_by(event_id=event_id).delete()
+            EventDailyStat.query.filter_by(event_id=event_id).delete()
+            RSVP.query.filter_by(event_id=event_id).delete()
+            Event.query.filter_by(id=event_id).delete()
+            db.session.commit()
+    print("✅ Arrival buckets kept in step with check-ins")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("📈 Arrival Analytics Test Suite")
+    print("=" * 60)
+    test_arrival_buckets()
+    print("\n🎉 All arrival analytics tests passed!")
+    print("=" * 60)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test script for printable badge sheets.
+"""
+
+import io
+import os
+import re
+import sys
+import zipfile
+from datetime import datetime, timedelta
+from functools import partial
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, Event, RSVP, make_qr_token
+from testutils import client_for, make_user
+from badges import (BADGES_PER_PAGE, chunked, render_badge_page, render_badge_png,
+                    render_in_pool, stream_badge_pdf, stream_badge_zip)
+
+
+def _badges(count):
+    return [{'name': f'陈大文 Attendee {i}', 'grade': 'Gold', 'meal': i % 2 == 0,
+             'code': f'EA1.1.{i}.signature', 'event': 'Badge Test Course'} for i in range(count)]
+
+
+def test_pdf_and_zip_output():
+    """Pages stream into a well-formed PDF and badges into a ZIP of PNGs."""
+    print("🧪 Testing badge rendering...")
+    badges = _badges(BADGES_PER_PAGE + 1)
+
+    # The process pool returns the same output, in the same order, as rendering inline
+    pool = list(render_in_pool(render_badge_png, badges[:3], workers=2))
+    assert pool == [render_badge_png(badge) for badge in badges[:3]]
+    assert pool[0].startswith(b'\x89PNG')
+
+    pdf = b''.join(stream_badge_pdf(render_in_pool(render_badge_page, chunked(badges, BADGES_PER_PAGE), 1)))
+    assert pdf.startswith(b'%PDF-1.4') and pdf.endswith(b'%%EOF\n')
+    assert b'/Type /Pages /Kids [5 0 R 8 0 R] /Count 2' in pdf
+    startxref = int(re.search(rb'startxref\n(\d+)', pdf).group(1))
+    assert pdf[startxref:].startswith(b'xref')
+    offsets = re.findall(rb'(\d{10}) 00000 n', pdf)
+    assert len(offsets) == 8
+    assert all(pdf[int(offset):].startswith(f"{number} 0 obj".encode())
+               for number, offset in enumerate(offsets, 1))
+
+    pngs = render_in_pool(partial(render_badge_png, font_path=None), badges[:3], 1)
+    archive = zipfile.ZipFile(io.BytesIO(b''.join(stream_badge_zip(
+        (f"{i}.png", png) for i, png in enumerate(pngs))))
+    )
+    assert archive.namelist() == ['0.png', '1.png', '2.png']
+    assert archive.testzip() is None
+    print("✅ Badge PDF and ZIP rendered")
+
+
+def test_badge_route():
+    """Organisers download badges for accepted attendees only."""
+    print("🧪 Testing badge download...")
+    original_workers = app.config['BADGE_WORKERS']
+    app.config['BADGE_WORKERS'] = 1
+    with app.app_context():
+        organiser = make_user('badge-organiser@example.com')
+        outsider = make_user('badge-outsider@example.com')
+        event = Event(name='Badge Route Course', start_date=datetime.utcnow() + timedelta(days=3),
+                      location='Singapore', capacity=10, creator_id=organiser.id)
+        db.session.add(event)
+        db.session.commit()
+        for i, status in enumerate(['Accepted', 'Accepted', 'Declined']):
+            attendee = make_user(f'badge-attendee{i}@example.com')
+            rsvp = RSVP(event_id=event.id, user_id=attendee.id, status=status)
+            db.session.add(rsvp)
+            db.session.flush()
+            if status == 'Accepted':
+                rsvp.qr_code = make_qr_token(event.id, rsvp.id)
+        db.session.commit()
+        organiser_id, outsider_id, event_id = organiser.id, outsider.id, event.id
+
+    try:
+        client = client_for(organiser_id)
+        response = client.get(f'/event/{event_id}/badges')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/pdf'
+        assert b'/Count 1' in response.data
+
+        response = client.get(f'/event/{event_id}/badges?format=zip')
+        assert response.mimetype == 'application/zip'
+        assert "filename*=UTF-8''Badge%20Route%20Course_badges.zip" in response.headers['Content-Disposition']
+        names = zipfile.ZipFile(io.BytesIO(response.data)).namelist()
+        assert len(names) == 2 and names[0].startswith('0001_')
+
+        assert client.get(f'/event/{event_id}/badges?format=doc').status_code == 400
+        assert client_for(outsider_id).get(f'/event/{event_id}/badges').status_code == 302
+    finally:
+        app.config['BADGE_WORKERS'] = original_workers
+        with app.app_context():
+            RSVP.query.filter_by(event_id=event_id).delete()
+            Event.query.filter_by(id=event_id).delete()
+            db.session.commit()
+    print("✅ Badges downloaded")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🪪 Badge Sheet Test Suite")
+    print("=" * 60)
+    test_pdf_and_zip_output()
+    test_badge_route()
+    print("\n🎉 All badge sheet tests passed!")
+    print("=" * 60)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test script for the check-in kiosk roster and bulk check-in API.
+"""
+
+import os
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, Event, RSVP, CheckInBucket, EventDailyStat, make_qr_token, roster_hash
+from testutils import client_for, make_user
+
+
+def _setup(attendees=3):
+    with app.app_context():
+        organiser = make_user('kiosk-organiser@example.com')
+        outsider = make_user('kiosk-outsider@example.com')
+        event = Event(name='Kiosk Test Course', start_date=datetime.utcnow() + timedelta(hours=1),
+                      location='Singapore', capacity=50, creator_id=organiser.id)
+        other_event = Event(name='Kiosk Other Course', start_date=datetime.utcnow() + timedelta(hours=1),
+                            location='Singapore', capacity=50, creator_id=organiser.id)
+        db.session.add_all([event, other_event])
+        db.session.commit()
+
+        codes = []
+        for i in range(attendees):
+            user = make_user(f'kiosk-attendee{i}@example.com')
+            rsvp = RSVP(event_id=event.id, user_id=user.id, status='Accepted', meal_opt_in=i == 0)
+            db.session.add(rsvp)
+            db.session.flush()
+            rsvp.qr_code = make_qr_token(event.id, rsvp.id)
+            codes.append(rsvp.qr_code)
+        legacy = str(uuid.uuid4())
+        db.session.add(RSVP(event_id=event.id, user_id=outsider.id, status='Accepted', qr_code=legacy))
+        db.session.commit()
+        return organiser.id, outsider.id, event.id, other_event.id, codes, legacy
+
+
+def _cleanup(event_ids):
+    with app.app_context():
+        RSVP.query.filter(RSVP.event_id.in_(event_ids)).delete()
+        CheckInBucket.query.filter(CheckInBucket.event_id.in_(event_ids)).delete()
+        EventDailyStat.query.filter(EventDailyStat.event_id.in_(event_ids)).delete()
+        Event.query.filter(Event.id.in_(event_ids)).delete()
+        db.session.commit()
+
+
+def test_roster_and_deltas():
+    """The full roster lists accepted RSVPs by hash; deltas carry changes."""
+    print("🧪 Testing kiosk roster...")
+    organiser_id, outsider_id, event_id, other_id, codes, legacy = _setup()
+    try:
+        client = client_for(organiser_id)
+        assert client.get(f'/event/{event_id}/kiosk').status_code == 200
+        assert client_for(outsider_id).get(f'/api/event/{event_id}/kiosk/roster').status_code == 403
+
+        roster = client.get(f'/api/event/{event_id}/kiosk/roster').get_json()
+        assert roster['full'] is True
+        assert len(roster['entries']) == 4
+        hashes = {entry['h'] for entry in roster['entries']}
+        assert roster_hash(codes[0]) in hashes and roster_hash(legacy) in hashes
+        assert all(code not in str(roster) for code in codes)
+
+        # Decline one RSVP; the delta removes it
+        with app.app_context():
+            rsvp = RSVP.query.filter_by(qr_code=codes[1]).one()
+            rsvp.status = 'Declined'
+            rsvp.qr_code = None
+            db.session.commit()
+            declined_id = rsvp.id
+        delta = client.get(f'/api/event/{event_id}/kiosk/roster',
+                           query_string={'since': roster['version']}).get_json()
+        assert delta['full'] is False
+        assert {'id': declined_id, 'removed': True} in delta['entries']
+    finally:
+        _cleanup([event_id, other_id])
+    print("✅ Roster and deltas served")
+
+
+def test_bulk_check_in_conflicts():
+    """Batched scans resolve duplicates across devices; earliest scan wins."""
+    print("🧪 Testing bulk check-in...")
+    organiser_id, outsider_id, event_id, other_id, codes, legacy = _setup()
+    try:
+        client = client_for(organiser_id)
+        url = f'/api/event/{event_id}/kiosk/check-ins'
+        early_at = datetime.utcnow().replace(microsecond=0) - timedelta(minutes=10)
+        early = early_at.isoformat() + 'Z'
+        late = (early_at + timedelta(minutes=5)).isoformat() + 'Z'
+
+        # Device A scans late, device B syncs an earlier scan of the same code afterwards
+        device_a = client.post(url, json={'check_ins': [
+            {'ref': 'a1', 'code': codes[0], 'scanned_at': late},
+            {'ref': 'a2', 'code': legacy, 'scanned_at': late},
+            {'ref': 'a3', 'code': codes[0][:-1] + 'x', 'scanned_at': late},
+            {'ref': 'a4', 'code': make_qr_token(other_id, 1), 'scanned_at': late},
+        ]}).get_json()['results']
+        assert [r['status'] for r in device_a] == ['checked_in', 'checked_in', 'invalid', 'wrong_event']
+        assert [r['ref'] for r in device_a] == ['a1', 'a2', 'a3', 'a4']
+
+        device_b = client.post(url, json={'check_ins': [
+            {'ref': 'b1', 'code': codes[0], 'scanned_at': early},
+            {'ref': 'b2', 'code': codes[0], 'scanned_at': late},
+        ]}).get_json()['results']
+        assert device_b[0]['status'] == 'checked_in'
+        assert device_b[1]['status'] == 'duplicate'
+        assert device_b[1]['checked_in_at'].startswith(early_at.isoformat())
+
+        with app.app_context():
+            rsvp = RSVP.query.filter_by(qr_code=codes[0]).one()
+            assert rsvp.checked_in is True
+            assert rsvp.checked_in_at == early_at
+
+        # Scan times from a fast device clock are capped at the server time
+        future = client.post(url, json={'check_ins': [
+            {'ref': 'c1', 'code': codes[2], 'scanned_at': '2099-01-01T00:00:00Z'},
+        ]}).get_json()['results'][0]
+        assert future['checked_in_at'] < '2099'
+
+        assert client.post(url, json={'check_ins': 'nope'}).status_code == 400
+    finally:
+        _cleanup([event_id, other_id])
+    print("✅ Bulk check-in conflicts resolved")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("📲 Check-in Kiosk Test Suite")
+    print("=" * 60)
+    test_roster_and_deltas()
+    test_bulk_check_in_conflicts()
+    print("\n🎉 All kiosk tests passed!")
+    print("=" * 60)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test script for the orphaned upload collector.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, CarouselImage, UploadedImage, collect_unused_uploads, referenced_upload_urls
+from storage import LocalStorage
+
+OLD = time.time() - 2 * 24 * 3600
+
+
+def _write(root, relative, data=b'x' * 100, old=True):
+    path = os.path.join(root, relative)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    if old:
+        os.utime(path, (OLD, OLD))
+    return path
+
+
+def test_collect_unused_uploads():
+    """Unreferenced originals, renditions and partial files go; live and recent ones stay."""
+    print("🧪 Testing upload collection...")
+    root = tempfile.mkdtemp()
+    quarantine = tempfile.mkdtemp()
+    with app.app_context():
+        live = UploadedImage(url='/static/uploads/content/aa/collect-live.jpg', ref_count=1)
+        dead = UploadedImage(url='/static/uploads/content/bb/collect-dead.jpg', ref_count=0,
+                             created_at=datetime.utcnow() - timedelta(days=2))
+        fresh = UploadedImage(url='/static/uploads/content/cc/collect-fresh.jpg', ref_count=0)
+        db.session.add_all([live, dead, fresh, CarouselImage(image_url=live.url, title='Collect Test')])
+        db.session.commit()
+        ids = [live.id, dead.id, fresh.id]
+    try:
+        kept = [
+            _write(root, 'content/aa/collect-live.jpg'),
+            _write(root, f'renditions/{ids[0]}/thumb.jpg'),
+            _write(root, 'content/cc/collect-fresh.jpg'),
+            _write(root, 'content/recent.part', old=False),
+        ]
+        removed = {
+            'content/bb/collect-dead.jpg': _write(root, 'content/bb/collect-dead.jpg', b'x' * 1000),
+            f'renditions/{ids[1]}/thumb.jpg': _write(root, f'renditions/{ids[1]}/thumb.jpg'),
+            'events/legacy-cover.png': _write(root, 'events/legacy-cover.png'),
+            'content/abandoned.part': _write(root, 'content/abandoned.part'),
+        }
+
+        with app.app_context():
+            assert '/static/uploads/content/aa/collect-live.jpg' in referenced_upload_urls()
+
+            report = collect_unused_uploads(dry_run=True, storage=LocalStorage(root))
+            assert sorted(report['paths']) == sorted(removed)
+            assert report['files'] == 4 and report['bytes'] == 1300
+            assert report['records'] == 1 and report['recent'] == 1
+            assert all(os.path.exists(path) for path in removed.values())
+            assert db.session.get(UploadedImage, ids[1]) is not None
+
+            report = collect_unused_uploads(quarantine_dir=quarantine, storage=LocalStorage(root))
+            assert report['files'] == 4 and report['records'] == 1
+            assert db.session.get(UploadedImage, ids[1]) is None
+            assert db.session.get(UploadedImage, ids[2]) is not None
+            assert not any(os.path.exists(path) for path in removed.values())
+            assert all(os.path.exists(path) for path in kept)
+            # Originals are quarantined; renditions can be rendered again and are deleted
+            assert os.path.isfile(os.path.join(quarantine, 'content', 'bb', 'collect-dead.jpg'))
+            assert not os.path.exists(os.path.join(quarantine, 'renditions'))
+            assert not os.path.exists(os.path.join(root, 'content', 'bb'))
+            assert os.path.isdir(os.path.join(root, 'events'))
+
+            assert collect_unused_uploads(storage=LocalStorage(root))['files'] == 0
+    finally:
+        with app.app_context():
+            UploadedImage.query.filter(UploadedImage.id.in_(ids)).delete(synchronize_session=False)
+            CarouselImage.query.filter_by(title='Collect Test').delete()
+            db.session.commit()
+        shutil.rmtree(root, ignore_errors=True)
+        shutil.rmtree(quarantine, ignore_errors=True)
+    print("✅ Upload collection")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧹 Upload Collector Test Suite")
+    print("=" * 60)
+    test_collect_unused_uploads()
+    print("\n🎉 All upload collector tests passed!")
+    print("=" * 60)
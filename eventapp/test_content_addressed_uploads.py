@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Test script for content-addressed upload storage.
+"""
+
+import hashlib
+import io
+import os
+import shutil
+import sys
+from datetime import datetime, timedelta
+
+from PIL import Image
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, Event, CarouselImage, UploadedImage, static_file_path
+from testutils import client_for, make_user
+from migrate_content_addressed_uploads import migrate_content_addressed_uploads
+
+
+def _png(color):
+    buffer = io.BytesIO()
+    Image.new('RGB', (64, 48), color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+CONTENT = _png((10, 120, 200))
+
+
+def _add_slide(client, title, content=CONTENT, filename='banner.JPG'):
+    response = client.post('/admin/carousel/add', content_type='multipart/form-data', data={
+        'image_file': (io.BytesIO(content), filename), 'title': title})
+    assert response.status_code == 302
+
+
+def _cleanup(urls, titles):
+    with app.app_context():
+        for image in UploadedImage.query.filter(UploadedImage.url.in_(urls)):
+            shutil.rmtree(os.path.dirname(static_file_path(image.rendition_url('thumb', 'jpg'))),
+                          ignore_errors=True)
+        UploadedImage.query.filter(UploadedImage.url.in_(urls)).delete(synchronize_session=False)
+        CarouselImage.query.filter(CarouselImage.title.in_(titles)).delete(synchronize_session=False)
+        db.session.commit()
+        for url in urls:
+            path = static_file_path(url)
+            if path and os.path.exists(path):
+                os.remove(path)
+
+
+def test_identical_uploads_are_stored_once():
+    """The same file uploaded twice is one file, one record and two references."""
+    print("🧪 Testing upload deduplication...")
+    with app.app_context():
+        admin_id = make_user('content-admin@example.com', is_admin=True).id
+    client = client_for(admin_id)
+    sha256 = hashlib.sha256(CONTENT).hexdigest()
+    # Stored under the detected format's extension, whatever the upload was called
+    urls = [f'/static/uploads/content/{sha256[:2]}/{sha256}.png']
+    titles = ['Content Test A', 'Content Test B']
+    try:
+        _add_slide(client, titles[0])
+        _add_slide(client, titles[1], filename='same-banner.png')
+        with app.app_context():
+            slides = CarouselImage.query.filter(CarouselImage.title.in_(titles)).all()
+            assert {slide.image_url for slide in slides} == set(urls)
+            image = UploadedImage.query.filter_by(sha256=sha256).one()
+            assert image.url == urls[0] and image.size_bytes == len(CONTENT)
+            assert image.ref_count == 2 and image.status == 'pending'
+            directory = os.path.dirname(static_file_path(urls[0]))
+            assert os.listdir(directory).count(f'{sha256}.png') == 1
+            assert not [name for name in os.listdir(directory) if name.endswith('.part')]
+            slide_ids = [slide.id for slide in slides]
+
+        response = client.get(urls[0])
+        assert response.status_code == 200 and response.data == CONTENT
+        assert 'immutable' in response.headers['Cache-Control']
+        assert 'max-age=31536000' in response.headers['Cache-Control']
+        response.close()
+
+        client.post(f'/admin/carousel/{slide_ids[0]}/delete')
+        with app.app_context():
+            assert UploadedImage.query.filter_by(sha256=sha256).one().ref_count == 1
+        client.post(f'/admin/carousel/{slide_ids[1]}/delete')
+        with app.app_context():
+            assert UploadedImage.query.filter_by(sha256=sha256).one().ref_count == 0
+            assert os.path.isfile(static_file_path(urls[0]))
+    finally:
+        _cleanup(urls, titles)
+    print("✅ Upload deduplication")
+
+
+def test_event_covers_are_counted():
+    """Replacing and duplicating a cover move its reference count."""
+    print("🧪 Testing cover references...")
+    with app.app_context():
+        admin = make_user('content-admin@example.com', is_admin=True)
+        admin_id = admin.id
+        event = Event(name='Content Cover Test', start_date=datetime.utcnow() + timedelta(days=3),
+                      location='Singapore', capacity=10, creator_id=admin_id)
+        db.session.add(event)
+        db.session.commit()
+        event_id = event.id
+    client = client_for(admin_id)
+    old_url = '/static/uploads/content/test-old-cover.jpg'
+    urls = [old_url]
+    try:
+        with app.app_context():
+            db.session.add(UploadedImage(url=old_url, ref_count=1))
+            Event.query.filter_by(id=event_id).update({'cover_image_url': old_url})
+            db.session.commit()
+            start = datetime.utcnow() + timedelta(days=3)
+
+        response = client.post(f'/event/{event_id}/update', content_type='multipart/form-data', data={
+            'name': 'Content Cover Test', 'description': '', 'location': 'Singapore', 'capacity': '10',
+            'date': start.strftime('%Y-%m-%d'), 'time': '10:00', 'price': '0',
+            'cover_image': (io.BytesIO(_png((200, 40, 40))), 'cover.png')})
+        assert response.status_code == 302
+        with app.app_context():
+            new_url = db.session.get(Event, event_id).cover_image_url
+            urls.append(new_url)
+            assert new_url.startswith('/static/uploads/content/') and new_url.endswith('.png')
+            assert UploadedImage.query.filter_by(url=old_url).one().ref_count == 0
+            assert UploadedImage.query.filter_by(url=new_url).one().ref_count == 1
+
+        client.post(f'/event/{event_id}/duplicate')
+        with app.app_context():
+            assert UploadedImage.query.filter_by(url=new_url).one().ref_count == 2
+    finally:
+        with app.app_context():
+            Event.query.filter(Event.name.like('Content Cover Test%')).delete(synchronize_session=False)
+            db.session.commit()
+        _cleanup(urls, [])
+    print("✅ Cover references")
+
+
+def test_legacy_uploads_are_migrated():
+    """The migration copies old uploads under their hash and merges duplicates."""
+    print("🧪 Testing legacy upload migration...")
+    sha256 = hashlib.sha256(CONTENT).hexdigest()
+    legacy = ['/static/uploads/carousel/content-legacy-a.png', '/static/uploads/carousel/content-legacy-b.png']
+    urls = legacy + [f'/static/uploads/content/{sha256[:2]}/{sha256}.png']
+    titles = ['Content Legacy A', 'Content Legacy B']
+    try:
+        with app.app_context():
+            for url, title in zip(legacy, titles):
+                os.makedirs(os.path.dirname(static_file_path(url)), exist_ok=True)
+                with open(static_file_path(url), 'wb') as f:
+                    f.write(CONTENT)
+                db.session.add(CarouselImage(image_url=url, title=title))
+            db.session.add(UploadedImage(url=legacy[0]))
+            db.session.commit()
+
+        migrate_content_addressed_uploads()
+
+        with app.app_context():
+            slides = CarouselImage.query.filter(CarouselImage.title.in_(titles)).all()
+            assert {slide.image_url for slide in slides} == {urls[2]}
+            image = UploadedImage.query.filter_by(sha256=sha256).one()
+            assert image.url == urls[2] and image.ref_count == 2
+            assert UploadedImage.query.filter(UploadedImage.url.in_(legacy)).count() == 0
+            with open(static_file_path(urls[2]), 'rb') as f:
+                assert f.read() == CONTENT
+    finally:
+        _cleanup(urls, titles)
+    print("✅ Legacy upload migration")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🗂️  Content-Addressed Upload Test Suite")
+    print("=" * 60)
+    test_identical_uploads_are_stored_once()
+    test_event_covers_are_counted()
+    test_legacy_uploads_are_migrated()
+    print("\n🎉 All content-addressed upload tests passed!")
+    print("=" * 60)
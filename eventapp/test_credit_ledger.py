@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Test script for the append-only credit ledger and atomic credit debits.
+"""
+
+import os
+import sys
+import threading
+from datetime import datetime, timedelta
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import (app, db, User, Event, RSVP, EventDailyStat, MemberEngagement, Notification, CreditTransaction,
+                 bulk_top_up_credits, record_credit_transaction, set_credit_balance, to_minor_units,
+                 verify_credit_ledger)
+from testutils import client_for
+
+
+def _make_user(email):
+    user = User.query.filter_by(email=email).first()
+    if user:
+        RSVP.query.filter_by(user_id=user.id).delete()
+        CreditTransaction.query.filter_by(user_id=user.id).delete()
+        MemberEngagement.query.filter_by(user_id=user.id).delete()
+        db.session.delete(user)
+        db.session.commit()
+    user = User(username=email.split('@')[0], email=email, email_verified=True)
+    user.set_password('password123')
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def test_minor_units():
+    """Amounts are stored as exact integer cents."""
+    print("🧪 Testing minor unit conversion...")
+    assert to_minor_units(12.5) == 1250
+    assert to_minor_units('0.1') + to_minor_units('0.2') == 30
+    assert to_minor_units('19.995') == 2000
+    for bad in ('abc', '', 'nan', None):
+        try:
+            to_minor_units(bad)
+            raise AssertionError(f"{bad!r} should be rejected")
+        except ValueError:
+            pass
+    print("✅ Conversions exact")
+
+
+def test_conditional_debit_and_replay():
+    """Debits never overdraw, and the ledger replays to the cached balance."""
+    print("🧪 Testing conditional debits...")
+    with app.app_context():
+        user = _make_user('ledger-user@example.com')
+
+        assert record_credit_transaction(user.id, 5000, 'topup') is not None
+        assert record_credit_transaction(user.id, -3000, 'debit') is not None
+        assert record_credit_transaction(user.id, -3000, 'debit') is None
+        db.session.commit()
+        assert user.credit_balance == 2000
+        assert user.credit_point == 20.0
+
+        entries = user.credit_transactions.order_by(CreditTransaction.id).all()
+        assert [e.amount for e in entries] == [5000, -3000]
+        assert [e.balance_after for e in entries] == [5000, 2000]
+
+        # Admin edits become adjustments
+        assert set_credit_balance(user, 7500, 2000, note='test').amount == 5500
+        db.session.commit()
+        assert db.session.get(User, user.id).credit_balance == 7500
+
+        assert user.id not in [row[0] for row in verify_credit_ledger()]
+    print("✅ Debits are conditional and the ledger replays")
+
+
+def test_admin_edit_keeps_concurrent_debits():
+    """Saving the member form doesn't undo debits made while it was open."""
+    print("🧪 Testing admin edits against a moving balance...")
+    with app.app_context():
+        admin = _make_user('ledger-admin@example.com')
+        admin.is_admin = True
+        member = _make_user('ledger-member@example.com')
+        record_credit_transaction(member.id, 5000, 'topup')
+        db.session.commit()
+        admin_id, member_id = admin.id, member.id
+
+    client = client_for(admin_id)
+
+    def save(credit_point, credit_point_loaded, first_name='Edited'):
+        return client.post(f'/admin/members/{member_id}/update', data={
+            'superuser_password': app.config['SUPERUSER_PASSWORD'],
+            'username': 'ledger-member', 'email': 'ledger-member@example.com', 'first_name': first_name,
+            'credit_point': credit_point, 'credit_point_loaded': credit_point_loaded,
+        })
+
+    # The form was loaded showing 50.00, then the member paid for an RSVP
+    with app.app_context():
+        record_credit_transaction(member_id, -2000, 'debit')
+        db.session.commit()
+
+    def balance_and_adjustments():
+        with app.app_context():
+            adjustments = CreditTransaction.query.filter_by(user_id=member_id, kind='adjustment').count()
+            return db.session.get(User, member_id).credit_balance, adjustments
+
+    # Editing the name alone leaves the balance and the ledger alone
+    assert save('50.00', '50.00').status_code == 302
+    assert balance_and_adjustments() == (3000, 0)
+    with app.app_context():
+        assert db.session.get(User, member_id).first_name == 'Edited'
+
+    # Changing the stale balance is refused rather than undoing the debit
+    assert save('80.00', '50.00', first_name='Refused').status_code == 302
+    assert balance_and_adjustments() == (3000, 0)
+    with app.app_context():
+        assert db.session.get(User, member_id).first_name == 'Edited'
+
+    # From a freshly loaded form the adjustment applies
+    save('80.00', '30.00')
+    assert balance_and_adjustments() == (8000, 1)
+    with app.app_context():
+        assert member_id not in [row[0] for row in verify_credit_ledger()]
+    print("✅ Admin edits keep concurrent debits")
+
+
+def test_concurrent_debits_cannot_double_spend():
+    """Two simultaneous debits against one balance: exactly one succeeds."""
+    print("🧪 Testing concurrent debits...")
+    with app.app_context():
+        user = _make_user('ledger-race@example.com')
+        record_credit_transaction(user.id, 10000, 'topup')
+        db.session.commit()
+        user_id = user.id
+
+    results = []
+    barrier = threading.Barrier(2)
+
+    def spend():
+        with app.app_context():
+            barrier.wait()
+            entry = record_credit_transaction(user_id, -6000, 'debit')
+            db.session.commit()
+            results.append(entry is not None)
+
+    threads = [threading.Thread(target=spend) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == [False, True]
+    with app.app_context():
+        assert db.session.get(User, user_id).credit_balance == 4000
+    print("✅ No double spend")
+
+
+def test_bulk_top_up():
+    """A bulk top-up credits every member once under a shared batch id."""
+    print("🧪 Testing bulk top-up...")
+    with app.app_context():
+        users = [_make_user(f'ledger-bulk{i}@example.com') for i in range(3)]
+        record_credit_transaction(users[0].id, 100, 'topup')
+        batch_id = bulk_top_up_credits([u.id for u in users], 2500, note='Renewal')
+        db.session.commit()
+
+        balances = [db.session.get(User, u.id).credit_balance for u in users]
+        assert balances == [2600, 2500, 2500]
+        assert CreditTransaction.query.filter_by(batch_id=batch_id).count() == 3
+        assert not verify_credit_ledger()
+    print("✅ Bulk top-up recorded")
+
+
+def test_rsvp_payment_uses_ledger():
+    """Paying for an RSVP debits once; declining refunds."""
+    print("🧪 Testing RSVP credit payment...")
+    with app.app_context():
+        user = _make_user('ledger-rsvp@example.com')
+        record_credit_transaction(user.id, 3000, 'topup')
+        event = Event(name='Ledger Test Course', start_date=datetime.utcnow() + timedelta(days=7),
+                      location='Singapore', capacity=10, price=12.5, creator_id=user.id)
+        db.session.add(event)
+        db.session.commit()
+        user_id, event_id = user.id, event.id
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(user_id)
+        sess['_fresh'] = True
+
+    try:
+        accept = {'status': 'Accepted', 'payment_method': 'credit'}
+        assert client.post(f'/event/{event_id}', data=accept).status_code == 302
+        assert client.post(f'/event/{event_id}', data=accept).status_code == 302
+        with app.app_context():
+            assert db.session.get(User, user_id).credit_balance == 1750
+            assert RSVP.query.filter_by(event_id=event_id, user_id=user_id).one().payment_status == 'paid'
+
+        client.post(f'/event/{event_id}', data={'status': 'Declined'})
+        with app.app_context():
+            assert db.session.get(User, user_id).credit_balance == 3000
+            kinds = [e.kind for e in CreditTransaction.query.filter_by(user_id=user_id)
+                     .order_by(CreditTransaction.id)]
+            assert kinds == ['topup', 'debit', 'refund']
+    finally:
+        with app.app_context():
+            RSVP.query.filter_by(event_id=event_id).delete()
+            EventDailyStat.query.filter_by(event_id=event_id).delete()
+            Notification.query.filter_by(event_id=event_id).delete()
+            Event.query.filter_by(id=event_id).delete()
+            db.session.commit()
+    print("✅ RSVP payments go through the ledger")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🏦 Credit Ledger Test Suite")
+    print("=" * 60)
+    test_minor_units()
+    test_conditional_debit_and_replay()
+    test_admin_edit_keeps_concurrent_debits()
+    test_concurrent_debits_cannot_double_spend()
+    test_bulk_top_up()
+    test_rsvp_payment_uses_ledger()
+    print("\n🎉 All credit ledger tests passed!")
+    print("=" * 60)
@@ -6,12 +6,12 @@ This script tests the credit point system implementation.
 
 import os
 import sys
-from sqlalchemy import create_engine, text
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app import app, db, User
+from db_compat import column_exists as db_column_exists
+from app import app, db, User, set_credit_balance, to_minor_units, verify_credit_ledger
 
 def test_credit_system():
     """Test the credit system functionality."""
@@ -19,20 +19,15 @@ def test_credit_system():
     
     try:
         with app.app_context():
-            # Test 1: Check if credit_point column exists
+            # Test 1: Check if credit_balance column exists
             print("\n1️⃣ Testing database schema...")
             with db.engine.connect() as conn:
-                result = conn.execute(text("""
-                    SELECT COUNT(*) as count 
-                    FROM pragma_table_info('user') 
-                    WHERE name = 'credit_point'
-                """))
-                column_exists = result.fetchone()[0] > 0
+                column_exists = db_column_exists(conn, 'user', 'credit_balance')
                 
                 if column_exists:
-                    print("✅ credit_point column exists in database")
+                    print("✅ credit_balance column exists in database")
                 else:
-                    print("❌ credit_point column missing from database")
+                    print("❌ credit_balance column missing from database")
                     return False
             
             # Test 2: Check user credit points
@@ -52,7 +47,7 @@ def test_credit_system():
                 print(f"   📝 Original credits for {test_user.username}: {original_credits}")
                 
                 # Update credits
-                test_user.credit_point = 100.50
+                set_credit_balance(test_user, to_minor_units(100.50), test_user.credit_balance or 0, note='Credit system test')
                 db.session.commit()
                 
                 # Verify update
@@ -60,7 +55,7 @@ def test_credit_system():
                 print(f"   ✅ Updated credits for {updated_user.username}: {updated_user.credit_point}")
                 
                 # Restore original credits
-                test_user.credit_point = original_credits
+                set_credit_balance(test_user, to_minor_units(original_credits), test_user.credit_balance or 0, note='Credit system test')
                 db.session.commit()
                 print(f"   🔄 Restored original credits: {original_credits}")
             
@@ -70,20 +65,23 @@ def test_credit_system():
                 test_user = users[0]
                 
                 # Test negative credits (should be set to 0)
-                test_user.credit_point = -10.0
+                set_credit_balance(test_user, to_minor_units(-10.0), test_user.credit_balance or 0, note='Credit system test')
                 db.session.commit()
                 updated_user = User.query.get(test_user.id)
                 print(f"   ✅ Negative credits handled: {updated_user.credit_point} (should be 0.0)")
                 
                 # Test decimal credits
-                test_user.credit_point = 123.45
+                set_credit_balance(test_user, to_minor_units(123.45), test_user.credit_balance or 0, note='Credit system test')
                 db.session.commit()
                 updated_user = User.query.get(test_user.id)
                 print(f"   ✅ Decimal credits handled: {updated_user.credit_point}")
                 
                 # Restore original
-                test_user.credit_point = original_credits
+                set_credit_balance(test_user, to_minor_units(original_credits), test_user.credit_balance or 0, note='Credit system test')
                 db.session.commit()
+                
+                # Every change above went through the ledger
+                print(f"   ✅ Ledger mismatches: {verify_credit_ledger()}")
             
             print("\n🎉 All credit system tests passed!")
             return True
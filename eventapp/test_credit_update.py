@@ -5,12 +5,11 @@ Test script to verify credit point updates are working correctly.
 
 import os
 import sys
-from sqlalchemy import create_engine, text
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app import app, db, User
+from app import app, db, User, set_credit_balance, to_minor_units
 
 def test_credit_update():
     """Test credit point updates."""
@@ -31,7 +30,7 @@ def test_credit_update():
             original_credits = user.credit_point
             test_credits = 150.75
             
-            user.credit_point = test_credits
+            set_credit_balance(user, to_minor_units(test_credits), user.credit_balance or 0, note='Credit update test')
             db.session.commit()
             
             # Verify update
@@ -45,7 +44,7 @@ def test_credit_update():
                 return False
             
             # Restore original credits
-            user.credit_point = original_credits
+            set_credit_balance(user, to_minor_units(original_credits), user.credit_balance or 0, note='Credit update test')
             db.session.commit()
             print(f"🔄 Restored original credits: {original_credits}")
             
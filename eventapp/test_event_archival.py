@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Test script for archiving finished events out of the hot tables and restoring them.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import (app, db, User, Event, RSVP, EventDailyStat, Notification, Feedback,
+                 ArchivedEvent, ArchivedRSVP, ArchivedNotification, ArchivedFeedback,
+                 archive_completed_events, unarchive_event, create_notification, organiser_analytics,
+                 rebuild_event_rollups)
+from testutils import client_for
+
+# Events dated well before anything else in the dev database, archived with a
+# matching "now" so the job never touches real data.
+OLD_DATE = datetime(2000, 3, 1, 10, 0)
+NOW = datetime(2002, 1, 1)
+
+
+def _setup():
+    """Create an organiser, an attendee and one old event with related rows."""
+    organiser = User.query.filter_by(email='archive-admin@example.com').first()
+    if not organiser:
+        organiser = User(username='archive-admin', email='archive-admin@example.com',
+                         is_admin=True, email_verified=True)
+        organiser.set_password('password123')
+        db.session.add(organiser)
+    attendee = User.query.filter_by(email='archive-user@example.com').first()
+    if not attendee:
+        attendee = User(username='archive-user', email='archive-user@example.com',
+                        email_verified=True)
+        attendee.set_password('password123')
+        db.session.add(attendee)
+    db.session.commit()
+
+    old_event = Event(name='Archive Test Course', start_date=OLD_DATE, end_date=OLD_DATE.replace(hour=12),
+                      location='Singapore', creator_id=organiser.id)
+    recent_event = Event(name='Archive Test Recent', start_date=datetime(2001, 12, 1),
+                         location='Singapore', creator_id=organiser.id)
+    db.session.add_all([old_event, recent_event])
+    db.session.commit()
+
+    db.session.add(RSVP(event_id=old_event.id, user_id=attendee.id, status='Accepted',
+                        qr_code=f'archive-qr-{old_event.id}', checked_in=True))
+    db.session.add(Feedback(event_id=old_event.id, user_id=attendee.id, overall_rating=5,
+                            content_quality=4, organization=4, venue_rating=5,
+                            value_for_money=4, likelihood_to_recommend=5))
+    db.session.commit()
+    create_notification(attendee.id, 'rsvp_confirmation', 'RSVP Confirmed', 'See you there',
+                        event_id=old_event.id)
+    return organiser.id, attendee.id, old_event.id, recent_event.id
+
+
+def _cleanup(event_ids):
+    for model in (RSVP, EventDailyStat, Notification, Feedback):
+        model.query.filter(model.event_id.in_(event_ids)).delete(synchronize_session=False)
+    for model in (ArchivedRSVP, ArchivedNotification, ArchivedFeedback):
+        model.query.filter(model.event_id.in_(event_ids)).delete(synchronize_session=False)
+    Event.query.filter(Event.id.in_(event_ids)).delete(synchronize_session=False)
+    ArchivedEvent.query.filter(ArchivedEvent.id.in_(event_ids)).delete(synchronize_session=False)
+    db.session.commit()
+
+
+def test_archive_and_unarchive():
+    """Old events move to the archive with their children and can be restored."""
+    print("🧪 Testing event archival...")
+    with app.app_context():
+        organiser_id, attendee_id, old_id, recent_id = _setup()
+        try:
+            rebuild_event_rollups(old_id)
+            db.session.commit()
+            totals = organiser_analytics(organiser_id)['totals']
+            assert totals[('rsvp', 'Accepted')]['count'] >= 1
+            moved = archive_completed_events(months=12, batch_size=1, now=NOW)
+            print(f"   📊 Moved: {moved}")
+            assert moved['event'] == 1
+            assert moved['rsvp'] == 1
+            assert moved['feedback'] == 1
+            assert moved['notification'] >= 1
+
+            assert db.session.get(Event, old_id) is None
+            assert db.session.get(Event, recent_id) is not None
+            assert RSVP.query.filter_by(event_id=old_id).count() == 0
+            assert Notification.query.filter_by(event_id=old_id).count() == 0
+            # Organiser analytics still count the archived event
+            assert EventDailyStat.query.filter_by(event_id=old_id).count() > 0
+            assert organiser_analytics(organiser_id)['totals'] == totals
+
+            archived = db.session.get(ArchivedEvent, old_id)
+            assert archived.name == 'Archive Test Course'
+            assert archived.archived_at == NOW
+            assert archived.accepted_count == 1
+            assert archived.rsvps[0].attendee.email == 'archive-user@example.com'
+
+            assert unarchive_event(old_id) is True
+            assert unarchive_event(old_id) is False
+            event = db.session.get(Event, old_id)
+            assert event.name == 'Archive Test Course'
+            assert RSVP.query.filter_by(event_id=old_id).one().qr_code == f'archive-qr-{old_id}'
+            assert Feedback.query.filter_by(event_id=old_id).count() == 1
+            assert Notification.query.filter_by(event_id=old_id).count() == 1
+            assert ArchivedRSVP.query.filter_by(event_id=old_id).count() == 0
+            assert organiser_analytics(organiser_id)['totals'] == totals
+        finally:
+            _cleanup([old_id, recent_id])
+    print("✅ Archive and restore verified")
+
+
+def test_archived_event_pages():
+    """Past events, details and exports read transparently from the archive."""
+    print("🧪 Testing archived event pages...")
+    with app.app_context():
+        organiser_id, attendee_id, old_id, recent_id = _setup()
+        archive_completed_events(months=12, now=NOW)
+
+    try:
+        attendee = client_for(attendee_id)
+        response = attendee.get('/past-events')
+        assert response.status_code == 200
+        assert b'Archive Test Course' in response.data
+
+        response = attendee.get(f'/event/{old_id}')
+        assert response.status_code == 200
+        assert b'archived' in response.data
+        assert b'id="rsvpForm"' not in response.data
+
+        response = attendee.post(f'/event/{old_id}', data={'status': 'Declined'})
+        assert response.status_code == 302
+
+        organiser = client_for(organiser_id)
+        assert organiser.get(f'/event/{old_id}/attendees').status_code == 200
+        response = organiser.get(f'/event/{old_id}/export')
+        assert response.status_code == 200
+        assert b'archive-user@example.com' in response.data
+
+        response = organiser.post(f'/admin/event/{old_id}/unarchive')
+        assert response.status_code == 302
+        with app.app_context():
+            assert db.session.get(Event, old_id) is not None
+    finally:
+        with app.app_context():
+            _cleanup([old_id, recent_id])
+    print("✅ Archived events readable through the app")
+
+
+def test_archived_events_stay_in_analytics():
+    """The analytics page and member deletion account for archived events."""
+    print("🧪 Testing analytics of archived events...")
+    with app.app_context():
+        organiser_id, attendee_id, old_id, recent_id = _setup()
+        rebuild_event_rollups(old_id)
+        db.session.commit()
+        total_events = Event.query.filter_by(creator_id=organiser_id).count()
+        archive_completed_events(months=12, now=NOW)
+    try:
+        organiser = client_for(organiser_id)
+        assert f'<h5 class="card-title">{total_events}</h5>' in organiser.get('/analytics').get_data(as_text=True)
+
+        response = organiser.post(f'/admin/members/{attendee_id}/delete',
+                                  data={'superuser_password': app.config['SUPERUSER_PASSWORD']})
+        assert response.status_code == 302
+        with app.app_context():
+            assert db.session.get(User, attendee_id) is None
+            assert EventDailyStat.query.filter_by(event_id=old_id).count() == 0
+    finally:
+        with app.app_context():
+            _cleanup([old_id, recent_id])
+    print("✅ Archived events counted in analytics")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("📦 Event Archival Test Suite")
+    print("=" * 60)
+    test_archive_and_unarchive()
+    test_archived_event_pages()
+    test_archived_events_stay_in_analytics()
+    print("\n🎉 All event archival tests passed!")
+    print("=" * 60)
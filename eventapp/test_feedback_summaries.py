@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for the cached per-event feedback rating summaries.
+"""
+
+import os
+import re
+import sys
+from datetime import datetime, timedelta
+
+from sqlalchemy import event as sa_event
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, Event, Feedback, EventFeedbackForm, feedback_summaries
+from testutils import client_for, make_user
+
+
+def _feedback(event_id, user_id, score, recommend):
+    return Feedback(event_id=event_id, user_id=user_id, overall_rating=score, content_quality=score,
+                    organization=score, venue_rating=score, value_for_money=score,
+                    likelihood_to_recommend=recommend)
+
+
+def test_feedback_summaries():
+    """Summaries come from one grouped query and are recomputed only when feedback changes."""
+    print("🧪 Testing feedback summaries...")
+    with app.app_context():
+        admin = make_user('feedback-summary-admin@example.com', is_admin=True)
+        events = [Event(name=f'Feedback Summary Course {i}', start_date=datetime.utcnow() - timedelta(days=3),
+                        location='Singapore', capacity=10, creator_id=admin.id, feedback_enabled=True)
+                  for i in range(3)]
+        db.session.add_all(events)
+        db.session.commit()
+        event_id = events[0].id
+        event_ids = [event.id for event in events]
+        db.session.add_all([_feedback(event_id, admin.id, score, recommend)
+                            for score, recommend in [(5, 5), (4, 5), (3, 4), (2, 2)]])
+        for other in event_ids:
+            db.session.add(EventFeedbackForm(event_id=other, form_name='Survey', ms_form_id='abc',
+                                             ms_form_url='https://forms.office.com/r/abc', created_by=admin.id))
+        db.session.commit()
+        admin_id = admin.id
+
+    try:
+        with app.app_context():
+            summary = feedback_summaries()[event_id]
+            assert summary['responses'] == 4
+            assert summary['ratings']['overall_rating']['mean'] == 3.5
+            assert summary['ratings']['overall_rating']['distribution'] == {1: 0, 2: 1, 3: 1, 4: 1, 5: 1}
+            # Two promoters, one passive, one detractor
+            assert summary['nps'] == 25
+            assert event_ids[1] not in feedback_summaries()
+
+            # Unchanged feedback is served from the cache
+            assert feedback_summaries() is feedback_summaries()
+            cached = feedback_summaries()
+            db.session.add(_feedback(event_id, admin_id, 1, 1))
+            db.session.commit()
+            updated = feedback_summaries()
+            assert updated is not cached
+            assert updated[event_id]['responses'] == 5
+            assert updated[event_id]['nps'] == 0
+
+            engines = [engine for engine in db.engines.values()]
+
+        statements = []
+
+        def log(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        for engine in engines:
+            sa_event.listen(engine, 'before_cursor_execute', log)
+        try:
+            response = client_for(admin_id).get('/admin/feedback-analytics')
+        finally:
+            for engine in engines:
+                sa_event.remove(engine, 'before_cursor_execute', log)
+        assert response.status_code == 200
+        page = response.get_data(as_text=True)
+        assert 'Net Promoter Score' in page
+        form_queries = [s for s in statements if re.search(r'\bfrom\s+event_feedback_form\b', s, re.IGNORECASE)]
+        assert len(form_queries) == 1
+    finally:
+        with app.app_context():
+            Feedback.query.filter(Feedback.event_id.in_(event_ids)).delete()
+            EventFeedbackForm.query.filter(EventFeedbackForm.event_id.in_(event_ids)).delete()
+            Event.query.filter(Event.id.in_(event_ids)).delete()
+            db.session.commit()
+    print("✅ Feedback summaries grouped and cached")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("💬 Feedback Summary Test Suite")
+    print("=" * 60)
+    test_feedback_summaries()
+    print("\n🎉 All feedback summary tests passed!")
+    print("=" * 60)
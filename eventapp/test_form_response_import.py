@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Test script for importing Microsoft Forms response exports.
+"""
+
+import csv
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, Event, EventFeedbackForm, Feedback, import_feedback_responses
+from testutils import make_user
+from forms_import import resolve_columns
+
+HEADERS = ['ID', 'Start time', 'Completion time', 'Email', 'Name',
+           'Overall, how would you rate the course?', 'Quality of the content',
+           'How well was it organised?', 'Venue and facilities', 'Value for money',
+           'How likely are you to recommend us?', 'Any other comments or suggestions?']
+
+
+def _row(response_id, email, rating, comment=''):
+    return [response_id, '10/1/26 9:00:00', '10/1/26 9:05:00', email, 'Someone'] + [rating] * 6 + [comment]
+
+
+def _write_csv(directory, name, rows, headers=HEADERS):
+    path = os.path.join(directory, name)
+    with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(rows)
+    return path
+
+
+def _setup():
+    with app.app_context():
+        admin = make_user('import-admin@example.com', is_admin=True)
+        members = [make_user(f'import-member{i}@example.com') for i in range(3)]
+        event = Event(name='Import Test Course', start_date=datetime.utcnow() - timedelta(days=2),
+                      location='Singapore', capacity=10, creator_id=admin.id)
+        db.session.add(event)
+        db.session.commit()
+        form = EventFeedbackForm(event_id=event.id, form_name='Course Feedback', ms_form_id='abc123',
+                                 ms_form_url='https://forms.office.com/r/abc123', created_by=admin.id)
+        db.session.add(form)
+        db.session.commit()
+        return form.id, event.id, [member.id for member in members]
+
+
+def _cleanup(event_id):
+    with app.app_context():
+        Feedback.query.filter_by(event_id=event_id).delete()
+        EventFeedbackForm.query.filter_by(event_id=event_id).delete()
+        Event.query.filter_by(id=event_id).delete()
+        db.session.commit()
+
+
+def test_resolve_columns():
+    """Standard columns match exactly, questions by keyword, and mappings win."""
+    print("🧪 Testing column matching...")
+    columns = resolve_columns(HEADERS)
+    assert columns['response_id'] == 0 and columns['email'] == 3 and columns['completed_at'] == 2
+    assert columns['overall_rating'] == 5 and columns['likelihood_to_recommend'] == 10
+    assert columns['additional_comments'] == 11
+
+    headers = HEADERS[:5] + ['Q1', 'Q2', 'Q3', 'Q4', 'Q5', 'Q6']
+    mapping = {field: f'Q{i}' for i, field in enumerate(
+        ['overall_rating', 'content_quality', 'organization', 'venue_rating',
+         'value_for_money', 'likelihood_to_recommend'], start=1)}
+    columns = resolve_columns(headers, mapping)
+    assert columns['venue_rating'] == 8 and 'additional_comments' not in columns
+    for bad in [None, {'overall_rating': 'Missing'}, {'nonsense': 'Q1'}]:
+        try:
+            resolve_columns(headers, bad)
+            raise AssertionError(f"{bad!r} should be rejected")
+        except ValueError:
+            pass
+    print("✅ Column matching")
+
+
+def test_import_and_reimport():
+    """Responses are upserted by response id; unknown emails and bad ratings are skipped."""
+    print("🧪 Testing response import...")
+    form_id, event_id, member_ids = _setup()
+    directory = tempfile.mkdtemp()
+    try:
+        first = _write_csv(directory, 'responses.csv', [
+            _row(1, 'Import-Member0@example.com', 5, 'Great course'),
+            _row(2, 'import-member1@example.com', 3),
+            _row(3, 'stranger@example.com', 4),
+            _row(4, 'import-member2@example.com', 9),
+            [''] * len(HEADERS),
+        ])
+        with app.app_context():
+            form = db.session.get(EventFeedbackForm, form_id)
+            stats = import_feedback_responses(form, first, batch_size=2)
+            assert stats['rows'] == 4 and stats['inserted'] == 2 and stats['updated'] == 0
+            assert stats['unmatched'] == 1 and stats['invalid'] == 1
+            assert stats['errors'] == ['Row 5: rating 9 is outside 1-5']
+
+            rows = Feedback.query.filter_by(event_id=event_id).order_by(Feedback.ms_response_id).all()
+            assert [(f.user_id, f.ms_response_id, f.overall_rating) for f in rows] == \
+                [(member_ids[0], '1', 5), (member_ids[1], '2', 3)]
+            assert rows[0].additional_comments == 'Great course' and rows[1].additional_comments is None
+            assert rows[0].feedback_form_id == form_id
+            assert rows[0].created_at == datetime(2026, 10, 1, 9, 5)
+
+        # A newer export repeats earlier responses with edits and adds one
+        second = _write_csv(directory, 'responses2.csv', [
+            _row(1, 'import-member0@example.com', 4, 'Good course'),
+            _row(2, 'import-member1@example.com', 3),
+            _row(5, 'import-member2@example.com', 2),
+        ])
+        with app.app_context():
+            form = db.session.get(EventFeedbackForm, form_id)
+            stats = import_feedback_responses(form, second, batch_size=2)
+            assert stats['inserted'] == 1 and stats['updated'] == 2
+            rows = Feedback.query.filter_by(event_id=event_id).order_by(Feedback.ms_response_id).all()
+            assert [(f.ms_response_id, f.overall_rating) for f in rows] == [('1', 4), ('2', 3), ('5', 2)]
+            assert rows[0].additional_comments == 'Good course'
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+        _cleanup(event_id)
+    print("✅ Import and re-import")
+
+
+def test_saved_mapping_and_bad_files():
+    """A form's saved mapping is used by default; unreadable files raise ValueError."""
+    print("🧪 Testing saved mappings...")
+    form_id, event_id, member_ids = _setup()
+    directory = tempfile.mkdtemp()
+    try:
+        headers = HEADERS[:5] + ['Q1', 'Q2', 'Q3', 'Q4', 'Q5', 'Q6', 'Notes']
+        path = _write_csv(directory, 'custom.csv', [_row(7, 'import-member0@example.com', 4, 'ok')], headers)
+        with app.app_context():
+            form = db.session.get(EventFeedbackForm, form_id)
+            form.response_mapping = ('{"overall_rating": "Q1", "content_quality": "Q2", "organization": "Q3", '
+                                     '"venue_rating": "Q4", "value_for_money": "Q5", '
+                                     '"likelihood_to_recommend": "Q6", "additional_comments": "Notes"}')
+            db.session.commit()
+            stats = import_feedback_responses(form, path)
+            assert stats['inserted'] == 1
+            assert Feedback.query.filter_by(event_id=event_id).one().additional_comments == 'ok'
+
+            for bad in [os.path.join(directory, 'responses.txt'), _write_csv(directory, 'empty.csv', [], [])]:
+                try:
+                    import_feedback_responses(form, bad, mapping={})
+                    raise AssertionError(f"{bad} should be rejected")
+                except ValueError:
+                    pass
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+        _cleanup(event_id)
+    print("✅ Saved mappings")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("📥 Form Response Import Test Suite")
+    print("=" * 60)
+    test_resolve_columns()
+    test_import_and_reimport()
+    test_saved_mapping_and_bad_files()
+    print("\n🎉 All form response import tests passed!")
+    print("=" * 60)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test script for the cached public home page.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import (app, db, User, Event, RSVP, _home_page_cache, _render_home_page,
+                 bump_home_page_generation, home_page_generation)
+from testutils import client_for, make_user
+
+
+def _add_event(name, creator_id, days=3):
+    event = Event(name=name, start_date=datetime.utcnow() + timedelta(days=days),
+                  location='Singapore', capacity=10, creator_id=creator_id)
+    db.session.add(event)
+    db.session.commit()
+    return event.id
+
+
+def _cleanup():
+    with app.app_context():
+        events = Event.query.filter(Event.name.like('Home Cache Test%')).all()
+        for event in events:
+            RSVP.query.filter_by(event_id=event.id).delete()
+            db.session.delete(event)
+        db.session.commit()
+
+
+def test_anonymous_page_is_cached_and_conditional():
+    """Repeat anonymous visits reuse the rendered page and answer 304."""
+    print("🧪 Testing cached home page...")
+    client = app.test_client()
+    first = client.get('/')
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    assert 'no-cache' in first.headers['Cache-Control']
+    entry = _home_page_cache['en']
+
+    second = client.get('/')
+    assert second.data == first.data and second.headers['ETag'] == etag
+    assert _home_page_cache['en'] is entry
+
+    assert client.get('/', headers={'If-None-Match': etag}).status_code == 304
+    if 'Last-Modified' in first.headers:
+        response = client.get('/', headers={'If-Modified-Since': first.headers['Last-Modified']})
+        assert response.status_code == 304
+    print("✅ Cached home page")
+
+
+def test_writes_invalidate_the_page():
+    """Event and RSVP writes bump the generation; unrelated writes and rollbacks don't."""
+    print("🧪 Testing home page invalidation...")
+    client = app.test_client()
+    try:
+        with app.app_context():
+            organiser = make_user('home-cache-organiser@example.com')
+            guest = make_user('home-cache-guest@example.com')
+            organiser_id, guest_id = organiser.id, guest.id
+
+            before = client.get('/')
+            generation = home_page_generation()[0]
+            event_id = _add_event('Home Cache Test Launch', organiser_id)
+            assert home_page_generation()[0] != generation
+            after = client.get('/')
+            assert b'Home Cache Test Launch' in after.data
+            assert after.headers['ETag'] != before.headers['ETag']
+            assert client.get('/', headers={'If-None-Match': before.headers['ETag']}).status_code == 200
+
+            generation = home_page_generation()[0]
+            db.session.add(RSVP(event_id=event_id, user_id=guest_id, status='Accepted'))
+            db.session.commit()
+            assert home_page_generation()[0] != generation
+
+            # Fields the page doesn't show leave it alone
+            generation = home_page_generation()[0]
+            user = db.session.get(User, guest_id)
+            user.locale = 'zh' if user.locale != 'zh' else 'en'
+            db.session.commit()
+            assert home_page_generation()[0] == generation
+
+            # A bump rolls back with the write that caused it
+            event = db.session.get(Event, event_id)
+            event.name = 'Home Cache Test Renamed'
+            db.session.flush()
+            db.session.rollback()
+            assert home_page_generation()[0] == generation
+
+            bump_home_page_generation()
+            db.session.commit()
+            assert home_page_generation()[0] != generation
+    finally:
+        _cleanup()
+    print("✅ Home page invalidation")
+
+
+def test_entry_expires_when_next_event_starts():
+    """A cached page is only good until the next event becomes a past event."""
+    print("🧪 Testing home page expiry...")
+    try:
+        with app.app_context():
+            organiser = make_user('home-cache-organiser@example.com')
+            event_id = _add_event('Home Cache Test Soon', organiser.id, days=1)
+            start = db.session.get(Event, event_id).start_date
+            with app.test_request_context('/'):
+                generation, changed_at = home_page_generation()
+                entry = _render_home_page(generation, changed_at, start - timedelta(hours=1))
+                assert entry['expires'] is not None and entry['expires'] <= start
+                later = _render_home_page(generation, changed_at, start + timedelta(minutes=1))
+                assert later['last_modified'] >= start
+                assert later['etag'] != entry['etag']
+    finally:
+        _cleanup()
+    print("✅ Home page expiry")
+
+
+def test_signed_in_visitors_are_not_served_the_cache():
+    """Members see their own greeting, not the anonymous page."""
+    print("🧪 Testing signed-in home page...")
+    with app.app_context():
+        member = make_user('home-cache-member@example.com')
+        member_id, name = member.id, member.display_name
+    app.test_client().get('/')
+    response = client_for(member_id).get('/')
+    assert response.status_code == 200
+    assert f'Welcome back, {name}!'.encode() in response.data
+    assert 'ETag' not in response.headers
+    print("✅ Signed-in home page")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🏠 Home Page Cache Test Suite")
+    print("=" * 60)
+    test_anonymous_page_is_cached_and_conditional()
+    test_writes_invalidate_the_page()
+    test_entry_expires_when_next_event_starts()
+    test_signed_in_visitors_are_not_served_the_cache()
+    print("\n🎉 All home page cache tests passed!")
+    print("=" * 60)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test script for responsive renditions of uploaded images.
+"""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+from PIL import Image
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import (app, db, CarouselImage, UploadedImage, backfill_uploaded_images, load_ready_images,
+                 process_pending_images, static_file_path)
+from testutils import client_for, make_user
+from images import RENDITIONS, make_renditions
+
+
+def _photo(size=(2400, 1200), orientation=None, mode='RGB', fmt='JPEG'):
+    """An image with camera metadata, as phones upload them."""
+    image = Image.new(mode, size, (200, 40, 40, 128) if mode == 'RGBA' else (200, 40, 40))
+    exif = Image.Exif()
+    exif[0x010F] = 'PhoneMaker'  # Make
+    if orientation:
+        exif[0x0112] = orientation
+    buffer = io.BytesIO()
+    image.save(buffer, fmt, exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+def test_make_renditions():
+    """Renditions are upright, metadata-free, never upscaled, in WebP and JPEG."""
+    print("🧪 Testing rendition rendering...")
+    directory = tempfile.mkdtemp()
+    try:
+        source = os.path.join(directory, 'photo.jpg')
+        with open(source, 'wb') as f:
+            f.write(_photo(orientation=6))  # Rotated 90° on the phone
+        result = make_renditions(source, os.path.join(directory, 'out'))
+        assert (result['width'], result['height']) == (1200, 2400)
+        assert result['renditions'] == {'thumb': [320, 640], 'card': [800, 1600], 'hero': [1200, 2400]}
+        assert result['placeholder'].startswith('data:image/jpeg;base64,') and len(result['placeholder']) < 1000
+        for name in RENDITIONS:
+            for extension, pil_format in (('webp', 'WEBP'), ('jpg', 'JPEG')):
+                with Image.open(os.path.join(directory, 'out', f'{name}.{extension}')) as image:
+                    assert image.format == pil_format
+                    assert list(image.size) == result['renditions'][name]
+                    assert not image.getexif()
+
+        small = os.path.join(directory, 'small.png')
+        with open(small, 'wb') as f:
+            f.write(_photo(size=(300, 200), mode='RGBA', fmt='PNG'))
+        result = make_renditions(small, os.path.join(directory, 'small'))
+        assert result['renditions'] == {'thumb': [300, 200]}
+        with Image.open(os.path.join(directory, 'small', 'thumb.jpg')) as image:
+            assert image.mode == 'RGB'
+        with Image.open(os.path.join(directory, 'small', 'thumb.webp')) as image:
+            assert image.mode == 'RGBA'
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    print("✅ Rendition rendering")
+
+
+def test_upload_queue_and_markup():
+    """Uploads are queued, rendered by the job and then served as <picture> with srcsets."""
+    print("🧪 Testing upload renditions...")
+    with app.app_context():
+        admin_id = make_user('renditions-admin@example.com', is_admin=True).id
+    client = client_for(admin_id)
+    image_ids, files = [], []
+    try:
+        response = client.post('/admin/carousel/add', content_type='multipart/form-data', data={
+            'image_file': (io.BytesIO(_photo()), 'poster.jpg'), 'title': 'Rendition Test'})
+        assert response.status_code == 302
+        with app.app_context():
+            slide = CarouselImage.query.filter_by(title='Rendition Test').one()
+            slide_id, slide_url = slide.id, slide.image_url
+            files.append(static_file_path(slide_url))
+            image = UploadedImage.query.filter_by(url=slide_url).one()
+            image_ids.append(image.id)
+            assert image.status == 'pending'
+
+            # A broken upload fails on its own without stopping the queue
+            broken_url = '/static/uploads/events/rendition-test-broken.jpg'
+            files.append(static_file_path(broken_url))
+            with open(files[-1], 'wb') as f:
+                f.write(b'not an image')
+            broken = UploadedImage(url=broken_url)
+            db.session.add(broken)
+            db.session.commit()
+            image_ids.append(broken.id)
+
+        html = client.get('/').get_data(as_text=True)
+        assert f'<img src="{slide_url}"' in html
+
+        with app.app_context():
+            stats = process_pending_images()
+            assert stats['ready'] >= 1 and stats['failed'] >= 1
+            assert process_pending_images() == {'ready': 0, 'failed': 0}
+            image = db.session.get(UploadedImage, image_ids[0])
+            assert image.status == 'ready' and (image.width, image.height) == (2400, 1200)
+            assert os.path.isfile(static_file_path(image.rendition_url('hero', 'webp')))
+            broken = db.session.get(UploadedImage, image_ids[1])
+            assert broken.status == 'failed' and broken.error
+            hero_url = image.rendition_url('hero', 'jpg')
+
+            # Pages only look up the uploads they show
+            with app.test_request_context('/'):
+                images = load_ready_images([slide_url, broken_url, None])
+                assert images == {slide_url: images[slide_url], broken_url: None}
+                assert images[slide_url].id == image_ids[0]
+
+        html = client.get('/').get_data(as_text=True)
+        assert '<picture class="responsive-picture"><source type="image/webp"' in html
+        assert f'{hero_url} 1600w' in html and 'sizes="100vw"' in html
+        assert 'background: url(data:image/jpeg;base64,' in html
+        assert client.get(hero_url).status_code == 200
+
+        # Deleting the slide only drops the reference; collect_uploads.py removes the files
+        client.post(f'/admin/carousel/{slide_id}/delete')
+        with app.app_context():
+            assert db.session.get(UploadedImage, image_ids[0]).ref_count == 0
+            assert os.path.isfile(static_file_path(hero_url))
+    finally:
+        with app.app_context():
+            for image in UploadedImage.query.filter(UploadedImage.id.in_(image_ids)):
+                shutil.rmtree(os.path.dirname(static_file_path(image.rendition_url('thumb', 'jpg'))),
+                              ignore_errors=True)
+            UploadedImage.query.filter(UploadedImage.id.in_(image_ids)).delete(synchronize_session=False)
+            CarouselImage.query.filter_by(title='Rendition Test').delete()
+            db.session.commit()
+        for path in files:
+            if os.path.exists(path):
+                os.remove(path)
+    print("✅ Upload renditions")
+
+
+def test_backfill():
+    """Existing uploads without renditions are queued once."""
+    print("🧪 Testing backfill...")
+    with app.app_context():
+        slide = CarouselImage(image_url='/static/uploads/carousel/rendition-backfill.jpg', title='Backfill Test')
+        external = CarouselImage(image_url='https://example.com/elsewhere.jpg', title='Backfill Test')
+        db.session.add_all([slide, external])
+        db.session.commit()
+        try:
+            assert backfill_uploaded_images() >= 1
+            assert UploadedImage.query.filter_by(url=slide.image_url).one().status == 'pending'
+            assert UploadedImage.query.filter_by(url=external.image_url).first() is None
+            assert backfill_uploaded_images() == 0
+        finally:
+            UploadedImage.query.filter_by(url=slide.image_url).delete()
+            CarouselImage.query.filter_by(title='Backfill Test').delete()
+            db.session.commit()
+    print("✅ Backfill")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🖼️  Image Rendition Test Suite")
+    print("=" * 60)
+    test_make_renditions()
+    test_upload_queue_and_markup()
+    test_backfill()
+    print("\n🎉 All image rendition tests passed!")
+    print("=" * 60)
@@ -10,7 +10,9 @@ import sys
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app import app, db, User, Event, RSVP
+from db_compat import column_exists as db_column_exists
+from app import (app, db, User, Event, RSVP, from_minor_units, record_credit_transaction, set_credit_balance,
+                 to_minor_units)
 
 def test_integrated_rsvp():
     """Test the integrated RSVP/payment system."""
@@ -21,12 +23,7 @@ def test_integrated_rsvp():
             # Test 1: Check if payment_method column exists
             print("\n1️⃣ Testing database schema...")
             with db.engine.connect() as conn:
-                result = conn.execute(db.text("""
-                    SELECT COUNT(*) as count 
-                    FROM pragma_table_info('rsvp') 
-                    WHERE name = 'payment_method'
-                """))
-                column_exists = result.fetchone()[0] > 0
+                column_exists = db_column_exists(conn, 'rsvp', 'payment_method')
                 
                 if column_exists:
                     print("✅ payment_method column exists in RSVP table")
@@ -52,7 +49,7 @@ def test_integrated_rsvp():
             print(f"   👤 Testing with user: {test_user.username}")
             print(f"   🎫 Testing with event: {test_event.name}")
             print(f"   💰 Event price: {test_event.price}")
-            print(f"   💳 User credits: {test_user.credit_point}")
+            print(f"   💳 User credits: {from_minor_units(test_user.credit_balance or 0)}")
             
             # Test 4: Test RSVP creation with different payment methods
             print("\n4️⃣ Testing RSVP creation...")
@@ -78,14 +75,12 @@ def test_integrated_rsvp():
                 print("   💳 Testing credit payment for paid event...")
                 
                 # Set user credits to cover event price
-                original_credits = test_user.credit_point
-                test_user.credit_point = test_event.price + 50.0  # Extra credits
+                original_credits = test_user.credit_balance or 0
+                set_credit_balance(test_user, to_minor_units(test_event.price + 50.0), original_credits,  # Extra credits
+                                   note='Integrated RSVP test')
                 db.session.commit()
                 
-                print(f"   💰 Set user credits to: {test_user.credit_point}")
-                
-                # Simulate credit payment
-                test_user.credit_point -= test_event.price
+                print(f"   💰 Set user credits to: {from_minor_units(test_user.credit_balance)}")
                 
                 test_rsvp = RSVP(
                     event_id=test_event.id,
@@ -97,12 +92,17 @@ def test_integrated_rsvp():
                     payment_method='credit'
                 )
                 db.session.add(test_rsvp)
+                db.session.flush()
+                
+                # Simulate credit payment
+                record_credit_transaction(test_user.id, -to_minor_units(test_event.price), 'debit',
+                                          note=f'RSVP: {test_event.name}', rsvp_id=test_rsvp.id)
                 db.session.commit()
                 
-                print(f"   ✅ Credit payment processed. Remaining credits: {test_user.credit_point}")
+                print(f"   ✅ Credit payment processed. Remaining credits: {from_minor_units(test_user.credit_balance)}")
                 
                 # Restore original credits
-                test_user.credit_point = original_credits
+                set_credit_balance(test_user, original_credits, test_user.credit_balance, note='Integrated RSVP test')
                 db.session.commit()
             
             # Test 6: Verify RSVP data
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test script for incrementally maintained member engagement.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import (app, db, User, Event, RSVP, CheckInBucket, EventDailyStat, MemberEngagement, Notification,
+                 CreditTransaction, grade_suggestions, rebuild_member_engagement, record_credit_transaction,
+                 settle_engagement)
+from testutils import client_for, make_user
+
+
+def _totals(user_id):
+    e = db.session.get(MemberEngagement, user_id)
+    db.session.refresh(e)
+    return (e.accepted, e.attended, e.no_shows, e.credits_spent)
+
+
+def test_engagement_follows_rsvps_and_check_ins():
+    """RSVPs, check-ins and settlement keep the totals equal to a rebuild."""
+    print("🧪 Testing member engagement...")
+    with app.app_context():
+        organiser = make_user('engagement-organiser@example.com', is_admin=True)
+        member = User(username='engagement-member', email='engagement-member@example.com',
+                      email_verified=True, membership_grade='Gold')
+        member.set_password('password123')
+        db.session.add(member)
+        db.session.commit()
+        record_credit_transaction(member.id, 5000, 'topup')
+        now = datetime.utcnow()
+        events = [
+            Event(name='Engagement Upcoming', start_date=now + timedelta(days=5), price=10.0,
+                  location='Singapore', capacity=10, creator_id=organiser.id),
+            Event(name='Engagement Attended', start_date=now - timedelta(days=2),
+                  location='Singapore', capacity=10, creator_id=organiser.id),
+            Event(name='Engagement Missed', start_date=now - timedelta(days=3),
+                  end_date=now - timedelta(days=3) + timedelta(hours=2),
+                  location='Singapore', capacity=10, creator_id=organiser.id),
+        ]
+        db.session.add_all(events)
+        db.session.commit()
+        organiser_id, member_id = organiser.id, member.id
+        event_ids = [event.id for event in events]
+
+    client = client_for(member_id)
+    try:
+        client.post(f'/event/{event_ids[0]}', data={'status': 'Accepted', 'payment_method': 'credit'})
+        client.post(f'/event/{event_ids[1]}', data={'status': 'Accepted'})
+        client.post(f'/event/{event_ids[2]}', data={'status': 'Maybe'})
+        client.post(f'/event/{event_ids[2]}', data={'status': 'Accepted'})
+        with app.app_context():
+            code = RSVP.query.filter_by(event_id=event_ids[1], user_id=member_id).one().qr_code
+        client_for(organiser_id).post('/verify', data={'code': code, 'event_id': event_ids[1]})
+
+        with app.app_context():
+            # Both past events are settled now; only the missed one is a no-show
+            settle_engagement()
+            assert _totals(member_id) == (3, 1, 1, 1000)
+            engagement = db.session.get(MemberEngagement, member_id)
+            assert engagement.check_in_rate == 0.5
+            assert engagement.score == 10 - 5 + 1
+            assert engagement.last_activity_at is not None
+            assert (engagement.user, 'Classic') in grade_suggestions()
+
+            # A late check-in to a settled event turns the no-show into attendance
+            code = RSVP.query.filter_by(event_id=event_ids[2], user_id=member_id).one().qr_code
+        client_for(organiser_id).post('/verify', data={'code': code, 'event_id': event_ids[2]})
+        client.post(f'/event/{event_ids[0]}', data={'status': 'Declined'})
+
+        with app.app_context():
+            incremental = _totals(member_id)
+            assert incremental == (2, 2, 0, 0)
+            rebuild_member_engagement(member_id)
+            db.session.commit()
+            assert _totals(member_id) == incremental
+
+        response = client_for(organiser_id).get('/admin/members')
+        assert response.status_code == 200
+        assert '2 attended (100%)' in response.get_data(as_text=True)
+    finally:
+        with app.app_context():
+            for model in (CheckInBucket, EventDailyStat, RSVP, Notification):
+                model.query.filter(model.event_id.in_(event_ids)).delete()
+            Event.query.filter(Event.id.in_(event_ids)).delete()
+            MemberEngagement.query.filter_by(user_id=member_id).delete()
+            CreditTransaction.query.filter_by(user_id=member_id).delete()
+            User.query.filter_by(id=member_id).delete()
+            db.session.commit()
+    print("✅ Engagement follows RSVPs and check-ins")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("⭐ Member Engagement Test Suite")
+    print("=" * 60)
+    test_engagement_follows_rsvps_and_check_ins()
+    print("\n🎉 All member engagement tests passed!")
+    print("=" * 60)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the cached QR code image endpoint.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, Event, RSVP, EventDailyStat, Notification, get_qr_png, qr_etag
+from testutils import client_for, make_user
+
+
+def test_qr_image_endpoint():
+    """QR images are rendered at RSVP time and served with strong caching."""
+    print("🧪 Testing QR image endpoint...")
+    original_folder = app.config['QR_CACHE_FOLDER']
+    tmp = tempfile.mkdtemp()
+    app.config['QR_CACHE_FOLDER'] = tmp
+    get_qr_png.cache_clear()
+    with app.app_context():
+        attendee = make_user('qr-attendee@example.com')
+        other = make_user('qr-other@example.com')
+        event = Event(name='QR Test Course', start_date=datetime.utcnow() + timedelta(days=3),
+                      location='Singapore', capacity=10, creator_id=other.id)
+        db.session.add(event)
+        db.session.commit()
+        attendee_id, other_id, event_id = attendee.id, other.id, event.id
+
+    # Requests run outside the app context so each one gets its own login state
+    try:
+        client = client_for(attendee_id)
+        client.post(f'/event/{event_id}', data={'status': 'Accepted'})
+        with app.app_context():
+            code = RSVP.query.filter_by(event_id=event_id, user_id=attendee_id).one().qr_code
+        assert code
+        # Pre-generated at RSVP time
+        assert os.listdir(tmp) == [f"{qr_etag(code)}.png"]
+
+        page = client.get(f'/event/{event_id}')
+        assert b'data:image/png;base64' not in page.data
+        assert f'/qr/{code}.png'.encode() in page.data
+
+        response = client.get(f'/qr/{code}.png')
+        assert response.status_code == 200
+        assert response.mimetype == 'image/png'
+        assert response.data.startswith(b'\x89PNG')
+        assert response.get_etag() == (qr_etag(code), False)
+        assert 'immutable' in response.headers['Cache-Control']
+        assert 'private' in response.headers['Cache-Control']
+
+        response = client.get(f'/qr/{code}.png', headers={'If-None-Match': f'"{qr_etag(code)}"'})
+        assert response.status_code == 304
+        assert response.data == b''
+
+        # Other members can't fetch someone else's check-in code
+        assert client_for(other_id).get(f'/qr/{code}.png').status_code == 404
+        assert client.get('/qr/not-a-code.png').status_code == 404
+    finally:
+        with app.app_context():
+            RSVP.query.filter_by(event_id=event_id).delete()
+            EventDailyStat.query.filter_by(event_id=event_id).delete()
+            Notification.query.filter_by(event_id=event_id).delete()
+            Event.query.filter_by(id=event_id).delete()
+            db.session.commit()
+        app.config['QR_CACHE_FOLDER'] = original_folder
+        get_qr_png.cache_clear()
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("✅ QR images cached and served")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🔳 QR Image Cache Test Suite")
+    print("=" * 60)
+    test_qr_image_endpoint()
+    print("\n🎉 All QR image cache tests passed!")
+    print("=" * 60)
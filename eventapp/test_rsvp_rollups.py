@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test script for the daily RSVP rollups behind the analytics page.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import (app, db, User, Event, RSVP, CheckInBucket, EventDailyStat, MemberEngagement, Notification,
+                 CreditTransaction, organiser_analytics, rebuild_event_rollups, record_credit_transaction)
+from testutils import client_for, make_user
+
+
+def _rollups(event_id):
+    return sorted((s.day, s.metric, s.key, s.count, s.guests, s.amount)
+                  for s in EventDailyStat.query.filter_by(event_id=event_id)
+                  if s.count or s.guests or s.amount)
+
+
+def test_rollups_follow_rsvp_changes():
+    """RSVPs, payments, cancellations and check-ins keep the rollups equal to a rebuild."""
+    print("🧪 Testing RSVP rollups...")
+    with app.app_context():
+        organiser = make_user('rollup-organiser@example.com', is_admin=True)
+        event = Event(name='Rollup Test Course', start_date=datetime.utcnow() + timedelta(days=3),
+                      location='Singapore', capacity=20, price=12.5, creator_id=organiser.id,
+                      meal_option_enabled=True, pay_at_venue_enabled=True)
+        db.session.add(event)
+        db.session.commit()
+        attendees = [make_user(f'rollup-attendee{i}@example.com') for i in range(3)]
+        for attendee in attendees:
+            record_credit_transaction(attendee.id, 5000, 'topup')
+        db.session.commit()
+        organiser_id, event_id = organiser.id, event.id
+        attendee_ids = [attendee.id for attendee in attendees]
+
+    clients = [client_for(user_id) for user_id in attendee_ids]
+    url = f'/event/{event_id}'
+    try:
+        clients[0].post(url, data={'status': 'Accepted', 'payment_method': 'credit', 'meal_opt_in': 'on'})
+        clients[1].post(url, data={'status': 'Accepted', 'payment_method': 'pay_at_venue', 'guests': '2'})
+        clients[2].post(url, data={'status': 'Maybe'})
+        # Withdrawing refunds the credits and counts as a cancellation
+        clients[0].post(url, data={'status': 'Declined'})
+        clients[2].post(url, data={'status': 'Accepted', 'payment_method': 'credit'})
+
+        with app.app_context():
+            code = RSVP.query.filter_by(event_id=event_id, user_id=attendee_ids[1]).one().qr_code
+        client_for(organiser_id).post('/verify', data={'code': code, 'event_id': event_id})
+
+        with app.app_context():
+            today = datetime.utcnow().date()
+            incremental = _rollups(event_id)
+            assert (today, 'rsvp', 'Accepted', 2, 2, 0) in incremental
+            assert (today, 'rsvp', 'Declined', 1, 0, 0) in incremental
+            assert (today, 'cancellation', '', 1, 0, 0) in incremental
+            assert (today, 'revenue', 'credit', 1, 0, 1250) in incremental
+            assert (today, 'check_in', '', 1, 2, 0) in incremental
+            assert not [row for row in incremental if row[1] == 'meal']
+
+            rebuild_event_rollups(event_id)
+            db.session.commit()
+            assert _rollups(event_id) == incremental
+
+            summary = organiser_analytics(organiser_id, days=7)
+            assert summary['events'][event_id][('rsvp', 'Accepted')]['count'] == 2
+            assert summary['days'][-1]['day'] == today
+            assert summary['days'][-1]['new_rsvps'] == 3
+            assert summary['days'][-1]['cancellations'] == 1
+
+        response = client_for(organiser_id).get('/analytics')
+        assert response.status_code == 200
+        page = response.get_data(as_text=True)
+        assert 'RSVPs Over Time' in page and 'Revenue by Payment Method' in page
+    finally:
+        with app.app_context():
+            for model in (EventDailyStat, CheckInBucket, RSVP, Notification):
+                model.query.filter_by(event_id=event_id).delete()
+            Event.query.filter_by(id=event_id).delete()
+            # Drop the attendees with their ledgers so balances and ledger stay in step
+            CreditTransaction.query.filter(CreditTransaction.user_id.in_(attendee_ids)).delete()
+            MemberEngagement.query.filter(MemberEngagement.user_id.in_(attendee_ids)).delete()
+            User.query.filter(User.id.in_(attendee_ids)).delete()
+            db.session.commit()
+    print("✅ Rollups follow RSVP changes")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("📊 RSVP Rollup Test Suite")
+    print("=" * 60)
+    test_rollups_follow_rsvp_changes()
+    print("\n🎉 All RSVP rollup tests passed!")
+    print("=" * 60)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test script for signed, self-verifying check-in QR codes.
+"""
+
+import os
+import re
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import event as sa_event
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import (app, db, Event, RSVP, CheckInBucket, EventDailyStat, is_qr_token, make_qr_token, parse_qr_token)
+from testutils import client_for, make_user
+
+
+class _RSVPQueryCounter:
+    """Count SQL statements touching the rsvp table."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if re.search(r'\b(from|join|update)\s+rsvp\b', statement, re.IGNORECASE):
+            self.count += 1
+
+
+def test_token_roundtrip():
+    """Tokens verify, and any tampering is detected."""
+    print("🧪 Testing token signing...")
+    with app.app_context():
+        token = make_qr_token(12, 345)
+        assert is_qr_token(token)
+        assert len(token) <= 64
+        assert parse_qr_token(token) == (12, 345)
+
+        prefix, event_id, rsvp_id, signature = token.split('.')
+        assert parse_qr_token(f"{prefix}.{event_id}.346.{signature}") is None
+        assert parse_qr_token(f"{prefix}.13.{rsvp_id}.{signature}") is None
+        assert parse_qr_token(token[:-1] + ('A' if token[-1] != 'A' else 'B')) is None
+        assert parse_qr_token('EA1.x.y.z') is None
+        assert not is_qr_token(str(uuid.uuid4()))
+    print("✅ Tokens verified")
+
+
+def test_verify_flow():
+    """Forged and wrong-event codes are rejected without querying RSVPs."""
+    print("🧪 Testing check-in with signed codes...")
+    with app.app_context():
+        admin = make_user('signed-qr-admin@example.com', is_admin=True)
+        attendee = make_user('signed-qr-user@example.com')
+        legacy_user = make_user('signed-qr-legacy@example.com')
+        events = [Event(name=f'Signed QR Course {i}', start_date=datetime.utcnow() + timedelta(hours=2),
+                        location='Singapore', capacity=10, creator_id=admin.id) for i in range(2)]
+        db.session.add_all(events)
+        db.session.commit()
+        event_id, other_event_id = events[0].id, events[1].id
+
+        rsvp = RSVP(event_id=event_id, user_id=attendee.id, status='Accepted')
+        db.session.add(rsvp)
+        db.session.flush()
+        rsvp.qr_code = make_qr_token(event_id, rsvp.id)
+        legacy_code = str(uuid.uuid4())
+        db.session.add(RSVP(event_id=event_id, user_id=legacy_user.id, status='Accepted', qr_code=legacy_code))
+        db.session.commit()
+        code, admin_id = rsvp.qr_code, admin.id
+
+    client = client_for(admin_id)
+    counter = _RSVPQueryCounter()
+    with app.app_context():
+        engine = db.engine
+    sa_event.listen(engine, 'before_cursor_execute', counter)
+    try:
+        forged = code[:-2] + ('AA' if not code.endswith('AA') else 'BB')
+        response = client.post('/verify', data={'code': forged})
+        assert b'Invalid QR code' in response.data
+        response = client.post('/verify', data={'code': code, 'event_id': other_event_id})
+        assert b'different event' in response.data
+        assert counter.count == 0, f"{counter.count} RSVP queries for rejected codes"
+
+        response = client.post('/verify', data={'code': code, 'event_id': event_id})
+        assert 'Check‑in successful'.encode() in response.data
+        assert counter.count > 0
+    finally:
+        sa_event.remove(engine, 'before_cursor_execute', counter)
+
+    try:
+        response = client.post('/verify', data={'code': code})
+        assert b'already checked in' in response.data
+
+        # Legacy UUID codes keep working
+        response = client.post('/verify', data={'code': legacy_code, 'event_id': event_id})
+        assert 'Check‑in successful'.encode() in response.data
+
+        # A revoked code (RSVP declined) is rejected even though it is correctly signed
+        with app.app_context():
+            RSVP.query.filter_by(qr_code=code).update({'qr_code': None, 'checked_in': False})
+            db.session.commit()
+        response = client.post('/verify', data={'code': code})
+        assert b'QR code not found' in response.data
+    finally:
+        with app.app_context():
+            RSVP.query.filter(RSVP.event_id.in_([event_id, other_event_id])).delete()
+            CheckInBucket.query.filter(CheckInBucket.event_id.in_([event_id, other_event_id])).delete()
+            EventDailyStat.query.filter(EventDailyStat.event_id.in_([event_id, other_event_id])).delete()
+            Event.query.filter(Event.id.in_([event_id, other_event_id])).delete()
+            db.session.commit()
+    print("✅ Signed check-in verified")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🔐 Signed QR Code Test Suite")
+    print("=" * 60)
+    test_token_roundtrip()
+    test_verify_flow()
+    print("\n🎉 All signed QR code tests passed!")
+    print("=" * 60)
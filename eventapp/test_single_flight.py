@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test script for coalescing concurrent computations.
+"""
+
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import singleflight
+from singleflight import SingleFlight
+
+WAITERS = 8
+
+
+def _run_together(target, count=WAITERS):
+    """Start ``count`` threads calling ``target`` at once; return their results."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def run(i):
+        barrier.wait()
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_callers_share_one_computation():
+    """Callers arriving while a computation runs reuse its result."""
+    print("🧪 Testing shared computations...")
+    flight = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return {'rows': len(calls)}
+
+    results = _run_together(lambda: flight.do('report', compute))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+    # Once it has finished, the next caller computes afresh
+    assert flight.do('report', compute) == {'rows': 2}
+    # Different keys don't wait for each other
+    assert flight.do('other', lambda: 'other') == 'other'
+    print("✅ Shared computations")
+
+
+def test_errors_are_shared_and_not_kept():
+    """Waiters see the computing caller's exception; later callers retry."""
+    print("🧪 Testing shared errors...")
+    flight = SingleFlight()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        time.sleep(0.2)
+        raise RuntimeError('database is locked')
+
+    results = _run_together(lambda: flight.do('report', fail))
+    assert len(calls) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.do('report', lambda: 'ok') == 'ok'
+    print("✅ Shared errors")
+
+
+def _compute_in_process(lock_dir, log_path, version, results):
+    def compute():
+        with open(log_path, 'a') as f:
+            f.write(f'compute {version}\n')
+        time.sleep(0.3)
+        return {'version': version, 'rows': [1, 2, 3]}
+    results.put(SingleFlight(lock_dir).do('feedback_summaries', compute, version=version))
+
+
+def test_processes_share_one_computation():
+    """Processes asking for the same version compute it once and all get the result."""
+    print("🧪 Testing cross-process sharing...")
+    if singleflight.fcntl is None:
+        print("⚠️  No fcntl on this platform; skipped")
+        return
+    lock_dir = tempfile.mkdtemp()
+    log_path = os.path.join(lock_dir, 'log')
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+
+    def run(version, count):
+        processes = [context.Process(target=_compute_in_process, args=(lock_dir, log_path, version, results))
+                     for _ in range(count)]
+        for process in processes:
+            process.start()
+        received = [results.get(timeout=10) for _ in processes]
+        for process in processes:
+            process.join()
+            assert process.exitcode == 0
+        with open(log_path) as f:
+            return received, f.read().split('\n')[:-1]
+
+    try:
+        received, log = run(1, 2)
+        assert log == ['compute 1']
+        assert received == [{'version': 1, 'rows': [1, 2, 3]}] * 2
+
+        # Later processes reuse the stored result; a new version computes again
+        received, log = run(1, 1)
+        assert log == ['compute 1'] and received == [{'version': 1, 'rows': [1, 2, 3]}]
+        received, log = run(2, 2)
+        assert log == ['compute 1', 'compute 2']
+        assert received == [{'version': 2, 'rows': [1, 2, 3]}] * 2
+        assert os.path.exists(SingleFlight(lock_dir).path('feedback_summaries') + '.result')
+    finally:
+        shutil.rmtree(lock_dir, ignore_errors=True)
+    print("✅ Cross-process sharing")
+
+
+def test_home_page_misses_render_once():
+    """Simultaneous first visits after a change render the home page once."""
+    print("🧪 Testing coalesced home page renders...")
+    import app as eventapp
+
+    renders = []
+    render = eventapp._render_home_page
+
+    def slow_render(*args):
+        renders.append(1)
+        time.sleep(0.2)
+        return render(*args)
+
+    eventapp._home_page_cache.clear()
+    eventapp._render_home_page = slow_render
+    try:
+        responses = _run_together(lambda: eventapp.app.test_client().get('/'))
+    finally:
+        eventapp._render_home_page = render
+    assert len(renders) == 1
+    assert {response.status_code for response in responses} == {200}
+    assert len({response.headers['ETag'] for response in responses}) == 1
+    print("✅ Coalesced home page renders")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🛬 Single-Flight Test Suite")
+    print("=" * 60)
+    test_concurrent_callers_share_one_computation()
+    test_errors_are_shared_and_not_kept()
+    test_processes_share_one_computation()
+    test_home_page_misses_render_once()
+    print("\n🎉 All single-flight tests passed!")
+    print("=" * 60)
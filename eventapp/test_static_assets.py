@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for the fingerprinted static asset bundles.
+"""
+
+import gzip
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, ASSET_MANIFEST
+from assets import DIST_DIR, build_assets, load_manifest, minify_css, minify_js
+
+
+def test_minifiers():
+    """Comments and whitespace go; strings and line breaks between statements stay."""
+    print("🧪 Testing minifiers...")
+    css = """
+      /* header */
+      .a , .b > .c {
+        color : red ;
+        background: url("data:image/svg+xml;charset=UTF-8,%3csvg /* not a comment */ %3e");
+        content: 'a ,  b';
+      }
+      @media (max-width: 768px) { .a { padding: 0 } }
+    """
+    assert minify_css(css) == (
+        '.a,.b > .c{color : red;background: url("data:image/svg+xml;charset=UTF-8,%3csvg /* not a comment */ %3e");'
+        "content: 'a ,  b'}@media (max-width: 768px){.a{padding: 0}}"
+    )
+    js = """
+      // Handle things
+      const url = 'https://example.com'; /* block */
+      const text = "say // hi";
+      let x = 1
+      x++
+    """
+    assert minify_js(js) == \
+        "const url = 'https://example.com';\nconst text = \"say // hi\";\nlet x = 1\nx++"
+    print("✅ Minifiers")
+
+
+def test_build_is_current_and_reproducible():
+    """Rebuilding gives the committed manifest, hashed names and gzip copies."""
+    print("🧪 Testing asset build...")
+    static_dir = tempfile.mkdtemp()
+    try:
+        shutil.copytree(os.path.join(app.static_folder, 'images'), os.path.join(static_dir, 'images'))
+        os.makedirs(os.path.join(static_dir, DIST_DIR))
+        stale = os.path.join(static_dir, DIST_DIR, 'app.000000000000.css')
+        open(stale, 'w').close()
+
+        manifest = build_assets(static_dir)
+        assert manifest == load_manifest(static_dir)
+        assert manifest == ASSET_MANIFEST, "static/dist is out of date; run python build_assets.py"
+        assert not os.path.exists(stale)
+        for name, hashed in manifest['bundles'].items():
+            stem, extension = os.path.splitext(name)
+            assert re.fullmatch(rf'{re.escape(stem)}\.[0-9a-f]{{12}}{extension}', hashed)
+            path = os.path.join(static_dir, DIST_DIR, hashed)
+            if extension == '.png':
+                continue
+            with open(path, 'rb') as f, gzip.open(path + '.gz') as gz:
+                assert f.read() == gz.read()
+        assert 'images/logos/chinese-seal.png' in manifest['files']
+    finally:
+        shutil.rmtree(static_dir, ignore_errors=True)
+    print("✅ Asset build")
+
+
+def test_pages_use_cacheable_assets():
+    """Pages link the bundles, which are served precompressed with a one-year immutable lifetime."""
+    print("🧪 Testing asset serving...")
+    client = app.test_client()
+    html = client.get('/login').get_data(as_text=True)
+    assert '<style>' not in html
+    urls = re.findall(r'(?:href|src)="(/static/[^"]+)"', html)
+    bundles = [f'/static/dist/{hashed}' for hashed in ASSET_MANIFEST['bundles'].values()]
+    assert set(bundles) <= set(urls)
+    assert f"/static/dist/{ASSET_MANIFEST['bundles']['chinese-seal-96.png']}" in urls
+    logo = f"/static/images/logos/chinese-seal.png?v={ASSET_MANIFEST['files']['images/logos/chinese-seal.png']}"
+
+    css = next(url for url in bundles if url.endswith('.css'))
+    plain = client.get(css, headers={'Accept-Encoding': 'identity'})
+    compressed = client.get(css, headers={'Accept-Encoding': 'gzip, deflate'})
+    assert plain.mimetype == compressed.mimetype == 'text/css'
+    assert plain.content_encoding is None and compressed.content_encoding == 'gzip'
+    assert gzip.decompress(compressed.data) == plain.data
+    for response in (plain, compressed, client.get(logo)):
+        assert response.status_code == 200
+        assert response.headers['Cache-Control'] == 'public, max-age=31536000, immutable'
+    assert 'Accept-Encoding' in compressed.headers['Vary']
+
+    # An out-of-date hash isn't cached for long, and nothing outside dist/ is reachable
+    assert 'immutable' not in client.get('/static/images/logos/chinese-seal.png?v=3').headers['Cache-Control']
+    assert client.get('/static/dist/../../app.py').status_code == 404
+    print("✅ Asset serving")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("📦 Static Asset Test Suite")
+    print("=" * 60)
+    test_minifiers()
+    test_build_is_current_and_reproducible()
+    test_pages_use_cacheable_assets()
+    print("\n🎉 All static asset tests passed!")
+    print("=" * 60)
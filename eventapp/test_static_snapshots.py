@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Test script for static HTML snapshots of the public pages.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import (app, db, Event, RSVP, AppSettings, StaleSnapshot, SNAPSHOTS_ASSETS_KEY,
+                 SNAPSHOTS_RENDERED_KEY, snapshot_path, static_url, write_snapshots)
+from testutils import make_user
+
+
+def _add_event(name, creator_id, days=3, visibility='public'):
+    event = Event(name=name, start_date=datetime.utcnow() + timedelta(days=days), location='Singapore',
+                  capacity=10, creator_id=creator_id, visibility=visibility)
+    db.session.add(event)
+    db.session.commit()
+    return event.id
+
+
+def _read(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+class _Snapshots:
+    """Snapshots enabled into a temporary folder, starting from a first run."""
+
+    def __enter__(self):
+        self.folder = tempfile.mkdtemp()
+        self.saved = app.config['STATIC_SNAPSHOTS'], app.config['SNAPSHOT_FOLDER']
+        app.config['STATIC_SNAPSHOTS'] = True
+        app.config['SNAPSHOT_FOLDER'] = self.folder
+        with app.app_context():
+            self._reset()
+        return self
+
+    def _reset(self):
+        AppSettings.query.filter(AppSettings.key.in_([SNAPSHOTS_RENDERED_KEY, SNAPSHOTS_ASSETS_KEY])).delete()
+        StaleSnapshot.query.delete()
+        db.session.commit()
+
+    def __exit__(self, *exc_info):
+        app.config['STATIC_SNAPSHOTS'], app.config['SNAPSHOT_FOLDER'] = self.saved
+        with app.app_context():
+            for event in Event.query.filter(Event.name.like('Snapshot Test%')).all():
+                RSVP.query.filter_by(event_id=event.id).delete()
+                db.session.delete(event)
+            db.session.commit()
+            self._reset()
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+
+def test_summary_page_is_public():
+    """Public events have a summary page anyone can open; private ones don't."""
+    print("🧪 Testing public event summaries...")
+    with _Snapshots():
+        with app.app_context():
+            organiser = make_user('snapshot-organiser@example.com')
+            public_id = _add_event('Snapshot Test Open Day', organiser.id)
+            private_id = _add_event('Snapshot Test Board Meeting', organiser.id, visibility='private')
+        client = app.test_client()
+        response = client.get(f'/events/{public_id}.html')
+        assert response.status_code == 200
+        assert b'Snapshot Test Open Day' in response.data and b'Sign in to RSVP' in response.data
+        assert client.get(f'/events/{private_id}.html').status_code == 404
+    print("✅ Public event summaries")
+
+
+def test_only_changed_pages_are_rewritten():
+    """The first run writes everything; later runs only what changes queued."""
+    print("🧪 Testing snapshot writes...")
+    with _Snapshots() as snapshots:
+        with app.app_context():
+            organiser = make_user('snapshot-organiser@example.com')
+            guest = make_user('snapshot-guest@example.com')
+            event_id = _add_event('Snapshot Test Workshop', organiser.id)
+            other_id = _add_event('Snapshot Test Seminar', organiser.id)
+            private_id = _add_event('Snapshot Test Private', organiser.id, visibility='private')
+
+            stats = write_snapshots()
+            for locale in ('en', 'zh'):
+                assert 'Snapshot Test Workshop' in _read(snapshot_path(locale))
+                assert 'Snapshot Test Workshop' in _read(snapshot_path(locale, event_id))
+                assert not os.path.exists(snapshot_path(locale, private_id))
+            assert stats['written'] >= 3
+            assert snapshot_path('en', event_id).startswith(snapshots.folder)
+
+            assert write_snapshots() == {'written': 0, 'removed': 0}
+
+            untouched = os.stat(snapshot_path('en', other_id)).st_mtime_ns
+            db.session.add(RSVP(event_id=event_id, user_id=guest.id, status='Accepted'))
+            db.session.commit()
+            assert write_snapshots() == {'written': 2, 'removed': 0}
+            assert '9 of 10' in _read(snapshot_path('en', event_id))
+            assert os.stat(snapshot_path('en', other_id)).st_mtime_ns == untouched
+
+            db.session.get(Event, other_id).status = 'cancelled'
+            db.session.commit()
+            assert write_snapshots() == {'written': 1, 'removed': 1}
+            assert not os.path.exists(snapshot_path('en', other_id))
+            assert 'Snapshot Test Seminar' not in _read(snapshot_path('en'))
+
+            leftovers = [name for _, _, files in os.walk(snapshots.folder) for name in files if name.endswith('.tmp')]
+            assert leftovers == []
+    print("✅ Snapshot writes")
+
+
+def test_started_events_are_rewritten():
+    """An event that starts between runs is re-rendered as past without any write."""
+    print("🧪 Testing started events...")
+    with _Snapshots():
+        with app.app_context():
+            organiser = make_user('snapshot-organiser@example.com')
+            event_id = _add_event('Snapshot Test Kickoff', organiser.id, days=-0.01)
+            write_snapshots()
+            os.remove(snapshot_path('en', event_id))
+
+            start = db.session.get(Event, event_id).start_date
+            AppSettings.set_setting(SNAPSHOTS_RENDERED_KEY, (start - timedelta(minutes=5)).isoformat())
+            assert write_snapshots()['written'] >= 2
+            assert 'This event has ended' in _read(snapshot_path('en', event_id))
+    print("✅ Started events")
+
+
+def test_asset_rebuild_rewrites_every_page():
+    """Pages link to hashed bundles, so new bundles mean re-rendering all of them."""
+    print("🧪 Testing asset rebuilds...")
+    with _Snapshots():
+        with app.app_context():
+            organiser = make_user('snapshot-organiser@example.com')
+            event_id = _add_event('Snapshot Test Assets', organiser.id)
+            write_snapshots()
+            with app.test_request_context('/'):
+                bundle = static_url('app.css')
+            assert bundle in _read(snapshot_path('en', event_id))
+            assert write_snapshots() == {'written': 0, 'removed': 0}
+
+            # As if build_assets.py had written a different manifest before this run
+            AppSettings.set_setting(SNAPSHOTS_ASSETS_KEY, 'previous-build')
+            stats = write_snapshots()
+            assert stats['written'] >= 2
+            assert bundle in _read(snapshot_path('en', event_id))
+    print("✅ Asset rebuilds")
+
+
+def test_nothing_is_queued_when_disabled():
+    """Without STATIC_SNAPSHOTS, writes don't fill the queue."""
+    print("🧪 Testing disabled snapshots...")
+    with _Snapshots():
+        app.config['STATIC_SNAPSHOTS'] = False
+        with app.app_context():
+            organiser = make_user('snapshot-organiser@example.com')
+            _add_event('Snapshot Test Quiet', organiser.id)
+            assert StaleSnapshot.query.count() == 0
+    print("✅ Disabled snapshots")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("📸 Static Snapshot Test Suite")
+    print("=" * 60)
+    test_summary_page_is_public()
+    test_only_changed_pages_are_rewritten()
+    test_started_events_are_rewritten()
+    test_asset_rebuild_rewrites_every_page()
+    test_nothing_is_queued_when_disabled()
+    print("\n🎉 All static snapshot tests passed!")
+    print("=" * 60)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test script for compiled translation catalogs and per-locale templates.
+"""
+
+import os
+import sys
+
+from jinja2 import DictLoader
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, SUPPORTED_LANGUAGES, get_current_language, get_translation
+from i18n import LocalizedEnvironment, TranslationExtension, compile_all_templates, compile_catalogs
+
+TEMPLATES = {
+    'base.html': "<title>{{ get_translation('home') }}</title>{% block body %}{% endblock %}",
+    'page.html': ("{% extends 'base.html' %}{% block body %}"
+                  "{{ get_translation('login') }}|{{ get_translation('nope') }}|{{ get_translation(key) }}|"
+                  "{{ get_translation('login', 'en') }}{% endblock %}"),
+}
+
+
+def _environment(catalogs, selected):
+    env = LocalizedEnvironment(app, loader=DictLoader(TEMPLATES), extensions=[TranslationExtension])
+    env.translation_catalogs = catalogs
+    env.locale_selector = lambda: selected[0]
+    env.globals['get_translation'] = lambda key, language=None: f'runtime:{key}'
+    return env
+
+
+def test_compile_catalogs():
+    """Catalogs are frozen, fall back to the default locale and report gaps."""
+    print("🧪 Testing catalog compilation...")
+    catalogs, gaps = compile_catalogs({'en': {'a': 'A', 'b': 'B'}, 'zh': {'a': '甲', 'c': '丙'}})
+    assert dict(catalogs['zh']) == {'a': '甲', 'b': 'B', 'c': '丙'}
+    assert gaps == {'en': [], 'zh': ['b']}
+    for frozen in (catalogs, catalogs['en']):
+        try:
+            frozen['x'] = 'X'
+            raise AssertionError("catalogs should be read-only")
+        except TypeError:
+            pass
+    print("✅ Catalog compilation")
+
+
+def test_constant_keys_inlined_per_locale():
+    """Constant keys become text at compile time, per locale; others still run at render time."""
+    print("🧪 Testing per-locale template compilation...")
+    catalogs, _ = compile_catalogs({'en': {'home': 'Home', 'login': 'Login'},
+                                    'zh': {'home': '首页', 'login': '登录'}})
+    selected = ['en']
+    env = _environment(catalogs, selected)
+    assert env.get_template('page.html').render(key='x') == \
+        '<title>Home</title>Login|nope|runtime:x|runtime:login'
+    selected[0] = 'zh'
+    assert env.get_template('page.html').render(key='x') == \
+        '<title>首页</title>登录|nope|runtime:x|runtime:login'
+    assert set(env.locale_overlays) == {'en', 'zh'}
+    assert env.missing_translations == {('page.html', 1, 'nope')}
+
+    source = env.for_locale('zh').compile(TEMPLATES['base.html'], raw=True)
+    assert '首页' in source and 'get_translation' not in source
+    print("✅ Per-locale template compilation")
+
+
+def test_app_language_per_request():
+    """The app resolves the language once per request and every template key is translated."""
+    print("🧪 Testing app translations...")
+    with app.test_request_context('/'):
+        from flask import session
+        session['language'] = 'zh'
+        assert get_current_language() == 'zh'
+        session['language'] = 'en'
+        assert get_current_language() == 'zh'
+        assert get_translation('login') == '登录' and get_translation('login', 'en') == 'Login'
+        assert get_translation('no_such_key') == 'no_such_key'
+    with app.test_request_context('/'):
+        from flask import session
+        session['language'] = 'fr'
+        assert get_current_language() == 'en'
+    with app.app_context():
+        assert get_current_language() == 'en'
+
+    client = app.test_client()
+    assert 'Login' in client.get('/login').get_data(as_text=True)
+    client.get('/set_language/zh')
+    assert '登录' in client.get('/login').get_data(as_text=True)
+
+    with app.app_context():
+        assert compile_all_templates(app.jinja_env, SUPPORTED_LANGUAGES) == []
+    print("✅ App translations")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🌐 Translation Test Suite")
+    print("=" * 60)
+    test_compile_catalogs()
+    test_constant_keys_inlined_per_locale()
+    test_app_language_per_request()
+    print("\n🎉 All translation tests passed!")
+    print("=" * 60)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test script for checking uploaded images before they are stored.
+"""
+
+import io
+import os
+import sys
+
+from PIL import Image
+from werkzeug.datastructures import FileStorage
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app as app_module
+from app import app, db, CarouselImage, UploadedImage, save_uploaded_file, static_file_path
+from testutils import client_for, make_user
+from images import read_image_header
+
+
+class CountingStream(io.BytesIO):
+    """A stream that counts how many bytes were read from it."""
+
+    bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def _image(size=(640, 480), fmt='JPEG', mode='RGB'):
+    buffer = io.BytesIO()
+    Image.new(mode, size, 'white' if mode == 'RGB' else 1).save(buffer, fmt)
+    return buffer.getvalue()
+
+
+def _part_files():
+    store = static_file_path('/static/uploads/content')
+    if not os.path.isdir(store):
+        return []
+    return [name for name in os.listdir(store) if name.endswith('.part')]
+
+
+def test_read_image_header():
+    """The real format and size come from the first chunk; the pixels are never read."""
+    print("🧪 Testing image header sniffing...")
+    data = _image((3000, 2000)) + b'\0' * 1024 * 1024
+    stream = CountingStream(data)
+    head, pil_format, size = read_image_header(stream, chunk_size=16 * 1024)
+    assert (pil_format, size) == ('JPEG', (3000, 2000))
+    assert stream.bytes_read == len(head) == 16 * 1024
+
+    for fmt in ('PNG', 'GIF', 'WEBP'):
+        assert read_image_header(io.BytesIO(_image(fmt=fmt)))[1:] == (fmt, (640, 480))
+
+    for data, message in ((b'<?php echo "hi"; ?>' * 10, 'Invalid file type'),
+                          (b'\x89PNG\r\n\x1a\n' + b'\0' * 100, 'not a readable image'),
+                          (_image((10000, 5000), 'PNG', '1'), 'too large')):
+        try:
+            read_image_header(io.BytesIO(data))
+            raise AssertionError(f"{data[:10]!r} should be rejected")
+        except ValueError as e:
+            assert message in str(e), e
+    print("✅ Image header sniffing")
+
+
+def test_format_is_taken_from_content():
+    """Images are accepted by their content, whatever their name says."""
+    print("🧪 Testing upload names...")
+    with app.test_request_context():
+        data = _image((37, 23))
+        url = save_uploaded_file(FileStorage(io.BytesIO(data), 'scan.jfif'))
+        try:
+            assert url.endswith('.jpg')
+            assert save_uploaded_file(FileStorage(io.BytesIO(data), 'IMG_0042')) == url
+        finally:
+            db.session.rollback()
+            os.remove(static_file_path(url))
+    print("✅ Upload names")
+
+
+def test_bad_uploads_are_rejected_early():
+    """Disguised, oversized and unreadable files are turned away before being stored."""
+    print("🧪 Testing upload rejection...")
+    with app.app_context():
+        admin_id = make_user('upload-check-admin@example.com', is_admin=True).id
+        images_before = UploadedImage.query.count()
+    client = client_for(admin_id)
+    parts_before = _part_files()
+
+    # A script renamed to .jpg is rejected after reading only its first chunk
+    with app.test_request_context():
+        stream = CountingStream(b'#!/bin/sh\n' + b'x' * 5 * 1024 * 1024)
+        try:
+            save_uploaded_file(FileStorage(stream, 'holiday.jpg'))
+            raise AssertionError("script should be rejected")
+        except ValueError as e:
+            assert 'Invalid file type' in str(e)
+        assert stream.bytes_read <= app_module.UPLOAD_CHUNK_SIZE
+
+    response = client.post('/admin/carousel/add', content_type='multipart/form-data', follow_redirects=True,
+                           data={'image_file': (io.BytesIO(b'GIF89a' + b'\0' * 50), 'broken.gif'),
+                                 'title': 'Upload Check'})
+    assert 'not a readable image' in response.get_data(as_text=True)
+
+    original_limit = app_module.MAX_UPLOAD_BYTES
+    app_module.MAX_UPLOAD_BYTES = 1024
+    try:
+        response = client.post('/admin/carousel/add', content_type='multipart/form-data', follow_redirects=True,
+                               data={'image_file': (io.BytesIO(_image()), 'big.jpg'), 'title': 'Upload Check'})
+        assert 'The image is too large' in response.get_data(as_text=True)
+    finally:
+        app_module.MAX_UPLOAD_BYTES = original_limit
+
+    with app.app_context():
+        assert CarouselImage.query.filter_by(title='Upload Check').count() == 0
+        assert UploadedImage.query.count() == images_before
+    assert _part_files() == parts_before
+    print("✅ Upload rejection")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🛡️  Upload Validation Test Suite")
+    print("=" * 60)
+    test_read_image_header()
+    test_format_is_taken_from_content()
+    test_bad_uploads_are_rejected_early()
+    print("\n🎉 All upload validation tests passed!")
+    print("=" * 60)
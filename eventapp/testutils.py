@@ -0,0 +1,28 @@
+"""
+Shared helpers for the test scripts.
+
+Tests run against the development database, so users are looked up by email
+and reused between runs.
+"""
+
+from app import app, db, User
+
+
+def make_user(email, is_admin=False, **fields):
+    """Return the user with ``email``, creating a verified one if needed."""
+    user = User.query.filter_by(email=email).first()
+    if not user:
+        user = User(username=email.split('@')[0], email=email, email_verified=True, is_admin=is_admin, **fields)
+        user.set_password('password123')
+        db.session.add(user)
+        db.session.commit()
+    return user
+
+
+def client_for(user_id):
+    """Return a test client logged in as ``user_id``."""
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(user_id)
+        sess['_fresh'] = True
+    return client
@@ -479,7 +479,11 @@ TRANSLATIONS = {
         'create_account': 'Create Account',
         'get_started': 'Get Started',
         'welcome_subtitle': 'Discover, create, and manage educational events with ease. RSVP to events and get your QR code for seamless check-ins.',
-        'welcome': 'Welcome to Noble Quest'
+        'welcome': 'Welcome to Noble Quest',
+        'first_name': 'First Name',
+        'last_name': 'Last Name',
+        'username': 'Username',
+        'country': 'Country'
     },
     'zh': {
         'welcome': '欢迎来到 Noble Quest',
@@ -958,6 +962,10 @@ TRANSLATIONS = {
         'create_account': '创建账户',
         'get_started': '开始使用',
         'welcome_subtitle': '轻松发现、创建和管理教育活动。报名参加活动并获取您的二维码，实现无缝签到。',
-        'welcome': '欢迎来到 Noble Quest'
+        'welcome': '欢迎来到 Noble Quest',
+        'first_name': '名字',
+        'last_name': '姓氏',
+        'username': '用户名',
+        'country': '国家'
     }
 }
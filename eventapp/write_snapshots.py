@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Write static HTML copies of the public pages.
+
+Renders the home page and the summary page of every public event
+(/events/<id>.html), once per language, into SNAPSHOT_FOLDER
+(static/snapshots by default), so the front-end server can answer
+signed-out visitors without the app. With STATIC_SNAPSHOTS=True, changes to
+events, RSVPs, carousel images and organisers queue the pages they affect,
+and each run re-renders only those. Files are replaced by renaming, so a
+page is never served half-written.
+
+Usage:
+    python write_snapshots.py              # re-render changed pages (e.g. every minute)
+    python write_snapshots.py --watch 10   # keep running, checking for changes every 10 seconds
+    python write_snapshots.py --rebuild    # re-render every page
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, write_snapshots
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write static HTML copies of the public pages.')
+    parser.add_argument('--rebuild', action='store_true', help='Re-render every page, not just changed ones')
+    parser.add_argument('--watch', type=float, metavar='SECONDS',
+                        help='Keep running, checking for changes this often')
+    args = parser.parse_args()
+
+    if not app.config['STATIC_SNAPSHOTS']:
+        print("⚠️  STATIC_SNAPSHOTS is not enabled, so changes are not queued; only --rebuild keeps pages current")
+
+    with app.app_context():
+        rebuild = args.rebuild
+        while True:
+            stats = write_snapshots(rebuild=rebuild)
+            rebuild = False
+            if stats['written'] or stats['removed'] or not args.watch:
+                print(f"✅ Wrote {stats['written']} pages, removed {stats['removed']}")
+            if not args.watch:
+                break
+            db.session.remove()
+            time.sleep(args.watch)
+
+
+if __name__ == '__main__':
+    main()